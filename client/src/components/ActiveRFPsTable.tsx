@@ -1,5 +1,10 @@
-import { useState } from 'react';
-import { useQuery, useMutation } from '@tanstack/react-query';
+import { useEffect, useState } from 'react';
+import {
+  keepPreviousData,
+  useInfiniteQuery,
+  useQuery,
+  useMutation,
+} from '@tanstack/react-query';
 import { Link, useLocation } from 'wouter';
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
 import { Button } from '@/components/ui/button';
@@ -32,9 +37,14 @@ import {
   getStatusLabel,
 } from '@/lib/badge-utils';
 import { DemoBadge } from '@/components/ui/demo-badge';
+import type { RfpDetailSummary } from '@/types/api';
+
+const RFP_PAGE_SIZE = 50;
+const SEARCH_DEBOUNCE_MS = 300;
 
 export default function ActiveRFPsTable() {
   const [searchQuery, setSearchQuery] = useState('');
+  const [debouncedSearch, setDebouncedSearch] = useState('');
   const [statusFilter, setStatusFilter] = useState('all');
   const [manualRfpUrl, setManualRfpUrl] = useState('');
   const [manualRfpUrlError, setManualRfpUrlError] = useState('');
@@ -52,8 +62,47 @@ export default function ActiveRFPsTable() {
   const { toast } = useToast();
   const [, navigate] = useLocation();
 
-  const { data: rfpData, isLoading } = useQuery({
-    queryKey: ['/api/rfps', 'detailed'],
+  useEffect(() => {
+    const timeout = setTimeout(
+      () => setDebouncedSearch(searchQuery.trim()),
+      SEARCH_DEBOUNCE_MS
+    );
+    return () => clearTimeout(timeout);
+  }, [searchQuery]);
+
+  // Keyset pages of the detail endpoint; each page costs the same however
+  // deep the table is scrolled. Filtering happens on the server, so every
+  // page holds matching RFPs only.
+  const {
+    data: rfpPages,
+    isLoading,
+    fetchNextPage,
+    hasNextPage,
+    isFetchingNextPage,
+  } = useInfiniteQuery({
+    queryKey: [
+      '/api/rfps',
+      'detailed',
+      'pages',
+      { status: statusFilter, q: debouncedSearch },
+    ],
+    queryFn: async ({ pageParam }) => {
+      const params = new URLSearchParams({
+        view: 'summary',
+        limit: String(RFP_PAGE_SIZE),
+      });
+      if (statusFilter !== 'all') params.set('status', statusFilter);
+      if (debouncedSearch) params.set('q', debouncedSearch);
+      if (pageParam) params.set('cursor', pageParam);
+      const response = await apiRequest('GET', `/api/rfps/detailed?${params}`);
+      return {
+        items: (await response.json()) as RfpDetailSummary[],
+        nextCursor: response.headers.get('X-Next-Cursor'),
+      };
+    },
+    initialPageParam: null as string | null,
+    getNextPageParam: lastPage => lastPage.nextCursor,
+    placeholderData: keepPreviousData,
   });
 
   // Fetch company profiles for the selector
@@ -272,15 +321,7 @@ export default function ActiveRFPsTable() {
     },
   });
 
-  const rfps = Array.isArray(rfpData) ? rfpData : [];
-  const filteredRfps = rfps.filter((item: any) => {
-    const matchesSearch =
-      item.rfp.title.toLowerCase().includes(searchQuery.toLowerCase()) ||
-      item.rfp.agency.toLowerCase().includes(searchQuery.toLowerCase());
-    const matchesStatus =
-      statusFilter === 'all' || item.rfp.status === statusFilter;
-    return matchesSearch && matchesStatus;
-  });
+  const rfps = rfpPages?.pages.flatMap(page => page.items) ?? [];
 
   const getStatusIcon = (status: string) => {
     switch (status) {
@@ -699,7 +740,7 @@ export default function ActiveRFPsTable() {
                 </tr>
               </thead>
               <tbody className="divide-y divide-border">
-                {filteredRfps.map((item: any) => {
+                {rfps.map((item: any) => {
                   const deadline = getDeadlineText(item.rfp.deadline);
                   const calculatedProgress = getProgressValue(item.rfp);
 
@@ -896,7 +937,7 @@ export default function ActiveRFPsTable() {
             </table>
           </div>
 
-          {filteredRfps.length === 0 && (
+          {rfps.length === 0 && (
             <div className="text-center py-12">
               <i className="fas fa-search text-4xl text-muted-foreground mb-4"></i>
               <h3 className="text-lg font-semibold text-foreground mb-2">
@@ -916,30 +957,21 @@ export default function ActiveRFPsTable() {
               className="text-sm text-muted-foreground"
               data-testid="table-pagination-info"
             >
-              Showing {Math.min(filteredRfps.length, 10)} of{' '}
-              {filteredRfps.length} results
-            </div>
-            <div className="flex items-center space-x-2">
-              <Button
-                variant="outline"
-                size="sm"
-                disabled
-                data-testid="pagination-previous"
-              >
-                Previous
-              </Button>
-              <Button size="sm" data-testid="pagination-current">
-                1
-              </Button>
-              <Button
-                variant="outline"
-                size="sm"
-                disabled
-                data-testid="pagination-next"
-              >
-                Next
-              </Button>
+              Showing {rfps.length} loaded RFPs
             </div>
+            <Button
+              variant="outline"
+              size="sm"
+              disabled={!hasNextPage || isFetchingNextPage}
+              onClick={() => fetchNextPage()}
+              data-testid="pagination-load-more"
+            >
+              {isFetchingNextPage
+                ? 'Loading...'
+                : hasNextPage
+                  ? 'Load more'
+                  : 'All RFPs loaded'}
+            </Button>
           </div>
         </CardContent>
       </Card>
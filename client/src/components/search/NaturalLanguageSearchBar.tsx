@@ -41,7 +41,9 @@ interface ParseResult {
 
 interface SearchResult {
   rfps: any[];
-  totalCount: number;
+  totalCount: number | null;
+  totalCountEstimated?: boolean;
+  nextCursor?: string | null;
   appliedFilters: SearchFilters;
   explanation: string;
   suggestions?: string[];
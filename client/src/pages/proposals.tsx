@@ -15,10 +15,11 @@ import {
   getStatusIcon,
   getStatusLabel,
 } from '@/lib/badge-utils';
+import { useRealtime } from '@/components/providers/RealtimeProvider';
 import { apiRequest, queryClient } from '@/lib/queryClient';
 import type { ProposalRow, RFP } from '@shared/schema';
 import { useMutation, useQuery } from '@tanstack/react-query';
-import { useState } from 'react';
+import { useEffect, useState } from 'react';
 
 type RFPWithDetails = { rfp: RFP; proposal?: ProposalRow };
 type ProposalUpdateData = Partial<
@@ -40,6 +41,32 @@ export default function Proposals() {
       enabled: !!selectedRfp,
     });
 
+  const { isConnected, lastMessage, sendMessage } = useRealtime();
+
+  useEffect(() => {
+    if (isConnected) {
+      sendMessage({ type: 'subscribe', payload: { channels: ['proposals'] } });
+    }
+  }, [isConnected, sendMessage]);
+
+  // Show section text as it is written instead of waiting for the whole draft
+  useEffect(() => {
+    if (lastMessage?.type !== 'proposal:section') return;
+    const { rfpId, section, text, status } = lastMessage.payload;
+    if (rfpId !== selectedRfp) return;
+
+    const queryKey = ['/api/proposals/rfp', rfpId];
+    const current = queryClient.getQueryData<ProposalRow>(queryKey);
+    if (!current || status === 'completed') {
+      queryClient.invalidateQueries({ queryKey });
+      return;
+    }
+    queryClient.setQueryData<ProposalRow>(queryKey, {
+      ...current,
+      content: { ...(current.content as object), [section]: text },
+    });
+  }, [lastMessage, selectedRfp]);
+
   const generateProposalMutation = useMutation({
     mutationFn: async (rfpId: string) => {
       return apiRequest('POST', `/api/proposals/${rfpId}/generate`);
@@ -406,6 +433,11 @@ export default function Proposals() {
 function ProposalContentEditor({ proposal, editMode, onUpdate }: any) {
   const [content, setContent] = useState(proposal.content || {});
 
+  // Keep the read view in step with sections streamed in while generating
+  useEffect(() => {
+    if (!editMode) setContent(proposal.content || {});
+  }, [editMode, proposal.content]);
+
   const handleSave = () => {
     onUpdate({ content });
   };
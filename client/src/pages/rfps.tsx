@@ -51,7 +51,9 @@ interface SearchFilters {
 
 interface SearchResult {
   rfps: RFP[];
-  totalCount: number;
+  totalCount: number | null;
+  totalCountEstimated?: boolean;
+  nextCursor?: string | null;
   appliedFilters: SearchFilters;
   explanation: string;
   suggestions?: string[];
@@ -73,7 +75,7 @@ export default function RFPsPage() {
     isLoading,
     error,
   } = useQuery<RFPWithDetails[]>({
-    queryKey: ['/api/rfps/detailed'],
+    queryKey: ['/api/rfps/detailed?view=summary'],
   });
 
   const handleSearchResults = useCallback((results: SearchResult | null) => {
@@ -155,7 +157,7 @@ export default function RFPsPage() {
           <h1 className="text-3xl font-bold">RFPs</h1>
           <Badge variant="secondary" data-testid="rfp-count">
             {isSearchMode
-              ? `${searchResults?.totalCount ?? 0} Results`
+              ? `${searchResults?.totalCountEstimated ? '~' : ''}${searchResults?.totalCount ?? 0} Results`
               : `${rfps.length} Total RFPs`}
           </Badge>
         </div>
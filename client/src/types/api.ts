@@ -14,6 +14,7 @@ export type {
 } from '@shared/api/agentMonitoring';
 export type {
   RfpDetail,
+  RfpDetailSummary,
   SubmissionProgressStatus,
   SubmissionStatusFilter,
 } from '@shared/api/rfps';
@@ -0,0 +1,115 @@
+-- Dashboard metrics rollup (DatabaseStorage.getDashboardMetrics)
+-- The dashboard_metric_counters table is declared in shared/schema.ts; the
+-- triggers below keep it current and are not managed by drizzle-kit.
+-- Statement-level triggers with transition tables aggregate a whole
+-- multi-row INSERT/UPDATE into one upsert per changed counter, and counters
+-- whose net change is zero are not written at all.
+-- DatabaseStorage.reconcileDashboardRollup() rebuilds the table from scratch.
+--   cat migrations/add_dashboard_metric_rollup.sql | flyctl postgres connect -a bidhive
+
+-- Upsert statement for a query yielding (metric, bucket, delta) rows. Trigger
+-- functions EXECUTE it themselves: transition tables are only visible to
+-- queries run directly by the trigger function.
+CREATE OR REPLACE FUNCTION dashboard_rollup_sql(changes text) RETURNS text AS $$
+BEGIN
+  RETURN format($sql$
+    INSERT INTO dashboard_metric_counters AS c (metric, bucket, value, updated_at)
+    SELECT metric, bucket, SUM(delta), NOW()
+    FROM (%s) AS d(metric, bucket, delta)
+    GROUP BY metric, bucket
+    HAVING SUM(delta) <> 0
+    ON CONFLICT (metric, bucket)
+    DO UPDATE SET value = c.value + EXCLUDED.value, updated_at = NOW()
+  $sql$, changes);
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION dashboard_rollup_rfps() RETURNS trigger AS $$
+DECLARE
+  rows_changed text;
+BEGIN
+  rows_changed := CASE TG_OP
+    WHEN 'INSERT' THEN 'SELECT status, estimated_value, discovered_at, 1 AS sign FROM new_rows'
+    WHEN 'DELETE' THEN 'SELECT status, estimated_value, discovered_at, -1 AS sign FROM old_rows'
+    ELSE 'SELECT status, estimated_value, discovered_at, 1 AS sign FROM new_rows
+          UNION ALL
+          SELECT status, estimated_value, discovered_at, -1 AS sign FROM old_rows'
+  END;
+
+  EXECUTE dashboard_rollup_sql(format($sql$
+    SELECT 'rfp_status', status, sign::numeric FROM (%1$s) r
+    UNION ALL
+    SELECT 'rfp_value', status, sign * COALESCE(estimated_value, 0) FROM (%1$s) r
+    UNION ALL
+    SELECT 'rfps_discovered', to_char(discovered_at, 'YYYY-MM-DD'), sign::numeric FROM (%1$s) r
+  $sql$, rows_changed));
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION dashboard_rollup_submissions() RETURNS trigger AS $$
+DECLARE
+  rows_changed text;
+BEGIN
+  rows_changed := CASE TG_OP
+    WHEN 'INSERT' THEN 'SELECT status, submitted_at, 1 AS sign FROM new_rows'
+    WHEN 'DELETE' THEN 'SELECT status, submitted_at, -1 AS sign FROM old_rows'
+    ELSE 'SELECT status, submitted_at, 1 AS sign FROM new_rows
+          UNION ALL
+          SELECT status, submitted_at, -1 AS sign FROM old_rows'
+  END;
+
+  EXECUTE dashboard_rollup_sql(format($sql$
+    SELECT 'submissions_submitted', to_char(submitted_at, 'YYYY-MM-DD'), sign::numeric
+    FROM (%1$s) s
+    WHERE status = 'submitted' AND submitted_at IS NOT NULL
+  $sql$, rows_changed));
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION dashboard_rollup_portals() RETURNS trigger AS $$
+BEGIN
+  EXECUTE dashboard_rollup_sql(CASE TG_OP
+    WHEN 'INSERT' THEN 'SELECT ''portals'', '''', 1::numeric FROM new_rows'
+    ELSE 'SELECT ''portals'', '''', -1::numeric FROM old_rows'
+  END);
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Transition tables require one trigger per event
+DROP TRIGGER IF EXISTS "rfps_dashboard_rollup_insert" ON "rfps";
+DROP TRIGGER IF EXISTS "rfps_dashboard_rollup_update" ON "rfps";
+DROP TRIGGER IF EXISTS "rfps_dashboard_rollup_delete" ON "rfps";
+CREATE TRIGGER "rfps_dashboard_rollup_insert" AFTER INSERT ON "rfps"
+  REFERENCING NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION dashboard_rollup_rfps();
+CREATE TRIGGER "rfps_dashboard_rollup_update" AFTER UPDATE ON "rfps"
+  REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION dashboard_rollup_rfps();
+CREATE TRIGGER "rfps_dashboard_rollup_delete" AFTER DELETE ON "rfps"
+  REFERENCING OLD TABLE AS old_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION dashboard_rollup_rfps();
+
+DROP TRIGGER IF EXISTS "submissions_dashboard_rollup_insert" ON "submissions";
+DROP TRIGGER IF EXISTS "submissions_dashboard_rollup_update" ON "submissions";
+DROP TRIGGER IF EXISTS "submissions_dashboard_rollup_delete" ON "submissions";
+CREATE TRIGGER "submissions_dashboard_rollup_insert" AFTER INSERT ON "submissions"
+  REFERENCING NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION dashboard_rollup_submissions();
+CREATE TRIGGER "submissions_dashboard_rollup_update" AFTER UPDATE ON "submissions"
+  REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION dashboard_rollup_submissions();
+CREATE TRIGGER "submissions_dashboard_rollup_delete" AFTER DELETE ON "submissions"
+  REFERENCING OLD TABLE AS old_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION dashboard_rollup_submissions();
+
+DROP TRIGGER IF EXISTS "portals_dashboard_rollup_insert" ON "portals";
+DROP TRIGGER IF EXISTS "portals_dashboard_rollup_delete" ON "portals";
+CREATE TRIGGER "portals_dashboard_rollup_insert" AFTER INSERT ON "portals"
+  REFERENCING NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION dashboard_rollup_portals();
+CREATE TRIGGER "portals_dashboard_rollup_delete" AFTER DELETE ON "portals"
+  REFERENCING OLD TABLE AS old_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION dashboard_rollup_portals();
@@ -0,0 +1,9 @@
+-- Content-addressed documents (DocumentContentStore)
+-- documents.content_hash, document_blobs and idx_documents_rfp_content_hash
+-- are declared in shared/schema.ts. On large databases build the index here
+-- after adding the column so it is created CONCURRENTLY.
+--   cat migrations/add_document_content_hash_index.sql | flyctl postgres connect -a bidhive
+
+ALTER TABLE "documents" ADD COLUMN IF NOT EXISTS "content_hash" varchar(64);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS "idx_documents_rfp_content_hash" ON "documents" USING btree ("rfp_id", "content_hash");
@@ -0,0 +1,11 @@
+-- Keyset pagination indexes (storage.getSubmissionsPage / getScansPage /
+-- getAuditLogsPage). RFP listings reuse idx_rfps_discovered_at_id from
+-- add_rfp_search_indexes.sql.
+-- Declared in shared/schema.ts; run this first on large databases so the
+-- indexes are built CONCURRENTLY instead of locking the tables during drizzle-kit push.
+--   cat migrations/add_keyset_pagination_indexes.sql | flyctl postgres connect -a bidhive
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS "idx_submissions_created_at_id" ON "submissions" USING btree ("created_at", "id");
+CREATE INDEX CONCURRENTLY IF NOT EXISTS "idx_scans_started_at_id" ON "scans" USING btree ("started_at", "id");
+CREATE INDEX CONCURRENTLY IF NOT EXISTS "idx_scans_portal_name_started_at_id" ON "scans" USING btree ("portal_name", "started_at", "id");
+CREATE INDEX CONCURRENTLY IF NOT EXISTS "idx_audit_logs_entity_timestamp_id" ON "audit_logs" USING btree ("entity_type", "entity_id", "timestamp", "id");
@@ -0,0 +1,8 @@
+-- RFP scan reconciliation indexes (IncrementalPortalScanService)
+-- Declared in shared/schema.ts; run this first on large databases so the
+-- indexes are built CONCURRENTLY instead of locking rfps during drizzle-kit push.
+--   cat migrations/add_rfp_reconcile_indexes.sql | flyctl postgres connect -a bidhive
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS "idx_rfps_portal_source_url" ON "rfps" USING btree ("portal_id", "source_url");
+CREATE INDEX CONCURRENTLY IF NOT EXISTS "idx_rfps_portal_analysis_source_id" ON "rfps" USING btree ("portal_id", ("analysis"->>'sourceIdentifier'));
+CREATE INDEX CONCURRENTLY IF NOT EXISTS "idx_rfps_portal_requirements_source_id" ON "rfps" USING btree ("portal_id", ("requirements"->>'sourceIdentifier'));
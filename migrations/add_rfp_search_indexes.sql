@@ -0,0 +1,14 @@
+-- RFP search indexes (natural-language search / storage.searchRFPs)
+-- Declared in shared/schema.ts; run this first on large databases so the
+-- indexes are built CONCURRENTLY instead of locking rfps during drizzle-kit push.
+--   cat migrations/add_rfp_search_indexes.sql | flyctl postgres connect -a bidhive
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS "idx_rfps_search_document_gin" ON "rfps"
+  USING gin (to_tsvector('english', coalesce("title", '') || ' ' || coalesce("description", '') || ' ' || coalesce("agency", '')));
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS "idx_rfps_discovered_at_id" ON "rfps" USING btree ("discovered_at", "id");
+CREATE INDEX CONCURRENTLY IF NOT EXISTS "idx_rfps_deadline" ON "rfps" USING btree ("deadline");
+CREATE INDEX CONCURRENTLY IF NOT EXISTS "idx_rfps_estimated_value" ON "rfps" USING btree ("estimated_value");
+CREATE INDEX CONCURRENTLY IF NOT EXISTS "idx_rfps_naics_code" ON "rfps" USING btree ("naics_code" varchar_pattern_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS "idx_rfps_state" ON "rfps" USING btree ("state");
+CREATE INDEX CONCURRENTLY IF NOT EXISTS "idx_rfps_status" ON "rfps" USING btree ("status");
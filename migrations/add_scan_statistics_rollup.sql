@@ -0,0 +1,31 @@
+-- Scan statistics (ScanHistoryService.getScanStatistics)
+-- scan_daily_stats and idx_scans_portal_started_at are declared in
+-- shared/schema.ts. Run this after drizzle-kit push to backfill the rollup
+-- from existing scan history; on large databases build the index here first
+-- so it is created CONCURRENTLY.
+--   cat migrations/add_scan_statistics_rollup.sql | flyctl postgres connect -a bidhive
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS "idx_scans_portal_started_at" ON "scans" USING btree ("portal_id", "started_at");
+
+-- Same derivation as storage.rebuildScanDailyStats, over all history
+BEGIN;
+LOCK TABLE scan_daily_stats IN EXCLUSIVE MODE;
+DELETE FROM scan_daily_stats;
+INSERT INTO scan_daily_stats (
+  portal_id, portal_name, day, scan_count, success_count,
+  failed_count, rfps_discovered, total_duration_ms, timed_scan_count
+)
+SELECT
+  portal_id,
+  MAX(portal_name),
+  started_at::date,
+  COUNT(*),
+  COUNT(*) FILTER (WHERE status = 'completed'),
+  COUNT(*) FILTER (WHERE status = 'failed'),
+  COALESCE(SUM(discovered_rfps_count), 0),
+  COALESCE(SUM(EXTRACT(EPOCH FROM (completed_at - started_at)) * 1000), 0)::bigint,
+  COUNT(completed_at)
+FROM scans
+WHERE status IN ('completed', 'failed')
+GROUP BY portal_id, started_at::date;
+COMMIT;
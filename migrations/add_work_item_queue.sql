@@ -0,0 +1,22 @@
+-- Work item queue (WorkItemQueue in server/services/workflows/workItemQueue.ts)
+-- The claim and lease indexes are also declared in shared/schema.ts; the NOTIFY trigger is
+-- not managed by drizzle-kit and must be applied manually.
+--   cat migrations/add_work_item_queue.sql | flyctl postgres connect -a bidhive
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS "work_items_claim_idx" ON "work_items" USING btree ("priority", "deadline", "created_at") WHERE "status" IN ('pending', 'assigned');
+CREATE INDEX CONCURRENTLY IF NOT EXISTS "work_items_lease_idx" ON "work_items" USING btree ("lease_expires_at") WHERE "status" = 'in_progress';
+
+-- Wake listening queue workers on every node when a work item becomes runnable
+CREATE OR REPLACE FUNCTION notify_work_item_ready() RETURNS trigger AS $$
+BEGIN
+  PERFORM pg_notify('work_items_ready', NEW.task_type);
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS "work_items_ready_notify" ON "work_items";
+CREATE TRIGGER "work_items_ready_notify"
+  AFTER INSERT OR UPDATE OF "status", "next_retry_at" ON "work_items"
+  FOR EACH ROW
+  WHEN (NEW.status IN ('pending', 'assigned'))
+  EXECUTE FUNCTION notify_work_item_ready();
@@ -0,0 +1,6 @@
+-- Due-retry index for the retry scheduler (RetryBackoffDlqService)
+-- Declared in shared/schema.ts; run this first on large databases so the
+-- index is built CONCURRENTLY instead of locking work_items during drizzle-kit push.
+--   cat migrations/add_work_item_retry_index.sql | flyctl postgres connect -a bidhive
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS "work_items_due_retry_idx" ON "work_items" USING btree ("next_retry_at") WHERE "status" = 'failed' AND "can_retry";
@@ -17,6 +17,7 @@ import { configureRoutes } from './routes';
 import { agentRegistryService } from './services/agents/agentRegistryService';
 import { saflaSystemIntegration } from './services/learning/saflaSystemIntegration';
 import { websocketService } from './services/core/websocketService';
+import { eventBus } from './services/core/eventBus';
 import { log, serveStatic, setupVite } from './vite';
 import { correlationIdMiddleware } from './middleware/correlationId';
 
@@ -256,6 +257,41 @@ app.use((req, res, next) => {
     log('📅 Daily portal health check scheduled (7 AM CT)');
   }
 
+  // Rebuild the dashboard and scan statistics rollups to correct drift
+  if (process.env.DISABLE_METRICS_RECONCILIATION !== 'true') {
+    const cron = await import('node-cron');
+    const { storage } = await import('./storage');
+
+    cron.schedule('*/15 * * * *', async () => {
+      try {
+        const counters = await storage.reconcileDashboardRollup();
+        log(`📊 Dashboard metrics rollup reconciled (${counters} counters)`);
+      } catch (error) {
+        log(
+          '⚠️ Dashboard metrics reconciliation failed:',
+          error instanceof Error ? error.message : String(error)
+        );
+      }
+    });
+    log('📅 Dashboard metrics reconciliation scheduled (every 15 minutes)');
+
+    // Re-derive the last two days of the scan statistics rollup
+    cron.schedule('30 0 * * *', async () => {
+      try {
+        const since = new Date();
+        since.setDate(since.getDate() - 1);
+        const rows = await storage.rebuildScanDailyStats(since);
+        log(`📊 Scan statistics rollup rebuilt (${rows} portal-days)`);
+      } catch (error) {
+        log(
+          '⚠️ Scan statistics rollup rebuild failed:',
+          error instanceof Error ? error.message : String(error)
+        );
+      }
+    });
+    log('📅 Scan statistics rollup rebuild scheduled (daily at 00:30)');
+  }
+
   // Configure modular routes
   log('📝 Configuring routes...');
   configureRoutes(app);
@@ -341,6 +377,22 @@ app.use((req, res, next) => {
   websocketService.initialize(server);
   log('🔌 WebSocket server initialized on /ws');
 
+  // Share progress, scan and WebSocket events with the other instances
+  eventBus
+    .start()
+    .then(() => log(`📨 Event bus started (${eventBus.getStats().backend})`))
+    .catch(error => console.error('❌ Failed to start event bus:', error));
+
+  // Open browser sessions ahead of the first portal scan
+  if (process.env.BROWSERBASE_API_KEY) {
+    import('../src/mastra/tools/session-manager')
+      .then(({ sessionManager }) => sessionManager.warmPool())
+      .then(() => log('🌐 Browser session pool warmed'))
+      .catch(error =>
+        console.error('❌ Failed to warm browser session pool:', error)
+      );
+  }
+
   // Start stall detection monitoring in production
   if (process.env.NODE_ENV === 'production') {
     const { stallDetectionService } = await import(
@@ -357,6 +409,7 @@ app.use((req, res, next) => {
     try {
       // Shutdown WebSocket service
       websocketService.shutdown();
+      await eventBus.stop();
 
       // Shutdown progress trackers
       const { progressTracker } = await import(
@@ -393,6 +446,32 @@ app.use((req, res, next) => {
         // Service may not be initialized
       }
 
+      // Stop document extraction workers
+      const { documentExtractionPool } = await import(
+        './services/processing/documentExtractionPool'
+      );
+      await documentExtractionPool.shutdown();
+
+      // Close pooled browser sessions so they stop counting against quota
+      try {
+        const { sessionManager } = await import(
+          '../src/mastra/tools/session-manager'
+        );
+        await sessionManager.cleanup();
+      } catch {
+        // Service may not be initialized
+      }
+
+      // Stop agent pool scaling evaluators
+      try {
+        const { agentPoolManager } = await import(
+          '../src/mastra/coordination/agent-pool-manager'
+        );
+        agentPoolManager.shutdown();
+      } catch {
+        // Service may not be initialized
+      }
+
       // Shutdown SAFLA learning engine
       try {
         const { saflaLearningEngine } = await import(
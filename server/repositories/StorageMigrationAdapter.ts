@@ -16,6 +16,7 @@ import type {
   Notification,
   Scan,
 } from '@shared/schema';
+import type { RfpDetailPage, RfpDetailQuery } from '@shared/api/rfps';
 
 /**
  * Migration adapter that implements the legacy IStorage interface
@@ -109,8 +110,19 @@ export class StorageMigrationAdapter {
     return await this.repositories.rfps.findBySourceUrl(sourceUrl);
   }
 
-  async getRFPsWithDetails(): Promise<any[]> {
-    return await this.repositories.rfps.findWithPortalDetails();
+  /**
+   * RFPs with their portal, in a single page. The repository has no keyset
+   * paging or latest-proposal join, so limit and cursor are not supported.
+   */
+  async getRFPsWithDetails(options: RfpDetailQuery = {}): Promise<RfpDetailPage> {
+    if (options.limit !== undefined || options.cursor) {
+      throw new Error('Paged RFP details are not supported by the repository adapter');
+    }
+    const rows = await this.repositories.rfps.findWithPortalDetails();
+    return {
+      items: rows.map(row => ({ ...row, proposal: null })),
+      nextCursor: null,
+    };
   }
 
   async createRFP(rfp: InsertRFP): Promise<RFP> {
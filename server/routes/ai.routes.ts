@@ -13,6 +13,7 @@ const router = Router();
 // Zod schemas for AI API endpoints
 const AnalyzeRFPRequestSchema = z.object({
   rfpText: z.string().min(1).max(50000),
+  bypassCache: z.boolean().optional(),
 });
 
 const MapCompanyDataRequestSchema = z.object({
@@ -110,6 +111,7 @@ const GenerateProposalRequestSchema = z.object({
   proposalType: z
     .enum(['standard', 'technical', 'construction', 'professional_services'])
     .optional(),
+  bypassCache: z.boolean().optional(),
 });
 
 // AI Conversation Schemas
@@ -153,8 +155,10 @@ router.post('/analyze-rfp', async (req, res) => {
       });
     }
 
-    const { rfpText } = validationResult.data;
-    const analysis = await aiProposalService.analyzeRFPDocument(rfpText);
+    const { rfpText, bypassCache } = validationResult.data;
+    const analysis = await aiProposalService.analyzeRFPDocument(rfpText, {
+      bypassCache,
+    });
     res.json(analysis);
   } catch (error) {
     console.error('Error analyzing RFP document:', error);
@@ -222,10 +226,13 @@ router.post('/generate-proposal', async (req, res) => {
       });
     }
 
-    const { rfpText, companyProfileId, proposalType } = validationResult.data;
+    const { rfpText, companyProfileId, proposalType, bypassCache } =
+      validationResult.data;
 
     // Step 1: Analyze RFP document
-    const analysis = await aiProposalService.analyzeRFPDocument(rfpText);
+    const analysis = await aiProposalService.analyzeRFPDocument(rfpText, {
+      bypassCache,
+    });
 
     // Step 2: Get company profile and related data
     const companyProfile = await storage.getCompanyProfile(companyProfileId);
@@ -251,7 +258,8 @@ router.post('/generate-proposal', async (req, res) => {
     const proposalContent = await aiProposalService.generateProposalContent(
       analysis,
       companyMapping,
-      proposalType || 'standard'
+      proposalType || 'standard',
+      { bypassCache }
     );
 
     res.json({
@@ -16,7 +16,8 @@ const router = express.Router();
  */
 router.post('/start', async (req, res) => {
   try {
-    const { rfpId, sessionId, companyProfileId, priority } = req.body;
+    const { rfpId, sessionId, companyProfileId, priority, bypassCache } =
+      req.body;
 
     if (!rfpId || !sessionId) {
       return res.status(400).json({
@@ -31,6 +32,7 @@ router.post('/start', async (req, res) => {
       sessionId,
       companyProfileId,
       priority: priority || 5,
+      bypassCache: bypassCache === true,
     });
 
     res.json({
@@ -1,20 +1,45 @@
 import { Router } from 'express';
+import { z } from 'zod';
 import { storage } from '../storage';
+import { validateQuery } from '../middleware/zodValidation';
+import { decodeCursor } from '../utils/cursor';
 
 const router = Router();
 
+const getAuditLogsQuerySchema = z.object({
+  limit: z.coerce.number().int().min(1).max(500).default(100),
+  cursor: z
+    .string()
+    .refine(cursor => decodeCursor(cursor) !== null, 'Invalid cursor')
+    .optional(),
+});
+
 /**
- * Get audit logs for a specific entity
+ * Get audit logs for a specific entity, newest first. The body is one
+ * page; the cursor for the next page is sent in X-Next-Cursor.
  */
-router.get('/:entityType/:entityId', async (req, res) => {
-  try {
-    const { entityType, entityId } = req.params;
-    const logs = await storage.getAuditLogsByEntity(entityType, entityId);
-    res.json(logs);
-  } catch (error) {
-    console.error('Error fetching audit logs:', error);
-    res.status(500).json({ error: 'Failed to fetch audit logs' });
+router.get(
+  '/:entityType/:entityId',
+  validateQuery(getAuditLogsQuerySchema),
+  async (req, res) => {
+    try {
+      const { entityType, entityId } = req.params;
+      const { limit, cursor } = req.query as unknown as z.infer<
+        typeof getAuditLogsQuerySchema
+      >;
+      const page = await storage.getAuditLogsPage(entityType, entityId, {
+        limit,
+        cursor,
+      });
+      if (page.nextCursor) {
+        res.set('X-Next-Cursor', page.nextCursor);
+      }
+      res.json(page.items);
+    } catch (error) {
+      console.error('Error fetching audit logs:', error);
+      res.status(500).json({ error: 'Failed to fetch audit logs' });
+    }
   }
-});
+);
 
 export default router;
@@ -23,8 +23,11 @@ router.get('/status', async (req, res) => {
 router.post('/analyze/:rfpId', async (req, res) => {
   try {
     const { rfpId } = req.params;
-    const result =
-      await complianceIntegrationService.processRfpCompliance(rfpId);
+    const bypassCache = req.body?.bypassCache === true;
+    const result = await complianceIntegrationService.processRfpCompliance(
+      rfpId,
+      { bypassCache }
+    );
     res.json(result);
   } catch (error) {
     console.error('Error triggering compliance analysis:', error);
@@ -78,9 +81,10 @@ router.get('/rfp/:rfpId', async (req, res) => {
 router.post('/refresh/:rfpId', async (req, res) => {
   try {
     const { rfpId } = req.params;
+    const bypassCache = req.body?.bypassCache === true;
     const result = await complianceIntegrationService.processRfpCompliance(
       rfpId,
-      { force: true }
+      { force: true, bypassCache }
     );
     res.json({
       ...result,
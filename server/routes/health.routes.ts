@@ -97,6 +97,30 @@ router.get(
   })
 );
 
+/**
+ * Warm browser session pool
+ * GET /api/health/browser-sessions
+ */
+router.get(
+  '/browser-sessions',
+  handleAsyncError(async (req, res) => {
+    const { sessionManager } = await import(
+      '../../src/mastra/tools/session-manager'
+    );
+
+    return ApiResponse.success(
+      res,
+      {
+        timestamp: new Date().toISOString(),
+        pool: sessionManager.getPoolStats(),
+      },
+      {
+        message: 'Browser session pool statistics',
+      }
+    );
+  })
+);
+
 /**
  * Readiness probe for Kubernetes/Docker
  * GET /api/health/ready
@@ -1,5 +1,10 @@
 import { Router } from 'express';
 import { agentMonitoringService } from '../services/agents/agentMonitoringService';
+import { llmResponseCache } from '../services/core/llmResponseCache';
+import { getResponseCacheStats } from '../services/core/tieredResponseCache';
+import { websocketService } from '../services/core/websocketService';
+import { eventBus } from '../services/core/eventBus';
+import { progressTracker } from '../services/monitoring/progressTracker';
 
 const router = Router();
 
@@ -31,4 +36,47 @@ router.get('/system-health', async (req, res) => {
   }
 });
 
+/**
+ * Get AI response cache hit/miss counters (NL search parse cache, etc.)
+ */
+router.get('/cache-metrics', (req, res) => {
+  try {
+    res.json(getResponseCacheStats());
+  } catch (error) {
+    console.error('Error fetching cache metrics:', error);
+    res.status(500).json({ error: 'Failed to fetch cache metrics' });
+  }
+});
+
+/**
+ * Get LLM response cache hits, misses, bypasses and tokens saved per
+ * operation
+ */
+router.get('/llm-cache-metrics', (req, res) => {
+  try {
+    res.json(llmResponseCache.getStats());
+  } catch (error) {
+    console.error('Error fetching LLM cache metrics:', error);
+    res.status(500).json({ error: 'Failed to fetch LLM cache metrics' });
+  }
+});
+
+/**
+ * Get WebSocket and SSE fan-out counters (subscribers per channel,
+ * coalesced updates, clients dropped for falling behind) and the
+ * cross-instance event bus counters
+ */
+router.get('/fanout-metrics', (req, res) => {
+  try {
+    res.json({
+      websocket: websocketService.getStats(),
+      sse: progressTracker.getFanOutStats(),
+      bus: eventBus.getStats(),
+    });
+  } catch (error) {
+    console.error('Error fetching fan-out metrics:', error);
+    res.status(500).json({ error: 'Failed to fetch fan-out metrics' });
+  }
+});
+
 export default router;
@@ -92,8 +92,10 @@ router.get(
   '/rfp/:rfpId',
   handleAsyncError(async (req, res) => {
     const proposal = await storage.getProposalByRFP(req.params.rfpId);
-    // Return as array to match the expected format
-    const proposals = proposal ? [proposal] : [];
+    // Return as array to match the expected format. A draft kept after a
+    // failed generation only exists for a retry to resume, so it is hidden.
+    const proposals =
+      proposal && proposal.status !== 'generation_failed' ? [proposal] : [];
     res.json(proposals);
   })
 );
@@ -456,6 +458,7 @@ router.post(
         autoSubmit: options?.autoSubmit ?? false,
         generatePricing: options?.generatePricing ?? true,
         generateCompliance: options?.generateCompliance ?? true,
+        bypassCache: options?.bypassCache === true,
       });
 
     if (!pipelineResult.success) {
@@ -2,6 +2,7 @@ import { randomUUID } from 'crypto';
 import { Router } from 'express';
 import { z } from 'zod';
 import { insertRfpSchema, documents, rfps } from '@shared/schema';
+import { RFP_DETAIL_VIEWS } from '@shared/api/rfps';
 import { NaturalLanguageSearchRequestSchema } from '@shared/searchTypes';
 import { ObjectStorageService } from '../objectStorage';
 import { DocumentParsingService } from '../services/processing/documentParsingService';
@@ -15,6 +16,7 @@ import { analysisOrchestrator } from '../services/orchestrators/analysisOrchestr
 import { storage } from '../storage';
 import { validateSchema, validateQuery } from '../middleware/zodValidation';
 import { documentDownloadOrchestrator } from '../services/downloads/documentDownloadOrchestrator';
+import { decodeCursor } from '../utils/cursor';
 import { db } from '../db';
 import { eq } from 'drizzle-orm';
 
@@ -23,18 +25,53 @@ const objectStorageService = new ObjectStorageService();
 const documentService = new DocumentParsingService();
 const manualRfpService = new ManualRfpService();
 
-// Query validation schema for GET /api/rfps
-const getRfpsQuerySchema = z.object({
+const cursorParam = z
+  .string()
+  .refine(cursor => decodeCursor(cursor) !== null, 'Invalid cursor')
+  .optional();
+
+// Rejects a malformed cursor with a 400 before the query is sent to the LLM
+const naturalLanguageSearchBodySchema =
+  NaturalLanguageSearchRequestSchema.extend({ cursor: cursorParam });
+
+// Query validation schema for GET /api/rfps/count
+const countRfpsQuerySchema = z.object({
   status: z.string().optional(),
   portalId: z.string().uuid('Portal ID must be a valid UUID').optional(),
-  page: z.coerce.number().int().min(1).default(1),
-  limit: z.coerce.number().int().min(1).max(100).default(20),
   excludeDemo: z
     .string()
     .optional()
     .transform(val => val === 'true' || val === '1'),
 });
 
+// Query validation schema for GET /api/rfps
+const getRfpsQuerySchema = countRfpsQuerySchema.extend({
+  page: z.coerce.number().int().min(1).default(1),
+  limit: z.coerce.number().int().min(1).max(100).default(20),
+  // Pass the previous response's pagination.nextCursor to seek instead of
+  // using page; cursor requests skip the count unless includeTotal=true
+  cursor: cursorParam,
+  includeTotal: z
+    .enum(['true', 'false'])
+    .optional()
+    .transform(val => (val === undefined ? undefined : val === 'true')),
+});
+
+// Query validation schema for GET /api/rfps/detailed. Without limit or
+// cursor the endpoint returns every RFP, as it did before paging.
+const getRfpDetailsQuerySchema = z.object({
+  limit: z.coerce.number().int().min(1).max(500).optional(),
+  cursor: cursorParam,
+  view: z.enum(RFP_DETAIL_VIEWS).default('full'),
+  status: z.string().optional(),
+  q: z
+    .string()
+    .trim()
+    .max(200)
+    .optional()
+    .transform(val => val || undefined),
+});
+
 // Manual RFP Input Schema
 const ManualRfpInputSchema = z.object({
   url: z.string().url(),
@@ -46,27 +83,37 @@ const ManualRfpInputSchema = z.object({
  */
 router.get('/', validateQuery(getRfpsQuerySchema), async (req, res) => {
   try {
-    const { status, portalId, page, limit, excludeDemo } =
-      req.query as unknown as z.infer<typeof getRfpsQuerySchema>;
-    const offset = (page - 1) * limit;
-
-    const result = await storage.getAllRFPs({
+    const {
       status,
       portalId,
+      page,
       limit,
-      offset,
       excludeDemo,
-    });
+      cursor,
+      includeTotal = cursor === undefined,
+    } = req.query as unknown as z.infer<typeof getRfpsQuerySchema>;
+    const filters = { status, portalId, excludeDemo };
+
+    const [result, total] = await Promise.all([
+      storage.getRFPsPage({
+        ...filters,
+        limit,
+        cursor,
+        offset: (page - 1) * limit,
+      }),
+      includeTotal ? storage.countRFPs(filters) : null,
+    ]);
 
     // Return standardized paginated response
     res.json({
       success: true,
-      data: result.rfps,
+      data: result.items,
       pagination: {
-        total: result.total,
+        total,
         page,
         limit,
-        totalPages: Math.ceil(result.total / limit),
+        totalPages: total === null ? null : Math.ceil(total / limit),
+        nextCursor: result.nextCursor,
       },
     });
   } catch (error) {
@@ -80,18 +127,50 @@ router.get('/', validateQuery(getRfpsQuerySchema), async (req, res) => {
 });
 
 /**
- * Get detailed RFPs with compliance data
+ * Count RFPs matching the list filters, for callers paging by cursor
  */
-router.get('/detailed', async (req, res) => {
+router.get('/count', validateQuery(countRfpsQuerySchema), async (req, res) => {
   try {
-    const rfps = await storage.getRFPsWithDetails();
-    res.json(rfps);
+    const filters = req.query as unknown as z.infer<
+      typeof countRfpsQuerySchema
+    >;
+    const total = await storage.countRFPs(filters);
+    res.json({ success: true, data: { total } });
   } catch (error) {
-    console.error('Error fetching detailed RFPs:', error);
-    res.status(500).json({ error: 'Failed to fetch detailed RFPs' });
+    console.error('Error counting RFPs:', error);
+    res.status(500).json({
+      success: false,
+      error: 'Failed to count RFPs',
+      details: error instanceof Error ? error.message : 'Unknown error',
+    });
   }
 });
 
+/**
+ * Get detailed RFPs with compliance data. Pass limit and/or cursor to page;
+ * the body is the page's items and the cursor for the next page is sent
+ * in X-Next-Cursor. With neither, all RFPs are returned.
+ */
+router.get(
+  '/detailed',
+  validateQuery(getRfpDetailsQuerySchema),
+  async (req, res) => {
+    try {
+      const query = req.query as unknown as z.infer<
+        typeof getRfpDetailsQuerySchema
+      >;
+      const page = await storage.getRFPsWithDetails(query);
+      if (page.nextCursor) {
+        res.set('X-Next-Cursor', page.nextCursor);
+      }
+      res.json(page.items);
+    } catch (error) {
+      console.error('Error fetching detailed RFPs:', error);
+      res.status(500).json({ error: 'Failed to fetch detailed RFPs' });
+    }
+  }
+);
+
 /**
  * Get a specific RFP by ID
  */
@@ -629,11 +708,20 @@ router.post('/:id/download-documents', async (req, res) => {
       for (const doc of results) {
         if (doc.downloadStatus === 'completed' && doc.storagePath) {
           try {
+            const existingDoc = doc.contentHash
+              ? await storage.getDocumentByContentHash(id, doc.contentHash)
+              : undefined;
+            if (existingDoc) {
+              savedDocuments.push(existingDoc);
+              continue;
+            }
+
             const savedDoc = await storage.createDocument({
               rfpId: id,
               filename: doc.name,
               fileType: 'application/pdf',
               objectPath: doc.storagePath,
+              contentHash: doc.contentHash,
             });
             savedDocuments.push(savedDoc);
           } catch (error) {
@@ -909,12 +997,14 @@ router.post('/:id/rescrape', async (req, res) => {
  */
 router.post('/search/natural', async (req, res) => {
   try {
-    const validated = NaturalLanguageSearchRequestSchema.parse(req.body);
+    const validated = naturalLanguageSearchBodySchema.parse(req.body);
 
     const searchService = getNaturalLanguageSearchService(storage);
     const result = await searchService.search(validated.query, {
       limit: validated.limit,
       offset: validated.offset,
+      cursor: validated.cursor,
+      countMode: validated.countMode,
     });
 
     res.json({
@@ -1,7 +1,13 @@
-import { Router } from 'express';
+import { Router, type Request, type Response } from 'express';
+import type { Scan } from '@shared/schema';
 import { storage } from '../storage';
 import { scanManager } from '../services/portals/scan-manager';
+import {
+  scanEventWriter,
+  type LiveScanEvent,
+} from '../services/portals/scanEventWriter';
 import { PortalMonitoringService } from '../services/monitoring/portal-monitoring-service';
+import { decodeCursor } from '../utils/cursor';
 
 const router = Router();
 const portalMonitoringService = new PortalMonitoringService(storage);
@@ -183,6 +189,130 @@ router.get('/stream', async (req, res) => {
   }
 });
 
+// How often a quiet incremental scan stream re-reads the scan's status, and
+// how long it may go without any event before it is closed
+const SCAN_STREAM_RECHECK_MS = 30 * 1000;
+const SCAN_STREAM_IDLE_TIMEOUT_MS = 10 * 60 * 1000;
+
+const isTerminalScanEvent = (type: string) =>
+  type === 'scan_completed' || type === 'scan_failed';
+
+/**
+ * Stream an incremental scan (persisted in the scans table) from the
+ * in-memory scan event writer. The stream subscribes before reading the
+ * scan, so a scan that finishes in between is still reported, and a quiet
+ * stream re-reads the scan in case its terminal event went missing.
+ */
+async function streamIncrementalScan(
+  scanId: string,
+  req: Request,
+  res: Response
+) {
+  // Events that arrive before the initial state is written wait here
+  let pending: LiveScanEvent[] | null = [];
+  let closed = false;
+  let lastEventAt = Date.now();
+  let recheckTimer: NodeJS.Timeout | null = null;
+
+  const close = () => {
+    if (closed) return;
+    closed = true;
+    unsubscribe();
+    if (recheckTimer) clearTimeout(recheckTimer);
+    res.end();
+  };
+
+  const send = (event: any) => {
+    if (closed) return;
+    lastEventAt = Date.now();
+    res.write(`data: ${JSON.stringify(event)}\n\n`);
+    if (isTerminalScanEvent(event.type)) close();
+  };
+
+  const sendFinalStatus = (scan: Scan) =>
+    send({
+      type: scan.status === 'completed' ? 'scan_completed' : 'scan_failed',
+      timestamp: scan.completedAt || new Date(),
+      data: { scanId: scan.id, errors: scan.errors },
+    });
+
+  const unsubscribe = scanEventWriter.subscribe(scanId, event => {
+    if (pending) {
+      pending.push(event);
+    } else {
+      send(event);
+    }
+  });
+
+  const scheduleRecheck = () => {
+    recheckTimer = setTimeout(async () => {
+      if (closed) return;
+      try {
+        const latest = await storage.getScan(scanId);
+        if (!latest || latest.status !== 'running') {
+          if (latest) sendFinalStatus(latest);
+          close();
+          return;
+        }
+      } catch (error) {
+        console.error(`Error re-checking scan ${scanId}:`, error);
+      }
+
+      if (Date.now() - lastEventAt >= SCAN_STREAM_IDLE_TIMEOUT_MS) {
+        send({ type: 'stream_idle_timeout', timestamp: new Date() });
+        close();
+        return;
+      }
+      scheduleRecheck();
+    }, SCAN_STREAM_RECHECK_MS);
+  };
+
+  req.on('close', close);
+
+  const scan = await storage.getScan(scanId).catch(error => {
+    unsubscribe();
+    throw error;
+  });
+  // The client may have gone while the scan was read
+  if (closed) return;
+  if (!scan) {
+    closed = true;
+    unsubscribe();
+    return res.status(404).json({ error: 'Scan not found' });
+  }
+
+  res.writeHead(200, {
+    'Content-Type': 'text/event-stream',
+    'Cache-Control': 'no-cache',
+    Connection: 'keep-alive',
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Headers': 'Cache-Control',
+  });
+
+  send({
+    type: 'initial_state',
+    data: {
+      scanId: scan.id,
+      portalId: scan.portalId,
+      portalName: scan.portalName,
+      status: scan.status,
+      currentStep: scan.currentStep,
+      currentProgress: scan.currentProgress,
+      startedAt: scan.startedAt,
+    },
+  });
+
+  const buffered = pending;
+  pending = null;
+  buffered.forEach(send);
+
+  if (scan.status !== 'running') {
+    sendFinalStatus(scan);
+    return;
+  }
+  if (!closed) scheduleRecheck();
+}
+
 /**
  * SSE endpoint for real-time scan streaming
  * GET /api/scans/:scanId/stream
@@ -193,7 +323,7 @@ router.get('/:scanId/stream', async (req, res) => {
 
     const scan = scanManager.getScan(scanId);
     if (!scan) {
-      return res.status(404).json({ error: 'Scan not found' });
+      return streamIncrementalScan(scanId, req, res);
     }
 
     // Set SSE headers
@@ -310,10 +440,23 @@ router.get('/:scanId/details', async (req, res) => {
 /**
  * Get scan history with filtering and pagination
  * GET /api/scans/history?portalName=X&status=completed&limit=20&offset=0
+ *
+ * Pass nextCursor back as `cursor` to page without OFFSET; cursor requests
+ * skip the total unless includeTotal=true.
  */
 router.get('/history', async (req, res) => {
   try {
-    const { portalName, status, limit = '50', offset = '0' } = req.query;
+    const {
+      portalName,
+      status,
+      limit = '50',
+      offset = '0',
+      cursor,
+      includeTotal,
+    } = req.query;
+    if (cursor !== undefined && decodeCursor(String(cursor)) === null) {
+      return res.status(400).json({ error: 'Invalid cursor' });
+    }
 
     const filter = {
       portalName: portalName as string | undefined,
@@ -326,19 +469,25 @@ router.get('/history', async (req, res) => {
         | undefined,
       limit: parseInt(limit as string, 10),
       offset: parseInt(offset as string, 10),
+      cursor: cursor === undefined ? undefined : String(cursor),
     };
+    const withTotal =
+      includeTotal === undefined ? cursor === undefined : includeTotal === 'true';
 
     const { scanHistoryService } = await import(
       '../services/monitoring/scanHistoryService'
     );
 
-    const scans = await scanHistoryService.getScanHistory(filter);
-    const total = await scanHistoryService.getScanHistoryCount(filter);
+    const [page, total] = await Promise.all([
+      scanHistoryService.getScanHistoryPage(filter),
+      withTotal ? scanHistoryService.getScanHistoryCount(filter) : null,
+    ]);
 
     res.json({
-      scans,
+      scans: page.items,
       total,
-      hasMore: filter.offset + scans.length < total,
+      hasMore: page.nextCursor !== null,
+      nextCursor: page.nextCursor,
     });
   } catch (error) {
     console.error('Error fetching scan history:', error);
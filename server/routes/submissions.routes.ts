@@ -2,6 +2,7 @@ import { Router } from 'express';
 import { z } from 'zod';
 import { submissionService } from '../services/core/submissionService';
 import { storage } from '../storage';
+import { decodeCursor } from '../utils/cursor';
 
 const router = Router();
 
@@ -273,10 +274,12 @@ router.post('/', async (req, res) => {
  * GET /api/submissions
  *
  * Returns a list of submissions with optional filtering and pagination.
+ * Pass data.nextCursor back as `cursor` to page without OFFSET; cursor
+ * requests skip the total unless includeTotal=true.
  */
 router.get('/', async (req, res) => {
   try {
-    const { status, limit, offset, rfpId } = req.query;
+    const { status, limit, offset, rfpId, cursor, includeTotal } = req.query;
 
     // Validate query parameters
     const limitNum = limit ? parseInt(String(limit), 10) : 100;
@@ -298,30 +301,49 @@ router.get('/', async (req, res) => {
       });
     }
 
-    // Get submissions from storage
-    let submissions;
+    if (cursor !== undefined && decodeCursor(String(cursor)) === null) {
+      return res.status(400).json({
+        success: false,
+        error: 'Invalid cursor',
+      });
+    }
+
+    // A single RFP has few submissions; page those in memory
     if (rfpId && typeof rfpId === 'string') {
-      submissions = await storage.getSubmissionsByRFP(rfpId);
-    } else {
-      submissions = await storage.getSubmissions({
-        limit: limitNum,
-        status: status as string | undefined,
+      const submissions = await storage.getSubmissionsByRFP(rfpId);
+      return res.json({
+        success: true,
+        data: {
+          submissions: submissions.slice(offsetNum, offsetNum + limitNum),
+          total: submissions.length,
+          limit: limitNum,
+          offset: offsetNum,
+          nextCursor: null,
+        },
       });
     }
 
-    // Apply pagination if not already applied by storage
-    const paginatedSubmissions = submissions.slice(
-      offsetNum,
-      offsetNum + limitNum
-    );
+    const statusFilter = typeof status === 'string' ? status : undefined;
+    const withTotal =
+      includeTotal === undefined ? cursor === undefined : includeTotal === 'true';
+    const [page, total] = await Promise.all([
+      storage.getSubmissionsPage({
+        status: statusFilter,
+        limit: limitNum,
+        cursor: cursor === undefined ? undefined : String(cursor),
+        offset: offsetNum,
+      }),
+      withTotal ? storage.countSubmissions({ status: statusFilter }) : null,
+    ]);
 
     res.json({
       success: true,
       data: {
-        submissions: paginatedSubmissions,
-        total: submissions.length,
+        submissions: page.items,
+        total,
         limit: limitNum,
         offset: offsetNum,
+        nextCursor: page.nextCursor,
       },
     });
   } catch (error) {
@@ -53,6 +53,19 @@ router.get('/phase-stats', async (req, res) => {
   }
 });
 
+/**
+ * Get work item queue depth, throughput and claim latency
+ */
+router.get('/queue-metrics', async (req, res) => {
+  try {
+    const metrics = await workflowCoordinator.getWorkItemQueueMetrics();
+    res.json(metrics);
+  } catch (error) {
+    console.error('Error fetching work item queue metrics:', error);
+    res.status(500).json({ error: 'Failed to fetch work item queue metrics' });
+  }
+});
+
 /**
  * Get workflow status by ID
  */
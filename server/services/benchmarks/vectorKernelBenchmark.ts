@@ -0,0 +1,260 @@
+import {
+  VectorMatrix,
+  kMeans,
+  normalizeVector,
+  scoreAll,
+  selectTopK,
+} from '../learning/vectorKernel';
+
+/**
+ * Vector Kernel Micro-benchmark
+ *
+ * Compares the contiguous Float32Array kernel against the previous approach
+ * (number[][] embeddings, per-document cosineSimilarity, full sort) for
+ * top-k similarity search and k-means clustering (k-means++ seeding plus a
+ * fixed number of Lloyd iterations).
+ *
+ * Run with: npm run bench:vectors
+ * Sizes and dimensions can be overridden with VECTOR_BENCH_SIZES=10000,100000
+ * and VECTOR_BENCH_DIMENSIONS=512.
+ */
+
+export interface VectorBenchmarkOptions {
+  sizes?: number[];
+  dimensions?: number;
+  queries?: number;
+  topK?: number;
+  clusters?: number;
+  kMeansIterations?: number;
+}
+
+export interface VectorBenchmarkResult {
+  vectors: number;
+  dimensions: number;
+  topK: {
+    baselineMs: number;
+    kernelMs: number;
+    speedup: number;
+  };
+  kMeans: {
+    baselineMs: number;
+    kernelMs: number;
+    speedup: number;
+  };
+}
+
+// Deterministic generator so runs are comparable
+function createRandom(seed: number): () => number {
+  let state = seed;
+  return () => {
+    state = (state * 1664525 + 1013904223) % 4294967296;
+    return state / 4294967296;
+  };
+}
+
+function randomVectors(
+  count: number,
+  dimensions: number,
+  random: () => number
+): number[][] {
+  return Array.from({ length: count }, () =>
+    Array.from({ length: dimensions }, () => random() * 2 - 1)
+  );
+}
+
+// Previous MLModelIntegration implementation, kept here as the baseline
+function baselineCosineSimilarity(a: number[], b: number[]): number {
+  let dotProduct = 0;
+  let normA = 0;
+  let normB = 0;
+  for (let i = 0; i < a.length; i++) {
+    dotProduct += a[i] * b[i];
+    normA += a[i] * a[i];
+    normB += b[i] * b[i];
+  }
+  return dotProduct / (Math.sqrt(normA) * Math.sqrt(normB));
+}
+
+function baselineTopK(query: number[], documents: number[][], k: number) {
+  const results: Array<{ index: number; similarity: number }> = [];
+  for (let i = 0; i < documents.length; i++) {
+    results.push({
+      index: i,
+      similarity: baselineCosineSimilarity(query, documents[i]),
+    });
+  }
+  results.sort((a, b) => b.similarity - a.similarity);
+  return results.slice(0, k);
+}
+
+// Previous MLModelIntegration.kMeansClustering, kept here as the baseline
+function baselineKMeans(
+  embeddings: number[][],
+  k: number,
+  maxIterations: number,
+  random: () => number
+): number[] {
+  const n = embeddings.length;
+  const euclideanDistance = (a: number[], b: number[]): number =>
+    Math.sqrt(a.reduce((sum, val, i) => sum + Math.pow(val - b[i], 2), 0));
+  const calculateMean = (vectors: number[][]): number[] => {
+    const mean = new Array(vectors[0].length).fill(0);
+    vectors.forEach(vec => {
+      vec.forEach((val, i) => {
+        mean[i] += val / vectors.length;
+      });
+    });
+    return mean;
+  };
+
+  const centroids: number[][] = [[...embeddings[Math.floor(random() * n)]]];
+  for (let i = 1; i < k; i++) {
+    const distances = embeddings.map(point =>
+      Math.min(...centroids.map(c => Math.pow(euclideanDistance(point, c), 2)))
+    );
+    let threshold = random() * distances.reduce((sum, d) => sum + d, 0);
+    let selectedIdx = 0;
+    for (let j = 0; j < distances.length; j++) {
+      threshold -= distances[j];
+      if (threshold <= 0) {
+        selectedIdx = j;
+        break;
+      }
+    }
+    centroids.push([...embeddings[selectedIdx]]);
+  }
+
+  const assignments = new Array(n).fill(-1);
+  for (let iteration = 0; iteration < maxIterations; iteration++) {
+    for (let i = 0; i < n; i++) {
+      let minDist = Infinity;
+      for (let j = 0; j < k; j++) {
+        const dist = euclideanDistance(embeddings[i], centroids[j]);
+        if (dist < minDist) {
+          minDist = dist;
+          assignments[i] = j;
+        }
+      }
+    }
+    for (let j = 0; j < k; j++) {
+      const clusterPoints = embeddings.filter((_, i) => assignments[i] === j);
+      if (clusterPoints.length > 0) {
+        centroids[j] = calculateMean(clusterPoints);
+      }
+    }
+  }
+  return assignments;
+}
+
+function time(
+  fn: () => void,
+  repetitions: number,
+  warmUp: () => void = fn
+): number {
+  warmUp(); // Let the JIT optimize before measuring
+  const start = process.hrtime.bigint();
+  for (let i = 0; i < repetitions; i++) {
+    fn();
+  }
+  return Number(process.hrtime.bigint() - start) / 1e6 / repetitions;
+}
+
+export function runVectorKernelBenchmark(
+  options?: VectorBenchmarkOptions
+): VectorBenchmarkResult[] {
+  const sizes = options?.sizes ?? [10000, 100000];
+  const dimensions = options?.dimensions ?? 512;
+  const queries = options?.queries ?? 5;
+  const k = options?.topK ?? 10;
+  const numClusters = options?.clusters ?? 10;
+  const iterations = options?.kMeansIterations ?? 5;
+  const random = createRandom(42);
+
+  return sizes.map(size => {
+    const documents = randomVectors(size, dimensions, random);
+    const queryVectors = randomVectors(queries, dimensions, random);
+
+    const matrix = VectorMatrix.from(documents, dimensions);
+    const normalizedQueries = queryVectors.map(normalizeVector);
+    const scores = new Float32Array(size);
+
+    const topKBaseline = time(() => {
+      for (const query of queryVectors) baselineTopK(query, documents, k);
+    }, 1);
+    const topKKernel = time(() => {
+      for (const query of normalizedQueries) {
+        selectTopK(scoreAll(matrix, query, scores), k);
+      }
+    }, 3);
+
+    // Both implementations cluster the same unit vectors. Warm-up runs on a
+    // small slice since a full run at 100k takes seconds.
+    const unitDocuments = documents.map(vector =>
+      Array.from(normalizeVector(vector))
+    );
+    const warmUpDocuments = unitDocuments.slice(0, 1000);
+    const warmUpMatrix = VectorMatrix.from(warmUpDocuments, dimensions);
+    const kMeansBaseline = time(
+      () =>
+        baselineKMeans(
+          unitDocuments,
+          numClusters,
+          iterations,
+          createRandom(7)
+        ),
+      1,
+      () =>
+        baselineKMeans(
+          warmUpDocuments,
+          numClusters,
+          iterations,
+          createRandom(7)
+        )
+    );
+    const kMeansKernel = time(
+      () =>
+        kMeans(matrix, numClusters, {
+          maxIterations: iterations,
+          random: createRandom(7),
+        }),
+      1,
+      () =>
+        kMeans(warmUpMatrix, numClusters, {
+          maxIterations: iterations,
+          random: createRandom(7),
+        })
+    );
+
+    return {
+      vectors: size,
+      dimensions,
+      topK: {
+        baselineMs: topKBaseline / queries,
+        kernelMs: topKKernel / queries,
+        speedup: topKBaseline / topKKernel,
+      },
+      kMeans: {
+        baselineMs: kMeansBaseline,
+        kernelMs: kMeansKernel,
+        speedup: kMeansBaseline / kMeansKernel,
+      },
+    };
+  });
+}
+
+if (import.meta.url === `file://${process.argv[1]}`) {
+  const sizes = process.env.VECTOR_BENCH_SIZES?.split(',').map(Number);
+  const dimensions = Number(process.env.VECTOR_BENCH_DIMENSIONS) || undefined;
+
+  for (const result of runVectorKernelBenchmark({ sizes, dimensions })) {
+    console.log(
+      `📐 ${result.vectors.toLocaleString()} x ${result.dimensions} vectors`
+    );
+    console.log(
+      `   top-k search:      ${result.topK.baselineMs.toFixed(1)}ms -> ${result.topK.kernelMs.toFixed(1)}ms per query (${result.topK.speedup.toFixed(1)}x)`
+    );
+    console.log(
+      `   k-means:           ${result.kMeans.baselineMs.toFixed(0)}ms -> ${result.kMeans.kernelMs.toFixed(0)}ms (${result.kMeans.speedup.toFixed(1)}x)`
+    );
+  }
+}
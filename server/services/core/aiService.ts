@@ -4,6 +4,13 @@ import type { RFP } from '@shared/schema';
 import OpenAI from 'openai';
 import { storage } from '../../storage';
 import { circuitBreakerManager } from './circuitBreaker';
+import { type LLMCacheOptions, llmResponseCache } from './llmResponseCache';
+import {
+  proposalSectionStreamer,
+  settleFailedDraft,
+  type ProposalGenerationDraft,
+  type ProposalSectionSpec,
+} from '../proposals/proposalSectionStreamer';
 
 // OpenAI client will be initialized lazily
 let openai: OpenAI | null = null;
@@ -318,7 +325,8 @@ export class AIService {
 
   async analyzeDocumentCompliance(
     documentText: string,
-    rfpContext: any
+    rfpContext: any,
+    options: LLMCacheOptions = {}
   ): Promise<any> {
     if (!this.checkApiKeyAvailable()) {
       console.warn(
@@ -385,49 +393,74 @@ Document text:
 ${documentText}
 `;
 
-      // Execute OpenAI call with circuit breaker protection
-      const response = await analysisCircuit.execute(
-        () =>
-          getOpenAI().chat.completions.create({
-            model: process.env.OPENAI_MODEL || 'gpt-5',
-            messages: [{ role: 'user', content: prompt }],
-            response_format: { type: 'json_object' },
-          }),
-        () => {
-          // Fallback when circuit is open
-          console.warn(
-            'Circuit breaker OPEN for document analysis - using basic compliance'
+      const model = process.env.OPENAI_MODEL || 'gpt-5';
+      const result = await llmResponseCache.getOrCompute(
+        {
+          operation: 'analyze-compliance',
+          model,
+          templateVersion: '1',
+          input: [
+            documentText,
+            rfpContext?.title || 'Unknown',
+            rfpContext?.agency || 'Unknown',
+          ],
+          bypassCache: options.bypassCache,
+        },
+        async () => {
+          let fellBack = false;
+
+          // Execute OpenAI call with circuit breaker protection
+          const response = await analysisCircuit.execute(
+            () =>
+              getOpenAI().chat.completions.create({
+                model,
+                messages: [{ role: 'user', content: prompt }],
+                response_format: { type: 'json_object' },
+              }),
+            () => {
+              // Fallback when circuit is open
+              fellBack = true;
+              console.warn(
+                'Circuit breaker OPEN for document analysis - using basic compliance'
+              );
+              return {
+                choices: [
+                  {
+                    message: {
+                      content: JSON.stringify({
+                        requirements: [],
+                        complianceItems: [],
+                        riskFlags: [],
+                        mandatoryFields: [],
+                      }),
+                    },
+                  },
+                ],
+              } as any;
+            }
           );
+
+          const content = response.choices[0].message.content;
+          const analysis = content ? JSON.parse(content) : null;
+
+          // Ensure the result has the expected structure
+          if (analysis) {
+            analysis.requirements = analysis.requirements || [];
+            analysis.complianceItems =
+              analysis.complianceItems || analysis.mandatoryFields || [];
+            analysis.riskFlags = analysis.riskFlags || [];
+            analysis.mandatoryFields =
+              analysis.mandatoryFields || analysis.complianceItems || [];
+          }
+
           return {
-            choices: [
-              {
-                message: {
-                  content: JSON.stringify({
-                    requirements: [],
-                    complianceItems: [],
-                    riskFlags: [],
-                    mandatoryFields: [],
-                  }),
-                },
-              },
-            ],
-          } as any;
+            value: analysis,
+            tokens: response.usage?.total_tokens,
+            cacheable: !fellBack,
+          };
         }
       );
 
-      const content = response.choices[0].message.content;
-      const result = content ? JSON.parse(content) : null;
-
-      // Ensure the result has the expected structure
-      if (result) {
-        result.requirements = result.requirements || [];
-        result.complianceItems =
-          result.complianceItems || result.mandatoryFields || [];
-        result.riskFlags = result.riskFlags || [];
-        result.mandatoryFields =
-          result.mandatoryFields || result.complianceItems || [];
-      }
-
       return result;
     } catch (error) {
       console.error('Error analyzing document compliance:', error);
@@ -457,6 +490,8 @@ ${documentText}
       return;
     }
 
+    // Set when this run creates the draft, so a failure can settle it
+    let createdProposalId: string | null = null;
     try {
       // Get related documents for context
       const documents = await storage.getDocumentsByRFP(rfp.id);
@@ -464,10 +499,23 @@ ${documentText}
         .map(doc => doc.extractedText)
         .join('\n\n');
 
+      // Sections are checkpointed into the proposal's generation draft as
+      // they stream in; its live content is only replaced once all succeed
+      let proposal = await storage.getProposalByRFP(rfp.id);
+      if (!proposal) {
+        proposal = await storage.createProposal({
+          rfpId: rfp.id,
+          content: {},
+          status: 'draft',
+        });
+        createdProposalId = proposal.id;
+      }
+
       // Generate proposal content
       const proposalContent = await this.generateProposalContent(
         rfp,
-        documentContext
+        documentContext,
+        proposal
       );
 
       // Generate pricing
@@ -476,25 +524,13 @@ ${documentText}
         documentContext
       );
 
-      // Create or update proposal
-      const existingProposal = await storage.getProposalByRFP(rfp.id);
-
-      if (existingProposal) {
-        await storage.updateProposal(existingProposal.id, {
-          content: proposalContent,
-          pricingTables,
-          status: 'review',
-          estimatedMargin: pricingTables?.defaultMargin || '40.00',
-        });
-      } else {
-        await storage.createProposal({
-          rfpId: rfp.id,
-          content: proposalContent,
-          pricingTables,
-          status: 'review',
-          estimatedMargin: pricingTables?.defaultMargin || '40.00',
-        });
-      }
+      await storage.updateProposal(proposal.id, {
+        content: proposalContent,
+        pricingTables,
+        status: 'review',
+        estimatedMargin: pricingTables?.defaultMargin || '40.00',
+        generationDraft: null,
+      });
 
       // Update RFP status
       await storage.updateRFP(rfp.id, {
@@ -535,6 +571,11 @@ ${documentText}
         captureException(error);
       });
 
+      // Keep the draft this run created only if a retry can resume it
+      if (createdProposalId) {
+        await settleFailedDraft(createdProposalId);
+      }
+
       // Update RFP status to indicate error
       await storage.updateRFP(rfp.id, {
         status: 'discovered',
@@ -552,22 +593,59 @@ ${documentText}
     }
   }
 
+  private readonly proposalSections: ProposalSectionSpec[] = [
+    {
+      key: 'executiveSummary',
+      title: 'Executive Summary',
+      instructions:
+        'Summarize why we are the right choice for this contract and what we will deliver.',
+    },
+    {
+      key: 'companyOverview',
+      title: 'Company Overview',
+      instructions:
+        'Describe the company, its history and its capabilities relevant to this RFP.',
+    },
+    {
+      key: 'technicalApproach',
+      title: 'Technical Approach',
+      instructions:
+        'Explain how the work will be performed, including methods, logistics and quality control.',
+    },
+    {
+      key: 'projectTeam',
+      title: 'Project Team',
+      instructions: 'Describe the team, roles and responsibilities.',
+    },
+    {
+      key: 'timeline',
+      title: 'Timeline',
+      instructions: 'Lay out the delivery schedule with phases and milestones.',
+    },
+    {
+      key: 'qualifications',
+      title: 'Qualifications',
+      instructions:
+        'List certifications, licenses and past performance that qualify us for this work.',
+    },
+    {
+      key: 'references',
+      title: 'References',
+      instructions: 'Describe relevant references and comparable contracts.',
+    },
+  ];
+
+  /**
+   * Write the proposal sections one at a time, streaming each into the
+   * proposal row and to the proposals page as it is generated
+   */
   private async generateProposalContent(
     rfp: RFP,
-    documentContext: string
-  ): Promise<any> {
-    const prompt = `
+    documentContext: string,
+    proposal: { id: string; generationDraft: unknown }
+  ): Promise<Record<string, string>> {
+    const contextPrompt = `
 Generate a comprehensive, professional proposal response for this RFP.
-Respond with JSON in this format:
-{
-  "executiveSummary": "string",
-  "companyOverview": "string", 
-  "technicalApproach": "string",
-  "projectTeam": "string",
-  "timeline": "string",
-  "qualifications": "string",
-  "references": "string"
-}
 
 RFP Details:
 Title: ${rfp.title}
@@ -582,42 +660,40 @@ Focus on water supply expertise, compliance with government regulations, and pro
 Use professional language suitable for government procurement.
 `;
 
-    // Execute OpenAI call with circuit breaker protection
-    const response = await generationCircuit.execute(
-      () =>
-        getOpenAI().chat.completions.create({
-          model: process.env.OPENAI_MODEL || 'gpt-5',
-          messages: [{ role: 'user', content: prompt }],
-          response_format: { type: 'json_object' },
-        }),
-      () => {
-        // Fallback when circuit is open
-        console.warn(
-          'Circuit breaker OPEN for proposal generation - using template'
-        );
-        return {
-          choices: [
-            {
-              message: {
-                content: JSON.stringify({
-                  executiveSummary:
-                    'Circuit breaker active - please retry later',
-                  companyOverview: '',
-                  technicalApproach: '',
-                  projectTeam: '',
-                  timeline: '',
-                  qualifications: '',
-                  references: '',
-                }),
-              },
-            },
-          ],
-        } as any;
-      }
+    return proposalSectionStreamer.streamSections({
+      proposalId: proposal.id,
+      rfpId: rfp.id,
+      systemPrompt:
+        'You are an expert proposal writer for government procurement.',
+      contextPrompt,
+      sections: this.proposalSections,
+      existingDraft: proposal.generationDraft as ProposalGenerationDraft | null,
+      stream: prompt => this.streamCompletion(prompt),
+    });
+  }
+
+  /**
+   * Stream completion text; the circuit breaker guards opening the stream
+   */
+  private async *streamCompletion(prompt: {
+    system: string;
+    user: string;
+  }): AsyncGenerator<string> {
+    const stream = await generationCircuit.execute(() =>
+      getOpenAI().chat.completions.create({
+        model: process.env.OPENAI_MODEL || 'gpt-5',
+        messages: [
+          { role: 'system', content: prompt.system },
+          { role: 'user', content: prompt.user },
+        ],
+        stream: true,
+      })
     );
 
-    const content = response.choices[0].message.content;
-    return content ? JSON.parse(content) : null;
+    for await (const chunk of stream) {
+      const delta = chunk.choices[0]?.delta?.content;
+      if (delta) yield delta;
+    }
   }
 
   private async generatePricingTables(
@@ -697,7 +773,8 @@ Target 40% gross margin. Be competitive but profitable.
 
   async extractRFPDetails(
     scrapedContent: string,
-    sourceUrl: string
+    sourceUrl: string,
+    options: LLMCacheOptions = {}
   ): Promise<any> {
     if (!this.checkApiKeyAvailable()) {
       console.warn('OpenAI API key not available - using basic RFP extraction');
@@ -742,34 +819,52 @@ Source URL: ${sourceUrl}
 Content: ${scrapedContent}
 `;
 
-      // Execute OpenAI call with circuit breaker protection
-      const response = await analysisCircuit.execute(
-        () =>
-          getOpenAI().chat.completions.create({
-            model: process.env.OPENAI_MODEL || 'gpt-5',
-            messages: [{ role: 'user', content: prompt }],
-            response_format: { type: 'json_object' },
-          }),
-        () => {
-          // Fallback when circuit is open
-          console.warn(
-            'Circuit breaker OPEN for RFP extraction - returning null'
+      const model = process.env.OPENAI_MODEL || 'gpt-5';
+      const result = await llmResponseCache.getOrCompute(
+        {
+          operation: 'extract-rfp-details',
+          model,
+          templateVersion: '1',
+          input: [sourceUrl, scrapedContent],
+          bypassCache: options.bypassCache,
+        },
+        async () => {
+          // Execute OpenAI call with circuit breaker protection
+          const response = await analysisCircuit.execute(
+            () =>
+              getOpenAI().chat.completions.create({
+                model,
+                messages: [{ role: 'user', content: prompt }],
+                response_format: { type: 'json_object' },
+              }),
+            () => {
+              // Fallback when circuit is open
+              console.warn(
+                'Circuit breaker OPEN for RFP extraction - returning null'
+              );
+              return null;
+            }
           );
-          return null;
-        }
-      );
 
-      if (!response) return null;
+          // Null results (fallback, empty response) are not cached
+          if (!response) return { value: null };
 
-      const content = response.choices[0].message.content;
-      if (!content) return null;
+          const content = response.choices[0].message.content;
+          if (!content) return { value: null };
 
-      const result = JSON.parse(content);
+          const extracted = JSON.parse(content);
 
-      // Ensure confidence score exists
-      if (result && result.title && !result.confidence) {
-        result.confidence = 0.6; // Default moderate confidence
-      }
+          // Ensure confidence score exists
+          if (extracted && extracted.title && !extracted.confidence) {
+            extracted.confidence = 0.6; // Default moderate confidence
+          }
+
+          return {
+            value: extracted,
+            tokens: response.usage?.total_tokens,
+          };
+        }
+      );
 
       return result && result.title ? result : null;
     } catch (error) {
@@ -781,39 +876,62 @@ Content: ${scrapedContent}
   /**
    * Generate content using OpenAI
    */
-  async generateContent(prompt: string): Promise<string> {
+  async generateContent(
+    prompt: string,
+    options: LLMCacheOptions = {}
+  ): Promise<string> {
     if (!this.checkApiKeyAvailable()) {
       console.warn('OpenAI API key not available - returning empty response');
       return '';
     }
 
     try {
-      // Execute OpenAI call with circuit breaker protection
-      const response = await generationCircuit.execute(
-        () =>
-          getOpenAI().chat.completions.create({
-            model: process.env.OPENAI_MODEL || 'gpt-5',
-            messages: [{ role: 'user', content: prompt }],
-          }),
-        () => {
-          // Fallback when circuit is open
-          console.warn(
-            'Circuit breaker OPEN for content generation - returning fallback'
+      const model = process.env.OPENAI_MODEL || 'gpt-5';
+      return await llmResponseCache.getOrCompute(
+        {
+          operation: 'generate-content',
+          model,
+          templateVersion: '1',
+          input: [prompt],
+          bypassCache: options.bypassCache,
+        },
+        async () => {
+          let fellBack = false;
+
+          // Execute OpenAI call with circuit breaker protection
+          const response = await generationCircuit.execute(
+            () =>
+              getOpenAI().chat.completions.create({
+                model,
+                messages: [{ role: 'user', content: prompt }],
+              }),
+            () => {
+              // Fallback when circuit is open
+              fellBack = true;
+              console.warn(
+                'Circuit breaker OPEN for content generation - returning fallback'
+              );
+              return {
+                choices: [
+                  {
+                    message: {
+                      content:
+                        'Service temporarily unavailable. Please try again later.',
+                    },
+                  },
+                ],
+              } as any;
+            }
           );
+
+          const content: string = response.choices[0].message.content || '';
           return {
-            choices: [
-              {
-                message: {
-                  content:
-                    'Service temporarily unavailable. Please try again later.',
-                },
-              },
-            ],
-          } as any;
+            value: content,
+            tokens: response.usage?.total_tokens,
+            cacheable: !fellBack && content !== '',
+          };
         }
       );
-
-      return response.choices[0].message.content || '';
     } catch (error) {
       console.error('Error generating content:', error);
 
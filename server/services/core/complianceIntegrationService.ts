@@ -2,6 +2,7 @@ import type { RFP } from '@shared/schema';
 import { storage } from '../../storage';
 import { agentMemoryService } from '../agents/agentMemoryService';
 import { aiService } from './aiService';
+import type { LLMCacheOptions } from './llmResponseCache';
 import { analysisOrchestrator } from '../orchestrators/analysisOrchestrator';
 
 export interface ComplianceAnalysisResult {
@@ -83,7 +84,8 @@ export class ComplianceIntegrationService {
    * Automatically trigger compliance analysis for a newly discovered RFP
    */
   async triggerComplianceAnalysisForDiscoveredRFP(
-    rfpId: string
+    rfpId: string,
+    cacheOptions: LLMCacheOptions = {}
   ): Promise<ComplianceAnalysisResult> {
     console.log(`🔍 Auto-triggering compliance analysis for RFP: ${rfpId}`);
 
@@ -137,14 +139,18 @@ export class ComplianceIntegrationService {
         console.log(
           `📝 No extracted text found, starting full analysis workflow for RFP ${rfpId}`
         );
-        return await this.startFullAnalysisWorkflow(rfp);
+        return await this.startFullAnalysisWorkflow(rfp, cacheOptions);
       }
 
       // Perform direct compliance analysis on existing text
       console.log(
         `⚡ Performing direct compliance analysis for RFP ${rfpId} with ${documentsWithText.length} documents`
       );
-      return await this.performDirectComplianceAnalysis(rfp, documentsWithText);
+      return await this.performDirectComplianceAnalysis(
+        rfp,
+        documentsWithText,
+        cacheOptions
+      );
     } catch (error) {
       console.error(
         `❌ Auto compliance analysis failed for RFP ${rfpId}:`,
@@ -251,7 +257,7 @@ export class ComplianceIntegrationService {
 
   async processRfpCompliance(
     rfpId: string,
-    options?: { force?: boolean }
+    options?: { force?: boolean; bypassCache?: boolean }
   ): Promise<ComplianceAnalysisResult> {
     if (options?.force) {
       await storage.updateRFP(rfpId, {
@@ -261,7 +267,9 @@ export class ComplianceIntegrationService {
       });
     }
 
-    return this.triggerComplianceAnalysisForDiscoveredRFP(rfpId);
+    return this.triggerComplianceAnalysisForDiscoveredRFP(rfpId, {
+      bypassCache: options?.bypassCache,
+    });
   }
 
   async batchProcessCompliance(limit: number = 10) {
@@ -363,7 +371,8 @@ export class ComplianceIntegrationService {
    */
   private async performDirectComplianceAnalysis(
     rfp: RFP,
-    documents: any[]
+    documents: any[],
+    cacheOptions: LLMCacheOptions = {}
   ): Promise<ComplianceAnalysisResult> {
     try {
       console.log(
@@ -386,7 +395,8 @@ export class ComplianceIntegrationService {
       // Use AI service for comprehensive compliance analysis
       const aiAnalysis = await aiService.analyzeDocumentCompliance(
         combinedText,
-        rfp
+        rfp,
+        cacheOptions
       );
 
       // Format the results to match UI expectations
@@ -458,7 +468,8 @@ export class ComplianceIntegrationService {
    * Start full analysis workflow including document processing
    */
   private async startFullAnalysisWorkflow(
-    rfp: RFP
+    rfp: RFP,
+    cacheOptions: LLMCacheOptions = {}
   ): Promise<ComplianceAnalysisResult> {
     try {
       console.log(`🔄 Starting full analysis workflow for RFP: ${rfp.title}`);
@@ -469,6 +480,7 @@ export class ComplianceIntegrationService {
           rfpId: rfp.id,
           sessionId: this.sessionId,
           priority: 8, // High priority for compliance integration
+          bypassCache: cacheOptions.bypassCache,
         }
       );
 
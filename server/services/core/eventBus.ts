@@ -0,0 +1,410 @@
+import { Client } from 'pg';
+import { randomUUID } from 'crypto';
+
+/**
+ * Event Bus
+ *
+ * Carries live updates (proposal progress, WebSocket notifications, scan
+ * events) between app instances so a client sees events published on any
+ * node, whichever node its connection landed on.
+ *
+ * Listeners on the publishing node are called synchronously. Other nodes
+ * get the event through the backend:
+ * - memory: single process, nothing leaves the node (default)
+ * - postgres: NOTIFY on the event_bus channel, with one LISTEN connection
+ *   per node
+ *
+ * A publish may be marked as a snapshot: the key's latest state. Snapshots
+ * are cached and, with the postgres backend, kept in event_bus_snapshots,
+ * so getSnapshot can replay them to clients that subscribe late or on
+ * another node.
+ */
+
+export const EVENT_BUS_CHANNEL = 'event_bus';
+
+export interface BusMessage<T = any> {
+  topic: string;
+  key: string;
+  payload: T;
+  /** Node that published the message */
+  origin: string;
+}
+
+export interface BusPublishOptions {
+  /** Keep the payload as the key's latest state for getSnapshot */
+  snapshot?: boolean;
+  /** The key's stream has ended: drop its snapshot */
+  final?: boolean;
+}
+
+export type BusListener<T = any> = (message: BusMessage<T>) => void;
+
+export interface EventBusBackend {
+  readonly name: string;
+  start(
+    receive: (message: BusMessage, options: BusPublishOptions) => void
+  ): Promise<void>;
+  /** Deliver to the other nodes; the bus handles local listeners */
+  publish(message: BusMessage, options: BusPublishOptions): Promise<void>;
+  loadSnapshot(topic: string, key: string): Promise<unknown | undefined>;
+  stop(): Promise<void>;
+  isConnected(): boolean;
+}
+
+export interface EventBusStats {
+  backend: string;
+  nodeId: string;
+  connected: boolean;
+  published: number;
+  received: number;
+  publishErrors: number;
+  listenerErrors: number;
+  snapshots: number;
+}
+
+const MAX_CACHED_SNAPSHOTS = 1000;
+// NOTIFY payloads must be under 8000 bytes
+const MAX_NOTIFY_BYTES = 7900;
+const SNAPSHOT_RETENTION_HOURS = 24;
+const LISTEN_RECONNECT_DELAY_MS = 5000;
+
+export class InMemoryEventBusBackend implements EventBusBackend {
+  readonly name = 'memory';
+
+  async start(): Promise<void> {}
+
+  async publish(): Promise<void> {}
+
+  async loadSnapshot(): Promise<unknown | undefined> {
+    return undefined;
+  }
+
+  async stop(): Promise<void> {}
+
+  isConnected(): boolean {
+    return true;
+  }
+}
+
+interface NotifyEnvelope {
+  message: BusMessage;
+  options: BusPublishOptions;
+  /** Payload left out for size; read it from event_bus_snapshots */
+  payloadInSnapshot?: boolean;
+}
+
+export class PostgresEventBusBackend implements EventBusBackend {
+  readonly name = 'postgres';
+
+  private client: Client | null = null;
+  private receive:
+    | ((message: BusMessage, options: BusPublishOptions) => void)
+    | null = null;
+  private reconnectTimer: NodeJS.Timeout | null = null;
+  private stopped = false;
+
+  constructor(private readonly connectionString: string) {}
+
+  async start(
+    receive: (message: BusMessage, options: BusPublishOptions) => void
+  ): Promise<void> {
+    this.receive = receive;
+    this.stopped = false;
+    await this.connect();
+
+    try {
+      await this.client?.query(
+        `DELETE FROM event_bus_snapshots
+         WHERE updated_at < now() - interval '${SNAPSHOT_RETENTION_HOURS} hours'`
+      );
+    } catch (error) {
+      console.error('❌ Failed to prune event bus snapshots:', error);
+    }
+  }
+
+  async publish(
+    message: BusMessage,
+    options: BusPublishOptions
+  ): Promise<void> {
+    const client = this.client;
+    if (!client) {
+      throw new Error('Event bus is not connected');
+    }
+
+    // Queries on one connection run in order, so the snapshot is stored
+    // before any node hears about it
+    if (options.final) {
+      await client.query(
+        'DELETE FROM event_bus_snapshots WHERE topic = $1 AND key = $2',
+        [message.topic, message.key]
+      );
+    } else if (options.snapshot) {
+      await client.query(
+        `INSERT INTO event_bus_snapshots (topic, key, payload, updated_at)
+         VALUES ($1, $2, $3, now())
+         ON CONFLICT (topic, key)
+         DO UPDATE SET payload = excluded.payload, updated_at = now()`,
+        [message.topic, message.key, JSON.stringify(message.payload)]
+      );
+    }
+
+    let envelope = JSON.stringify({ message, options } as NotifyEnvelope);
+    if (Buffer.byteLength(envelope) > MAX_NOTIFY_BYTES) {
+      if (!options.snapshot || options.final) {
+        throw new Error(
+          `Event ${message.topic}:${message.key} is too large to NOTIFY`
+        );
+      }
+      envelope = JSON.stringify({
+        message: { ...message, payload: null },
+        options,
+        payloadInSnapshot: true,
+      } as NotifyEnvelope);
+    }
+
+    await client.query('SELECT pg_notify($1, $2)', [
+      EVENT_BUS_CHANNEL,
+      envelope,
+    ]);
+  }
+
+  async loadSnapshot(topic: string, key: string): Promise<unknown> {
+    if (!this.client) return undefined;
+    const result = await this.client.query(
+      'SELECT payload FROM event_bus_snapshots WHERE topic = $1 AND key = $2',
+      [topic, key]
+    );
+    return result.rows[0]?.payload;
+  }
+
+  async stop(): Promise<void> {
+    this.stopped = true;
+    if (this.reconnectTimer) {
+      clearTimeout(this.reconnectTimer);
+      this.reconnectTimer = null;
+    }
+    const client = this.client;
+    this.client = null;
+    await client?.end().catch(() => {});
+  }
+
+  isConnected(): boolean {
+    return this.client !== null;
+  }
+
+  private async connect(): Promise<void> {
+    if (this.stopped) return;
+
+    const client = new Client({ connectionString: this.connectionString });
+    client.on('notification', notification => {
+      if (notification.channel !== EVENT_BUS_CHANNEL) return;
+      void this.handleNotification(notification.payload);
+    });
+    client.on('error', error => {
+      console.error('❌ Event bus listener error:', error);
+      this.reconnect(client);
+    });
+
+    try {
+      await client.connect();
+      await client.query(`LISTEN ${EVENT_BUS_CHANNEL}`);
+      if (this.stopped) {
+        await client.end();
+        return;
+      }
+      this.client = client;
+    } catch (error) {
+      console.error('❌ Failed to LISTEN for bus events:', error);
+      this.reconnect(client);
+    }
+  }
+
+  private async handleNotification(payload?: string): Promise<void> {
+    if (!payload || !this.receive) return;
+    try {
+      const envelope = JSON.parse(payload) as NotifyEnvelope;
+      const { message, options } = envelope;
+      if (envelope.payloadInSnapshot) {
+        message.payload = await this.loadSnapshot(message.topic, message.key);
+        if (message.payload === undefined) return;
+      }
+      this.receive(message, options);
+    } catch (error) {
+      console.error('❌ Failed to handle bus event:', error);
+    }
+  }
+
+  private reconnect(client: Client): void {
+    if (this.client === client) this.client = null;
+    client.end().catch(() => {});
+    if (this.stopped || this.reconnectTimer) return;
+
+    this.reconnectTimer = setTimeout(() => {
+      this.reconnectTimer = null;
+      void this.connect();
+    }, LISTEN_RECONNECT_DELAY_MS);
+    this.reconnectTimer.unref?.();
+  }
+}
+
+export class EventBus {
+  readonly nodeId = `${process.env.FLY_MACHINE_ID || 'node'}-${randomUUID()}`;
+
+  private listeners = new Map<string, Set<BusListener>>();
+  private snapshots = new Map<string, unknown>();
+  private stats = {
+    published: 0,
+    received: 0,
+    publishErrors: 0,
+    listenerErrors: 0,
+  };
+
+  constructor(private readonly backend: EventBusBackend) {}
+
+  /**
+   * Connect to the backend so events from other nodes start arriving
+   */
+  async start(): Promise<void> {
+    await this.backend.start((message, options) =>
+      this.receive(message, options)
+    );
+  }
+
+  async stop(): Promise<void> {
+    await this.backend.stop();
+  }
+
+  /**
+   * Deliver to local listeners now and to other nodes asynchronously.
+   * A failed remote delivery is logged, never thrown.
+   */
+  publish<T>(
+    topic: string,
+    key: string,
+    payload: T,
+    options: BusPublishOptions = {}
+  ): void {
+    const message: BusMessage<T> = {
+      topic,
+      key,
+      payload,
+      origin: this.nodeId,
+    };
+    this.stats.published++;
+    this.applySnapshot(message, options);
+    this.dispatch(message);
+
+    this.backend.publish(message, options).catch(error => {
+      this.stats.publishErrors++;
+      console.error(`❌ Failed to publish bus event on ${topic}:`, error);
+    });
+  }
+
+  /**
+   * Listen to every key on a topic, from this node and others
+   */
+  subscribe<T = any>(topic: string, listener: BusListener<T>): () => void {
+    let listeners = this.listeners.get(topic);
+    if (!listeners) {
+      listeners = new Set();
+      this.listeners.set(topic, listeners);
+    }
+    listeners.add(listener);
+
+    return () => {
+      listeners!.delete(listener);
+      if (listeners!.size === 0 && this.listeners.get(topic) === listeners) {
+        this.listeners.delete(topic);
+      }
+    };
+  }
+
+  /**
+   * Latest snapshot published for a key, from any node
+   */
+  async getSnapshot<T = any>(
+    topic: string,
+    key: string
+  ): Promise<T | undefined> {
+    const cacheKey = snapshotKey(topic, key);
+    if (this.snapshots.has(cacheKey)) {
+      return this.snapshots.get(cacheKey) as T;
+    }
+
+    try {
+      const payload = await this.backend.loadSnapshot(topic, key);
+      return payload as T | undefined;
+    } catch (error) {
+      console.error(`❌ Failed to load bus snapshot ${topic}:${key}:`, error);
+      return undefined;
+    }
+  }
+
+  getStats(): EventBusStats {
+    return {
+      backend: this.backend.name,
+      nodeId: this.nodeId,
+      connected: this.backend.isConnected(),
+      ...this.stats,
+      snapshots: this.snapshots.size,
+    };
+  }
+
+  private receive(message: BusMessage, options: BusPublishOptions): void {
+    // Already delivered locally when it was published
+    if (message.origin === this.nodeId) return;
+    this.stats.received++;
+    this.applySnapshot(message, options);
+    this.dispatch(message);
+  }
+
+  private applySnapshot(message: BusMessage, options: BusPublishOptions) {
+    const cacheKey = snapshotKey(message.topic, message.key);
+    if (options.final) {
+      this.snapshots.delete(cacheKey);
+    } else if (options.snapshot) {
+      // Re-insert so eviction drops the least recently updated key
+      this.snapshots.delete(cacheKey);
+      this.snapshots.set(cacheKey, message.payload);
+      if (this.snapshots.size > MAX_CACHED_SNAPSHOTS) {
+        const oldest = this.snapshots.keys().next().value;
+        if (oldest !== undefined) this.snapshots.delete(oldest);
+      }
+    }
+  }
+
+  private dispatch(message: BusMessage): void {
+    const listeners = this.listeners.get(message.topic);
+    if (!listeners) return;
+    for (const listener of Array.from(listeners)) {
+      try {
+        listener(message);
+      } catch (error) {
+        this.stats.listenerErrors++;
+        console.error(
+          `❌ Bus listener failed on ${message.topic}:${message.key}:`,
+          error
+        );
+      }
+    }
+  }
+}
+
+function snapshotKey(topic: string, key: string): string {
+  return `${topic}\u0000${key}`;
+}
+
+/**
+ * EVENT_BUS_BACKEND=postgres shares events across instances over
+ * EVENT_BUS_LISTEN_URL (or DATABASE_URL); anything else stays in-process.
+ */
+export function createEventBus(): EventBus {
+  const connectionString =
+    process.env.EVENT_BUS_LISTEN_URL || process.env.DATABASE_URL;
+  if (process.env.EVENT_BUS_BACKEND === 'postgres' && connectionString) {
+    return new EventBus(new PostgresEventBusBackend(connectionString));
+  }
+  return new EventBus(new InMemoryEventBusBackend());
+}
+
+export const eventBus = createEventBus();
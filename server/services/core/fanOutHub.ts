@@ -0,0 +1,305 @@
+/**
+ * Fan-out Hub
+ *
+ * Pub/sub delivery for long-lived push connections (WebSocket and SSE).
+ * A channel → subscriber index means a publish only touches that channel's
+ * subscribers, and each message is encoded once for all of them.
+ *
+ * Every write checks the subscriber's transport buffer:
+ * - below lagBytes, frames are written immediately;
+ * - above lagBytes, frames published with a coalesceKey are held back and
+ *   only the latest frame per key is kept. They are written once the client
+ *   has caught up. Frames without a key are still written;
+ * - above maxBufferedBytes, the client is disconnected.
+ */
+
+export interface FanOutTransport {
+  /** Bytes accepted for the client but not yet flushed to its socket */
+  bufferedBytes(): number;
+  write(frame: string): void;
+  /** Drop a client that cannot keep up */
+  terminate(): void;
+}
+
+export interface FanOutSubscriber {
+  id: string;
+  transport: FanOutTransport;
+  channels: Set<string>;
+  /** Latest held-back frame per coalesce key while the client lags */
+  pending: Map<string, string>;
+}
+
+export interface FanOutHubOptions<M> {
+  encode: (message: M) => string;
+  lagBytes?: number;
+  maxBufferedBytes?: number;
+  flushIntervalMs?: number;
+  /** Called after a slow subscriber has been disconnected and removed */
+  onDisconnect?: (subscriber: FanOutSubscriber) => void;
+}
+
+export interface FanOutStats {
+  subscribers: number;
+  channels: Record<string, number>;
+  published: number;
+  delivered: number;
+  coalesced: number;
+  pendingFrames: number;
+  laggingSubscribers: number;
+  disconnected: number;
+  writeErrors: number;
+}
+
+const DEFAULT_LAG_BYTES = 64 * 1024;
+const DEFAULT_MAX_BUFFERED_BYTES = 1024 * 1024;
+const DEFAULT_FLUSH_INTERVAL_MS = 100;
+
+export class FanOutHub<M> {
+  private readonly encode: (message: M) => string;
+  private readonly lagBytes: number;
+  private readonly maxBufferedBytes: number;
+  private readonly flushIntervalMs: number;
+  private readonly onDisconnect?: (subscriber: FanOutSubscriber) => void;
+
+  private subscribers = new Map<string, FanOutSubscriber>();
+  private channels = new Map<string, Set<FanOutSubscriber>>();
+  private lagging = new Set<FanOutSubscriber>();
+  private flushTimer: NodeJS.Timeout | null = null;
+  private stats = {
+    published: 0,
+    delivered: 0,
+    coalesced: 0,
+    disconnected: 0,
+    writeErrors: 0,
+  };
+
+  constructor(options: FanOutHubOptions<M>) {
+    this.encode = options.encode;
+    this.lagBytes = options.lagBytes ?? DEFAULT_LAG_BYTES;
+    this.maxBufferedBytes =
+      options.maxBufferedBytes ?? DEFAULT_MAX_BUFFERED_BYTES;
+    this.flushIntervalMs = options.flushIntervalMs ?? DEFAULT_FLUSH_INTERVAL_MS;
+    this.onDisconnect = options.onDisconnect;
+  }
+
+  addSubscriber(id: string, transport: FanOutTransport): FanOutSubscriber {
+    const subscriber: FanOutSubscriber = {
+      id,
+      transport,
+      channels: new Set(),
+      pending: new Map(),
+    };
+    this.subscribers.set(id, subscriber);
+    return subscriber;
+  }
+
+  removeSubscriber(subscriber: FanOutSubscriber): void {
+    for (const channel of subscriber.channels) {
+      this.unindex(channel, subscriber);
+    }
+    subscriber.channels.clear();
+    subscriber.pending.clear();
+    this.lagging.delete(subscriber);
+    this.subscribers.delete(subscriber.id);
+  }
+
+  subscribe(subscriber: FanOutSubscriber, channel: string): void {
+    subscriber.channels.add(channel);
+    let members = this.channels.get(channel);
+    if (!members) {
+      members = new Set();
+      this.channels.set(channel, members);
+    }
+    members.add(subscriber);
+  }
+
+  unsubscribe(subscriber: FanOutSubscriber, channel: string): void {
+    subscriber.channels.delete(channel);
+    this.unindex(channel, subscriber);
+  }
+
+  /**
+   * Remove a channel from the index and return its former subscribers.
+   * Connections are left open.
+   */
+  closeChannel(channel: string): FanOutSubscriber[] {
+    const members = Array.from(this.channels.get(channel) ?? []);
+    for (const subscriber of members) {
+      subscriber.channels.delete(channel);
+    }
+    this.channels.delete(channel);
+    return members;
+  }
+
+  subscribersOf(channel: string): FanOutSubscriber[] {
+    return Array.from(this.channels.get(channel) ?? []);
+  }
+
+  /**
+   * Deliver a message to a channel's subscribers. Returns how many were
+   * written immediately.
+   */
+  publish(
+    channel: string,
+    message: M,
+    options?: { coalesceKey?: string }
+  ): number {
+    const members = this.channels.get(channel);
+    if (!members || members.size === 0) return 0;
+    return this.deliverAll(members, message, options?.coalesceKey);
+  }
+
+  /**
+   * Deliver a message to every subscriber, whatever its channels
+   */
+  broadcast(message: M, options?: { coalesceKey?: string }): number {
+    if (this.subscribers.size === 0) return 0;
+    return this.deliverAll(
+      this.subscribers.values(),
+      message,
+      options?.coalesceKey
+    );
+  }
+
+  send(
+    subscriber: FanOutSubscriber,
+    message: M,
+    options?: { coalesceKey?: string }
+  ): boolean {
+    return this.deliver(subscriber, this.encode(message), options?.coalesceKey);
+  }
+
+  getStats(): FanOutStats {
+    let pendingFrames = 0;
+    for (const subscriber of this.lagging) {
+      pendingFrames += subscriber.pending.size;
+    }
+
+    return {
+      subscribers: this.subscribers.size,
+      channels: Object.fromEntries(
+        Array.from(this.channels, ([channel, members]) => [
+          channel,
+          members.size,
+        ])
+      ),
+      ...this.stats,
+      pendingFrames,
+      laggingSubscribers: this.lagging.size,
+    };
+  }
+
+  shutdown(): void {
+    if (this.flushTimer) {
+      clearInterval(this.flushTimer);
+      this.flushTimer = null;
+    }
+    this.subscribers.clear();
+    this.channels.clear();
+    this.lagging.clear();
+  }
+
+  private deliverAll(
+    subscribers: Iterable<FanOutSubscriber>,
+    message: M,
+    coalesceKey?: string
+  ): number {
+    const frame = this.encode(message);
+    this.stats.published++;
+
+    let delivered = 0;
+    // Copy first: deliver may disconnect and unindex a subscriber
+    for (const subscriber of Array.from(subscribers)) {
+      if (this.deliver(subscriber, frame, coalesceKey)) delivered++;
+    }
+    return delivered;
+  }
+
+  private deliver(
+    subscriber: FanOutSubscriber,
+    frame: string,
+    coalesceKey?: string
+  ): boolean {
+    const buffered = subscriber.transport.bufferedBytes();
+    if (buffered > this.maxBufferedBytes) {
+      this.disconnect(subscriber);
+      return false;
+    }
+
+    // Once lagging, keyed frames queue behind the held-back ones until the
+    // flush so a client never sees an older state after a newer one
+    if (
+      coalesceKey !== undefined &&
+      (buffered > this.lagBytes || this.lagging.has(subscriber))
+    ) {
+      if (subscriber.pending.has(coalesceKey)) this.stats.coalesced++;
+      subscriber.pending.set(coalesceKey, frame);
+      this.lagging.add(subscriber);
+      this.scheduleFlush();
+      return false;
+    }
+
+    return this.write(subscriber, frame);
+  }
+
+  private write(subscriber: FanOutSubscriber, frame: string): boolean {
+    try {
+      subscriber.transport.write(frame);
+      this.stats.delivered++;
+      return true;
+    } catch {
+      this.stats.writeErrors++;
+      this.removeSubscriber(subscriber);
+      return false;
+    }
+  }
+
+  private disconnect(subscriber: FanOutSubscriber): void {
+    this.stats.disconnected++;
+    this.removeSubscriber(subscriber);
+    try {
+      subscriber.transport.terminate();
+    } catch {
+      // Already closed
+    }
+    this.onDisconnect?.(subscriber);
+  }
+
+  private unindex(channel: string, subscriber: FanOutSubscriber): void {
+    const members = this.channels.get(channel);
+    if (!members) return;
+    members.delete(subscriber);
+    if (members.size === 0) this.channels.delete(channel);
+  }
+
+  private scheduleFlush(): void {
+    if (this.flushTimer) return;
+    this.flushTimer = setInterval(
+      () => this.flushLagging(),
+      this.flushIntervalMs
+    );
+    this.flushTimer.unref?.();
+  }
+
+  // Write held-back frames for subscribers that have caught up
+  private flushLagging(): void {
+    for (const subscriber of Array.from(this.lagging)) {
+      const buffered = subscriber.transport.bufferedBytes();
+      if (buffered > this.maxBufferedBytes) {
+        this.disconnect(subscriber);
+      } else if (buffered <= this.lagBytes) {
+        const frames = Array.from(subscriber.pending.values());
+        subscriber.pending.clear();
+        this.lagging.delete(subscriber);
+        for (const frame of frames) {
+          if (!this.write(subscriber, frame)) break;
+        }
+      }
+    }
+
+    if (this.lagging.size === 0 && this.flushTimer) {
+      clearInterval(this.flushTimer);
+      this.flushTimer = null;
+    }
+  }
+}
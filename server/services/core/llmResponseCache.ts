@@ -0,0 +1,191 @@
+import type { IStorage } from '../../storage';
+import { storage } from '../../storage';
+import { logger } from '../../utils/logger';
+import { TieredResponseCache } from './tieredResponseCache';
+
+const log = logger.child({ service: 'LLMResponseCache' });
+
+const HOUR_MS = 60 * 60 * 1000;
+
+/**
+ * Cache lifetime per operation. Extraction and analysis of unchanged text
+ * are stable for days; free-form generation is kept briefly so retries and
+ * restarts reuse it without pinning one draft forever.
+ */
+export const LLM_CACHE_TTLS_MS = {
+  'analyze-compliance': 7 * 24 * HOUR_MS,
+  'extract-rfp-details': 7 * 24 * HOUR_MS,
+  'analyze-rfp-document': 7 * 24 * HOUR_MS,
+  'generate-proposal-content': 24 * HOUR_MS,
+  'generate-content': 6 * HOUR_MS,
+} as const;
+
+export type LLMOperation = keyof typeof LLM_CACHE_TTLS_MS;
+
+export interface LLMCacheOptions {
+  /** Skip the cache lookup; the fresh response still replaces the entry */
+  bypassCache?: boolean;
+}
+
+export interface LLMCacheRequest extends LLMCacheOptions {
+  operation: LLMOperation;
+  model: string;
+  /** Bump when the prompt template changes so old responses are not reused */
+  templateVersion: string;
+  /** Everything besides the template that the response depends on */
+  input: string[];
+}
+
+export interface LLMCacheResult<T> {
+  value: T;
+  /** Total tokens the call used; counted as saved on later hits */
+  tokens?: number;
+  /** False for fallbacks and other responses that must not be reused */
+  cacheable?: boolean;
+}
+
+interface CachedLLMResponse {
+  value: unknown;
+  tokens: number;
+}
+
+export interface LLMOperationStats {
+  hits: number;
+  misses: number;
+  bypassed: number;
+  tokensSaved: number;
+}
+
+export interface LLMResponseCacheStats {
+  enabled: boolean;
+  tokensSaved: number;
+  operations: Record<string, LLMOperationStats>;
+}
+
+/**
+ * Collapse whitespace so re-scraped or re-extracted text with different
+ * line wrapping maps to the same entry
+ */
+export function normalizeLLMInput(input: string): string {
+  return input.normalize('NFC').replace(/\s+/g, ' ').trim();
+}
+
+/**
+ * Content-addressed cache for model responses.
+ *
+ * Entries are keyed on the operation, model, prompt template version and
+ * the normalized input, so a stall-detection restart, a DLQ retry or a
+ * re-triggered analysis of an unchanged RFP is answered without a model
+ * call. Each operation gets its own TieredResponseCache namespace
+ * (llm:<operation>), which keeps the in-memory LRU in front of the shared
+ * ai_response_cache table. Set LLM_RESPONSE_CACHE=off to disable it.
+ */
+export class LLMResponseCache {
+  private caches = new Map<
+    LLMOperation,
+    TieredResponseCache<CachedLLMResponse>
+  >();
+  private stats = new Map<LLMOperation, LLMOperationStats>();
+
+  constructor(
+    private storage: IStorage,
+    private options: { enabled?: boolean; maxSize?: number } = {}
+  ) {}
+
+  get enabled(): boolean {
+    return (
+      this.options.enabled ?? process.env.LLM_RESPONSE_CACHE !== 'off'
+    );
+  }
+
+  /**
+   * Return the cached response for this request, or run `compute` and cache
+   * its result
+   */
+  async getOrCompute<T>(
+    request: LLMCacheRequest,
+    compute: () => Promise<LLMCacheResult<T>>
+  ): Promise<T> {
+    if (!this.enabled) {
+      return (await compute()).value;
+    }
+
+    const cache = this.cacheFor(request.operation);
+    const stats = this.statsFor(request.operation);
+    const key = cache.key(
+      request.model,
+      request.templateVersion,
+      ...request.input.map(normalizeLLMInput)
+    );
+
+    if (request.bypassCache) {
+      stats.bypassed++;
+    } else {
+      const cached = await cache.get(key);
+      if (cached !== undefined) {
+        stats.hits++;
+        stats.tokensSaved += cached.tokens;
+        log.debug('LLM response cache hit', {
+          operation: request.operation,
+          tokensSaved: cached.tokens,
+        });
+        // Callers may mutate what they get back; keep the entry intact
+        return structuredClone(cached.value) as T;
+      }
+      stats.misses++;
+    }
+
+    const result = await compute();
+    if (result.cacheable !== false && result.value != null) {
+      await cache.set(key, {
+        value: structuredClone(result.value),
+        tokens: result.tokens ?? 0,
+      });
+    }
+    return result.value;
+  }
+
+  getStats(): LLMResponseCacheStats {
+    const operations = Object.fromEntries(
+      Array.from(this.stats.entries()).map(([operation, stats]) => [
+        operation,
+        { ...stats },
+      ])
+    );
+    return {
+      enabled: this.enabled,
+      tokensSaved: Array.from(this.stats.values()).reduce(
+        (total, stats) => total + stats.tokensSaved,
+        0
+      ),
+      operations,
+    };
+  }
+
+  private cacheFor(
+    operation: LLMOperation
+  ): TieredResponseCache<CachedLLMResponse> {
+    let cache = this.caches.get(operation);
+    if (!cache) {
+      cache = new TieredResponseCache<CachedLLMResponse>(this.storage, {
+        namespace: `llm:${operation}`,
+        maxSize:
+          this.options.maxSize ?? (Number(process.env.LLM_CACHE_SIZE) || 200),
+        ttlMs: LLM_CACHE_TTLS_MS[operation],
+      });
+      this.caches.set(operation, cache);
+    }
+    return cache;
+  }
+
+  private statsFor(operation: LLMOperation): LLMOperationStats {
+    let stats = this.stats.get(operation);
+    if (!stats) {
+      stats = { hits: 0, misses: 0, bypassed: 0, tokensSaved: 0 };
+      this.stats.set(operation, stats);
+    }
+    return stats;
+  }
+}
+
+export const llmResponseCache = new LLMResponseCache(storage);
@@ -44,10 +44,22 @@ export interface RetryResult {
   moveToDLQ?: boolean;
 }
 
+// Work items requeued per UPDATE by the retry scheduler
+const RETRY_BATCH_SIZE = 500;
+// Longest the scheduler sleeps, so retries scheduled by other processes are
+// picked up even when nothing here wakes it earlier
+const MAX_RETRY_SLEEP_MS = 60000;
+// Shortest sleep after a pass, so rows locked elsewhere cannot cause a spin
+const MIN_RETRY_SLEEP_MS = 1000;
+
 export class RetryBackoffDlqService {
   private retryPolicies: Map<string, RetryPolicy> = new Map();
   private activeRetries: Map<string, RetryAttempt[]> = new Map();
   private dlqEntries: Map<string, DLQEntry> = new Map();
+  private retrySchedulerStarted = false;
+  private retryTimer: NodeJS.Timeout | null = null;
+  private retryWakeAt: number | null = null;
+  private processingRetries = false;
 
   constructor() {
     this.initializeDefaultRetryPolicies();
@@ -595,61 +607,72 @@ export class RetryBackoffDlqService {
   }
 
   /**
-   * Start the retry scheduler that processes pending retries (disabled by default)
+   * Start the retry scheduler that processes pending retries (disabled by default).
+   * It sleeps until the earliest scheduled nextRetryAt rather than polling.
    */
   startRetryScheduler(): void {
+    if (this.retrySchedulerStarted) return;
+    this.retrySchedulerStarted = true;
     console.log('⏰ Starting retry scheduler...');
 
-    setInterval(async () => {
-      await this.processScheduledRetries();
-    }, 5000); // Check every 5 seconds
+    this.scheduleRetryWakeup(new Date());
+  }
+
+  /**
+   * Make sure the scheduler wakes up by retryAt. Call after scheduling a
+   * retry so it is not left waiting for the next idle check.
+   */
+  scheduleRetryWakeup(retryAt: Date): void {
+    if (!this.retrySchedulerStarted) return;
+
+    const wakeAt = Math.min(
+      Math.max(retryAt.getTime(), Date.now()),
+      Date.now() + MAX_RETRY_SLEEP_MS
+    );
+    if (this.retryWakeAt !== null && this.retryWakeAt <= wakeAt) return;
+
+    if (this.retryTimer) clearTimeout(this.retryTimer);
+    this.retryWakeAt = wakeAt;
+    this.retryTimer = setTimeout(() => {
+      this.retryTimer = null;
+      this.retryWakeAt = null;
+      void this.processScheduledRetries();
+    }, wakeAt - Date.now());
   }
 
   /**
-   * Process work items that are scheduled for retry
+   * Requeue work items whose retry is due, then sleep until the next one
    */
   private async processScheduledRetries(): Promise<void> {
+    if (this.processingRetries) return;
+    this.processingRetries = true;
+
+    let nextWakeAt = new Date(Date.now() + MAX_RETRY_SLEEP_MS);
     try {
       const { storage } = await import('../../storage');
 
-      // Get work items that are ready for retry
-      const workItems = await storage.getWorkItems();
-      const retryableItems = workItems.filter(
-        item =>
-          item.status === 'failed' &&
-          item.nextRetryAt &&
-          new Date(item.nextRetryAt) <= new Date() &&
-          item.canRetry
-      );
+      let requeued = 0;
+      let batch;
+      do {
+        batch = await storage.requeueDueRetries(RETRY_BATCH_SIZE);
+        requeued += batch.length;
+      } while (batch.length === RETRY_BATCH_SIZE);
 
-      if (retryableItems.length === 0) {
-        return;
+      if (requeued > 0) {
+        console.log(`⚡ Requeued ${requeued} work items for scheduled retry`);
       }
 
-      console.log(
-        `🔄 Processing ${retryableItems.length} scheduled retries...`
-      );
-
-      for (const item of retryableItems) {
-        try {
-          // Reset work item for retry
-          await storage.updateWorkItem(item.id, {
-            status: 'pending',
-            assignedAgentId: null,
-            nextRetryAt: null,
-            lastRetryAt: new Date(),
-            updatedAt: new Date(),
-          });
-
-          console.log(
-            `⚡ Requeued work item ${item.id} for retry (attempt ${item.retries + 1})`
-          );
-        } catch (error) {
-          console.error(`❌ Failed to requeue work item ${item.id}:`, error);
-        }
+      const nextRetryAt = await storage.getNextRetryAt();
+      if (nextRetryAt) {
+        nextWakeAt = new Date(
+          Math.max(nextRetryAt.getTime(), Date.now() + MIN_RETRY_SLEEP_MS)
+        );
       }
     } catch (error) {
       console.error('❌ Error in retry scheduler:', error);
+    } finally {
+      this.processingRetries = false;
+      this.scheduleRetryWakeup(nextWakeAt);
     }
   }
 
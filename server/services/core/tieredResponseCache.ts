@@ -0,0 +1,217 @@
+import { createHash } from 'crypto';
+import type { AiResponseCacheHit, IStorage } from '../../storage';
+import { logger } from '../../utils/logger';
+import { LRUCache, type LRUCacheStats } from '../../utils/lruCache';
+
+const log = logger.child({ service: 'TieredResponseCache' });
+
+const PURGE_INTERVAL_MS = 60 * 60 * 1000; // 1 hour
+const HIT_FLUSH_INTERVAL_MS = 30 * 1000;
+
+export interface TieredResponseCacheOptions<T> {
+  namespace: string;
+  maxSize: number;
+  ttlMs: number;
+  persist?: boolean; // Write through to the ai_response_cache table (default true)
+  parse?: (value: unknown) => T; // Validate values read back from Postgres
+}
+
+export interface TieredResponseCacheStats {
+  namespace: string;
+  memory: LRUCacheStats;
+  persistentHits: number;
+  misses: number;
+  writes: number;
+  persistenceErrors: number;
+  hitRate: number;
+}
+
+const registry = new Map<string, TieredResponseCache<unknown>>();
+let purgeTimer: NodeJS.Timeout | null = null;
+let hitFlushTimer: NodeJS.Timeout | null = null;
+
+/**
+ * Two-tier cache for expensive AI responses.
+ *
+ * Lookups go to an in-process LRU first and fall back to the shared
+ * ai_response_cache table, so entries survive restarts and are visible to
+ * every instance. Persistence failures are logged and treated as misses;
+ * the cache never makes a request fail. Persistent-tier reads are plain
+ * SELECTs; their hit counts are written back in batches by flushHits().
+ */
+export class TieredResponseCache<T> {
+  private memory: LRUCache<string, T>;
+  private persistentHits = 0;
+  private misses = 0;
+  private writes = 0;
+  private persistenceErrors = 0;
+  private pendingHits = new Map<string, AiResponseCacheHit>();
+
+  constructor(
+    private storage: IStorage,
+    private options: TieredResponseCacheOptions<T>
+  ) {
+    this.memory = new LRUCache<string, T>({
+      maxSize: options.maxSize,
+      ttlMs: options.ttlMs,
+    });
+    registry.set(options.namespace, this as TieredResponseCache<unknown>);
+
+    if (this.persistent && !purgeTimer) {
+      purgeTimer = setInterval(() => {
+        storage
+          .deleteExpiredAiResponseCacheEntries()
+          .then(count => {
+            if (count > 0) {
+              log.debug('Purged expired cache entries', { count });
+            }
+          })
+          .catch(error => {
+            log.warn('Failed to purge expired cache entries', {
+              error: (error as Error).message,
+            });
+          });
+      }, PURGE_INTERVAL_MS);
+      purgeTimer.unref();
+    }
+
+    if (this.persistent && !hitFlushTimer) {
+      hitFlushTimer = setInterval(() => {
+        for (const cache of registry.values()) {
+          void cache.flushHits();
+        }
+      }, HIT_FLUSH_INTERVAL_MS);
+      hitFlushTimer.unref();
+    }
+  }
+
+  private get persistent(): boolean {
+    return this.options.persist !== false;
+  }
+
+  /**
+   * Build a cache key from the parts that determine the response
+   */
+  key(...parts: string[]): string {
+    return createHash('sha256')
+      .update([this.options.namespace, ...parts].join('\u0000'))
+      .digest('hex');
+  }
+
+  async get(key: string): Promise<T | undefined> {
+    const cached = this.memory.get(key);
+    if (cached !== undefined) {
+      return cached;
+    }
+
+    if (this.persistent) {
+      try {
+        const entry = await this.storage.getAiResponseCacheEntry(key);
+        if (entry) {
+          const value = this.options.parse
+            ? this.options.parse(entry.value)
+            : (entry.value as T);
+          const remainingMs = entry.expiresAt.getTime() - Date.now();
+          this.memory.set(key, value, Math.min(remainingMs, this.options.ttlMs));
+          this.persistentHits++;
+          this.recordHit(key);
+          return value;
+        }
+      } catch (error) {
+        this.persistenceErrors++;
+        log.warn('Persistent cache read failed', {
+          namespace: this.options.namespace,
+          error: (error as Error).message,
+        });
+      }
+    }
+
+    this.misses++;
+    return undefined;
+  }
+
+  async set(key: string, value: T, ttlMs: number = this.options.ttlMs) {
+    this.memory.set(key, value, ttlMs);
+    this.writes++;
+
+    if (!this.persistent) return;
+
+    try {
+      await this.storage.upsertAiResponseCacheEntry({
+        cacheKey: key,
+        namespace: this.options.namespace,
+        value,
+        expiresAt: new Date(Date.now() + ttlMs),
+      });
+    } catch (error) {
+      this.persistenceErrors++;
+      log.warn('Persistent cache write failed', {
+        namespace: this.options.namespace,
+        error: (error as Error).message,
+      });
+    }
+  }
+
+  /**
+   * Write hit counts gathered since the last flush to the persistent tier
+   */
+  async flushHits(): Promise<void> {
+    if (this.pendingHits.size === 0) return;
+    const hits = Array.from(this.pendingHits.values());
+    this.pendingHits = new Map();
+
+    try {
+      await this.storage.recordAiResponseCacheHits(hits);
+    } catch (error) {
+      this.persistenceErrors++;
+      log.warn('Failed to record cache hits', {
+        namespace: this.options.namespace,
+        error: (error as Error).message,
+      });
+    }
+  }
+
+  private recordHit(key: string): void {
+    const pending = this.pendingHits.get(key);
+    if (pending) {
+      pending.hits++;
+      pending.lastHitAt = new Date();
+    } else {
+      this.pendingHits.set(key, {
+        cacheKey: key,
+        hits: 1,
+        lastHitAt: new Date(),
+      });
+    }
+  }
+
+  getStats(): TieredResponseCacheStats {
+    const memory = this.memory.getStats();
+    const hits = memory.hits + this.persistentHits;
+    const lookups = hits + this.misses;
+    return {
+      namespace: this.options.namespace,
+      memory,
+      persistentHits: this.persistentHits,
+      misses: this.misses,
+      writes: this.writes,
+      persistenceErrors: this.persistenceErrors,
+      hitRate: lookups > 0 ? hits / lookups : 0,
+    };
+  }
+}
+
+/**
+ * Stats for every tiered cache created in this process, keyed by namespace
+ */
+export function getResponseCacheStats(): Record<
+  string,
+  TieredResponseCacheStats
+> {
+  return Object.fromEntries(
+    Array.from(registry.entries()).map(([namespace, cache]) => [
+      namespace,
+      cache.getStats(),
+    ])
+  );
+}
@@ -1,6 +1,12 @@
 import { WebSocketServer, WebSocket } from 'ws';
 import type { Server } from 'http';
 import { logger } from '../../utils/logger';
+import {
+  FanOutHub,
+  type FanOutStats,
+  type FanOutSubscriber,
+} from './fanOutHub';
+import { eventBus, type BusMessage, type EventBus } from './eventBus';
 
 /**
  * WebSocket Service for Real-Time Updates
@@ -12,6 +18,7 @@ export type WebSocketMessageType =
   | 'rfp:updated'
   | 'proposal:generated'
   | 'proposal:updated'
+  | 'proposal:section'
   | 'agent:activity'
   | 'workflow:progress'
   | 'scan:started'
@@ -31,17 +38,47 @@ export interface WebSocketMessage {
 export interface WebSocketClient {
   id: string;
   ws: WebSocket;
+  subscriber: FanOutSubscriber;
+  /** Same set as subscriber.channels */
   subscriptions: Set<string>;
   lastPing: number;
   metadata?: Record<string, any>;
 }
 
+// Event bus topic for client messages, keyed by channel
+const WEBSOCKET_TOPIC = 'websocket';
+const ALL_CLIENTS_KEY = '*';
+
+interface WebSocketBusEvent {
+  message: WebSocketMessage;
+  coalesceKey?: string;
+}
+
 export class WebSocketService {
   private wss: WebSocketServer | null = null;
   private clients: Map<string, WebSocketClient> = new Map();
   private pingInterval: NodeJS.Timeout | null = null;
   private readonly PING_INTERVAL = 30000; // 30 seconds
   private readonly PING_TIMEOUT = 10000; // 10 seconds
+  // Messages are serialized once per publish; clients whose socket buffer
+  // backs up get coalesced updates, and are dropped past the high-water mark
+  private fanOut = new FanOutHub<WebSocketMessage>({
+    encode: message => JSON.stringify(message),
+    onDisconnect: subscriber => {
+      this.clients.delete(subscriber.id);
+      logger.warn('Dropped slow WebSocket client', {
+        clientId: subscriber.id,
+        remainingClients: this.clients.size,
+      });
+    },
+  });
+
+  constructor(private readonly bus: EventBus = eventBus) {
+    // Messages from any node reach the clients connected to this one
+    this.bus.subscribe<WebSocketBusEvent>(WEBSOCKET_TOPIC, event =>
+      this.deliver(event)
+    );
+  }
 
   /**
    * Initialize WebSocket server
@@ -69,10 +106,18 @@ export class WebSocketService {
    */
   private handleConnection(ws: WebSocket, req: any): void {
     const clientId = this.generateClientId();
+    const subscriber = this.fanOut.addSubscriber(clientId, {
+      bufferedBytes: () => ws.bufferedAmount,
+      write: frame => {
+        if (ws.readyState === WebSocket.OPEN) ws.send(frame);
+      },
+      terminate: () => ws.terminate(),
+    });
     const client: WebSocketClient = {
       id: clientId,
       ws,
-      subscriptions: new Set(),
+      subscriber,
+      subscriptions: subscriber.channels,
       lastPing: Date.now(),
     };
 
@@ -179,7 +224,9 @@ export class WebSocketService {
     const { channels } = payload;
 
     if (Array.isArray(channels)) {
-      channels.forEach(channel => client.subscriptions.add(channel));
+      channels.forEach(channel =>
+        this.fanOut.subscribe(client.subscriber, channel)
+      );
       logger.info('Client subscribed to channels', {
         clientId: client.id,
         channels,
@@ -203,7 +250,9 @@ export class WebSocketService {
     const { channels } = payload;
 
     if (Array.isArray(channels)) {
-      channels.forEach(channel => client.subscriptions.delete(channel));
+      channels.forEach(channel =>
+        this.fanOut.unsubscribe(client.subscriber, channel)
+      );
       logger.info('Client unsubscribed from channels', {
         clientId: client.id,
         channels,
@@ -215,6 +264,8 @@ export class WebSocketService {
    * Handle client disconnect
    */
   private handleDisconnect(clientId: string): void {
+    const client = this.clients.get(clientId);
+    if (client) this.fanOut.removeSubscriber(client.subscriber);
     this.clients.delete(clientId);
     logger.info('WebSocket client disconnected', {
       clientId,
@@ -226,39 +277,44 @@ export class WebSocketService {
    * Broadcast message to all clients
    */
   broadcast(message: WebSocketMessage): void {
-    const messageStr = JSON.stringify(message);
-
-    for (const client of this.clients.values()) {
-      if (client.ws.readyState === WebSocket.OPEN) {
-        client.ws.send(messageStr);
-      }
-    }
+    this.bus.publish<WebSocketBusEvent>(WEBSOCKET_TOPIC, ALL_CLIENTS_KEY, {
+      message,
+    });
+  }
 
-    logger.debug('Message broadcasted', {
-      type: message.type,
-      clientCount: this.clients.size,
+  /**
+   * Send message to specific channel subscribers. Messages sharing a
+   * coalesceKey supersede each other for clients that are lagging behind.
+   */
+  broadcastToChannel(
+    channel: string,
+    message: WebSocketMessage,
+    options?: { coalesceKey?: string }
+  ): void {
+    this.bus.publish<WebSocketBusEvent>(WEBSOCKET_TOPIC, channel, {
+      message,
+      coalesceKey: options?.coalesceKey,
     });
   }
 
   /**
-   * Send message to specific channel subscribers
+   * Deliver a message published on any node to this node's clients
    */
-  broadcastToChannel(channel: string, message: WebSocketMessage): void {
-    const messageStr = JSON.stringify(message);
-    let sentCount = 0;
+  private deliver({ key, payload }: BusMessage<WebSocketBusEvent>): void {
+    const { message, coalesceKey } = payload;
 
-    for (const client of this.clients.values()) {
-      if (
-        client.subscriptions.has(channel) &&
-        client.ws.readyState === WebSocket.OPEN
-      ) {
-        client.ws.send(messageStr);
-        sentCount++;
-      }
+    if (key === ALL_CLIENTS_KEY) {
+      const sentCount = this.fanOut.broadcast(message, { coalesceKey });
+      logger.debug('Message broadcasted', {
+        type: message.type,
+        clientCount: sentCount,
+      });
+      return;
     }
 
+    const sentCount = this.fanOut.publish(key, message, { coalesceKey });
     logger.debug('Message broadcasted to channel', {
-      channel,
+      channel: key,
       type: message.type,
       clientCount: sentCount,
     });
@@ -268,9 +324,7 @@ export class WebSocketService {
    * Send message to specific client
    */
   sendToClient(client: WebSocketClient, message: WebSocketMessage): void {
-    if (client.ws.readyState === WebSocket.OPEN) {
-      client.ws.send(JSON.stringify(message));
-    }
+    this.fanOut.send(client.subscriber, message);
   }
 
   /**
@@ -295,15 +349,44 @@ export class WebSocketService {
     });
   }
 
+  /**
+   * Send live text of a proposal section being generated. Each message
+   * carries the full section text so far, so a lagging client only needs
+   * the latest one per section.
+   */
+  notifyProposalSection(sectionData: {
+    proposalId: string;
+    section: string;
+    [key: string]: any;
+  }): void {
+    this.broadcastToChannel(
+      'proposals',
+      {
+        type: 'proposal:section',
+        payload: sectionData,
+        timestamp: new Date().toISOString(),
+      },
+      {
+        coalesceKey: `proposal:${sectionData.proposalId}:${sectionData.section}`,
+      }
+    );
+  }
+
   /**
    * Send workflow progress update
    */
   notifyWorkflowProgress(workflowData: any): void {
-    this.broadcastToChannel('workflows', {
-      type: 'workflow:progress',
-      payload: workflowData,
-      timestamp: new Date().toISOString(),
-    });
+    const workflowId = workflowData?.workflowId ?? workflowData?.id;
+    this.broadcastToChannel(
+      'workflows',
+      {
+        type: 'workflow:progress',
+        payload: workflowData,
+        timestamp: new Date().toISOString(),
+      },
+      // Only the latest progress of a workflow matters to a slow client
+      workflowId ? { coalesceKey: `workflow:${workflowId}` } : undefined
+    );
   }
 
   /**
@@ -345,6 +428,7 @@ export class WebSocketService {
             lastPing: new Date(client.lastPing).toISOString(),
           });
           client.ws.terminate();
+          this.fanOut.removeSubscriber(client.subscriber);
           this.clients.delete(client.id);
         } else if (client.ws.readyState === WebSocket.OPEN) {
           // Send ping
@@ -372,21 +456,17 @@ export class WebSocketService {
     totalConnections: number;
     activeConnections: number;
     subscriptionCounts: Record<string, number>;
+    fanOut: FanOutStats;
   } {
-    const subscriptionCounts: Record<string, number> = {};
-
-    for (const client of this.clients.values()) {
-      for (const sub of client.subscriptions) {
-        subscriptionCounts[sub] = (subscriptionCounts[sub] || 0) + 1;
-      }
-    }
+    const fanOut = this.fanOut.getStats();
 
     return {
       totalConnections: this.clients.size,
       activeConnections: Array.from(this.clients.values()).filter(
         c => c.ws.readyState === WebSocket.OPEN
       ).length,
-      subscriptionCounts,
+      subscriptionCounts: fanOut.channels,
+      fanOut,
     };
   }
 
@@ -401,6 +481,8 @@ export class WebSocketService {
     for (const client of this.clients.values()) {
       client.ws.close(1000, 'Server shutting down');
     }
+    this.fanOut.shutdown();
+    this.clients.clear();
 
     if (this.wss) {
       this.wss.close();
@@ -0,0 +1,312 @@
+import { createHash, randomUUID } from 'crypto';
+import { createReadStream, createWriteStream, promises as fs } from 'fs';
+import os from 'os';
+import path from 'path';
+import { Readable, Transform } from 'stream';
+import { pipeline } from 'stream/promises';
+import type { DocumentBlob, InsertDocumentBlob } from '@shared/schema';
+import { ObjectStorageService, objectStorageClient } from '../../objectStorage';
+import { storage } from '../../storage';
+import { LRUCache } from '../../utils/lruCache';
+import { logger } from '../../utils/logger';
+
+/**
+ * Document Content Store
+ *
+ * Stores downloaded RFP documents by the SHA-256 of their bytes, so an
+ * addendum fetched on every scan of a solicitation is uploaded and parsed
+ * once.
+ *
+ * A download is hashed while it streams to a temp spool file. If
+ * document_blobs already has the hash, the spool is dropped and the stored
+ * object is reused; otherwise the spool is uploaded to
+ * rfp_documents/blobs/<hash><ext>. Extracted text is kept on the blob row,
+ * with recently used texts cached in memory.
+ */
+
+export interface DocumentBlobRepository {
+  getDocumentBlob(contentHash: string): Promise<DocumentBlob | undefined>;
+  upsertDocumentBlob(blob: InsertDocumentBlob): Promise<DocumentBlob>;
+}
+
+/** Uploads a spooled file or buffer and returns its storage URL */
+export type DocumentBlobUploader = (
+  source: { filePath: string } | { buffer: Buffer },
+  objectPath: string,
+  contentType: string
+) => Promise<string>;
+
+export interface IngestOptions {
+  /** Original file name; its extension is kept on the stored object */
+  fileName: string;
+  contentType?: string;
+  /** Abort the download once it exceeds this many bytes */
+  maxBytes?: number;
+}
+
+export interface IngestedDocument {
+  contentHash: string;
+  /** Storage URL of the object holding these bytes */
+  storagePath: string;
+  size: number;
+  contentType: string;
+  /** True when the bytes were already stored and no upload happened */
+  deduplicated: boolean;
+}
+
+export interface DocumentContentStoreOptions {
+  blobs?: DocumentBlobRepository;
+  upload?: DocumentBlobUploader;
+  spoolDir?: string;
+  textCacheSize?: number;
+}
+
+export interface DocumentContentStoreStats {
+  ingested: number;
+  uploaded: number;
+  deduplicated: number;
+  bytesUploaded: number;
+  bytesSkipped: number;
+  textCacheHits: number;
+  textCacheMisses: number;
+  textCacheSize: number;
+}
+
+export class DocumentTooLargeError extends Error {
+  constructor(maxBytes: number) {
+    super(`Document exceeds maximum allowed size of ${maxBytes} bytes`);
+    this.name = 'DocumentTooLargeError';
+  }
+}
+
+const BLOB_PREFIX = 'rfp_documents/blobs';
+const DEFAULT_TEXT_CACHE_SIZE = 200;
+const DEFAULT_CONTENT_TYPE = 'application/octet-stream';
+
+export class DocumentContentStore {
+  private readonly blobs: DocumentBlobRepository;
+  private readonly upload: DocumentBlobUploader;
+  private readonly spoolDir: string;
+  private readonly texts: LRUCache<string, string>;
+
+  // Concurrent ingests of the same bytes share one upload
+  private inFlight = new Map<string, Promise<IngestedDocument>>();
+  private stats = {
+    ingested: 0,
+    uploaded: 0,
+    deduplicated: 0,
+    bytesUploaded: 0,
+    bytesSkipped: 0,
+    textCacheHits: 0,
+    textCacheMisses: 0,
+  };
+
+  constructor(options?: DocumentContentStoreOptions) {
+    this.blobs = options?.blobs ?? storage;
+    this.upload = options?.upload ?? uploadToObjectStorage;
+    this.spoolDir = options?.spoolDir ?? os.tmpdir();
+    this.texts = new LRUCache<string, string>({
+      maxSize: options?.textCacheSize ?? DEFAULT_TEXT_CACHE_SIZE,
+    });
+  }
+
+  /**
+   * Hash a download while spooling it to disk, then upload it unless the
+   * same bytes are already stored
+   */
+  async ingestStream(
+    source: Readable,
+    options: IngestOptions
+  ): Promise<IngestedDocument> {
+    const spoolPath = path.join(this.spoolDir, `rfp-ingest-${randomUUID()}`);
+    const hash = createHash('sha256');
+    let size = 0;
+
+    const meter = new Transform({
+      transform(chunk: Buffer, _encoding, callback) {
+        size += chunk.length;
+        if (options.maxBytes !== undefined && size > options.maxBytes) {
+          callback(new DocumentTooLargeError(options.maxBytes));
+          return;
+        }
+        hash.update(chunk);
+        callback(null, chunk);
+      },
+    });
+
+    try {
+      await pipeline(source, meter, createWriteStream(spoolPath));
+      return await this.store(
+        hash.digest('hex'),
+        size,
+        { filePath: spoolPath },
+        options
+      );
+    } finally {
+      await fs.rm(spoolPath, { force: true });
+    }
+  }
+
+  /**
+   * Store a document that is already in memory
+   */
+  async ingestBuffer(
+    buffer: Buffer,
+    options: IngestOptions
+  ): Promise<IngestedDocument> {
+    if (options.maxBytes !== undefined && buffer.length > options.maxBytes) {
+      throw new DocumentTooLargeError(options.maxBytes);
+    }
+    return this.store(hashContent(buffer), buffer.length, { buffer }, options);
+  }
+
+  /**
+   * Text extracted earlier from the same bytes, if any
+   */
+  async getExtractedText(contentHash: string): Promise<string | undefined> {
+    const cached = this.texts.get(contentHash);
+    if (cached !== undefined) {
+      this.stats.textCacheHits++;
+      return cached;
+    }
+
+    const blob = await this.blobs.getDocumentBlob(contentHash);
+    if (blob?.extractedText == null) {
+      this.stats.textCacheMisses++;
+      return undefined;
+    }
+    this.stats.textCacheHits++;
+    this.texts.set(contentHash, blob.extractedText);
+    return blob.extractedText;
+  }
+
+  /**
+   * Remember extracted text for every document with these bytes. The blob
+   * row is created if the document was stored before hashing existed.
+   */
+  async saveExtractedText(
+    contentHash: string,
+    text: string,
+    blob: { objectPath: string; size: number; contentType?: string | null }
+  ): Promise<void> {
+    this.texts.set(contentHash, text);
+    await this.blobs.upsertDocumentBlob({
+      contentHash,
+      objectPath: blob.objectPath,
+      size: blob.size,
+      contentType: blob.contentType ?? null,
+      extractedText: text,
+      textExtractedAt: new Date(),
+    });
+  }
+
+  getStats(): DocumentContentStoreStats {
+    return {
+      ...this.stats,
+      textCacheSize: this.texts.size,
+    };
+  }
+
+  private store(
+    contentHash: string,
+    size: number,
+    source: { filePath: string } | { buffer: Buffer },
+    options: IngestOptions
+  ): Promise<IngestedDocument> {
+    this.stats.ingested++;
+    const pending = this.inFlight.get(contentHash);
+    if (pending) {
+      this.stats.deduplicated++;
+      this.stats.bytesSkipped += size;
+      return pending.then(stored => ({ ...stored, deduplicated: true }));
+    }
+
+    const storing = this.storeOnce(contentHash, size, source, options);
+    this.inFlight.set(contentHash, storing);
+    return storing.finally(() => this.inFlight.delete(contentHash));
+  }
+
+  private async storeOnce(
+    contentHash: string,
+    size: number,
+    source: { filePath: string } | { buffer: Buffer },
+    options: IngestOptions
+  ): Promise<IngestedDocument> {
+    const existing = await this.blobs.getDocumentBlob(contentHash);
+    if (existing) {
+      this.stats.deduplicated++;
+      this.stats.bytesSkipped += size;
+      return {
+        contentHash,
+        storagePath: existing.objectPath,
+        size: existing.size,
+        contentType:
+          existing.contentType ?? options.contentType ?? DEFAULT_CONTENT_TYPE,
+        deduplicated: true,
+      };
+    }
+
+    const contentType = options.contentType || DEFAULT_CONTENT_TYPE;
+    const extension = blobExtension(options.fileName);
+    const objectPath = `${BLOB_PREFIX}/${contentHash}${extension}`;
+    const storagePath = await this.upload(source, objectPath, contentType);
+
+    // Another node may have stored the same bytes meanwhile; the row that
+    // won keeps its object path
+    const blob = await this.blobs.upsertDocumentBlob({
+      contentHash,
+      objectPath: storagePath,
+      size,
+      contentType,
+    });
+    this.stats.uploaded++;
+    this.stats.bytesUploaded += size;
+
+    logger.info('Stored document blob', {
+      contentHash,
+      size,
+      storagePath: blob.objectPath,
+    });
+
+    return {
+      contentHash,
+      storagePath: blob.objectPath,
+      size,
+      contentType,
+      deduplicated: false,
+    };
+  }
+}
+
+export function hashContent(data: Buffer | Uint8Array): string {
+  return createHash('sha256').update(data).digest('hex');
+}
+
+// Keep a short, safe extension so file-type detection by path still works
+function blobExtension(fileName: string): string {
+  const extension = path.extname(fileName).toLowerCase();
+  return /^\.[a-z0-9]{1,8}$/.test(extension) ? extension : '';
+}
+
+const uploadToObjectStorage: DocumentBlobUploader = async (
+  source,
+  objectPath,
+  contentType
+) => {
+  const privateDir = new ObjectStorageService().getPrivateObjectDir();
+  const bucketName = privateDir.split('/')[0];
+  const file = objectStorageClient.bucket(bucketName).file(objectPath);
+
+  if ('buffer' in source) {
+    await file.save(source.buffer, { contentType, resumable: false });
+  } else {
+    await pipeline(
+      createReadStream(source.filePath),
+      file.createWriteStream({ contentType, resumable: false })
+    );
+  }
+
+  return `https://storage.googleapis.com/${bucketName}/${objectPath}`;
+};
+
+export const documentContentStore = new DocumentContentStore();
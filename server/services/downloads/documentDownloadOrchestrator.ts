@@ -1,3 +1,4 @@
+import { and, eq } from 'drizzle-orm';
 import { db } from '../../db';
 import { documents } from '@shared/schema';
 import { logger } from '../../utils/logger';
@@ -5,7 +6,10 @@ import {
   browserbaseDownloadService,
   DownloadedFile,
 } from './browserbaseDownloadService';
-import { ObjectStorageService } from '../../objectStorage';
+import {
+  DocumentContentStore,
+  documentContentStore,
+} from './documentContentStore';
 
 export interface ExpectedDocument {
   name: string;
@@ -28,6 +32,9 @@ export interface ProcessedDocument {
   sourceSize?: number;
   verificationPassed: boolean;
   downloadStatus: 'completed' | 'verified';
+  contentHash: string;
+  /** True when this RFP already had a document with the same bytes */
+  reused: boolean;
 }
 
 export interface FailedDocument {
@@ -50,15 +57,15 @@ export interface ProcessDocumentsResult {
  * Orchestrates the complete document download workflow:
  * 1. Retrieve downloads from Browserbase cloud storage
  * 2. Verify file sizes against expected values
- * 3. Upload to Google Cloud Storage
- * 4. Store metadata in database
+ * 3. Store content-addressed in Google Cloud Storage, skipping known bytes
+ * 4. Store metadata in database, reusing the record for a repeat download
  */
 export class DocumentDownloadOrchestrator {
-  private objectStorage: ObjectStorageService;
+  private contentStore: DocumentContentStore;
   private log = logger.child({ service: 'DocumentDownloadOrchestrator' });
 
-  constructor() {
-    this.objectStorage = new ObjectStorageService();
+  constructor(contentStore: DocumentContentStore = documentContentStore) {
+    this.contentStore = contentStore;
   }
 
   /**
@@ -208,8 +215,43 @@ export class DocumentDownloadOrchestrator {
       });
     }
 
-    // Step 2: Upload to Google Cloud Storage
-    const storagePath = await this.uploadToStorage(rfpId, file);
+    // Step 2: Store the bytes; known content is not uploaded again
+    const stored = await this.contentStore.ingestBuffer(file.buffer, {
+      fileName: file.originalName,
+      contentType: file.mimeType,
+    });
+    const downloadStatus = verificationPassed ? 'verified' : 'completed';
+
+    // A repeat scan of the same solicitation keeps the existing record and
+    // its extracted text
+    const [existing] = await db
+      .select()
+      .from(documents)
+      .where(
+        and(
+          eq(documents.rfpId, rfpId),
+          eq(documents.contentHash, stored.contentHash),
+        ),
+      )
+      .limit(1);
+
+    if (existing) {
+      log.info('Document already stored for RFP', {
+        documentId: existing.id,
+        contentHash: stored.contentHash,
+      });
+      return {
+        id: existing.id,
+        filename: file.originalName,
+        objectPath: existing.objectPath,
+        downloadedSize: file.size,
+        sourceSize: expected?.expectedSize,
+        verificationPassed,
+        downloadStatus,
+        contentHash: stored.contentHash,
+        reused: true,
+      };
+    }
 
     // Step 3: Create database record
     const [record] = await db
@@ -218,11 +260,12 @@ export class DocumentDownloadOrchestrator {
         rfpId,
         filename: file.originalName,
         fileType: file.mimeType,
-        objectPath: storagePath,
+        objectPath: stored.storagePath,
+        contentHash: stored.contentHash,
         sourceUrl: expected?.sourceUrl,
         sourceSize: expected?.expectedSize,
         downloadedSize: file.size,
-        downloadStatus: verificationPassed ? 'verified' : 'completed',
+        downloadStatus,
         verificationStatus: expected?.expectedSize
           ? verificationPassed
             ? 'passed'
@@ -232,42 +275,24 @@ export class DocumentDownloadOrchestrator {
       })
       .returning();
 
-    log.info('Document record created', { documentId: record.id });
+    log.info('Document record created', {
+      documentId: record.id,
+      deduplicated: stored.deduplicated,
+    });
 
     return {
       id: record.id,
       filename: file.originalName,
-      objectPath: storagePath,
+      objectPath: stored.storagePath,
       downloadedSize: file.size,
       sourceSize: expected?.expectedSize,
       verificationPassed,
-      downloadStatus: verificationPassed ? 'verified' : 'completed',
+      downloadStatus,
+      contentHash: stored.contentHash,
+      reused: false,
     };
   }
 
-  /**
-   * Upload file buffer to Google Cloud Storage
-   */
-  private async uploadToStorage(
-    rfpId: string,
-    file: DownloadedFile,
-  ): Promise<string> {
-    const privateDir = this.objectStorage.getPrivateObjectDir();
-    const bucketName = privateDir.split('/')[0];
-
-    const safeFileName = file.originalName.replace(/[^a-zA-Z0-9._-]/g, '_');
-    const timestamp = Date.now();
-    const objectPath = `rfp_documents/${rfpId}/${timestamp}-${safeFileName}`;
-
-    await this.objectStorage.uploadPrivateObject({
-      objectPath,
-      data: file.buffer,
-      contentType: file.mimeType,
-    });
-
-    return `https://storage.googleapis.com/${bucketName}/${objectPath}`;
-  }
-
   /**
    * Normalize filename for comparison
    */
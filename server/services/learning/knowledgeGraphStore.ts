@@ -0,0 +1,556 @@
+import { MinHashLSH } from './minHashIndex';
+import type {
+  KnowledgeCluster,
+  KnowledgeEdge,
+  KnowledgeGraph,
+  KnowledgeNode,
+} from './persistentMemoryEngine';
+
+/**
+ * Incremental Knowledge Graph Store
+ *
+ * Holds a knowledge graph as an adjacency index so it can be maintained one
+ * node at a time. Upserting a knowledge item re-scores it only against its
+ * candidate neighbours (every node while the graph is small, MinHash/LSH
+ * bucket-mates after that), and only the clusters around changed nodes are
+ * rebuilt. Items whose relationship features are unchanged (e.g. a usage
+ * count bump) just refresh their node without touching edges.
+ *
+ * Edge direction follows insertion order, so building a graph by upserting
+ * every item into an empty store matches the old all-pairs pass.
+ */
+
+export interface KnowledgeRelationship {
+  type: KnowledgeEdge['relationship'];
+  strength: number;
+  confidence: number;
+  evidence: string[];
+}
+
+export interface KnowledgeGraphStoreOptions {
+  toNode: (item: any) => KnowledgeNode;
+  relate: (from: any, to: any) => KnowledgeRelationship;
+  tokenSets: (item: any) => Iterable<string>[];
+  relationKey: (item: any) => string; // Changes whenever relate() could
+  searchText: (item: any) => string; // Lower-cased text for keyword queries
+  edgeThreshold?: number;
+  clusterThreshold?: number;
+  exactPairLimit?: number;
+  yieldInterval?: number; // Pairs scored between event loop yields
+}
+
+export interface KnowledgeGraphChange {
+  changedNodeIds: string[]; // Nodes whose edges were recomputed
+  removedNodeIds: string[];
+  pairsScored: number;
+}
+
+export interface KnowledgeGraphStats {
+  nodes: number;
+  edges: number;
+  clusters: number;
+  strength: number;
+}
+
+interface GraphEntry {
+  slot: number;
+  item: any;
+  node: KnowledgeNode;
+  relationKey: string;
+  searchText: string;
+  clusterId?: string;
+}
+
+const DEFAULT_EDGE_THRESHOLD = 0.3;
+const DEFAULT_CLUSTER_THRESHOLD = 0.7;
+const DEFAULT_EXACT_PAIR_LIMIT = 256;
+const DEFAULT_YIELD_INTERVAL = 5000;
+const RECENT_ACTIVITY_MS = 7 * 24 * 60 * 60 * 1000;
+
+export class KnowledgeGraphStore {
+  private readonly options: KnowledgeGraphStoreOptions;
+  private readonly edgeThreshold: number;
+  private readonly clusterThreshold: number;
+  private readonly exactPairLimit: number;
+  private readonly yieldInterval: number;
+
+  private entries = new Map<string, GraphEntry>();
+  private slotIds = new Map<number, string>();
+  private nextSlot = 0;
+  private adjacency = new Map<string, Map<string, KnowledgeEdge>>();
+  private indexes: MinHashLSH[] = [];
+  private clusters = new Map<string, KnowledgeCluster>();
+  private edgeCount = 0;
+  private totalStrength = 0;
+  private pairsSinceYield = 0;
+
+  constructor(options: KnowledgeGraphStoreOptions) {
+    this.options = options;
+    this.edgeThreshold = options.edgeThreshold ?? DEFAULT_EDGE_THRESHOLD;
+    this.clusterThreshold =
+      options.clusterThreshold ?? DEFAULT_CLUSTER_THRESHOLD;
+    this.exactPairLimit = options.exactPairLimit ?? DEFAULT_EXACT_PAIR_LIMIT;
+    this.yieldInterval = options.yieldInterval ?? DEFAULT_YIELD_INTERVAL;
+  }
+
+  get size(): number {
+    return this.entries.size;
+  }
+
+  has(id: string): boolean {
+    return this.entries.has(id);
+  }
+
+  /**
+   * Restore a graph from items and previously computed edges without
+   * re-scoring any pairs. Edges referencing unknown items are dropped.
+   */
+  load(items: any[], edges: KnowledgeEdge[]): void {
+    this.clear();
+    for (const item of items) {
+      this.insertEntry(item);
+    }
+    for (const edge of edges) {
+      if (this.entries.has(edge.from) && this.entries.has(edge.to)) {
+        this.attachEdge(edge);
+      }
+    }
+    this.reclusterAll();
+  }
+
+  /**
+   * Add or update knowledge items, recomputing edges only for items whose
+   * relationship features changed (or every item when force is set)
+   */
+  async upsert(
+    items: any[],
+    options?: { force?: boolean }
+  ): Promise<KnowledgeGraphChange> {
+    const changed: string[] = [];
+    const affected = new Set<string>();
+    let pairsScored = 0;
+
+    for (const item of items) {
+      const existing = this.entries.get(item.id);
+      const relationKey = this.options.relationKey(item);
+
+      if (
+        existing &&
+        !options?.force &&
+        existing.relationKey === relationKey
+      ) {
+        this.refreshEntry(existing, item);
+        affected.add(item.id);
+        continue;
+      }
+
+      if (existing) {
+        for (const neighborId of this.detachEdges(item.id)) {
+          affected.add(neighborId);
+        }
+        this.unindexEntry(existing);
+        this.refreshEntry(existing, item);
+        existing.relationKey = relationKey;
+        this.indexEntry(existing);
+      } else {
+        this.insertEntry(item);
+      }
+
+      const entry = this.entries.get(item.id)!;
+      for (const otherId of this.candidatesFor(entry)) {
+        const other = this.entries.get(otherId)!;
+        const [from, to] =
+          other.slot < entry.slot ? [other, entry] : [entry, other];
+        const relationship = this.options.relate(from.item, to.item);
+        pairsScored++;
+
+        if (relationship.strength > this.edgeThreshold) {
+          this.attachEdge({
+            id: `edge_${from.node.id}_${to.node.id}`,
+            from: from.node.id,
+            to: to.node.id,
+            relationship: relationship.type,
+            strength: relationship.strength,
+            confidence: relationship.confidence,
+            evidence: relationship.evidence,
+          });
+          affected.add(otherId);
+        }
+
+        if (++this.pairsSinceYield >= this.yieldInterval) {
+          this.pairsSinceYield = 0;
+          await new Promise(resolve => setTimeout(resolve, 0));
+        }
+      }
+
+      changed.push(item.id);
+      affected.add(item.id);
+    }
+
+    this.reclusterAround(affected);
+    return { changedNodeIds: changed, removedNodeIds: [], pairsScored };
+  }
+
+  /**
+   * Remove knowledge items and their edges
+   */
+  remove(ids: string[]): KnowledgeGraphChange {
+    const removed: string[] = [];
+    const affected = new Set<string>();
+
+    for (const id of ids) {
+      const entry = this.entries.get(id);
+      if (!entry) continue;
+
+      for (const neighborId of this.detachEdges(id)) {
+        affected.add(neighborId);
+      }
+      this.dissolveCluster(entry.clusterId, affected);
+      this.unindexEntry(entry);
+      this.entries.delete(id);
+      this.slotIds.delete(entry.slot);
+      this.adjacency.delete(id);
+      affected.delete(id);
+      removed.push(id);
+    }
+
+    this.reclusterAround(affected);
+    return { changedNodeIds: [], removedNodeIds: removed, pairsScored: 0 };
+  }
+
+  getNode(id: string): KnowledgeNode | undefined {
+    return this.entries.get(id)?.node;
+  }
+
+  /**
+   * Edges touching a node, from the adjacency index
+   */
+  getEdges(id: string): KnowledgeEdge[] {
+    return Array.from(this.adjacency.get(id)?.values() ?? []);
+  }
+
+  getNeighbors(id: string): KnowledgeNode[] {
+    const neighbors: KnowledgeNode[] = [];
+    for (const neighborId of this.adjacency.get(id)?.keys() ?? []) {
+      neighbors.push(this.entries.get(neighborId)!.node);
+    }
+    return neighbors;
+  }
+
+  /**
+   * Nodes matching a type and any keyword, ranked by importance and
+   * connectivity
+   */
+  findNodes(query: {
+    type?: KnowledgeNode['type'];
+    keywords?: string[];
+    limit?: number;
+  }): KnowledgeNode[] {
+    const keywords = (query.keywords ?? []).map(keyword =>
+      keyword.toLowerCase()
+    );
+    const matches: KnowledgeNode[] = [];
+
+    for (const entry of this.entries.values()) {
+      if (query.type && entry.node.type !== query.type) continue;
+      if (
+        keywords.length > 0 &&
+        !keywords.some(keyword => entry.searchText.includes(keyword))
+      ) {
+        continue;
+      }
+      matches.push(entry.node);
+    }
+
+    const score = (node: KnowledgeNode) =>
+      node.importance * 0.7 + node.connections * 0.3;
+    matches.sort((a, b) => score(b) - score(a));
+    return query.limit ? matches.slice(0, query.limit) : matches;
+  }
+
+  /**
+   * All distinct edges, each reported once
+   */
+  getAllEdges(): KnowledgeEdge[] {
+    const edges: KnowledgeEdge[] = [];
+    for (const [id, neighbors] of this.adjacency) {
+      for (const edge of neighbors.values()) {
+        if (edge.from === id) edges.push(edge);
+      }
+    }
+    return edges;
+  }
+
+  getClusters(): KnowledgeCluster[] {
+    return Array.from(this.clusters.values());
+  }
+
+  getStrength(): number {
+    const n = this.entries.size;
+    const maxPossibleConnections = (n * (n - 1)) / 2;
+    return maxPossibleConnections > 0
+      ? this.totalStrength / maxPossibleConnections
+      : 0;
+  }
+
+  getStats(): KnowledgeGraphStats {
+    return {
+      nodes: this.entries.size,
+      edges: this.edgeCount,
+      clusters: this.clusters.size,
+      strength: this.getStrength(),
+    };
+  }
+
+  toGraph(): KnowledgeGraph {
+    return {
+      nodes: Array.from(this.entries.values(), entry => entry.node),
+      edges: this.getAllEdges(),
+      clusters: this.getClusters(),
+      strength: this.getStrength(),
+      lastUpdated: new Date(),
+    };
+  }
+
+  private clear(): void {
+    this.entries.clear();
+    this.slotIds.clear();
+    this.adjacency.clear();
+    this.clusters.clear();
+    this.indexes = [];
+    this.nextSlot = 0;
+    this.edgeCount = 0;
+    this.totalStrength = 0;
+  }
+
+  private insertEntry(item: any): void {
+    const entry: GraphEntry = {
+      slot: this.nextSlot++,
+      item,
+      node: this.options.toNode(item),
+      relationKey: this.options.relationKey(item),
+      searchText: this.options.searchText(item),
+    };
+    entry.node.connections = 0;
+    this.entries.set(item.id, entry);
+    this.slotIds.set(entry.slot, item.id);
+    this.adjacency.set(item.id, new Map());
+    this.indexEntry(entry);
+  }
+
+  // Replace the item and node attributes, keeping slot, edges and cluster
+  private refreshEntry(entry: GraphEntry, item: any): void {
+    const connections = entry.node.connections;
+    entry.item = item;
+    entry.node = this.options.toNode(item);
+    entry.node.connections = connections;
+    entry.searchText = this.options.searchText(item);
+  }
+
+  private indexEntry(entry: GraphEntry): void {
+    this.options.tokenSets(entry.item).forEach((tokens, setIndex) => {
+      if (!this.indexes[setIndex]) this.indexes[setIndex] = new MinHashLSH();
+      this.indexes[setIndex].add(entry.slot, tokens);
+    });
+  }
+
+  private unindexEntry(entry: GraphEntry): void {
+    for (const lsh of this.indexes) {
+      lsh.remove(entry.slot);
+    }
+  }
+
+  private candidatesFor(entry: GraphEntry): string[] {
+    if (this.entries.size <= this.exactPairLimit) {
+      return Array.from(this.entries.keys()).filter(
+        id => id !== entry.node.id
+      );
+    }
+
+    const candidates = new Set<string>();
+    for (const lsh of this.indexes) {
+      for (const slot of lsh.candidates(entry.slot)) {
+        candidates.add(this.slotIds.get(slot)!);
+      }
+    }
+    return Array.from(candidates);
+  }
+
+  private attachEdge(edge: KnowledgeEdge): void {
+    const fromEdges = this.adjacency.get(edge.from)!;
+    const toEdges = this.adjacency.get(edge.to)!;
+    const previous = fromEdges.get(edge.to);
+    if (previous) {
+      this.totalStrength -= previous.strength;
+    } else {
+      this.edgeCount++;
+      this.entries.get(edge.from)!.node.connections++;
+      this.entries.get(edge.to)!.node.connections++;
+    }
+
+    fromEdges.set(edge.to, edge);
+    toEdges.set(edge.from, edge);
+    this.totalStrength += edge.strength;
+  }
+
+  // Remove every edge touching a node; returns the former neighbours
+  private detachEdges(id: string): string[] {
+    const edges = this.adjacency.get(id);
+    if (!edges) return [];
+
+    const neighborIds = Array.from(edges.keys());
+    for (const [neighborId, edge] of edges) {
+      this.adjacency.get(neighborId)!.delete(id);
+      this.entries.get(neighborId)!.node.connections--;
+      this.totalStrength -= edge.strength;
+      this.edgeCount--;
+    }
+    edges.clear();
+    this.entries.get(id)!.node.connections = 0;
+    return neighborIds;
+  }
+
+  private strongNeighbors(id: string): string[] {
+    const neighbors: string[] = [];
+    for (const [neighborId, edge] of this.adjacency.get(id) ?? []) {
+      if (edge.strength > this.clusterThreshold) neighbors.push(neighborId);
+    }
+    return neighbors;
+  }
+
+  private dissolveCluster(
+    clusterId: string | undefined,
+    released: Set<string>
+  ): void {
+    if (!clusterId) return;
+    const cluster = this.clusters.get(clusterId);
+    if (!cluster) return;
+
+    for (const memberId of cluster.nodes) {
+      const member = this.entries.get(memberId);
+      if (member) member.clusterId = undefined;
+      released.add(memberId);
+    }
+    this.clusters.delete(clusterId);
+  }
+
+  private reclusterAll(): void {
+    this.clusters.clear();
+    for (const entry of this.entries.values()) {
+      entry.clusterId = undefined;
+    }
+    this.formClusters(Array.from(this.entries.values()));
+  }
+
+  /**
+   * Dissolve the clusters around the affected nodes (and their strong
+   * neighbours) and greedily rebuild star clusters from the released nodes.
+   * Clusters elsewhere in the graph are left as they are.
+   */
+  private reclusterAround(affected: Set<string>): void {
+    if (affected.size === 0) return;
+
+    const region = new Set<string>();
+    for (const id of affected) {
+      if (!this.entries.has(id)) continue;
+      region.add(id);
+      for (const neighborId of this.strongNeighbors(id)) {
+        region.add(neighborId);
+      }
+    }
+
+    const released = new Set<string>(region);
+    for (const id of region) {
+      this.dissolveCluster(this.entries.get(id)!.clusterId, released);
+    }
+
+    const seeds: GraphEntry[] = [];
+    for (const id of released) {
+      const entry = this.entries.get(id);
+      if (entry) seeds.push(entry);
+    }
+    seeds.sort((a, b) => a.slot - b.slot);
+    this.formClusters(seeds);
+  }
+
+  // Each unclustered seed claims its unclustered strong neighbours
+  private formClusters(seeds: GraphEntry[]): void {
+    const processed = new Set<string>();
+
+    for (const seed of seeds) {
+      if (processed.has(seed.node.id) || seed.clusterId) continue;
+      processed.add(seed.node.id);
+
+      const members = [seed.node.id];
+      for (const neighborId of this.strongNeighbors(seed.node.id)) {
+        if (processed.has(neighborId)) continue;
+        if (this.entries.get(neighborId)!.clusterId) continue;
+        members.push(neighborId);
+        processed.add(neighborId);
+      }
+      if (members.length < 2) continue;
+
+      const cluster: KnowledgeCluster = {
+        id: `cluster_${seed.node.id}`,
+        name: `Cluster: ${seed.node.label}`,
+        nodes: members,
+        cohesion: this.calculateCohesion(members),
+        domain: this.determineDominantDomain(members),
+        keyInsights: this.extractInsights(members),
+      };
+      for (const memberId of members) {
+        this.entries.get(memberId)!.clusterId = cluster.id;
+      }
+      this.clusters.set(cluster.id, cluster);
+    }
+  }
+
+  private calculateCohesion(memberIds: string[]): number {
+    const members = new Set(memberIds);
+    let internalEdges = 0;
+    for (const id of memberIds) {
+      for (const neighborId of this.adjacency.get(id)!.keys()) {
+        if (members.has(neighborId)) internalEdges++;
+      }
+    }
+
+    const maxPossibleEdges = (memberIds.length * (memberIds.length - 1)) / 2;
+    return maxPossibleEdges > 0 ? internalEdges / 2 / maxPossibleEdges : 0;
+  }
+
+  private determineDominantDomain(memberIds: string[]): string {
+    const domainCounts: Record<string, number> = {};
+    for (const id of memberIds) {
+      const domain = this.entries.get(id)!.node.content?.domain;
+      if (domain && domain !== 'general') {
+        domainCounts[domain] = (domainCounts[domain] || 0) + 1;
+      }
+    }
+
+    const domains = Object.keys(domainCounts);
+    if (domains.length === 0) return 'general';
+    return domains.reduce((a, b) =>
+      domainCounts[a] > domainCounts[b] ? a : b
+    );
+  }
+
+  private extractInsights(memberIds: string[]): string[] {
+    const insights = [];
+    const now = Date.now();
+    let importance = 0;
+    let recent = 0;
+    for (const id of memberIds) {
+      const node = this.entries.get(id)!.node;
+      importance += node.importance;
+      if (now - node.lastActivated.getTime() < RECENT_ACTIVITY_MS) recent++;
+    }
+
+    if (importance / memberIds.length > 0.8) {
+      insights.push('High importance cluster');
+    }
+    if (recent > memberIds.length * 0.5) {
+      insights.push('Recently active cluster');
+    }
+    return insights;
+  }
+}
@@ -0,0 +1,234 @@
+/**
+ * MinHash / LSH Candidate Index
+ *
+ * Finds likely-similar items without comparing every pair. Each item's token
+ * set is reduced to a MinHash signature (bands x rowsPerBand values) whose
+ * per-position agreement probability equals the sets' Jaccard similarity.
+ * Items sharing any band land in the same bucket and become candidates, so
+ * only those pairs need an exact score.
+ *
+ * Roughly, a pair with Jaccard similarity J becomes a candidate with
+ * probability 1 - (1 - J^rowsPerBand)^bands.
+ *
+ * Buckets larger than maxBucketSize (e.g. every memory sharing one common
+ * tag) would reintroduce all-pairs work, so within a bucket only members
+ * fewer than maxBucketSize positions apart are paired. Items with identical
+ * signatures are also grouped on their own and paired the same way, so
+ * exact duplicates still find each other inside a large bucket.
+ */
+
+export interface MinHashLSHOptions {
+  bands?: number;
+  rowsPerBand?: number;
+  maxBucketSize?: number;
+  seed?: number;
+}
+
+export interface MinHashLSHStats {
+  items: number;
+  buckets: number;
+  oversizedBuckets: number;
+}
+
+const DEFAULT_BANDS = 16;
+const DEFAULT_ROWS_PER_BAND = 2;
+const DEFAULT_MAX_BUCKET_SIZE = 200;
+
+/**
+ * 32-bit FNV-1a hash of a string
+ */
+export function hashToken(token: string): number {
+  let hash = 0x811c9dc5;
+  for (let i = 0; i < token.length; i++) {
+    hash ^= token.charCodeAt(i);
+    hash = Math.imul(hash, 0x01000193);
+  }
+  return hash >>> 0;
+}
+
+// Murmur3 finalizer; mixing the token hash with a per-row seed gives
+// independent hash functions without storing permutations
+function mix32(value: number): number {
+  let h = value;
+  h ^= h >>> 16;
+  h = Math.imul(h, 0x85ebca6b);
+  h ^= h >>> 13;
+  h = Math.imul(h, 0xc2b2ae35);
+  h ^= h >>> 16;
+  return h >>> 0;
+}
+
+export class MinHashLSH {
+  private readonly bands: number;
+  private readonly rowsPerBand: number;
+  private readonly maxBucketSize: number;
+  private readonly seeds: Uint32Array;
+  private buckets = new Map<string, number[]>();
+  private itemBuckets = new Map<number, string[]>();
+  // Items keyed by their full signature; a bucket in its own right
+  private signatureGroups = new Map<string, number[]>();
+
+  constructor(options?: MinHashLSHOptions) {
+    this.bands = options?.bands ?? DEFAULT_BANDS;
+    this.rowsPerBand = options?.rowsPerBand ?? DEFAULT_ROWS_PER_BAND;
+    this.maxBucketSize = options?.maxBucketSize ?? DEFAULT_MAX_BUCKET_SIZE;
+
+    const numHashes = this.bands * this.rowsPerBand;
+    this.seeds = new Uint32Array(numHashes);
+    let state = options?.seed ?? 0x9e3779b9;
+    for (let i = 0; i < numHashes; i++) {
+      state = mix32(state + 0x9e3779b9);
+      this.seeds[i] = state;
+    }
+  }
+
+  /**
+   * MinHash signature of a token set; null when the set is empty
+   */
+  signature(tokens: Iterable<string>): Uint32Array | null {
+    const signature = new Uint32Array(this.seeds.length).fill(0xffffffff);
+    let empty = true;
+
+    for (const token of tokens) {
+      empty = false;
+      const hash = hashToken(token);
+      for (let i = 0; i < this.seeds.length; i++) {
+        const value = mix32(hash ^ this.seeds[i]);
+        if (value < signature[i]) signature[i] = value;
+      }
+    }
+
+    return empty ? null : signature;
+  }
+
+  /**
+   * Index an item under each of its band buckets. Items with no tokens are
+   * never candidates.
+   */
+  add(id: number, tokens: Iterable<string>): void {
+    const signature = this.signature(tokens);
+    if (!signature) return;
+
+    const keys: string[] = [];
+    for (let band = 0; band < this.bands; band++) {
+      const start = band * this.rowsPerBand;
+      let key = `${band}`;
+      for (let row = 0; row < this.rowsPerBand; row++) {
+        key += `:${signature[start + row]}`;
+      }
+      keys.push(key);
+
+      addMember(this.buckets, key, id);
+    }
+    addMember(this.signatureGroups, keys.join('|'), id);
+    this.itemBuckets.set(id, keys);
+  }
+
+  /**
+   * Drop an item from every bucket it was indexed under
+   */
+  remove(id: number): void {
+    const keys = this.itemBuckets.get(id);
+    if (!keys) return;
+
+    for (const key of keys) {
+      removeMember(this.buckets, key, id);
+    }
+    removeMember(this.signatureGroups, keys.join('|'), id);
+    this.itemBuckets.delete(id);
+  }
+
+  /**
+   * Items sharing at least one bucket with the given item, in ascending id
+   * order. In buckets larger than maxBucketSize only the members within
+   * maxBucketSize positions of the item count.
+   */
+  candidates(id: number): number[] {
+    const keys = this.itemBuckets.get(id);
+    if (!keys) return [];
+
+    const result = new Set<number>();
+    const collect = (bucket: number[]) => {
+      const position = bucket.indexOf(id);
+      const start = Math.max(0, position - this.maxBucketSize + 1);
+      const end = Math.min(bucket.length, position + this.maxBucketSize);
+      for (let i = start; i < end; i++) {
+        if (bucket[i] !== id) result.add(bucket[i]);
+      }
+    };
+
+    for (const key of keys) {
+      collect(this.buckets.get(key)!);
+    }
+    collect(this.signatureGroups.get(keys.join('|'))!);
+    return Array.from(result).sort((a, b) => a - b);
+  }
+
+  /**
+   * Every distinct candidate pair [a, b] with a < b, using the same
+   * per-bucket cap as candidates()
+   */
+  candidatePairs(): Array<[number, number]> {
+    const seen = new Set<string>();
+    const pairs: Array<[number, number]> = [];
+
+    for (const bucket of [
+      ...this.buckets.values(),
+      ...this.signatureGroups.values(),
+    ]) {
+      for (let i = 0; i < bucket.length; i++) {
+        const end = Math.min(bucket.length, i + this.maxBucketSize);
+        for (let j = i + 1; j < end; j++) {
+          const a = Math.min(bucket[i], bucket[j]);
+          const b = Math.max(bucket[i], bucket[j]);
+          const key = `${a}:${b}`;
+          if (seen.has(key)) continue;
+          seen.add(key);
+          pairs.push([a, b]);
+        }
+      }
+    }
+
+    return pairs;
+  }
+
+  getStats(): MinHashLSHStats {
+    let oversizedBuckets = 0;
+    for (const bucket of this.buckets.values()) {
+      if (bucket.length > this.maxBucketSize) oversizedBuckets++;
+    }
+    return {
+      items: this.itemBuckets.size,
+      buckets: this.buckets.size,
+      oversizedBuckets,
+    };
+  }
+}
+
+function addMember(
+  buckets: Map<string, number[]>,
+  key: string,
+  id: number
+): void {
+  const bucket = buckets.get(key);
+  if (bucket) {
+    bucket.push(id);
+  } else {
+    buckets.set(key, [id]);
+  }
+}
+
+function removeMember(
+  buckets: Map<string, number[]>,
+  key: string,
+  id: number
+): void {
+  const bucket = buckets.get(key);
+  if (!bucket) return;
+  const position = bucket.indexOf(id);
+  if (position !== -1) {
+    bucket[position] = bucket[bucket.length - 1];
+    bucket.pop();
+  }
+  if (bucket.length === 0) buckets.delete(key);
+}
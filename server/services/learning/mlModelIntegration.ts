@@ -1,5 +1,18 @@
 import OpenAI from 'openai';
 import { storage } from '../../storage';
+import {
+  RFP_EMBEDDING_DIMENSIONS,
+  RFP_EMBEDDING_MODEL,
+  rfpEmbeddingIndex,
+} from './rfpEmbeddingIndex';
+import {
+  VectorMatrix,
+  kMeans,
+  meanSilhouette,
+  normalizeVector,
+  scoreAll,
+  selectTopK,
+} from './vectorKernel';
 
 /**
  * ML Model Integration for RFP Agent Intelligence
@@ -228,7 +241,10 @@ export class MLModelIntegration {
   }
 
   /**
-   * Batch generate embeddings for multiple texts
+   * Batch generate embeddings for multiple texts.
+   * Texts already in the embedding cache are not sent to the API again.
+   * The result is aligned with `texts`; entries whose batch failed are
+   * undefined.
    */
   async generateEmbeddingBatch(
     texts: string[],
@@ -237,28 +253,41 @@ export class MLModelIntegration {
       dimensions?: number;
       batchSize?: number;
     }
-  ): Promise<number[][]> {
+  ): Promise<Array<number[] | undefined>> {
     const batchSize = options?.batchSize || 100;
-    const embeddings: number[][] = [];
+    const model = options?.model || this.embeddingModel;
+    const dimensions = options?.dimensions || this.embeddingDimensions;
+    const cacheKeyFor = (text: string) => `${text}_${model}_${dimensions}`;
 
-    for (let i = 0; i < texts.length; i += batchSize) {
-      const batch = texts.slice(i, i + batchSize);
+    const results: Array<number[] | undefined> = texts.map(text =>
+      this.embeddingCache.get(cacheKeyFor(text))
+    );
+    const uncachedIndices = results
+      .map((embedding, idx) => (embedding ? -1 : idx))
+      .filter(idx => idx !== -1);
+
+    for (let i = 0; i < uncachedIndices.length; i += batchSize) {
+      const batchIndices = uncachedIndices.slice(i, i + batchSize);
 
       try {
         const response = await openai.embeddings.create({
-          model: options?.model || this.embeddingModel,
-          input: batch,
+          model,
+          input: batchIndices.map(idx => texts[idx]),
           dimensions: options?.dimensions,
         });
 
-        embeddings.push(...response.data.map(d => d.embedding));
+        response.data.forEach((d, j) => {
+          const idx = batchIndices[j];
+          results[idx] = d.embedding;
+          this.embeddingCache.set(cacheKeyFor(texts[idx]), d.embedding);
+        });
 
         console.log(
-          `🔢 Generated ${embeddings.length}/${texts.length} embeddings`
+          `🔢 Generated ${Math.min(i + batchSize, uncachedIndices.length)}/${uncachedIndices.length} embeddings (${texts.length - uncachedIndices.length} cached)`
         );
       } catch (error) {
         console.error(
-          `❌ Error generating embeddings for batch (texts ${i}-${i + batch.length - 1}):`,
+          `❌ Error generating embeddings for batch (texts ${i}-${i + batchIndices.length - 1}):`,
           error instanceof Error ? error.message : error
         );
         // Skip this batch and continue with remaining batches
@@ -267,13 +296,13 @@ export class MLModelIntegration {
     }
 
     // Ensure we have at least some embeddings
-    if (embeddings.length === 0) {
+    if (texts.length > 0 && results.every(embedding => !embedding)) {
       throw new Error(
         `Failed to generate any embeddings for ${texts.length} texts. All batches failed.`
       );
     }
 
-    return embeddings;
+    return results;
   }
 
   /**
@@ -294,37 +323,31 @@ export class MLModelIntegration {
       // Generate query embedding
       const queryEmbedding = await this.generateEmbedding(query);
 
-      // Generate document embeddings
+      // Generate document embeddings, dropping documents whose batch failed
       const docTexts = documents.map(d => d.text);
       const docEmbeddings = await this.generateEmbeddingBatch(docTexts);
+      const embeddedDocs = documents.filter((_, idx) => docEmbeddings[idx]);
+      const vectors = docEmbeddings.filter(
+        (embedding): embedding is number[] => embedding !== undefined
+      );
 
-      // Calculate similarities
-      const results: SemanticSearchResult[] = [];
-
-      for (let i = 0; i < documents.length; i++) {
-        const similarity = this.cosineSimilarity(
-          queryEmbedding,
-          docEmbeddings[i]
-        );
-
-        if (similarity >= threshold) {
-          results.push({
-            id: documents[i].id,
-            text: documents[i].text,
-            similarity,
-            metadata: documents[i].metadata,
-          });
-        }
-      }
-
-      // Sort by similarity and return top K
-      results.sort((a, b) => b.similarity - a.similarity);
+      // Score all documents in one pass over a contiguous matrix
+      const matrix = VectorMatrix.from(vectors, queryEmbedding.length);
+      const scores = scoreAll(matrix, normalizeVector(queryEmbedding));
+      const results: SemanticSearchResult[] = selectTopK(scores, topK, {
+        minScore: threshold,
+      }).map(({ index, score }) => ({
+        id: embeddedDocs[index].id,
+        text: embeddedDocs[index].text,
+        similarity: score,
+        metadata: embeddedDocs[index].metadata,
+      }));
 
       console.log(
         `🔍 Semantic Search: Found ${results.length} results above threshold ${threshold}`
       );
 
-      return results.slice(0, topK);
+      return results;
     } catch (error) {
       console.error('Error in semantic search:', error);
       return [];
@@ -332,7 +355,42 @@ export class MLModelIntegration {
   }
 
   /**
-   * Find similar RFPs using embeddings
+   * Semantic search over all RFPs using the persistent embedding index.
+   * Only the query text is embedded (and cached); RFP vectors come from the index.
+   */
+  async semanticSearchRFPs(
+    query: string,
+    options?: {
+      topK?: number;
+      threshold?: number;
+    }
+  ): Promise<SemanticSearchResult[]> {
+    try {
+      const queryEmbedding = await this.generateEmbedding(query, {
+        model: RFP_EMBEDDING_MODEL,
+        dimensions: RFP_EMBEDDING_DIMENSIONS,
+      });
+
+      const matches = await rfpEmbeddingIndex.query(queryEmbedding, {
+        topK: options?.topK || 10,
+        minSimilarity: options?.threshold || 0.5,
+      });
+
+      return matches.map(match => ({
+        id: match.rfpId,
+        text: '',
+        similarity: match.similarity,
+        metadata: { agency: match.agency, category: match.category },
+      }));
+    } catch (error) {
+      console.error('Error in RFP semantic search:', error);
+      return [];
+    }
+  }
+
+  /**
+   * Find similar RFPs using the persistent embedding index.
+   * Makes no embedding calls when the RFP's stored embedding is current.
    */
   async findSimilarRFPs(
     rfpId: string,
@@ -348,30 +406,16 @@ export class MLModelIntegration {
       const rfp = await storage.getRFP(rfpId);
       if (!rfp) return [];
 
-      // Create RFP text representation
-      const rfpText = `${rfp.title}\n${rfp.description}\nAgency: ${rfp.agency}\nCategory: ${rfp.category}`;
-
-      // Get all other RFPs
-      const allRfps = await storage.getAllRFPs();
-      const otherRfps = allRfps.rfps.filter((r: any) => r.id !== rfpId);
-
-      // Perform semantic search
-      const documents = otherRfps.map(r => ({
-        id: r.id,
-        text: `${r.title}\n${r.description}\nAgency: ${r.agency}\nCategory: ${r.category}`,
-        metadata: { agency: r.agency, category: r.category },
-      }));
-
-      const results = await this.semanticSearch(rfpText, documents, {
+      const results = await rfpEmbeddingIndex.findSimilar(rfp, {
         topK: options?.topK || 10,
-        threshold: options?.minSimilarity || 0.7,
+        minSimilarity: options?.minSimilarity || 0.7,
       });
 
       // Identify matching features
       return results.map(r => ({
-        rfpId: r.id,
+        rfpId: r.rfpId,
         similarity: r.similarity,
-        matchingFeatures: this.identifyMatchingFeatures(rfp, r.metadata),
+        matchingFeatures: this.identifyMatchingFeatures(rfp, r),
       }));
     } catch (error) {
       console.error('Error finding similar RFPs:', error);
@@ -666,25 +710,31 @@ Respond with JSON:
    * Cluster RFPs by similarity
    */
   async clusterRFPs(
-    rfps: Array<{ id: string; text: string }>,
+    inputRfps: Array<{ id: string; text: string }>,
     options?: {
       numClusters?: number;
       minClusterSize?: number;
     }
   ): Promise<ClusterAnalysis> {
     try {
-      // Generate embeddings for all RFPs
-      const embeddings = await this.generateEmbeddingBatch(
-        rfps.map(r => r.text)
+      // Generate embeddings for all RFPs, dropping those whose batch failed
+      const allEmbeddings = await this.generateEmbeddingBatch(
+        inputRfps.map(r => r.text)
+      );
+      const rfps = inputRfps.filter((_, idx) => allEmbeddings[idx]);
+      const embeddings = allEmbeddings.filter(
+        (embedding): embedding is number[] => embedding !== undefined
       );
 
+      const matrix = VectorMatrix.from(embeddings);
+
       // Determine optimal number of clusters (if not specified)
       const k =
         options?.numClusters ||
         Math.min(10, Math.ceil(Math.sqrt(rfps.length / 2)));
 
       // K-means clustering
-      const clusters = this.kMeansClustering(embeddings, k);
+      const clusters = this.kMeansClustering(matrix, k);
 
       // Calculate cluster characteristics
       const clusterAnalysis = clusters.map((cluster, i) => ({
@@ -697,10 +747,7 @@ Respond with JSON:
       }));
 
       // Calculate silhouette score (cluster quality metric)
-      const silhouetteScore = this.calculateSilhouetteScore(
-        embeddings,
-        clusters
-      );
+      const silhouetteScore = this.calculateSilhouetteScore(matrix, clusters);
 
       console.log(
         `🎯 Clustering: ${k} clusters, silhouette score: ${silhouetteScore.toFixed(3)}`
@@ -808,22 +855,6 @@ Respond with JSON:
   // HELPER METHODS
   // ========================================================================
 
-  private cosineSimilarity(a: number[], b: number[]): number {
-    if (a.length !== b.length) return 0;
-
-    let dotProduct = 0;
-    let normA = 0;
-    let normB = 0;
-
-    for (let i = 0; i < a.length; i++) {
-      dotProduct += a[i] * b[i];
-      normA += a[i] * a[i];
-      normB += b[i] * b[i];
-    }
-
-    return dotProduct / (Math.sqrt(normA) * Math.sqrt(normB));
-  }
-
   private identifyMatchingFeatures(rfp1: any, rfp2Metadata: any): string[] {
     const features: string[] = [];
 
@@ -1024,166 +1055,35 @@ Respond with JSON:
     );
   }
 
+  /**
+   * K-means over L2-normalized embeddings (see vectorKernel.kMeans)
+   */
   private kMeansClustering(
-    embeddings: number[][],
+    matrix: VectorMatrix,
     k: number,
     options?: { maxIterations?: number; seed?: number }
   ): Array<{
     centroid: number[];
     memberIndices: number[];
   }> {
-    const maxIterations = options?.maxIterations || 100;
-    const n = embeddings.length;
-
-    // Input validation
-    if (k <= 0) {
-      throw new Error('k must be greater than 0');
-    }
-    if (n === 0) {
-      throw new Error('embeddings cannot be empty');
-    }
-
-    // Adjust k if it exceeds number of points
-    const effectiveK = Math.min(k, n);
-
-    // Helper: Euclidean distance
-    const euclideanDistance = (a: number[], b: number[]): number => {
-      return Math.sqrt(
-        a.reduce((sum, val, i) => sum + Math.pow(val - b[i], 2), 0)
-      );
-    };
-
-    // Helper: Calculate mean of vectors
-    const calculateMean = (vectors: number[][]): number[] => {
-      if (vectors.length === 0) return [];
-      const dim = vectors[0].length;
-      const mean = new Array(dim).fill(0);
-      vectors.forEach(vec => {
-        vec.forEach((val, i) => {
-          mean[i] += val / vectors.length;
-        });
-      });
-      return mean;
-    };
-
-    // K-means++ initialization for better centroid selection
-    const initializeCentroids = (): number[][] => {
-      const centroids: number[][] = [];
-      const rng =
+    const result = kMeans(matrix, k, {
+      maxIterations: options?.maxIterations,
+      random:
         options?.seed !== undefined
           ? this.seededRandom(options.seed)
-          : Math.random;
-
-      // First centroid: random point
-      const firstIdx = Math.floor(rng() * n);
-      centroids.push([...embeddings[firstIdx]]);
-
-      // Select remaining centroids using k-means++
-      for (let i = 1; i < effectiveK; i++) {
-        const distances = embeddings.map(point => {
-          const minDist = Math.min(
-            ...centroids.map(c => Math.pow(euclideanDistance(point, c), 2))
-          );
-          return minDist;
-        });
-
-        const totalDist = distances.reduce((sum, d) => sum + d, 0);
-        let threshold = rng() * totalDist;
-
-        let selectedIdx = 0;
-        for (let j = 0; j < distances.length; j++) {
-          threshold -= distances[j];
-          if (threshold <= 0) {
-            selectedIdx = j;
-            break;
-          }
-        }
-
-        centroids.push([...embeddings[selectedIdx]]);
-      }
-
-      return centroids;
-    };
-
-    // Initialize centroids
-    const centroids = initializeCentroids();
-    const assignments = new Array(n).fill(-1);
-    let previousAssignments: number[] = [];
-    let iteration = 0;
-
-    // Main K-means loop
-    while (iteration < maxIterations) {
-      previousAssignments = [...assignments];
-
-      // Assignment step: assign each point to nearest centroid
-      for (let i = 0; i < n; i++) {
-        let minDist = Infinity;
-        let assignedCluster = 0;
-
-        for (let j = 0; j < effectiveK; j++) {
-          const dist = euclideanDistance(embeddings[i], centroids[j]);
-          if (dist < minDist) {
-            minDist = dist;
-            assignedCluster = j;
-          }
-        }
-
-        assignments[i] = assignedCluster;
-      }
-
-      // Check convergence
-      if (
-        iteration > 0 &&
-        assignments.every((val, i) => val === previousAssignments[i])
-      ) {
-        break;
-      }
-
-      // Update step: recompute centroids
-      for (let j = 0; j < effectiveK; j++) {
-        const clusterPoints = embeddings.filter((_, i) => assignments[i] === j);
-
-        if (clusterPoints.length > 0) {
-          centroids[j] = calculateMean(clusterPoints);
-        } else {
-          // Handle empty cluster by reinitializing centroid
-          // Select the point furthest from any existing centroid
-          let maxMinDist = -1;
-          let furthestIdx = 0;
-
-          for (let i = 0; i < n; i++) {
-            const minDist = Math.min(
-              ...centroids.map(c => euclideanDistance(embeddings[i], c))
-            );
-            if (minDist > maxMinDist) {
-              maxMinDist = minDist;
-              furthestIdx = i;
-            }
-          }
-
-          centroids[j] = [...embeddings[furthestIdx]];
-        }
-      }
-
-      iteration++;
-    }
-
-    // Build result in required format
-    const clusters: Array<{
-      centroid: number[];
-      memberIndices: number[];
-    }> = [];
-
-    for (let j = 0; j < effectiveK; j++) {
-      const memberIndices = assignments
-        .map((cluster, idx) => (cluster === j ? idx : -1))
-        .filter(idx => idx !== -1);
-
-      clusters.push({
-        centroid: centroids[j],
-        memberIndices,
-      });
-    }
+          : undefined,
+    });
+
+    const dims = matrix.dimensions;
+    const clusters = Array.from({ length: result.k }, (_, j) => ({
+      centroid: Array.from(
+        result.centroids.subarray(j * dims, (j + 1) * dims)
+      ),
+      memberIndices: [] as number[],
+    }));
+    result.assignments.forEach((cluster, idx) => {
+      clusters[cluster].memberIndices.push(idx);
+    });
 
     return clusters;
   }
@@ -1216,113 +1116,30 @@ Respond with JSON:
   }
 
   private calculateSilhouetteScore(
-    embeddings: number[][],
-    clusters: any[]
+    matrix: VectorMatrix,
+    clusters: Array<{ memberIndices: number[] }>
   ): number {
     // Validate inputs
-    if (
-      !embeddings ||
-      embeddings.length === 0 ||
-      !clusters ||
-      clusters.length < 2
-    ) {
+    if (matrix.size === 0 || !clusters || clusters.length < 2) {
       return 0;
     }
 
-    // Build cluster assignments map
-    const clusterMap = new Map<number, number>(); // index -> clusterId
-    for (let i = 0; i < clusters.length; i++) {
-      const cluster = clusters[i];
-      if (cluster.memberIndices && Array.isArray(cluster.memberIndices)) {
-        cluster.memberIndices.forEach((idx: number) => {
-          if (idx >= 0 && idx < embeddings.length) {
-            clusterMap.set(idx, i);
-          }
-        });
-      }
-    }
-
-    // Ensure all points are assigned
-    if (clusterMap.size !== embeddings.length) {
-      return 0;
-    }
-
-    // Helper: Euclidean distance
-    const euclideanDistance = (a: number[], b: number[]): number => {
-      if (a.length !== b.length) return Infinity;
-      let sum = 0;
-      for (let i = 0; i < a.length; i++) {
-        const diff = a[i] - b[i];
-        sum += diff * diff;
-      }
-      return Math.sqrt(sum);
-    };
-
-    // Precompute pairwise distances for performance
-    const distances: number[][] = [];
-    for (let i = 0; i < embeddings.length; i++) {
-      distances[i] = [];
-      for (let j = 0; j < embeddings.length; j++) {
-        if (i === j) {
-          distances[i][j] = 0;
-        } else if (j < i) {
-          distances[i][j] = distances[j][i]; // Symmetric
-        } else {
-          distances[i][j] = euclideanDistance(embeddings[i], embeddings[j]);
-        }
-      }
-    }
-
-    // Calculate silhouette for each point
-    const silhouetteScores: number[] = [];
-
-    for (let i = 0; i < embeddings.length; i++) {
-      const ownClusterId = clusterMap.get(i)!;
-      const ownClusterMembers = clusters[ownClusterId].memberIndices.filter(
-        (idx: number) => idx !== i
-      );
-
-      // a(i): mean distance to other points in same cluster
-      let a = 0;
-      if (ownClusterMembers.length === 0) {
-        // Single member cluster - silhouette is 0
-        silhouetteScores.push(0);
-        continue;
-      }
-
-      for (const idx of ownClusterMembers) {
-        a += distances[i][idx];
-      }
-      a /= ownClusterMembers.length;
-
-      // b(i): minimum mean distance to points in any other cluster
-      let b = Infinity;
-      for (let c = 0; c < clusters.length; c++) {
-        if (c === ownClusterId) continue;
-
-        const otherClusterMembers = clusters[c].memberIndices;
-        if (!otherClusterMembers || otherClusterMembers.length === 0) continue;
-
-        let meanDist = 0;
-        for (const idx of otherClusterMembers) {
-          meanDist += distances[i][idx];
+    // Build cluster assignments; every point must belong to a cluster
+    const assignments = new Int32Array(matrix.size).fill(-1);
+    let assigned = 0;
+    clusters.forEach((cluster, clusterId) => {
+      for (const idx of cluster.memberIndices ?? []) {
+        if (idx >= 0 && idx < matrix.size && assignments[idx] === -1) {
+          assignments[idx] = clusterId;
+          assigned++;
         }
-        meanDist /= otherClusterMembers.length;
-
-        b = Math.min(b, meanDist);
       }
-
-      // Silhouette coefficient: (b - a) / max(a, b)
-      const maxAB = Math.max(a, b);
-      const silhouette = maxAB === 0 ? 0 : (b - a) / maxAB;
-      silhouetteScores.push(silhouette);
+    });
+    if (assigned !== matrix.size) {
+      return 0;
     }
 
-    // Return mean silhouette score
-    if (silhouetteScores.length === 0) return 0;
-    return (
-      silhouetteScores.reduce((sum, s) => sum + s, 0) / silhouetteScores.length
-    );
+    return meanSilhouette(matrix, assignments, clusters.length);
   }
 
   private async getCategoryBaseline(category: string): Promise<{
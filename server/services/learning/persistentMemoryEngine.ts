@@ -1,11 +1,17 @@
-import { agentKnowledgeBase, agentMemory } from '@shared/schema';
-import { and, asc, count, lt, sql } from 'drizzle-orm';
+import {
+  agentKnowledgeBase,
+  agentMemory,
+  knowledgeGraphEdges,
+} from '@shared/schema';
+import { and, asc, count, eq, gt, inArray, lt, or, sql } from 'drizzle-orm';
 import { db } from '../../db';
 import { storage } from '../../storage';
 import {
   agentMemoryService,
   type AgentMemoryEntry,
 } from '../agents/agentMemoryService';
+import { KnowledgeGraphStore } from './knowledgeGraphStore';
+import { MinHashLSH, hashToken } from './minHashIndex';
 
 /**
  * Persistent Memory Engine Service
@@ -169,6 +175,45 @@ interface GlobalPatternStatsResult {
   agentIds: string[];
 }
 
+// Tokens precomputed once per memory/knowledge item so pairwise scoring
+// never re-serializes content
+interface MemoryFeatures {
+  tags: string[];
+  tagSet: Set<string>;
+  wordCount: number;
+  longWordCounts: Map<string, number>; // Words longer than 3 chars
+  context: Record<string, any>;
+  contextKeys: string[];
+  contextTokens: string[]; // key=value for primitive context values
+}
+
+interface KnowledgeGraphState {
+  graphKey: string;
+  domain?: string;
+  store: KnowledgeGraphStore;
+  syncedAt: Date; // Knowledge updated after this has not been applied yet
+  pending: Promise<unknown>; // Serializes builds and syncs per graph
+}
+
+interface KnowledgeGraphSummary {
+  graphKey: string;
+  nodeCount: number;
+  edgeCount: number;
+  clusterCount: number;
+  strength: number;
+  lastUpdated: Date;
+  // Set once edges are persisted; a graph without it is rebuilt on load
+  edgeVersion?: number;
+  syncedAt?: Date; // Knowledge updated after this is rescored on load
+}
+
+interface KnowledgeFeatures {
+  tags: string[];
+  tagSet: Set<string>;
+  content: string; // Lower-cased JSON content
+  longWords: Set<string>;
+}
+
 export class PersistentMemoryEngine {
   private static instance: PersistentMemoryEngine;
   private consolidationEnabled: boolean = true;
@@ -185,6 +230,20 @@ export class PersistentMemoryEngine {
   private patternAggregationBatchSize: number = 500;
   private patternAggregationYieldInterval: number = 5;
 
+  // Similarity candidate generation
+  private similarityExactPairLimit: number = 256; // Score all pairs at or below this many items
+  private similarityYieldInterval: number = 5000; // Pairs scored between event loop yields
+  private memoryFeatureCache = new WeakMap<object, MemoryFeatures>();
+  private knowledgeFeatureCache = new WeakMap<object, KnowledgeFeatures>();
+
+  // Knowledge graphs, keyed by domain ('*' for all domains)
+  private knowledgeGraphs = new Map<
+    string,
+    Promise<KnowledgeGraphState | null>
+  >();
+  private knowledgeGraphWriteBatchSize: number = 1000;
+  private knowledgeGraphEdgeVersion: number = 1; // Bump to rebuild persisted edges
+
   public static getInstance(): PersistentMemoryEngine {
     if (!PersistentMemoryEngine.instance) {
       PersistentMemoryEngine.instance = new PersistentMemoryEngine();
@@ -393,7 +452,9 @@ export class PersistentMemoryEngine {
       consolidation.memoriesProcessed += memoriesToConsolidate.length;
 
       // Extract patterns from memories
-      const patterns = this.extractMemoryPatterns(memoriesToConsolidate);
+      const patterns = await this.extractMemoryPatterns(
+        memoriesToConsolidate
+      );
       consolidation.patternsExtracted += patterns.length;
 
       // Convert episodic memories to semantic knowledge
@@ -468,7 +529,8 @@ export class PersistentMemoryEngine {
   // ============ KNOWLEDGE GRAPH MANAGEMENT ============
 
   /**
-   * Build and maintain knowledge graph from memories
+   * Rebuild a knowledge graph from scratch. Routine updates go through
+   * updateKnowledgeGraph, which only rescores changed knowledge.
    */
   async buildKnowledgeGraph(domain?: string): Promise<KnowledgeGraph> {
     try {
@@ -476,33 +538,27 @@ export class PersistentMemoryEngine {
         `🕸️ Building knowledge graph${domain ? ` for domain: ${domain}` : ''}`
       );
 
-      // Get all semantic knowledge
-      const allKnowledge = await this.getAllSemanticKnowledge(domain);
-
-      // Create nodes from knowledge
-      const nodes = this.createKnowledgeNodes(allKnowledge);
-
-      // Create edges from relationships
-      const edges = await this.createKnowledgeEdges(nodes, allKnowledge);
-
-      // Identify clusters
-      const clusters = this.identifyKnowledgeClusters(nodes, edges);
-
-      const knowledgeGraph: KnowledgeGraph = {
-        nodes,
-        edges,
-        clusters,
-        strength: this.calculateGraphStrength(nodes, edges),
-        lastUpdated: new Date(),
-      };
-
-      // Store knowledge graph
-      await this.storeKnowledgeGraph(knowledgeGraph, domain);
+      const graphKey = this.getKnowledgeGraphKey(domain);
+      const previous = this.knowledgeGraphs.get(graphKey);
+      const building = (async () => {
+        const current = await previous?.catch(() => null);
+        await current?.pending;
+        return await this.rebuildKnowledgeGraphState(domain);
+      })();
+      this.knowledgeGraphs.set(graphKey, building);
+
+      const state = await building.catch(error => {
+        if (this.knowledgeGraphs.get(graphKey) === building) {
+          this.knowledgeGraphs.delete(graphKey);
+        }
+        throw error;
+      });
+      const stats = state.store.getStats();
 
       console.log(
-        `✅ Knowledge graph built: ${nodes.length} nodes, ${edges.length} edges, ${clusters.length} clusters`
+        `✅ Knowledge graph built: ${stats.nodes} nodes, ${stats.edges} edges, ${stats.clusters} clusters`
       );
-      return knowledgeGraph;
+      return state.store.toGraph();
     } catch (error) {
       console.error('❌ Failed to build knowledge graph:', error);
       throw error;
@@ -520,49 +576,22 @@ export class PersistentMemoryEngine {
     limit?: number;
   }): Promise<any[]> {
     try {
-      const graph = await this.getKnowledgeGraph(query.domain);
-      if (!graph) return [];
-
-      let relevantNodes = graph.nodes;
-
-      // Filter by type
-      if (query.type) {
-        relevantNodes = relevantNodes.filter(node => node.type === query.type);
-      }
-
-      // Filter by keywords
-      if (query.keywords && query.keywords.length > 0) {
-        relevantNodes = relevantNodes.filter(node =>
-          query.keywords!.some(
-            keyword =>
-              node.label.toLowerCase().includes(keyword.toLowerCase()) ||
-              JSON.stringify(node.content)
-                .toLowerCase()
-                .includes(keyword.toLowerCase())
-          )
-        );
-      }
-
-      // Sort by importance and connections
-      relevantNodes.sort((a, b) => {
-        const scoreA = a.importance * 0.7 + a.connections * 0.3;
-        const scoreB = b.importance * 0.7 + b.connections * 0.3;
-        return scoreB - scoreA;
+      const state = await this.getKnowledgeGraphState(query.domain);
+      if (!state) return [];
+
+      const { store } = state;
+      const relevantNodes = store.findNodes({
+        type: query.type,
+        keywords: query.keywords,
+        limit: query.limit,
       });
 
-      // Apply limit
-      if (query.limit) {
-        relevantNodes = relevantNodes.slice(0, query.limit);
-      }
-
-      // Enrich with relationship information
-      const enrichedResults = relevantNodes.map(node => ({
+      // Enrich with relationship information from the adjacency index
+      return relevantNodes.map(node => ({
         ...node,
-        relatedNodes: this.getRelatedNodes(node.id, graph),
-        insights: this.generateNodeInsights(node, graph),
+        relatedNodes: store.getNeighbors(node.id),
+        insights: this.generateNodeInsights(node, store.size),
       }));
-
-      return enrichedResults;
     } catch (error) {
       console.error('❌ Failed to query knowledge graph:', error);
       return [];
@@ -574,11 +603,13 @@ export class PersistentMemoryEngine {
   /**
    * Extract patterns from memory collections
    */
-  private extractMemoryPatterns(memories: any[]): MemoryPattern[] {
+  private async extractMemoryPatterns(
+    memories: any[]
+  ): Promise<MemoryPattern[]> {
     const patterns: MemoryPattern[] = [];
 
     // Group memories by similarity
-    const memoryGroups = this.groupMemoriesBySimilarity(memories);
+    const memoryGroups = await this.groupMemoriesBySimilarity(memories);
 
     for (const group of memoryGroups) {
       if (group.length >= 2) {
@@ -600,26 +631,42 @@ export class PersistentMemoryEngine {
   }
 
   /**
-   * Group memories by similarity using semantic analysis
+   * Group memories by similarity using semantic analysis.
+   * Each memory is compared only against its LSH candidates (shared tags,
+   * content words or context values) rather than every other memory.
    */
-  private groupMemoriesBySimilarity(memories: any[]): any[][] {
+  private async groupMemoriesBySimilarity(memories: any[]): Promise<any[][]> {
     const groups: any[][] = [];
-    const processed = new Set<string>();
+    const processed = new Set<number>();
+    const candidatesFor = await this.buildCandidateLookup(memories, memory => {
+      const features = this.getMemoryFeatures(memory);
+      return [
+        features.tagSet,
+        features.longWordCounts.keys(),
+        features.contextTokens,
+      ];
+    });
+    let scored = 0;
 
-    for (const memory of memories) {
-      if (processed.has(memory.id)) continue;
+    for (let i = 0; i < memories.length; i++) {
+      if (processed.has(i)) continue;
 
+      const memory = memories[i];
       const similarMemories = [memory];
-      processed.add(memory.id);
+      processed.add(i);
 
       // Find similar memories
-      for (const otherMemory of memories) {
-        if (processed.has(otherMemory.id)) continue;
+      for (const j of candidatesFor(i)) {
+        if (processed.has(j)) continue;
 
-        const similarity = this.calculateMemorySimilarity(memory, otherMemory);
+        const similarity = this.calculateMemorySimilarity(memory, memories[j]);
         if (similarity > 0.7) {
-          similarMemories.push(otherMemory);
-          processed.add(otherMemory.id);
+          similarMemories.push(memories[j]);
+          processed.add(j);
+        }
+
+        if (++scored % this.similarityYieldInterval === 0) {
+          await this.yieldToEventLoop();
         }
       }
 
@@ -635,44 +682,122 @@ export class PersistentMemoryEngine {
    * Calculate similarity between two memories
    */
   private calculateMemorySimilarity(memory1: any, memory2: any): number {
+    const features1 = this.getMemoryFeatures(memory1);
+    const features2 = this.getMemoryFeatures(memory2);
     let similarity = 0;
 
     // Tag similarity
-    const tags1 = memory1.tags || [];
-    const tags2 = memory2.tags || [];
-    const commonTags = tags1.filter((tag: string) => tags2.includes(tag));
+    let commonTags = 0;
+    for (const tag of features1.tags) {
+      if (features2.tagSet.has(tag)) commonTags++;
+    }
     const tagSimilarity =
-      commonTags.length / Math.max(tags1.length, tags2.length, 1);
+      commonTags / Math.max(features1.tags.length, features2.tags.length, 1);
     similarity += tagSimilarity * 0.4;
 
     // Content similarity (simplified)
-    const content1 = JSON.stringify(memory1.content).toLowerCase();
-    const content2 = JSON.stringify(memory2.content).toLowerCase();
-    const words1 = content1.split(/\s+/);
-    const words2 = content2.split(/\s+/);
-    const commonWords = words1.filter(
-      word => words2.includes(word) && word.length > 3
-    );
+    let commonWords = 0;
+    for (const [word, count] of features1.longWordCounts) {
+      if (features2.longWordCounts.has(word)) commonWords += count;
+    }
     const contentSimilarity =
-      commonWords.length / Math.max(words1.length, words2.length, 1);
+      commonWords / Math.max(features1.wordCount, features2.wordCount, 1);
     similarity += contentSimilarity * 0.3;
 
     // Context similarity
-    const context1 = memory1.metadata || {};
-    const context2 = memory2.metadata || {};
-    const contextKeys1 = Object.keys(context1);
-    const contextKeys2 = Object.keys(context2);
-    const commonContextKeys = contextKeys1.filter(
-      key => contextKeys2.includes(key) && context1[key] === context2[key]
-    );
+    let commonContextKeys = 0;
+    for (const key of features1.contextKeys) {
+      if (
+        Object.prototype.hasOwnProperty.call(features2.context, key) &&
+        features1.context[key] === features2.context[key]
+      ) {
+        commonContextKeys++;
+      }
+    }
     const contextSimilarity =
-      commonContextKeys.length /
-      Math.max(contextKeys1.length, contextKeys2.length, 1);
+      commonContextKeys /
+      Math.max(features1.contextKeys.length, features2.contextKeys.length, 1);
     similarity += contextSimilarity * 0.3;
 
     return Math.min(similarity, 1.0);
   }
 
+  private getMemoryFeatures(memory: any): MemoryFeatures {
+    const cached = this.memoryFeatureCache.get(memory);
+    if (cached) return cached;
+
+    const tags: string[] = memory.tags || [];
+    const words = (JSON.stringify(memory.content) ?? '')
+      .toLowerCase()
+      .split(/\s+/);
+    const longWordCounts = new Map<string, number>();
+    for (const word of words) {
+      if (word.length > 3) {
+        longWordCounts.set(word, (longWordCounts.get(word) ?? 0) + 1);
+      }
+    }
+
+    const context = memory.metadata || {};
+    const contextKeys = Object.keys(context);
+    const contextTokens = contextKeys
+      .filter(key => context[key] === null || typeof context[key] !== 'object')
+      .map(key => `${key}=${String(context[key])}`);
+
+    const features: MemoryFeatures = {
+      tags,
+      tagSet: new Set(tags),
+      wordCount: words.length,
+      longWordCounts,
+      context,
+      contextKeys,
+      contextTokens,
+    };
+    this.memoryFeatureCache.set(memory, features);
+    return features;
+  }
+
+  /**
+   * Build a lookup of comparison candidates for each item index.
+   *
+   * Small collections compare every later item. Larger ones use one
+   * MinHash/LSH index per token set, and an item's candidates are the union
+   * of its bucket-mates across those indexes.
+   */
+  private async buildCandidateLookup(
+    items: any[],
+    tokenSets: (item: any) => Iterable<string>[]
+  ): Promise<(index: number) => number[]> {
+    if (items.length <= this.similarityExactPairLimit) {
+      return (index: number) =>
+        Array.from(
+          { length: items.length - index - 1 },
+          (_, offset) => index + 1 + offset
+        );
+    }
+
+    const indexes: MinHashLSH[] = [];
+    for (let i = 0; i < items.length; i++) {
+      tokenSets(items[i]).forEach((tokens, setIndex) => {
+        if (!indexes[setIndex]) indexes[setIndex] = new MinHashLSH();
+        indexes[setIndex].add(i, tokens);
+      });
+
+      if ((i + 1) % this.patternAggregationBatchSize === 0) {
+        await this.yieldToEventLoop();
+      }
+    }
+
+    return (index: number) => {
+      const candidates = new Set<number>();
+      for (const lsh of indexes) {
+        for (const candidate of lsh.candidates(index)) {
+          candidates.add(candidate);
+        }
+      }
+      return Array.from(candidates).sort((a, b) => a - b);
+    };
+  }
+
   /**
    * Create pattern from group of similar memories
    */
@@ -1248,6 +1373,7 @@ export class PersistentMemoryEngine {
       primaryMemory.metadata = updatedPrimary.metadata ?? updatedMetadata;
       primaryMemory.tags = updatedPrimary.tags ?? Array.from(combinedTags);
       primaryMemory.importance = updatedPrimary.importance ?? updatedImportance;
+      this.memoryFeatureCache.delete(primaryMemory);
 
       memoryById.set(primaryMemory.id, primaryMemory);
 
@@ -1949,153 +2075,301 @@ export class PersistentMemoryEngine {
     return allKnowledge;
   }
 
-  private createKnowledgeNodes(knowledge: any[]): KnowledgeNode[] {
-    return knowledge.map(item => ({
+  private getKnowledgeGraphKey(domain?: string): string {
+    return domain ?? '*';
+  }
+
+  private createKnowledgeGraphStore(): KnowledgeGraphStore {
+    return new KnowledgeGraphStore({
+      toNode: item => this.createKnowledgeNode(item),
+      relate: (knowledge1, knowledge2) =>
+        this.analyzeRelationship(knowledge1, knowledge2),
+      tokenSets: item => {
+        const features = this.getKnowledgeFeatures(item);
+        return [features.tagSet, features.longWords];
+      },
+      relationKey: item => {
+        const features = this.getKnowledgeFeatures(item);
+        return `${item.domain}:${hashToken(features.tags.join('\u0000'))}:${hashToken(features.content)}`;
+      },
+      searchText: item =>
+        `${(item.title ?? '').toLowerCase()}\n${this.getKnowledgeFeatures(item).content}`,
+      exactPairLimit: this.similarityExactPairLimit,
+      yieldInterval: this.similarityYieldInterval,
+    });
+  }
+
+  private createKnowledgeNode(item: any): KnowledgeNode {
+    return {
       id: item.id,
       type: this.mapKnowledgeToNodeType(item.knowledgeType),
       label: item.title,
       content: item.content,
       importance: item.confidenceScore * item.usageCount,
-      connections: 0, // Will be calculated when creating edges
+      connections: 0, // Maintained by the graph store
       lastActivated: new Date(item.updatedAt),
-    }));
+    };
   }
 
-  private async createKnowledgeEdges(
-    nodes: KnowledgeNode[],
-    knowledge: any[]
-  ): Promise<KnowledgeEdge[]> {
-    const edges: KnowledgeEdge[] = [];
-
-    // Create edges based on content similarity and tag overlap
-    for (let i = 0; i < nodes.length; i++) {
-      for (let j = i + 1; j < nodes.length; j++) {
-        const node1 = nodes[i];
-        const node2 = nodes[j];
-        const knowledge1 = knowledge[i];
-        const knowledge2 = knowledge[j];
-
-        const relationship = this.analyzeRelationship(knowledge1, knowledge2);
-        if (relationship.strength > 0.3) {
-          edges.push({
-            id: `edge_${node1.id}_${node2.id}`,
-            from: node1.id,
-            to: node2.id,
-            relationship: relationship.type,
-            strength: relationship.strength,
-            confidence: relationship.confidence,
-            evidence: relationship.evidence,
-          });
-
-          // Update connection counts
-          node1.connections++;
-          node2.connections++;
+  /**
+   * In-memory graph for a domain, loaded from persisted edges on first use.
+   * Returns null when no graph has been built for the domain.
+   */
+  private async getKnowledgeGraphState(
+    domain?: string
+  ): Promise<KnowledgeGraphState | null> {
+    const graphKey = this.getKnowledgeGraphKey(domain);
+    let state = this.knowledgeGraphs.get(graphKey);
+    if (!state) {
+      state = this.loadKnowledgeGraphState(domain);
+      this.knowledgeGraphs.set(graphKey, state);
+      state.catch(() => {
+        if (this.knowledgeGraphs.get(graphKey) === state) {
+          this.knowledgeGraphs.delete(graphKey);
         }
-      }
+      });
     }
-
-    return edges;
+    return await state;
   }
 
-  private identifyKnowledgeClusters(
-    nodes: KnowledgeNode[],
-    edges: KnowledgeEdge[]
-  ): KnowledgeCluster[] {
-    // Simple clustering based on strong connections
-    const clusters: KnowledgeCluster[] = [];
-    const processed = new Set<string>();
+  private async loadKnowledgeGraphState(
+    domain?: string
+  ): Promise<KnowledgeGraphState | null> {
+    const graphKey = this.getKnowledgeGraphKey(domain);
+    const summary = await this.getKnowledgeGraph(domain);
+    if (!summary) return null;
+    if (summary.edgeVersion !== this.knowledgeGraphEdgeVersion) {
+      // Graphs stored before edges were persisted are rebuilt once
+      return await this.rebuildKnowledgeGraphState(domain);
+    }
 
-    for (const node of nodes) {
-      if (processed.has(node.id)) continue;
+    const edgeRows = await db
+      .select()
+      .from(knowledgeGraphEdges)
+      .where(eq(knowledgeGraphEdges.graphKey, graphKey));
+
+    const knowledge = await this.getAllSemanticKnowledge(domain);
+    const store = this.createKnowledgeGraphStore();
+    store.load(
+      knowledge,
+      edgeRows.map(row => ({
+        id: `edge_${row.fromId}_${row.toId}`,
+        from: row.fromId,
+        to: row.toId,
+        relationship: row.relationship as KnowledgeEdge['relationship'],
+        strength: row.strength,
+        confidence: row.confidence,
+        evidence: row.evidence,
+      }))
+    );
 
-      const cluster = this.buildClusterFromNode(node, nodes, edges, processed);
-      if (cluster.nodes.length > 1) {
-        clusters.push(cluster);
-      }
+    // Knowledge that changed after the graph was last synced is rescored
+    const syncedAt = new Date(summary.syncedAt ?? summary.lastUpdated);
+    const stale = knowledge.filter(item => new Date(item.updatedAt) > syncedAt);
+    const state: KnowledgeGraphState = {
+      graphKey,
+      domain,
+      store,
+      syncedAt: this.latestKnowledgeUpdate(knowledge, syncedAt),
+      pending: Promise.resolve(),
+    };
+    if (stale.length > 0) {
+      const change = await store.upsert(stale, { force: true });
+      await this.persistKnowledgeGraphEdges(
+        graphKey,
+        store,
+        change.changedNodeIds
+      );
+      await this.storeKnowledgeGraph(state);
     }
 
-    return clusters;
+    console.log(
+      `🕸️ Loaded knowledge graph ${graphKey}: ${store.size} nodes, ${edgeRows.length} edges (${stale.length} rescored)`
+    );
+    return state;
   }
 
-  private buildClusterFromNode(
-    startNode: KnowledgeNode,
-    allNodes: KnowledgeNode[],
-    edges: KnowledgeEdge[],
-    processed: Set<string>
-  ): KnowledgeCluster {
-    const clusterNodes = [startNode.id];
-    processed.add(startNode.id);
+  private async rebuildKnowledgeGraphState(
+    domain?: string
+  ): Promise<KnowledgeGraphState> {
+    const graphKey = this.getKnowledgeGraphKey(domain);
+    const startedAt = new Date();
+    const knowledge = await this.getAllSemanticKnowledge(domain);
+
+    // Inserting every item into an empty store scores each candidate pair once
+    const store = this.createKnowledgeGraphStore();
+    await store.upsert(knowledge);
+    await this.persistKnowledgeGraphEdges(graphKey, store, null);
+
+    const state: KnowledgeGraphState = {
+      graphKey,
+      domain,
+      store,
+      syncedAt: this.latestKnowledgeUpdate(knowledge, startedAt),
+      pending: Promise.resolve(),
+    };
+    await this.storeKnowledgeGraph(state);
+    return state;
+  }
 
-    // Find strongly connected nodes
-    const connectedEdges = edges.filter(
-      edge =>
-        (edge.from === startNode.id || edge.to === startNode.id) &&
-        edge.strength > 0.7
-    );
+  /**
+   * Apply knowledge changed since the last sync: rescore changed items
+   * against their candidate neighbours, drop items that moved to another
+   * domain, and rewrite only the affected edges
+   */
+  private async syncKnowledgeGraph(state: KnowledgeGraphState): Promise<void> {
+    const run = state.pending.then(async () => {
+      const changedRows = await db
+        .select()
+        .from(agentKnowledgeBase)
+        .where(gt(agentKnowledgeBase.updatedAt, state.syncedAt))
+        .orderBy(asc(agentKnowledgeBase.createdAt));
+      if (changedRows.length === 0) return;
+
+      const inGraph = changedRows.filter(
+        row => !state.domain || row.domain === state.domain
+      );
+      const movedOut = changedRows
+        .filter(row => state.domain && row.domain !== state.domain)
+        .map(row => row.id)
+        .filter(id => state.store.has(id));
 
-    for (const edge of connectedEdges) {
-      const connectedNodeId = edge.from === startNode.id ? edge.to : edge.from;
-      if (!processed.has(connectedNodeId)) {
-        clusterNodes.push(connectedNodeId);
-        processed.add(connectedNodeId);
-      }
-    }
+      const change = await state.store.upsert(inGraph);
+      const removal = state.store.remove(movedOut);
+      await this.persistKnowledgeGraphEdges(state.graphKey, state.store, [
+        ...change.changedNodeIds,
+        ...removal.removedNodeIds,
+      ]);
 
-    return {
-      id: `cluster_${Date.now()}_${Math.random().toString(36).substring(2, 11)}`,
-      name: `Cluster: ${startNode.label}`,
-      nodes: clusterNodes,
-      cohesion: this.calculateClusterCohesion(clusterNodes, edges),
-      domain: this.determineDominantDomain(clusterNodes, allNodes),
-      keyInsights: this.extractClusterInsights(clusterNodes, allNodes),
-    };
+      state.syncedAt = this.latestKnowledgeUpdate(changedRows, state.syncedAt);
+      await this.storeKnowledgeGraph(state);
+
+      console.log(
+        `🕸️ Synced knowledge graph ${state.graphKey}: ${inGraph.length} updated, ${change.changedNodeIds.length} rescored (${change.pairsScored} pairs), ${removal.removedNodeIds.length} removed`
+      );
+    });
+    state.pending = run.catch(() => undefined);
+    await run;
   }
 
-  private calculateGraphStrength(
-    nodes: KnowledgeNode[],
-    edges: KnowledgeEdge[]
-  ): number {
-    if (nodes.length === 0) return 0;
+  /**
+   * Write edges to knowledge_graph_edges. With nodeIds, only edges touching
+   * those nodes are replaced; with null, the graph's edges are rewritten.
+   * Deletes and inserts share one transaction, so a failed write never
+   * leaves a half-written graph behind.
+   */
+  private async persistKnowledgeGraphEdges(
+    graphKey: string,
+    store: KnowledgeGraphStore,
+    nodeIds: string[] | null
+  ): Promise<void> {
+    if (nodeIds !== null && nodeIds.length === 0) return;
 
-    const totalConnections = edges.reduce(
-      (sum, edge) => sum + edge.strength,
-      0
-    );
-    const maxPossibleConnections = (nodes.length * (nodes.length - 1)) / 2;
+    let edges: KnowledgeEdge[];
+    if (nodeIds === null) {
+      edges = store.getAllEdges();
+    } else {
+      const edgeMap = new Map<string, KnowledgeEdge>();
+      for (const nodeId of nodeIds) {
+        for (const edge of store.getEdges(nodeId)) {
+          edgeMap.set(edge.id, edge);
+        }
+      }
+      edges = Array.from(edgeMap.values());
+    }
+
+    const batchSize = this.knowledgeGraphWriteBatchSize;
+    await db.transaction(async tx => {
+      if (nodeIds === null) {
+        await tx
+          .delete(knowledgeGraphEdges)
+          .where(eq(knowledgeGraphEdges.graphKey, graphKey));
+      } else {
+        for (let i = 0; i < nodeIds.length; i += batchSize) {
+          const batch = nodeIds.slice(i, i + batchSize);
+          await tx
+            .delete(knowledgeGraphEdges)
+            .where(
+              and(
+                eq(knowledgeGraphEdges.graphKey, graphKey),
+                or(
+                  inArray(knowledgeGraphEdges.fromId, batch),
+                  inArray(knowledgeGraphEdges.toId, batch)
+                )
+              )
+            );
+        }
+      }
 
-    return maxPossibleConnections > 0
-      ? totalConnections / maxPossibleConnections
-      : 0;
+      for (let i = 0; i < edges.length; i += batchSize) {
+        await tx
+          .insert(knowledgeGraphEdges)
+          .values(
+            edges.slice(i, i + batchSize).map(edge => ({
+              graphKey,
+              fromId: edge.from,
+              toId: edge.to,
+              relationship: edge.relationship,
+              strength: edge.strength,
+              confidence: edge.confidence,
+              evidence: edge.evidence,
+            }))
+          )
+          .onConflictDoNothing();
+        await this.yieldToEventLoop();
+      }
+    });
+  }
+
+  private latestKnowledgeUpdate(knowledge: any[], fallback: Date): Date {
+    let latest = fallback.getTime();
+    for (const item of knowledge) {
+      const updatedAt = new Date(item.updatedAt).getTime();
+      if (updatedAt > latest) latest = updatedAt;
+    }
+    return new Date(latest);
   }
 
+  // Stores a summary only; edges live in knowledge_graph_edges
   private async storeKnowledgeGraph(
-    graph: KnowledgeGraph,
-    domain?: string
+    state: KnowledgeGraphState
   ): Promise<void> {
+    const { domain } = state;
     const graphKey = domain
       ? `knowledge_graph_${domain}`
       : 'knowledge_graph_global';
+    const stats = state.store.getStats();
+    const summary: KnowledgeGraphSummary = {
+      graphKey: state.graphKey,
+      nodeCount: stats.nodes,
+      edgeCount: stats.edges,
+      clusterCount: stats.clusters,
+      strength: stats.strength,
+      lastUpdated: new Date(),
+      edgeVersion: this.knowledgeGraphEdgeVersion,
+      syncedAt: state.syncedAt,
+    };
 
     await agentMemoryService.storeMemory({
       agentId: 'memory-engine',
       memoryType: 'semantic',
       contextKey: graphKey,
       title: `Knowledge Graph${domain ? `: ${domain}` : ''}`,
-      content: graph,
+      content: summary,
       importance: 10, // Highest importance for knowledge graphs
       tags: ['knowledge_graph', domain || 'global'],
       metadata: {
-        nodeCount: graph.nodes.length,
-        edgeCount: graph.edges.length,
-        clusterCount: graph.clusters.length,
-        strength: graph.strength,
+        nodeCount: summary.nodeCount,
+        edgeCount: summary.edgeCount,
+        clusterCount: summary.clusterCount,
+        strength: summary.strength,
       },
     });
   }
 
   private async getKnowledgeGraph(
     domain?: string
-  ): Promise<KnowledgeGraph | null> {
+  ): Promise<KnowledgeGraphSummary | null> {
     const graphKey = domain
       ? `knowledge_graph_${domain}`
       : 'knowledge_graph_global';
@@ -2107,28 +2381,13 @@ export class PersistentMemoryEngine {
     return memory ? memory.content : null;
   }
 
-  private getRelatedNodes(
-    nodeId: string,
-    graph: KnowledgeGraph
-  ): KnowledgeNode[] {
-    const relatedEdges = graph.edges.filter(
-      edge => edge.from === nodeId || edge.to === nodeId
-    );
-
-    const relatedNodeIds = relatedEdges.map(edge =>
-      edge.from === nodeId ? edge.to : edge.from
-    );
-
-    return graph.nodes.filter(node => relatedNodeIds.includes(node.id));
-  }
-
   private generateNodeInsights(
     node: KnowledgeNode,
-    graph: KnowledgeGraph
+    graphSize: number
   ): string[] {
     const insights = [];
 
-    if (node.connections > graph.nodes.length * 0.1) {
+    if (node.connections > graphSize * 0.1) {
       insights.push('Highly connected concept');
     }
 
@@ -2513,15 +2772,17 @@ export class PersistentMemoryEngine {
     let strength = 0;
     let type = 'similar';
     const evidence = [];
+    const features1 = this.getKnowledgeFeatures(knowledge1);
+    const features2 = this.getKnowledgeFeatures(knowledge2);
 
     // Tag overlap
-    const tags1 = knowledge1.tags || [];
-    const tags2 = knowledge2.tags || [];
-    const commonTags = tags1.filter((tag: string) => tags2.includes(tag));
+    const commonTags = features1.tags.filter(tag => features2.tagSet.has(tag));
 
     if (commonTags.length > 0) {
       strength +=
-        (commonTags.length / Math.max(tags1.length, tags2.length)) * 0.4;
+        (commonTags.length /
+          Math.max(features1.tags.length, features2.tags.length)) *
+        0.4;
       evidence.push(`Common tags: ${commonTags.join(', ')}`);
     }
 
@@ -2532,8 +2793,8 @@ export class PersistentMemoryEngine {
     }
 
     // Content similarity (simplified)
-    const content1 = JSON.stringify(knowledge1.content).toLowerCase();
-    const content2 = JSON.stringify(knowledge2.content).toLowerCase();
+    const content1 = features1.content;
+    const content2 = features2.content;
 
     if (content1.includes('success') && content2.includes('failure')) {
       type = 'conflicts';
@@ -2550,79 +2811,36 @@ export class PersistentMemoryEngine {
       evidence,
     };
   }
-
-  private calculateClusterCohesion(
-    nodeIds: string[],
-    edges: KnowledgeEdge[]
-  ): number {
-    const internalEdges = edges.filter(
-      edge => nodeIds.includes(edge.from) && nodeIds.includes(edge.to)
-    );
-
-    const maxPossibleEdges = (nodeIds.length * (nodeIds.length - 1)) / 2;
-    return maxPossibleEdges > 0 ? internalEdges.length / maxPossibleEdges : 0;
-  }
-
-  private determineDominantDomain(
-    nodeIds: string[],
-    allNodes: KnowledgeNode[]
-  ): string {
-    const clusterNodes = allNodes.filter(node => nodeIds.includes(node.id));
-
-    // Extract domains from node content (simplified)
-    const domains = clusterNodes
-      .map(node => node.content?.domain || 'general')
-      .filter(domain => domain !== 'general');
-
-    if (domains.length === 0) return 'general';
-
-    const domainCounts = domains.reduce(
-      (counts, domain) => {
-        counts[domain as keyof typeof counts] =
-          (counts[domain as keyof typeof counts] || 0) + 1;
-        return counts;
-      },
-      {} as Record<string, number>
-    );
-
-    return Object.keys(domainCounts).reduce((a, b) =>
-      domainCounts[a] > domainCounts[b] ? a : b
-    );
+  private getKnowledgeFeatures(knowledge: any): KnowledgeFeatures {
+    const cached = this.knowledgeFeatureCache.get(knowledge);
+    if (cached) return cached;
+
+    const tags: string[] = knowledge.tags || [];
+    const content = (JSON.stringify(knowledge.content) ?? '').toLowerCase();
+    const features: KnowledgeFeatures = {
+      tags,
+      tagSet: new Set(tags),
+      content,
+      longWords: new Set(content.split(/\s+/).filter(word => word.length > 3)),
+    };
+    this.knowledgeFeatureCache.set(knowledge, features);
+    return features;
   }
 
-  private extractClusterInsights(
-    nodeIds: string[],
-    allNodes: KnowledgeNode[]
-  ): string[] {
-    const clusterNodes = allNodes.filter(node => nodeIds.includes(node.id));
-    const insights = [];
-
-    const avgImportance =
-      clusterNodes.reduce((sum, node) => sum + node.importance, 0) /
-      clusterNodes.length;
-    if (avgImportance > 0.8) {
-      insights.push('High importance cluster');
-    }
-
-    const recentNodes = clusterNodes.filter(
-      node =>
-        Date.now() - node.lastActivated.getTime() < 7 * 24 * 60 * 60 * 1000
+  private async updateKnowledgeGraph(learnings: any[]): Promise<void> {
+    // Apply new learnings to existing graphs for their domains, and to the
+    // all-domain graph when it is loaded
+    const graphKeys = new Set<string>(
+      learnings.map(learning => this.getKnowledgeGraphKey(learning.domain))
     );
+    if (this.knowledgeGraphs.has('*')) graphKeys.add('*');
 
-    if (recentNodes.length > clusterNodes.length * 0.5) {
-      insights.push('Recently active cluster');
-    }
-
-    return insights;
-  }
-
-  private async updateKnowledgeGraph(learnings: any[]): Promise<void> {
-    // Update knowledge graph with new learnings
-    for (const learning of learnings) {
-      const graph = await this.getKnowledgeGraph(learning.domain);
-      if (graph) {
-        // Add new nodes and edges based on learnings
-        await this.buildKnowledgeGraph(learning.domain);
+    for (const graphKey of graphKeys) {
+      const state = await this.getKnowledgeGraphState(
+        graphKey === '*' ? undefined : graphKey
+      );
+      if (state) {
+        await this.syncKnowledgeGraph(state);
       }
     }
   }
@@ -2642,7 +2860,9 @@ export class PersistentMemoryEngine {
     );
 
     if (sessionSpecificMemories.length > 0) {
-      const patterns = this.extractMemoryPatterns(sessionSpecificMemories);
+      const patterns = await this.extractMemoryPatterns(
+        sessionSpecificMemories
+      );
       const semanticKnowledge = this.convertToSemanticKnowledge(
         patterns,
         sessionContext.agentId
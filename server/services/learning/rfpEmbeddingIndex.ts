@@ -0,0 +1,385 @@
+import { createHash } from 'crypto';
+import type { RFP } from '@shared/schema';
+import { storage } from '../../storage';
+import {
+  VectorMatrix,
+  normalizeVector,
+  scoreAll,
+  selectTopK,
+} from './vectorKernel';
+
+/**
+ * Persistent RFP Embedding Index
+ *
+ * Stores one embedding per RFP in the rfp_embeddings table, keyed by a hash
+ * of the embedded text so unchanged RFPs are never re-embedded. Vectors are
+ * kept L2-normalized in one contiguous matrix (see vectorKernel), making
+ * cosine similarity a batched dot product followed by a heap top-k.
+ *
+ * - createRFP/updateRFP schedule a debounced, batched refresh
+ * - Queries sync incrementally from Postgres (updated_at) so embeddings
+ *   written by other instances become visible without a full reload
+ * - RFPs without an embedding are backfilled in the background
+ */
+
+export const RFP_EMBEDDING_MODEL = 'text-embedding-3-large';
+// Reduced dimensions keep the in-memory index small (512 floats = 2KB/RFP)
+export const RFP_EMBEDDING_DIMENSIONS =
+  Number(process.env.RFP_EMBEDDING_DIMENSIONS) || 512;
+
+const MAX_EMBEDDING_TEXT_LENGTH = 8000; // Stay well under the model token limit
+const REFRESH_DEBOUNCE_MS = 2000;
+const SYNC_INTERVAL_MS = 60000;
+const SYNC_CLOCK_SKEW_MS = 5000;
+const EMBEDDING_BATCH_SIZE = 100;
+
+type RFPTextFields = Pick<RFP, 'title' | 'description' | 'agency' | 'category'>;
+
+interface IndexedRFP {
+  row: number; // Row in the vector matrix
+  contentHash: string;
+  agency: string;
+  category: string | null;
+}
+
+export interface RFPSimilarityMatch {
+  rfpId: string;
+  similarity: number;
+  agency: string;
+  category: string | null;
+}
+
+/**
+ * Text representation of an RFP used for embeddings
+ */
+export function buildRFPEmbeddingText(rfp: RFPTextFields): string {
+  return `${rfp.title}\n${rfp.description}\nAgency: ${rfp.agency}\nCategory: ${rfp.category}`.slice(
+    0,
+    MAX_EMBEDDING_TEXT_LENGTH
+  );
+}
+
+export function hashEmbeddingText(text: string): string {
+  return createHash('sha256')
+    .update(`${RFP_EMBEDDING_MODEL}:${RFP_EMBEDDING_DIMENSIONS}:${text}`)
+    .digest('hex');
+}
+
+export function packEmbedding(vector: ArrayLike<number>): Buffer {
+  const floats = Float32Array.from(vector);
+  return Buffer.from(floats.buffer, floats.byteOffset, floats.byteLength);
+}
+
+export function unpackEmbedding(buffer: Buffer): Float32Array {
+  // Copy into a fresh, 4-byte aligned ArrayBuffer
+  const bytes = new Uint8Array(buffer.byteLength);
+  bytes.set(buffer);
+  return new Float32Array(bytes.buffer);
+}
+
+export class RFPEmbeddingIndex {
+  private entries = new Map<string, IndexedRFP>();
+  private matrix = new VectorMatrix(RFP_EMBEDDING_DIMENSIONS);
+  private rowIds: string[] = [];
+  private scores = new Float32Array(0);
+  private loadPromise: Promise<void> | null = null;
+  private lastSyncAt = 0;
+  private pending = new Set<string>();
+  private flushTimer: NodeJS.Timeout | null = null;
+  private backfillRunning = false;
+  private embeddingCalls = 0;
+  private skippedUnchanged = 0;
+
+  /**
+   * Queue an RFP for (re-)embedding. Calls within the debounce window are
+   * coalesced into a single batched embedding request.
+   */
+  scheduleRefresh(rfpId: string): void {
+    if (!process.env.OPENAI_API_KEY) return;
+
+    this.pending.add(rfpId);
+    if (this.flushTimer) return;
+
+    this.flushTimer = setTimeout(() => {
+      this.flushTimer = null;
+      const ids = Array.from(this.pending);
+      this.pending.clear();
+      this.refresh(ids).catch(error => {
+        console.error('❌ Failed to refresh RFP embeddings:', error);
+      });
+    }, REFRESH_DEBOUNCE_MS);
+    this.flushTimer.unref?.();
+  }
+
+  remove(rfpId: string): void {
+    this.removeEntry(rfpId);
+    this.pending.delete(rfpId);
+  }
+
+  /**
+   * Embed the given RFPs whose text changed since their stored embedding.
+   * Returns the number of RFPs that were (re-)embedded.
+   */
+  async refresh(rfpIds: string[]): Promise<number> {
+    if (rfpIds.length === 0) return 0;
+    await this.ensureLoaded();
+
+    const rfpRows = await storage.getRFPsByIds(rfpIds);
+    return this.embedRFPs(rfpRows);
+  }
+
+  /**
+   * Find RFPs similar to the given one. Makes no embedding calls when the
+   * RFP's stored embedding is current.
+   */
+  async findSimilar(
+    rfp: RFP,
+    options?: { topK?: number; minSimilarity?: number }
+  ): Promise<RFPSimilarityMatch[]> {
+    await this.ensureLoaded();
+
+    const contentHash = hashEmbeddingText(buildRFPEmbeddingText(rfp));
+    if (this.entries.get(rfp.id)?.contentHash !== contentHash) {
+      await this.embedRFPs([rfp]);
+    } else {
+      this.skippedUnchanged++;
+    }
+
+    const target = this.entries.get(rfp.id);
+    if (!target) return [];
+
+    return this.query(this.matrix.row(target.row), {
+      ...options,
+      excludeIds: new Set([rfp.id]),
+    });
+  }
+
+  /**
+   * Top-k RFPs by cosine similarity to a query vector
+   */
+  async query(
+    vector: ArrayLike<number>,
+    options?: {
+      topK?: number;
+      minSimilarity?: number;
+      excludeIds?: Set<string>;
+    }
+  ): Promise<RFPSimilarityMatch[]> {
+    await this.ensureLoaded();
+
+    const queryVector = normalizeVector(vector);
+    if (queryVector.length !== RFP_EMBEDDING_DIMENSIONS) {
+      throw new Error(
+        `Query vector has ${queryVector.length} dimensions, index uses ${RFP_EMBEDDING_DIMENSIONS}`
+      );
+    }
+
+    if (this.scores.length < this.matrix.size) {
+      this.scores = new Float32Array(this.matrix.size * 2);
+    }
+    const scores = scoreAll(this.matrix, queryVector, this.scores);
+    const excludeIds = options?.excludeIds;
+
+    return selectTopK(scores, options?.topK ?? 10, {
+      count: this.matrix.size,
+      minScore: options?.minSimilarity ?? 0,
+      exclude: excludeIds?.size
+        ? row => excludeIds.has(this.rowIds[row])
+        : undefined,
+    }).map(({ index, score }) => {
+      const rfpId = this.rowIds[index];
+      const entry = this.entries.get(rfpId)!;
+      return {
+        rfpId,
+        similarity: score,
+        agency: entry.agency,
+        category: entry.category,
+      };
+    });
+  }
+
+  /**
+   * Embed RFPs that have no stored embedding yet, in batches
+   */
+  async backfill(batchSize: number = EMBEDDING_BATCH_SIZE): Promise<number> {
+    if (this.backfillRunning || !process.env.OPENAI_API_KEY) return 0;
+    this.backfillRunning = true;
+
+    let total = 0;
+    try {
+      for (;;) {
+        const ids = await storage.getRFPIdsMissingEmbeddings(
+          RFP_EMBEDDING_MODEL,
+          RFP_EMBEDDING_DIMENSIONS,
+          batchSize
+        );
+        if (ids.length === 0) break;
+
+        const embedded = await this.embedRFPs(
+          await storage.getRFPsByIds(ids)
+        );
+        total += embedded;
+        // Nothing embedded means the batch keeps failing; try again later
+        if (embedded === 0) break;
+      }
+      if (total > 0) {
+        console.log(`🔢 Backfilled embeddings for ${total} RFPs`);
+      }
+    } catch (error) {
+      console.error('❌ RFP embedding backfill failed:', error);
+    } finally {
+      this.backfillRunning = false;
+    }
+    return total;
+  }
+
+  getStats() {
+    return {
+      size: this.entries.size,
+      dimensions: RFP_EMBEDDING_DIMENSIONS,
+      model: RFP_EMBEDDING_MODEL,
+      pendingRefreshes: this.pending.size,
+      embeddingCalls: this.embeddingCalls,
+      skippedUnchanged: this.skippedUnchanged,
+      lastSyncAt: this.lastSyncAt ? new Date(this.lastSyncAt) : null,
+    };
+  }
+
+  private async ensureLoaded(): Promise<void> {
+    if (!this.loadPromise) {
+      this.loadPromise = this.sync().catch(error => {
+        this.loadPromise = null;
+        throw error;
+      });
+      await this.loadPromise;
+      void this.backfill();
+      return;
+    }
+
+    await this.loadPromise;
+    if (Date.now() - this.lastSyncAt > SYNC_INTERVAL_MS) {
+      await this.sync();
+    }
+  }
+
+  /**
+   * Load embeddings from Postgres; incremental after the first load
+   */
+  private async sync(): Promise<void> {
+    const startedAt = Date.now();
+    const updatedSince = this.lastSyncAt
+      ? new Date(this.lastSyncAt - SYNC_CLOCK_SKEW_MS)
+      : undefined;
+
+    const rows = await storage.getRFPEmbeddings({
+      model: RFP_EMBEDDING_MODEL,
+      dimensions: RFP_EMBEDDING_DIMENSIONS,
+      updatedSince,
+    });
+
+    for (const row of rows) {
+      this.upsertEntry(row.rfpId, unpackEmbedding(row.embedding), {
+        contentHash: row.contentHash,
+        agency: row.agency,
+        category: row.category,
+      });
+    }
+
+    this.lastSyncAt = startedAt;
+  }
+
+  private async embedRFPs(rfpRows: RFP[]): Promise<number> {
+    const stale = rfpRows
+      .map(rfp => {
+        const text = buildRFPEmbeddingText(rfp);
+        return { rfp, text, contentHash: hashEmbeddingText(text) };
+      })
+      .filter(item => {
+        const unchanged =
+          this.entries.get(item.rfp.id)?.contentHash === item.contentHash;
+        if (unchanged) this.skippedUnchanged++;
+        return !unchanged;
+      });
+
+    if (stale.length === 0) return 0;
+
+    const { MLModelIntegration } = await import('./mlModelIntegration');
+    const ml = MLModelIntegration.getInstance();
+
+    let embedded = 0;
+    for (let i = 0; i < stale.length; i += EMBEDDING_BATCH_SIZE) {
+      const batch = stale.slice(i, i + EMBEDDING_BATCH_SIZE);
+      // One request per batch keeps embeddings aligned with their RFPs
+      const vectors = await ml.generateEmbeddingBatch(
+        batch.map(item => item.text),
+        {
+          model: RFP_EMBEDDING_MODEL,
+          dimensions: RFP_EMBEDDING_DIMENSIONS,
+          batchSize: batch.length,
+        }
+      );
+      this.embeddingCalls++;
+
+      // RFPs whose embedding failed stay stale and are retried next run
+      const generated = batch.flatMap((item, idx) => {
+        const vector = vectors[idx];
+        return vector ? [{ item, vector }] : [];
+      });
+      if (generated.length === 0) continue;
+
+      await storage.upsertRFPEmbeddings(
+        generated.map(({ item, vector }) => ({
+          rfpId: item.rfp.id,
+          model: RFP_EMBEDDING_MODEL,
+          dimensions: RFP_EMBEDDING_DIMENSIONS,
+          contentHash: item.contentHash,
+          embedding: packEmbedding(vector),
+        }))
+      );
+
+      generated.forEach(({ item, vector }) => {
+        this.upsertEntry(item.rfp.id, vector, {
+          contentHash: item.contentHash,
+          agency: item.rfp.agency,
+          category: item.rfp.category,
+        });
+      });
+      embedded += generated.length;
+    }
+
+    return embedded;
+  }
+
+  private upsertEntry(
+    rfpId: string,
+    vector: ArrayLike<number>,
+    metadata: Omit<IndexedRFP, 'row'>
+  ): void {
+    const existing = this.entries.get(rfpId);
+    if (existing) {
+      this.matrix.set(existing.row, vector);
+      this.entries.set(rfpId, { ...metadata, row: existing.row });
+      return;
+    }
+
+    const row = this.matrix.add(vector);
+    this.rowIds[row] = rfpId;
+    this.entries.set(rfpId, { ...metadata, row });
+  }
+
+  private removeEntry(rfpId: string): void {
+    const entry = this.entries.get(rfpId);
+    if (!entry) return;
+
+    this.entries.delete(rfpId);
+    const movedFrom = this.matrix.removeSwap(entry.row);
+    if (movedFrom !== -1) {
+      const movedId = this.rowIds[movedFrom];
+      this.rowIds[entry.row] = movedId;
+      this.entries.get(movedId)!.row = entry.row;
+    }
+    this.rowIds.length = this.matrix.size;
+  }
+}
+
+export const rfpEmbeddingIndex = new RFPEmbeddingIndex();
@@ -0,0 +1,617 @@
+/**
+ * Vector Kernel
+ *
+ * Numeric helpers for embedding workloads. Embeddings live in one contiguous,
+ * L2-normalized Float32Array (row-major), so cosine similarity is a dot
+ * product and scoring a query against every row is a single tight loop with
+ * no per-vector allocation or pointer chasing.
+ *
+ * - VectorMatrix: growable row store with O(1) swap-remove
+ * - scoreAll: batched dot products of a query against every row
+ * - selectTopK: bounded min-heap selection instead of sorting every score
+ * - kMeans: k-means++ with batched centroid distances (||x||² + ||c||² - 2x·c)
+ */
+
+export interface ScoredRow {
+  index: number;
+  score: number;
+}
+
+/**
+ * Dot product of two equal-length slices, unrolled by four
+ */
+export function dot(
+  a: Float32Array,
+  aOffset: number,
+  b: Float32Array,
+  bOffset: number,
+  length: number
+): number {
+  let s0 = 0;
+  let s1 = 0;
+  let s2 = 0;
+  let s3 = 0;
+  let i = 0;
+  const end = length - (length % 4);
+  for (; i < end; i += 4) {
+    s0 += a[aOffset + i] * b[bOffset + i];
+    s1 += a[aOffset + i + 1] * b[bOffset + i + 1];
+    s2 += a[aOffset + i + 2] * b[bOffset + i + 2];
+    s3 += a[aOffset + i + 3] * b[bOffset + i + 3];
+  }
+  for (; i < length; i++) {
+    s0 += a[aOffset + i] * b[bOffset + i];
+  }
+  return s0 + s1 + s2 + s3;
+}
+
+// Scratch output for dotRows4; a single monomorphic target keeps it inlinable
+const block = new Float64Array(4);
+
+/**
+ * Dot products of four consecutive rows against one vector, written to
+ * block[0..3]. Each vector element is loaded once per four rows.
+ */
+function dotRows4(
+  data: Float32Array,
+  rowOffset: number,
+  dims: number,
+  vector: Float32Array,
+  vectorOffset: number
+) {
+  const o1 = rowOffset + dims;
+  const o2 = o1 + dims;
+  const o3 = o2 + dims;
+  let s0 = 0;
+  let s1 = 0;
+  let s2 = 0;
+  let s3 = 0;
+  for (let i = 0; i < dims; i++) {
+    const v = vector[vectorOffset + i];
+    s0 += data[rowOffset + i] * v;
+    s1 += data[o1 + i] * v;
+    s2 += data[o2 + i] * v;
+    s3 += data[o3 + i] * v;
+  }
+  block[0] = s0;
+  block[1] = s1;
+  block[2] = s2;
+  block[3] = s3;
+}
+
+// Rows scored per dotTile call in assignToCentroids (bounds scratch memory)
+const ASSIGN_CHUNK_ROWS = 256;
+
+/**
+ * Dot products of rows [rowStart, rowEnd) against `count` vectors, written
+ * row-major to out[(row - rowStart) * count + v]. Works in 2-row x 4-vector
+ * tiles so each loaded value feeds several accumulators; V8 has no SIMD, so
+ * register reuse is where the speedup comes from.
+ */
+function dotTile(
+  data: Float32Array,
+  dims: number,
+  rowStart: number,
+  rowEnd: number,
+  vectors: Float32Array,
+  count: number,
+  out: Float64Array
+) {
+  const pairedEnd = rowStart + ((rowEnd - rowStart) & ~1);
+  const quadCount = count & ~3;
+
+  for (let row = rowStart; row < pairedEnd; row += 2) {
+    const r0 = row * dims;
+    const r1 = r0 + dims;
+    const out0 = (row - rowStart) * count;
+    const out1 = out0 + count;
+
+    for (let v = 0; v < quadCount; v += 4) {
+      const v0 = v * dims;
+      const v1 = v0 + dims;
+      const v2 = v1 + dims;
+      const v3 = v2 + dims;
+      let a0 = 0;
+      let a1 = 0;
+      let a2 = 0;
+      let a3 = 0;
+      let b0 = 0;
+      let b1 = 0;
+      let b2 = 0;
+      let b3 = 0;
+      for (let i = 0; i < dims; i++) {
+        const x = data[r0 + i];
+        const y = data[r1 + i];
+        const p0 = vectors[v0 + i];
+        const p1 = vectors[v1 + i];
+        const p2 = vectors[v2 + i];
+        const p3 = vectors[v3 + i];
+        a0 += x * p0;
+        a1 += x * p1;
+        a2 += x * p2;
+        a3 += x * p3;
+        b0 += y * p0;
+        b1 += y * p1;
+        b2 += y * p2;
+        b3 += y * p3;
+      }
+      out[out0 + v] = a0;
+      out[out0 + v + 1] = a1;
+      out[out0 + v + 2] = a2;
+      out[out0 + v + 3] = a3;
+      out[out1 + v] = b0;
+      out[out1 + v + 1] = b1;
+      out[out1 + v + 2] = b2;
+      out[out1 + v + 3] = b3;
+    }
+
+    for (let v = quadCount; v < count; v++) {
+      out[out0 + v] = dot(data, r0, vectors, v * dims, dims);
+      out[out1 + v] = dot(data, r1, vectors, v * dims, dims);
+    }
+  }
+
+  if (pairedEnd < rowEnd) {
+    const r0 = pairedEnd * dims;
+    const out0 = (pairedEnd - rowStart) * count;
+    for (let v = 0; v < count; v++) {
+      out[out0 + v] = dot(data, r0, vectors, v * dims, dims);
+    }
+  }
+}
+
+/**
+ * Copy a vector into a Float32Array scaled to unit length.
+ * Zero vectors are returned unchanged.
+ */
+export function normalizeVector(vector: ArrayLike<number>): Float32Array {
+  const out = Float32Array.from(vector);
+  normalizeRow(out, 0, out.length);
+  return out;
+}
+
+function normalizeRow(data: Float32Array, offset: number, length: number) {
+  const norm = Math.sqrt(dot(data, offset, data, offset, length));
+  if (norm === 0) return;
+  const inv = 1 / norm;
+  for (let i = 0; i < length; i++) {
+    data[offset + i] *= inv;
+  }
+}
+
+/**
+ * Contiguous store of L2-normalized vectors
+ */
+export class VectorMatrix {
+  private buffer: Float32Array;
+  private rowCount = 0;
+
+  constructor(
+    readonly dimensions: number,
+    initialCapacity: number = 1024
+  ) {
+    if (dimensions <= 0) {
+      throw new Error('dimensions must be greater than 0');
+    }
+    this.buffer = new Float32Array(Math.max(1, initialCapacity) * dimensions);
+  }
+
+  static from(vectors: ArrayLike<number>[], dimensions?: number): VectorMatrix {
+    const dims = dimensions ?? vectors[0]?.length ?? 0;
+    const matrix = new VectorMatrix(dims, vectors.length);
+    for (const vector of vectors) {
+      matrix.add(vector);
+    }
+    return matrix;
+  }
+
+  get size(): number {
+    return this.rowCount;
+  }
+
+  /**
+   * Backing array; only the first size * dimensions values are meaningful
+   */
+  get data(): Float32Array {
+    return this.buffer;
+  }
+
+  /**
+   * Append a vector (normalized on the way in) and return its row index
+   */
+  add(vector: ArrayLike<number>): number {
+    if (this.rowCount * this.dimensions === this.buffer.length) {
+      const grown = new Float32Array(this.buffer.length * 2);
+      grown.set(this.buffer);
+      this.buffer = grown;
+    }
+    const row = this.rowCount++;
+    this.set(row, vector);
+    return row;
+  }
+
+  set(row: number, vector: ArrayLike<number>): void {
+    this.assertRow(row);
+    if (vector.length !== this.dimensions) {
+      throw new Error(
+        `Vector has ${vector.length} dimensions, matrix uses ${this.dimensions}`
+      );
+    }
+    const offset = row * this.dimensions;
+    for (let i = 0; i < this.dimensions; i++) {
+      this.buffer[offset + i] = vector[i];
+    }
+    normalizeRow(this.buffer, offset, this.dimensions);
+  }
+
+  /**
+   * Remove a row by moving the last row into its slot.
+   * Returns the previous index of the moved row, or -1 if nothing moved.
+   */
+  removeSwap(row: number): number {
+    this.assertRow(row);
+    const last = --this.rowCount;
+    if (row === last) return -1;
+    const dims = this.dimensions;
+    this.buffer.copyWithin(row * dims, last * dims, (last + 1) * dims);
+    return last;
+  }
+
+  /**
+   * Zero-copy view of a row
+   */
+  row(row: number): Float32Array {
+    this.assertRow(row);
+    const offset = row * this.dimensions;
+    return this.buffer.subarray(offset, offset + this.dimensions);
+  }
+
+  clear(): void {
+    this.rowCount = 0;
+  }
+
+  private assertRow(row: number) {
+    if (row < 0 || row >= this.rowCount) {
+      throw new RangeError(`Row ${row} out of range (size ${this.rowCount})`);
+    }
+  }
+}
+
+/**
+ * Dot product of the query against every row. The query is expected to be
+ * normalized already if cosine similarity is wanted.
+ */
+export function scoreAll(
+  matrix: VectorMatrix,
+  query: Float32Array,
+  out?: Float32Array
+): Float32Array {
+  const dims = matrix.dimensions;
+  if (query.length !== dims) {
+    throw new Error(
+      `Query vector has ${query.length} dimensions, matrix uses ${dims}`
+    );
+  }
+  const n = matrix.size;
+  const scores = out && out.length >= n ? out : new Float32Array(n);
+  const data = matrix.data;
+  let row = 0;
+  for (; row + 4 <= n; row += 4) {
+    dotRows4(data, row * dims, dims, query, 0);
+    scores[row] = block[0];
+    scores[row + 1] = block[1];
+    scores[row + 2] = block[2];
+    scores[row + 3] = block[3];
+  }
+  for (; row < n; row++) {
+    scores[row] = dot(data, row * dims, query, 0, dims);
+  }
+  return scores;
+}
+
+/**
+ * Highest-scoring rows in descending order. Keeps a size-k min-heap, so
+ * selection is O(n log k) rather than sorting all n scores.
+ */
+export function selectTopK(
+  scores: Float32Array,
+  k: number,
+  options?: {
+    count?: number; // Number of valid scores (defaults to scores.length)
+    minScore?: number;
+    exclude?: (index: number) => boolean;
+  }
+): ScoredRow[] {
+  const n = options?.count ?? scores.length;
+  const minScore = options?.minScore ?? -Infinity;
+  const exclude = options?.exclude;
+  const limit = Math.min(k, n);
+  if (limit <= 0) return [];
+
+  const heapScores = new Float64Array(limit);
+  const heapIndices = new Int32Array(limit);
+  let size = 0;
+
+  const siftDown = (start: number) => {
+    let i = start;
+    for (;;) {
+      const left = 2 * i + 1;
+      const right = left + 1;
+      let smallest = i;
+      if (left < size && heapScores[left] < heapScores[smallest]) {
+        smallest = left;
+      }
+      if (right < size && heapScores[right] < heapScores[smallest]) {
+        smallest = right;
+      }
+      if (smallest === i) return;
+      const score = heapScores[i];
+      const index = heapIndices[i];
+      heapScores[i] = heapScores[smallest];
+      heapIndices[i] = heapIndices[smallest];
+      heapScores[smallest] = score;
+      heapIndices[smallest] = index;
+      i = smallest;
+    }
+  };
+
+  for (let i = 0; i < n; i++) {
+    const score = scores[i];
+    if (score < minScore) continue;
+    if (size === limit && score <= heapScores[0]) continue;
+    if (exclude && exclude(i)) continue;
+
+    if (size < limit) {
+      // Sift up
+      let child = size++;
+      while (child > 0) {
+        const parent = (child - 1) >> 1;
+        if (heapScores[parent] <= score) break;
+        heapScores[child] = heapScores[parent];
+        heapIndices[child] = heapIndices[parent];
+        child = parent;
+      }
+      heapScores[child] = score;
+      heapIndices[child] = i;
+    } else {
+      heapScores[0] = score;
+      heapIndices[0] = i;
+      siftDown(0);
+    }
+  }
+
+  const results: ScoredRow[] = [];
+  for (let i = 0; i < size; i++) {
+    results.push({ index: heapIndices[i], score: heapScores[i] });
+  }
+  return results.sort((a, b) => b.score - a.score);
+}
+
+/**
+ * Assign every row to its nearest centroid using batched squared distances.
+ * Writes into assignments/distances and returns how many assignments changed.
+ */
+export function assignToCentroids(
+  matrix: VectorMatrix,
+  centroids: Float32Array,
+  k: number,
+  assignments: Int32Array,
+  distances: Float32Array
+): number {
+  const dims = matrix.dimensions;
+  const data = matrix.data;
+  const centroidNorms = new Float64Array(k);
+  for (let j = 0; j < k; j++) {
+    centroidNorms[j] = dot(centroids, j * dims, centroids, j * dims, dims);
+  }
+
+  const n = matrix.size;
+  const dots = new Float64Array(ASSIGN_CHUNK_ROWS * k);
+  let changed = 0;
+
+  for (let start = 0; start < n; start += ASSIGN_CHUNK_ROWS) {
+    const end = Math.min(n, start + ASSIGN_CHUNK_ROWS);
+    dotTile(data, dims, start, end, centroids, k, dots);
+
+    for (let row = start; row < end; row++) {
+      const rowNorm = dot(data, row * dims, data, row * dims, dims);
+      const dotOffset = (row - start) * k;
+      let best = 0;
+      let bestDistance = Infinity;
+      for (let j = 0; j < k; j++) {
+        const distance = rowNorm + centroidNorms[j] - 2 * dots[dotOffset + j];
+        if (distance < bestDistance) {
+          bestDistance = distance;
+          best = j;
+        }
+      }
+      if (assignments[row] !== best) {
+        assignments[row] = best;
+        changed++;
+      }
+      // Clamp float error around zero
+      distances[row] = bestDistance > 0 ? bestDistance : 0;
+    }
+  }
+  return changed;
+}
+
+export interface KMeansResult {
+  centroids: Float32Array; // k rows of matrix.dimensions values
+  assignments: Int32Array; // Cluster index per row
+  k: number;
+  iterations: number;
+}
+
+/**
+ * K-means with k-means++ seeding over the rows of a matrix
+ */
+export function kMeans(
+  matrix: VectorMatrix,
+  k: number,
+  options?: { maxIterations?: number; random?: () => number }
+): KMeansResult {
+  const n = matrix.size;
+  if (k <= 0) {
+    throw new Error('k must be greater than 0');
+  }
+  if (n === 0) {
+    throw new Error('embeddings cannot be empty');
+  }
+
+  const maxIterations = options?.maxIterations || 100;
+  const random = options?.random ?? Math.random;
+  const effectiveK = Math.min(k, n);
+  const dims = matrix.dimensions;
+  const data = matrix.data;
+  const centroids = new Float32Array(effectiveK * dims);
+
+  const copyRowToCentroid = (row: number, centroid: number) => {
+    centroids.set(
+      data.subarray(row * dims, (row + 1) * dims),
+      centroid * dims
+    );
+  };
+
+  // K-means++: track each row's squared distance to its nearest chosen
+  // centroid, updating only against the newest centroid each round
+  const nearest = new Float64Array(n).fill(Infinity);
+  const centroidDots = new Float32Array(n);
+  const rowNorms = new Float64Array(n);
+  for (let row = 0; row < n; row++) {
+    rowNorms[row] = dot(data, row * dims, data, row * dims, dims);
+  }
+  let chosen = Math.floor(random() * n);
+  for (let c = 0; c < effectiveK; c++) {
+    copyRowToCentroid(chosen, c);
+    if (c === effectiveK - 1) break;
+
+    const centroid = centroids.subarray(c * dims, (c + 1) * dims);
+    const centroidNorm = dot(centroid, 0, centroid, 0, dims);
+    scoreAll(matrix, centroid, centroidDots);
+    let total = 0;
+    for (let row = 0; row < n; row++) {
+      const distance = Math.max(
+        0,
+        rowNorms[row] + centroidNorm - 2 * centroidDots[row]
+      );
+      if (distance < nearest[row]) nearest[row] = distance;
+      total += nearest[row];
+    }
+
+    let threshold = random() * total;
+    chosen = 0;
+    for (let row = 0; row < n; row++) {
+      threshold -= nearest[row];
+      if (threshold <= 0) {
+        chosen = row;
+        break;
+      }
+    }
+  }
+
+  const assignments = new Int32Array(n).fill(-1);
+  const distances = new Float32Array(n);
+  const sums = new Float64Array(effectiveK * dims);
+  const counts = new Int32Array(effectiveK);
+  let iterations = 0;
+
+  while (iterations < maxIterations) {
+    const changed = assignToCentroids(
+      matrix,
+      centroids,
+      effectiveK,
+      assignments,
+      distances
+    );
+    if (iterations > 0 && changed === 0) break;
+
+    // Update step: recompute centroids as member means
+    sums.fill(0);
+    counts.fill(0);
+    for (let row = 0, offset = 0; row < n; row++, offset += dims) {
+      const cluster = assignments[row];
+      const sumOffset = cluster * dims;
+      for (let d = 0; d < dims; d++) {
+        sums[sumOffset + d] += data[offset + d];
+      }
+      counts[cluster]++;
+    }
+
+    for (let j = 0; j < effectiveK; j++) {
+      if (counts[j] > 0) {
+        const inv = 1 / counts[j];
+        for (let d = 0; d < dims; d++) {
+          centroids[j * dims + d] = sums[j * dims + d] * inv;
+        }
+      } else {
+        // Re-seed an empty cluster with the row furthest from its centroid
+        let furthest = 0;
+        for (let row = 1; row < n; row++) {
+          if (distances[row] > distances[furthest]) furthest = row;
+        }
+        copyRowToCentroid(furthest, j);
+        distances[furthest] = 0;
+      }
+    }
+
+    iterations++;
+  }
+
+  return { centroids, assignments, k: effectiveK, iterations };
+}
+
+/**
+ * Mean silhouette coefficient for a clustering, using Euclidean distance
+ * between rows. Distances are computed a row at a time from batched dot
+ * products, so memory stays O(n) instead of an n x n distance table.
+ */
+export function meanSilhouette(
+  matrix: VectorMatrix,
+  assignments: Int32Array,
+  k: number
+): number {
+  const n = matrix.size;
+  if (n === 0 || k < 2) return 0;
+
+  const dims = matrix.dimensions;
+  const data = matrix.data;
+  const clusterSizes = new Int32Array(k);
+  const norms = new Float64Array(n);
+  for (let row = 0; row < n; row++) {
+    const cluster = assignments[row];
+    if (cluster < 0 || cluster >= k) return 0;
+    clusterSizes[cluster]++;
+    norms[row] = dot(data, row * dims, data, row * dims, dims);
+  }
+
+  const scores = new Float32Array(n);
+  const distanceSums = new Float64Array(k);
+  let total = 0;
+
+  for (let i = 0; i < n; i++) {
+    const own = assignments[i];
+    if (clusterSizes[own] <= 1) continue; // Singleton clusters score 0
+
+    scoreAll(matrix, matrix.row(i), scores);
+    distanceSums.fill(0);
+    for (let j = 0; j < n; j++) {
+      if (j === i) continue;
+      const squared = norms[i] + norms[j] - 2 * scores[j];
+      distanceSums[assignments[j]] += squared > 0 ? Math.sqrt(squared) : 0;
+    }
+
+    const a = distanceSums[own] / (clusterSizes[own] - 1);
+    let b = Infinity;
+    for (let c = 0; c < k; c++) {
+      if (c === own || clusterSizes[c] === 0) continue;
+      b = Math.min(b, distanceSums[c] / clusterSizes[c]);
+    }
+    if (b === Infinity) continue;
+
+    const maxAB = Math.max(a, b);
+    total += maxAB === 0 ? 0 : (b - a) / maxAB;
+  }
+
+  return total / n;
+}
@@ -1,5 +1,11 @@
 import { EventEmitter } from 'events';
 import { Response } from 'express';
+import {
+  FanOutHub,
+  type FanOutStats,
+  type FanOutSubscriber,
+} from '../core/fanOutHub';
+import { eventBus, type BusMessage, type EventBus } from '../core/eventBus';
 
 export interface ProgressUpdate {
   step: string;
@@ -20,14 +26,41 @@ export interface RFPProcessingProgress {
   error?: string;
 }
 
+// Event bus topic carrying progress for every session, keyed by session id
+const PROGRESS_TOPIC = 'progress';
+
+type ProgressEvent =
+  | { type: 'progress'; data: RFPProcessingProgress }
+  | { type: 'complete'; rfpId: string }
+  | { type: 'error'; error: string };
+
+interface SSEClient {
+  sessionId: string;
+  res: Response;
+  subscriber: FanOutSubscriber;
+  lastActivity: Date;
+  heartbeatInterval: NodeJS.Timeout;
+}
+
 class ProgressTracker extends EventEmitter {
   private progressMap: Map<string, RFPProcessingProgress> = new Map();
-  private sseClients: Map<string, Response[]> = new Map();
   private workflowTypes: Map<
     string,
     'rfp_processing' | 'submission_materials'
   > = new Map();
-  private clientInfo: Map<string, { lastActivity: Date; heartbeatInterval: NodeJS.Timeout }> = new Map();
+  // SSE clients by subscriber id; each subscribes to its session's channel
+  private sseClients: Map<string, SSEClient> = new Map();
+  private nextClientId = 0;
+  // Frames are encoded once per update. Progress is coalesced per session
+  // for clients that lag, and clients far behind are dropped.
+  private fanOut = new FanOutHub<object>({
+    encode: message => `data: ${JSON.stringify(message)}\n\n`,
+    onDisconnect: subscriber => {
+      console.log(`📡 Dropping slow SSE client ${subscriber.id}`);
+      this.removeSSEClient(subscriber.id);
+    },
+  });
+
   private readonly HEARTBEAT_INTERVAL_MS = 15000; // 15 seconds for better proxy compatibility
   private readonly CONNECTION_TIMEOUT_MS = 120000; // 2 minutes inactivity timeout
 
@@ -62,6 +95,15 @@ class ProgressTracker extends EventEmitter {
   // Default to RFP processing steps for backward compatibility
   private readonly PROCESSING_STEPS = this.WORKFLOW_STEPS.rfp_processing;
 
+  constructor(private readonly bus: EventBus = eventBus) {
+    super();
+    // Updates reach SSE clients through the bus, so a client connected to
+    // any node sees progress made on any other
+    this.bus.subscribe<ProgressEvent>(PROGRESS_TOPIC, message =>
+      this.handleProgressEvent(message)
+    );
+  }
+
   /**
    * Start tracking a new processing job
    */
@@ -75,7 +117,7 @@ class ProgressTracker extends EventEmitter {
       const oldestKey = this.progressMap.keys().next().value;
       if (oldestKey) {
         this.progressMap.delete(oldestKey);
-        this.sseClients.delete(oldestKey);
+        this.fanOut.closeChannel(oldestKey);
       }
     }
     if (this.workflowTypes.size >= this.MAX_WORKFLOW_TYPES) {
@@ -198,13 +240,23 @@ class ProgressTracker extends EventEmitter {
     // Send initial connection message
     res.write(`data: ${JSON.stringify({ type: 'connected', sessionId })}\n\n`);
 
-    // Add client to the session's client list
-    if (!this.sseClients.has(sessionId)) {
-      this.sseClients.set(sessionId, []);
-    }
-    this.sseClients.get(sessionId)!.push(res);
+    // Add client to the session's channel
+    const subscriber = this.fanOut.addSubscriber(
+      `${sessionId}:${++this.nextClientId}`,
+      {
+        bufferedBytes: () => res.writableLength ?? 0,
+        write: frame => {
+          res.write(frame);
+        },
+        terminate: () => {
+          if (res.destroy) res.destroy();
+          else res.end();
+        },
+      }
+    );
+    this.fanOut.subscribe(subscriber, sessionId);
     console.log(
-      `📡 SSE client added. Total clients for session ${sessionId}: ${this.sseClients.get(sessionId)!.length}`
+      `📡 SSE client added. Total clients for session ${sessionId}: ${this.fanOut.subscribersOf(sessionId).length}`
     );
 
     // Send current progress if available
@@ -213,11 +265,24 @@ class ProgressTracker extends EventEmitter {
       console.log(
         `📡 Sending existing progress to new client: ${progress.status}`
       );
-      res.write(
-        `data: ${JSON.stringify({ type: 'progress', data: progress })}\n\n`
+      this.fanOut.send(
+        subscriber,
+        { type: 'progress', data: progress },
+        { coalesceKey: 'progress' }
       );
     } else {
-      console.log(`📡 No existing progress found for session: ${sessionId}`);
+      // The session may be running on another node
+      void this.bus
+        .getSnapshot<ProgressEvent>(PROGRESS_TOPIC, sessionId)
+        .then(snapshot => {
+          if (snapshot && this.sseClients.has(subscriber.id)) {
+            this.fanOut.send(subscriber, snapshot, { coalesceKey: 'progress' });
+          } else if (!snapshot) {
+            console.log(
+              `📡 No existing progress found for session: ${sessionId}`
+            );
+          }
+        });
     }
 
     // Keep connection alive with more frequent heartbeat for proxy compatibility
@@ -229,9 +294,9 @@ class ProgressTracker extends EventEmitter {
           `data: ${JSON.stringify({ type: 'heartbeat', timestamp: Date.now() })}\n\n`
         );
         // Update last activity
-        const info = this.clientInfo.get(`${sessionId}:${res}`);
-        if (info) {
-          info.lastActivity = new Date();
+        const client = this.sseClients.get(subscriber.id);
+        if (client) {
+          client.lastActivity = new Date();
         }
       } catch {
         console.log(
@@ -242,8 +307,10 @@ class ProgressTracker extends EventEmitter {
     }, this.HEARTBEAT_INTERVAL_MS);
 
     // Track client info
-    const clientKey = `${sessionId}:${this.sseClients.get(sessionId)!.length - 1}`;
-    this.clientInfo.set(clientKey, {
+    this.sseClients.set(subscriber.id, {
+      sessionId,
+      res,
+      subscriber,
       lastActivity: new Date(),
       heartbeatInterval: heartbeat,
     });
@@ -251,26 +318,19 @@ class ProgressTracker extends EventEmitter {
     // Handle client disconnect - single consolidated handler
     res.on('close', () => {
       console.log(`📡 SSE client disconnected for session: ${sessionId}`);
-      clearInterval(heartbeat);
-      this.clientInfo.delete(clientKey);
-      this.removeSSEClient(sessionId, res);
+      this.removeSSEClient(subscriber.id);
     });
   }
 
   /**
    * Remove an SSE client
    */
-  private removeSSEClient(sessionId: string, res: Response): void {
-    const clients = this.sseClients.get(sessionId);
-    if (clients) {
-      const index = clients.indexOf(res);
-      if (index > -1) {
-        clients.splice(index, 1);
-      }
-      if (clients.length === 0) {
-        this.sseClients.delete(sessionId);
-      }
-    }
+  private removeSSEClient(clientId: string): void {
+    const client = this.sseClients.get(clientId);
+    if (!client) return;
+    clearInterval(client.heartbeatInterval);
+    this.fanOut.removeSubscriber(client.subscriber);
+    this.sseClients.delete(clientId);
   }
 
   /**
@@ -278,28 +338,49 @@ class ProgressTracker extends EventEmitter {
    */
   private broadcastProgress(sessionId: string): void {
     const progress = this.progressMap.get(sessionId);
-    const clients = this.sseClients.get(sessionId);
-
-    if (progress && clients) {
-      const data = JSON.stringify({
-        type: 'progress',
-        data: progress,
-      });
-
-      clients.forEach(client => {
-        try {
-          client.write(`data: ${data}\n\n`);
-        } catch (error) {
-          console.error('Error sending SSE:', error);
-          this.removeSSEClient(sessionId, client);
-        }
-      });
+
+    if (progress) {
+      this.bus.publish<ProgressEvent>(
+        PROGRESS_TOPIC,
+        sessionId,
+        { type: 'progress', data: progress },
+        { snapshot: true }
+      );
     }
 
     // Emit event for other listeners
     this.emit('progress', sessionId, progress);
   }
 
+  /**
+   * Deliver a session's progress, from this node or another, to its clients
+   */
+  private handleProgressEvent({ key, payload }: BusMessage<ProgressEvent>) {
+    if (payload.type === 'progress') {
+      this.fanOut.publish(key, payload, { coalesceKey: 'progress' });
+    } else {
+      this.progressMap.delete(key);
+      this.closeSession(key, payload);
+    }
+  }
+
+  /**
+   * Send a final message to a session's clients and close them
+   */
+  private closeSession(sessionId: string, message: object): void {
+    this.fanOut.publish(sessionId, message);
+    for (const subscriber of this.fanOut.closeChannel(sessionId)) {
+      const client = this.sseClients.get(subscriber.id);
+      if (!client) continue;
+      try {
+        client.res.end();
+      } catch {
+        // Client may already be disconnected
+      }
+      this.removeSSEClient(subscriber.id);
+    }
+  }
+
   /**
    * Mark processing as complete
    */
@@ -314,21 +395,12 @@ class ProgressTracker extends EventEmitter {
 
     // Clean up after a delay
     setTimeout(() => {
-      this.progressMap.delete(sessionId);
-      const clients = this.sseClients.get(sessionId);
-      if (clients) {
-        clients.forEach(client => {
-          try {
-            client.write(
-              `data: ${JSON.stringify({ type: 'complete', rfpId })}\n\n`
-            );
-            client.end();
-          } catch {
-            // Client may already be disconnected
-          }
-        });
-        this.sseClients.delete(sessionId);
-      }
+      this.bus.publish<ProgressEvent>(
+        PROGRESS_TOPIC,
+        sessionId,
+        { type: 'complete', rfpId },
+        { final: true }
+      );
     }, 5000);
   }
 
@@ -344,21 +416,12 @@ class ProgressTracker extends EventEmitter {
 
       // Clean up after a delay
       setTimeout(() => {
-        this.progressMap.delete(sessionId);
-        const clients = this.sseClients.get(sessionId);
-        if (clients) {
-          clients.forEach(client => {
-            try {
-              client.write(
-                `data: ${JSON.stringify({ type: 'error', error })}\n\n`
-              );
-              client.end();
-            } catch {
-              // Client may already be disconnected
-            }
-          });
-          this.sseClients.delete(sessionId);
-        }
+        this.bus.publish<ProgressEvent>(
+          PROGRESS_TOPIC,
+          sessionId,
+          { type: 'error', error },
+          { final: true }
+        );
       }, 5000);
     }
   }
@@ -367,14 +430,21 @@ class ProgressTracker extends EventEmitter {
    * Get client info for debugging/monitoring
    */
   getClientInfo(sessionId: string): { lastActivity: Date } | undefined {
-    for (const [key, info] of this.clientInfo.entries()) {
-      if (key.startsWith(sessionId)) {
-        return { lastActivity: info.lastActivity };
+    for (const client of this.sseClients.values()) {
+      if (client.sessionId === sessionId) {
+        return { lastActivity: client.lastActivity };
       }
     }
     return undefined;
   }
 
+  /**
+   * SSE fan-out counters: subscribers per session, coalesced and dropped
+   */
+  getFanOutStats(): FanOutStats {
+    return this.fanOut.getStats();
+  }
+
   /**
    * Shutdown and cleanup all resources
    * Should be called on application shutdown to prevent memory leaks
@@ -383,34 +453,26 @@ class ProgressTracker extends EventEmitter {
     console.log('🛑 ProgressTracker shutdown initiated...');
 
     // Close all SSE clients with reconnect hint
-    for (const [, clients] of this.sseClients) {
-      clients.forEach(client => {
-        try {
-          client.write(
-            `data: ${JSON.stringify({
-              type: 'shutdown',
-              message: 'Server shutting down for maintenance',
-              reconnectAfter: 5000, // Suggest client wait 5s before reconnecting
-              timestamp: Date.now(),
-            })}\n\n`
-          );
-          client.end();
-        } catch {
-          // Client may already be disconnected
-        }
-      });
-    }
-
-    // Clear all heartbeat intervals
-    for (const [, info] of this.clientInfo) {
-      clearInterval(info.heartbeatInterval);
+    this.fanOut.broadcast({
+      type: 'shutdown',
+      message: 'Server shutting down for maintenance',
+      reconnectAfter: 5000, // Suggest client wait 5s before reconnecting
+      timestamp: Date.now(),
+    });
+    for (const client of this.sseClients.values()) {
+      clearInterval(client.heartbeatInterval);
+      try {
+        client.res.end();
+      } catch {
+        // Client may already be disconnected
+      }
     }
 
     // Clear all data structures
     this.progressMap.clear();
     this.sseClients.clear();
     this.workflowTypes.clear();
-    this.clientInfo.clear();
+    this.fanOut.shutdown();
 
     console.log('✅ ProgressTracker shutdown complete');
   }
@@ -1,4 +1,5 @@
 import { IStorage, storage } from '../../storage';
+import type { KeysetPage } from '../../utils/cursor';
 import type { Scan, InsertScan, InsertScanEvent, ScanEvent } from '@shared/schema';
 
 export interface ScanHistoryItem {
@@ -29,6 +30,7 @@ export interface ScanHistoryFilter {
   endDate?: Date;
   limit?: number;
   offset?: number;
+  cursor?: string;
 }
 
 export class ScanHistoryService {
@@ -40,26 +42,30 @@ export class ScanHistoryService {
   async getScanHistory(
     filter: ScanHistoryFilter = {}
   ): Promise<ScanHistoryItem[]> {
+    const page = await this.getScanHistoryPage(filter);
+    return page.items;
+  }
+
+  /**
+   * Get one page of scan history, newest first. Pass nextCursor back as
+   * filter.cursor to seek to the next page; offset is used otherwise.
+   */
+  async getScanHistoryPage(
+    filter: ScanHistoryFilter = {}
+  ): Promise<KeysetPage<ScanHistoryItem>> {
     try {
-      // Use getActiveScans() or getScansByPortal() depending on filter
-      let scans: any[] = [];
-      if (filter.portalName) {
-        const portals = await this.storage.getAllPortals();
-        const portal = portals.find(p => p.name === filter.portalName);
-        if (portal) {
-          scans = await this.storage.getScansByPortal(
-            portal.id,
-            filter.limit || 50
-          );
-        }
-      } else {
-        scans = await this.storage.getActiveScans();
-      }
+      const page = await this.storage.getScansPage({
+        ...filter,
+        limit: filter.limit || 50,
+      });
 
-      return scans.map((scan: any) => this.convertScanToHistoryItem(scan));
+      return {
+        items: page.items.map(scan => this.convertScanToHistoryItem(scan)),
+        nextCursor: page.nextCursor,
+      };
     } catch (error) {
       console.error('Error fetching scan history:', error);
-      return [];
+      return { items: [], nextCursor: null };
     }
   }
 
@@ -68,8 +74,7 @@ export class ScanHistoryService {
    */
   async getScanHistoryCount(filter: ScanHistoryFilter = {}): Promise<number> {
     try {
-      const scans = await this.getScanHistory(filter);
-      return scans.length;
+      return await this.storage.countScans(filter);
     } catch (error) {
       console.error('Error fetching scan history count:', error);
       return 0;
@@ -97,7 +102,8 @@ export class ScanHistoryService {
   }
 
   /**
-   * Get scan statistics
+   * Get scan statistics for finished scans over the last N days, aggregated
+   * per portal in SQL. Reads the daily rollup unless SCAN_STATS_SOURCE=scans.
    */
   async getScanStatistics(days: number = 30): Promise<{
     totalScans: number;
@@ -118,82 +124,57 @@ export class ScanHistoryService {
       const startDate = new Date();
       startDate.setDate(startDate.getDate() - days);
 
-      const scans = await this.storage.getActiveScans();
-
-      const totalScans = scans.length;
-      const successfulScans = scans.filter(
-        (s: any) => s.status === 'completed'
-      ).length;
-      const failedScans = scans.filter(
-        (s: any) => s.status === 'failed'
-      ).length;
-      const successRate =
-        totalScans > 0 ? (successfulScans / totalScans) * 100 : 0;
-
-      const totalRfpsDiscovered = scans.reduce(
-        (sum: number, scan: any) => sum + (scan.discoveredRfpsCount || 0),
-        0
-      );
-      const avgRfpsPerScan =
-        totalScans > 0 ? totalRfpsDiscovered / totalScans : 0;
-
-      // Calculate average scan duration
-      const completedScans = scans.filter(
-        (s: any) => s.completedAt && s.startedAt
-      );
-      const totalDuration = completedScans.reduce((sum: number, scan: any) => {
-        const duration =
-          new Date(scan.completedAt!).getTime() -
-          new Date(scan.startedAt).getTime();
-        return sum + duration;
-      }, 0);
-      const avgScanDuration =
-        completedScans.length > 0 ? totalDuration / completedScans.length : 0;
+      const portalStats = await this.storage.getScanPortalStats(startDate, {
+        source: process.env.SCAN_STATS_SOURCE === 'scans' ? 'scans' : 'rollup',
+      });
 
-      // Top portals by performance
-      const portalStats = new Map<
-        string,
+      const totals = portalStats.reduce(
+        (sum, stats) => ({
+          scanCount: sum.scanCount + stats.scanCount,
+          successCount: sum.successCount + stats.successCount,
+          failedCount: sum.failedCount + stats.failedCount,
+          rfpsDiscovered: sum.rfpsDiscovered + stats.rfpsDiscovered,
+          totalDurationMs: sum.totalDurationMs + stats.totalDurationMs,
+          timedScanCount: sum.timedScanCount + stats.timedScanCount,
+        }),
         {
-          scanCount: number;
-          successCount: number;
-          rfpsDiscovered: number;
-        }
-      >();
-
-      scans.forEach((scan: any) => {
-        const current = portalStats.get(scan.portalName) || {
           scanCount: 0,
           successCount: 0,
+          failedCount: 0,
           rfpsDiscovered: 0,
-        };
-
-        current.scanCount++;
-        if (scan.status === 'completed') {
-          current.successCount++;
+          totalDurationMs: 0,
+          timedScanCount: 0,
         }
-        current.rfpsDiscovered += scan.discoveredRfpsCount || 0;
-
-        portalStats.set(scan.portalName, current);
-      });
+      );
 
-      const topPortals = Array.from(portalStats.entries())
-        .map(([portalName, stats]) => ({
-          portalName,
+      const topPortals = portalStats
+        .map(stats => ({
+          portalName: stats.portalName,
           scanCount: stats.scanCount,
-          successRate: (stats.successCount / stats.scanCount) * 100,
+          successRate:
+            stats.scanCount > 0
+              ? (stats.successCount / stats.scanCount) * 100
+              : 0,
           rfpsDiscovered: stats.rfpsDiscovered,
         }))
         .sort((a, b) => b.rfpsDiscovered - a.rfpsDiscovered)
         .slice(0, 10);
 
       return {
-        totalScans,
-        successfulScans,
-        failedScans,
-        successRate,
-        totalRfpsDiscovered,
-        avgRfpsPerScan,
-        avgScanDuration,
+        totalScans: totals.scanCount,
+        successfulScans: totals.successCount,
+        failedScans: totals.failedCount,
+        successRate:
+          totals.scanCount > 0
+            ? (totals.successCount / totals.scanCount) * 100
+            : 0,
+        totalRfpsDiscovered: totals.rfpsDiscovered,
+        avgRfpsPerScan:
+          totals.scanCount > 0 ? totals.rfpsDiscovered / totals.scanCount : 0,
+        avgScanDuration:
+          totals.timedScanCount > 0
+            ? totals.totalDurationMs / totals.timedScanCount
+            : 0,
         topPortals,
       };
     } catch (error) {
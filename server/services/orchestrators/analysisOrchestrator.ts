@@ -11,6 +11,7 @@ export interface AnalysisWorkflowInput {
   companyProfileId?: string;
   priority?: number;
   deadline?: Date;
+  bypassCache?: boolean;
 }
 
 export interface AnalysisWorkflowResult {
@@ -332,7 +333,8 @@ export class AnalysisOrchestrator {
         input.sessionId,
         documents,
         input.priority || 5,
-        input.deadline
+        input.deadline,
+        input.bypassCache === true
       );
 
       // Store work sequence
@@ -389,7 +391,8 @@ export class AnalysisOrchestrator {
     sessionId: string,
     documents: RFPDocument[],
     priority: number,
-    deadline?: Date
+    deadline?: Date,
+    bypassCache = false
   ): Promise<WorkItemSequence[]> {
     const sequence: WorkItemSequence[] = [];
 
@@ -464,6 +467,7 @@ export class AnalysisOrchestrator {
           'deadlines',
         ],
         structuredOutput: true,
+        bypassCache,
       },
       metadata: {
         workflowId,
@@ -495,6 +499,7 @@ export class AnalysisOrchestrator {
           'deadlines',
         ],
         riskAssessment: true,
+        bypassCache,
       },
       metadata: {
         workflowId,
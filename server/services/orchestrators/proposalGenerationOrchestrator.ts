@@ -2,6 +2,17 @@ import { storage } from '../../storage';
 import { workflowCoordinator } from '../workflows/workflowCoordinator';
 import { agentMemoryService } from '../agents/agentMemoryService';
 import { progressTracker } from '../monitoring/progressTracker';
+import {
+  PROPOSAL_PHASE_GRAPH,
+  PhaseExecutionError,
+  phaseGraphDepth,
+  proposalPhaseScheduler,
+  withoutPhases,
+  type PhaseScheduleReport,
+  type ProposalPhaseId,
+  type ProposalPhaseNode,
+} from './proposalPhaseScheduler';
+import type { WorkItem } from '@shared/schema';
 import { nanoid } from 'nanoid';
 
 export interface ProposalGenerationPipeline {
@@ -37,6 +48,8 @@ export interface ProposalGenerationPipeline {
     proposalId?: string;
   };
   qualityScore?: number;
+  /** Phase timings and critical path, once the phase graph has run */
+  schedule?: PhaseScheduleReport;
   metadata: any;
   createdAt: Date;
   updatedAt: Date;
@@ -72,6 +85,160 @@ export interface ProposalGenerationResult {
   nextSteps?: string[];
 }
 
+interface WorkItemWaiter {
+  pipelineId: string;
+  resolve: (result: any) => void;
+  reject: (error: Error) => void;
+  poll: NodeJS.Timeout;
+  timeout: NodeJS.Timeout;
+}
+
+type ProgressStep =
+  | 'rfp_analysis'
+  | 'company_profile'
+  | 'content_generation'
+  | 'compliance_check'
+  | 'document_assembly'
+  | 'quality_review';
+
+/**
+ * Work item each phase runs as, the pipeline stage it reports under and
+ * the progress step it counts toward
+ */
+const PHASE_WORK_ITEMS: Record<
+  ProposalPhaseId,
+  {
+    taskType: string;
+    expectedOutputs: string[];
+    stage: ProposalGenerationPipeline['currentPhase'];
+    progressStep: ProgressStep;
+    contentType?: string;
+  }
+> = {
+  outline: {
+    taskType: 'proposal_outline_creation',
+    expectedOutputs: [
+      'proposal_outline',
+      'section_breakdown',
+      'requirements_mapping',
+    ],
+    stage: 'outline-solid',
+    progressStep: 'rfp_analysis',
+  },
+  executive_summary: {
+    taskType: 'executive_summary_generation',
+    expectedOutputs: ['executive_summary', 'company_overview'],
+    stage: 'content_generation',
+    progressStep: 'content_generation',
+    contentType: 'executive',
+  },
+  technical_content: {
+    taskType: 'technical_content_generation',
+    expectedOutputs: ['technical_approach', 'methodology', 'timeline'],
+    stage: 'content_generation',
+    progressStep: 'content_generation',
+    contentType: 'technical',
+  },
+  qualifications: {
+    taskType: 'qualifications_generation',
+    expectedOutputs: [
+      'qualifications',
+      'experience_narratives',
+      'case_studies',
+    ],
+    stage: 'content_generation',
+    progressStep: 'company_profile',
+    contentType: 'qualifications',
+  },
+  pricing_analysis: {
+    taskType: 'proposal_pricing_analysis',
+    expectedOutputs: [
+      'pricing_breakdown',
+      'cost_analysis',
+      'competitive_strategy',
+    ],
+    stage: 'pricing_analysis',
+    progressStep: 'content_generation',
+  },
+  compliance_validation: {
+    taskType: 'proposal_compliance_validation',
+    expectedOutputs: [
+      'compliance_matrix',
+      'validation_report',
+      'risk_assessment',
+    ],
+    stage: 'compliance_validation',
+    progressStep: 'compliance_check',
+  },
+  form_completion: {
+    taskType: 'proposal_form_completion',
+    expectedOutputs: [
+      'completed_forms',
+      'attachments_list',
+      'submission_package',
+    ],
+    stage: 'form_completion',
+    progressStep: 'document_assembly',
+  },
+  final_assembly: {
+    taskType: 'proposal_final_assembly',
+    expectedOutputs: [
+      'complete_proposal',
+      'proposal_metadata',
+      'submission_ready',
+    ],
+    stage: 'final_assembly',
+    progressStep: 'document_assembly',
+  },
+  quality_assurance: {
+    taskType: 'proposal_quality_assurance',
+    expectedOutputs: [
+      'quality_score',
+      'validation_report',
+      'improvement_recommendations',
+    ],
+    stage: 'quality_assurance',
+    progressStep: 'quality_review',
+  },
+};
+
+const PROGRESS_STEP_MESSAGES: Record<
+  ProgressStep,
+  { started: string; completed: string }
+> = {
+  rfp_analysis: {
+    started: 'Analyzing RFP requirements and creating proposal structure',
+    completed: 'RFP analysis complete',
+  },
+  company_profile: {
+    started: 'Loading company profile and qualifications',
+    completed: 'Company profile loaded',
+  },
+  content_generation: {
+    started: 'Generating proposal content with AI agents',
+    completed: 'Proposal content generated',
+  },
+  compliance_check: {
+    started: 'Validating compliance with requirements',
+    completed: 'Compliance validation complete',
+  },
+  document_assembly: {
+    started: 'Assembling final proposal documents',
+    completed: 'Document assembly complete',
+  },
+  quality_review: {
+    started: 'Performing quality review and validation',
+    completed: 'Quality review complete',
+  },
+};
+
+interface PhaseGraphRun {
+  graph: ProposalPhaseNode[];
+  completed: Set<ProposalPhaseId>;
+  openedSteps: Set<ProgressStep>;
+  closedSteps: Set<ProgressStep>;
+}
+
 /**
  * Proposal Generation Orchestrator
  *
@@ -88,10 +255,16 @@ export interface ProposalGenerationResult {
  * 5. Form Completion - Fill out forms and documents
  * 6. Final Assembly - Combine all components into complete proposal
  * 7. Quality Assurance - Validate and score the complete proposal
+ *
+ * Phases run as a dependency graph (see PROPOSAL_PHASE_GRAPH): phases that
+ * do not read each other's results run concurrently, so only assembly and
+ * quality assurance wait for everything else.
  */
 export class ProposalGenerationOrchestrator {
   private activePipelines: Map<string, ProposalGenerationPipeline> = new Map();
   private phaseTimeout = 30 * 60 * 1000; // 30 minutes per phase
+  private workItemPollInterval = 10000; // Catches items finished on other nodes
+  private workItemWaiters: Map<string, WorkItemWaiter> = new Map();
 
   /**
    * Initiate a comprehensive proposal generation pipeline
@@ -206,8 +379,9 @@ export class ProposalGenerationOrchestrator {
         );
       }
 
-      // Start the pipeline with Phase 1: Outline Creation
-      await this.executePhase1_OutlineCreation(pipeline);
+      // Run the phase graph in the background; phases report as they finish
+      pipeline.status = 'in_progress';
+      void this.runPhaseGraph(pipeline);
 
       return {
         success: true,
@@ -228,491 +402,276 @@ export class ProposalGenerationOrchestrator {
   }
 
   /**
-   * Phase 1: Outline Creation
-   * Analyze RFP requirements and create proposal structure
+   * Run the pipeline's phases in dependency order, concurrently where the
+   * graph allows, then complete or fail the pipeline
    */
-  private async executePhase1_OutlineCreation(
+  private async runPhaseGraph(
     pipeline: ProposalGenerationPipeline
   ): Promise<void> {
-    console.log(
-      `📋 Phase 1: Creating proposal outline-solid for pipeline ${pipeline.pipelineId}`
-    );
-
-    // Update progress tracking (if enabled)
-    if (pipeline.enableProgressTracking) {
-      await progressTracker.updateStep(
-        pipeline.sessionId,
-        'rfp_analysis',
-        'in_progress',
-        'Analyzing RFP requirements and creating proposal structure'
-      );
-    }
-
-    pipeline.status = 'in_progress';
-    pipeline.currentPhase = 'outline-solid';
-    pipeline.progress = 10;
-    pipeline.updatedAt = new Date();
+    const run: PhaseGraphRun = {
+      graph: this.getPhaseGraph(pipeline.executionMode),
+      completed: new Set(),
+      openedSteps: new Set(),
+      closedSteps: new Set(),
+    };
 
-    // Create work item for outline creation
-    const outlineWorkItem = await workflowCoordinator.createWorkItem({
-      sessionId: pipeline.sessionId,
-      taskType: 'proposal_outline_creation',
-      inputs: {
-        rfpId: pipeline.rfpId,
-        proposalType: pipeline.proposalType,
-        companyProfileId: pipeline.companyProfileId,
-        pipelineId: pipeline.pipelineId,
-      },
-      expectedOutputs: [
-        'proposal_outline',
-        'section_breakdown',
-        'requirements_mapping',
-      ],
-      priority: pipeline.metadata.priority,
-      deadline: new Date(Date.now() + this.phaseTimeout),
-      contextRef: pipeline.rfpId,
-      createdByAgentId: 'proposal-orchestrator',
-      metadata: { phase: 'outline-solid', pipelineId: pipeline.pipelineId },
-    });
-
-    pipeline.workItems.push(outlineWorkItem.id);
-
-    // Schedule phase monitoring
-    this.schedulePhaseCompletion(
-      pipeline,
-      outlineWorkItem.id,
-      'content_generation'
-    );
-  }
-
-  /**
-   * Phase 2: Content Generation
-   * Generate narrative sections and technical content
-   */
-  private async executePhase2_ContentGeneration(
-    pipeline: ProposalGenerationPipeline
-  ): Promise<void> {
-    console.log(
-      `✍️ Phase 2: Content generation for pipeline ${pipeline.pipelineId}`
-    );
-
-    // Complete RFP analysis step (if tracking enabled)
-    if (pipeline.enableProgressTracking) {
-      await progressTracker.updateStep(
-        pipeline.sessionId,
-        'rfp_analysis',
-        'completed',
-        'RFP analysis complete'
-      );
-
-      // Start company profile step (intermediate step before content generation)
-      await progressTracker.updateStep(
-        pipeline.sessionId,
-        'company_profile',
-        'in_progress',
-        'Loading company profile and context'
+    try {
+      const schedule = await proposalPhaseScheduler.run(
+        run.graph,
+        phase => this.executePhase(pipeline, phase),
+        {
+          onPhaseStart: phase => this.onPhaseStart(pipeline, phase, run),
+          onPhaseComplete: phase => this.onPhaseComplete(pipeline, phase, run),
+        }
       );
-    }
-
-    pipeline.currentPhase = 'content_generation';
-    pipeline.progress = 25;
-    pipeline.updatedAt = new Date();
-
-    // Create parallel work items for different content types
-    const contentWorkItems = await Promise.all([
-      // Executive summary and company overview
-      workflowCoordinator.createWorkItem({
-        sessionId: pipeline.sessionId,
-        taskType: 'executive_summary_generation',
-        inputs: {
-          rfpId: pipeline.rfpId,
-          companyProfileId: pipeline.companyProfileId,
-          outline: pipeline.results.outline,
-          pipelineId: pipeline.pipelineId,
-        },
-        expectedOutputs: ['executive_summary', 'company_overview'],
-        priority: pipeline.metadata.priority,
-        deadline: new Date(Date.now() + this.phaseTimeout),
-        contextRef: pipeline.rfpId,
-        createdByAgentId: 'proposal-orchestrator',
-        metadata: {
-          phase: 'content_generation',
-          contentType: 'executive',
-          pipelineId: pipeline.pipelineId,
-        },
-      }),
-
-      // Technical approach and methodology
-      workflowCoordinator.createWorkItem({
-        sessionId: pipeline.sessionId,
-        taskType: 'technical_content_generation',
-        inputs: {
-          rfpId: pipeline.rfpId,
-          companyProfileId: pipeline.companyProfileId,
-          outline: pipeline.results.outline,
-          proposalType: pipeline.proposalType,
-          pipelineId: pipeline.pipelineId,
-        },
-        expectedOutputs: ['technical_approach', 'methodology', 'timeline'],
-        priority: pipeline.metadata.priority,
-        deadline: new Date(Date.now() + this.phaseTimeout),
-        contextRef: pipeline.rfpId,
-        createdByAgentId: 'proposal-orchestrator',
-        metadata: {
-          phase: 'content_generation',
-          contentType: 'technical',
-          pipelineId: pipeline.pipelineId,
-        },
-      }),
+      pipeline.schedule = schedule;
 
-      // Qualifications and experience
-      workflowCoordinator.createWorkItem({
-        sessionId: pipeline.sessionId,
-        taskType: 'qualifications_generation',
-        inputs: {
-          rfpId: pipeline.rfpId,
-          companyProfileId: pipeline.companyProfileId,
-          outline: pipeline.results.outline,
-          pipelineId: pipeline.pipelineId,
-        },
-        expectedOutputs: [
-          'qualifications',
-          'experience_narratives',
-          'case_studies',
-        ],
-        priority: pipeline.metadata.priority,
-        deadline: new Date(Date.now() + this.phaseTimeout),
-        contextRef: pipeline.rfpId,
-        createdByAgentId: 'proposal-orchestrator',
-        metadata: {
-          phase: 'content_generation',
-          contentType: 'qualifications',
-          pipelineId: pipeline.pipelineId,
-        },
-      }),
-    ]);
-
-    // Complete company profile and start content generation (if tracking enabled)
-    if (pipeline.enableProgressTracking) {
-      await progressTracker.updateStep(
-        pipeline.sessionId,
-        'company_profile',
-        'completed',
-        'Company profile loaded'
+      console.log(
+        `⏱️ Pipeline ${pipeline.pipelineId} phases took ${schedule.elapsedMs}ms (${schedule.sequentialMs}ms if run in sequence); critical path: ${schedule.criticalPath.join(' → ')}`
       );
 
-      await progressTracker.updateStep(
-        pipeline.sessionId,
-        'content_generation',
-        'in_progress',
-        'Generating proposal content with AI agents'
-      );
+      if (this.activePipelines.has(pipeline.pipelineId)) {
+        await this.completePipeline(pipeline);
+      }
+    } catch (error) {
+      if (error instanceof PhaseExecutionError) {
+        pipeline.schedule = error.report;
+      }
+      // Cancelled pipelines are already cleaned up
+      if (this.activePipelines.has(pipeline.pipelineId)) {
+        await this.handlePipelineFailure(
+          pipeline,
+          error instanceof Error ? error.message : 'Phase execution failed'
+        );
+      }
     }
-
-    pipeline.workItems.push(...contentWorkItems.map(item => item.id));
-
-    // Schedule phase monitoring for all content work items
-    this.schedulePhaseCompletion(
-      pipeline,
-      contentWorkItems.map(item => item.id),
-      'pricing_analysis'
-    );
   }
 
   /**
-   * Phase 3: Pricing Analysis
-   * Analyze requirements and generate competitive pricing
+   * Phase graph for the pipeline; fast mode skips compliance, forms and QA
    */
-  private async executePhase3_PricingAnalysis(
-    pipeline: ProposalGenerationPipeline
-  ): Promise<void> {
-    console.log(
-      `💰 Phase 3: Pricing analysis for pipeline ${pipeline.pipelineId}`
-    );
-
-    pipeline.currentPhase = 'pricing_analysis';
-    pipeline.progress = 50;
-    pipeline.updatedAt = new Date();
-
-    // Create work item for pricing analysis
-    const pricingWorkItem = await workflowCoordinator.createWorkItem({
-      sessionId: pipeline.sessionId,
-      taskType: 'proposal_pricing_analysis',
-      inputs: {
-        rfpId: pipeline.rfpId,
-        companyProfileId: pipeline.companyProfileId,
-        outline: pipeline.results.outline,
-        content: pipeline.results.content,
-        proposalType: pipeline.proposalType,
-        pipelineId: pipeline.pipelineId,
-      },
-      expectedOutputs: [
-        'pricing_breakdown',
-        'cost_analysis',
-        'competitive_strategy',
-      ],
-      priority: pipeline.metadata.priority,
-      deadline: new Date(Date.now() + this.phaseTimeout),
-      contextRef: pipeline.rfpId,
-      createdByAgentId: 'proposal-orchestrator',
-      metadata: { phase: 'pricing_analysis', pipelineId: pipeline.pipelineId },
-    });
-
-    pipeline.workItems.push(pricingWorkItem.id);
-
-    // Schedule phase monitoring
-    this.schedulePhaseCompletion(
-      pipeline,
-      pricingWorkItem.id,
-      'compliance_validation'
-    );
+  private getPhaseGraph(
+    executionMode: ProposalGenerationPipeline['executionMode']
+  ): ProposalPhaseNode[] {
+    return executionMode === 'fast'
+      ? withoutPhases(PROPOSAL_PHASE_GRAPH, [
+          'compliance_validation',
+          'form_completion',
+          'quality_assurance',
+        ])
+      : PROPOSAL_PHASE_GRAPH;
   }
 
   /**
-   * Phase 4: Compliance Validation
-   * Validate against requirements and regulations
+   * Create the work item for a phase and wait for its result
    */
-  private async executePhase4_ComplianceValidation(
-    pipeline: ProposalGenerationPipeline
+  private async executePhase(
+    pipeline: ProposalGenerationPipeline,
+    phase: ProposalPhaseId
   ): Promise<void> {
-    console.log(
-      `✅ Phase 4: Compliance validation for pipeline ${pipeline.pipelineId}`
-    );
-
-    // Complete content generation (if tracking enabled)
-    if (pipeline.enableProgressTracking) {
-      await progressTracker.updateStep(
-        pipeline.sessionId,
-        'content_generation',
-        'completed',
-        'Proposal content generated'
-      );
-
-      // Start compliance check
-      await progressTracker.updateStep(
-        pipeline.sessionId,
-        'compliance_check',
-        'in_progress',
-        'Validating compliance with requirements'
-      );
+    if (!this.activePipelines.has(pipeline.pipelineId)) {
+      throw new Error('Pipeline is no longer active');
     }
 
-    pipeline.currentPhase = 'compliance_validation';
-    pipeline.progress = 65;
-    pipeline.updatedAt = new Date();
-
-    // Create work item for compliance validation
-    const complianceWorkItem = await workflowCoordinator.createWorkItem({
+    const spec = PHASE_WORK_ITEMS[phase];
+    const workItem = await workflowCoordinator.createWorkItem({
       sessionId: pipeline.sessionId,
-      taskType: 'proposal_compliance_validation',
+      taskType: spec.taskType,
       inputs: {
         rfpId: pipeline.rfpId,
         companyProfileId: pipeline.companyProfileId,
+        proposalType: pipeline.proposalType,
         outline: pipeline.results.outline,
         content: pipeline.results.content,
         pricing: pipeline.results.pricing,
-        proposalType: pipeline.proposalType,
+        compliance: pipeline.results.compliance,
+        forms: pipeline.results.forms,
+        proposalId: pipeline.results.proposalId,
+        qualityThreshold: pipeline.metadata.qualityThreshold,
+        bypassCache: pipeline.metadata.bypassCache,
         pipelineId: pipeline.pipelineId,
       },
-      expectedOutputs: [
-        'compliance_matrix',
-        'validation_report',
-        'risk_assessment',
-      ],
+      expectedOutputs: spec.expectedOutputs,
       priority: pipeline.metadata.priority,
       deadline: new Date(Date.now() + this.phaseTimeout),
       contextRef: pipeline.rfpId,
       createdByAgentId: 'proposal-orchestrator',
       metadata: {
-        phase: 'compliance_validation',
+        phase: spec.stage,
+        schedulerPhase: phase,
+        contentType: spec.contentType,
         pipelineId: pipeline.pipelineId,
       },
     });
 
-    pipeline.workItems.push(complianceWorkItem.id);
-
-    // Schedule phase monitoring
-    this.schedulePhaseCompletion(
-      pipeline,
-      complianceWorkItem.id,
-      'form_completion'
-    );
+    pipeline.workItems.push(workItem.id);
+    const result = await this.waitForWorkItem(pipeline, phase, workItem.id);
+    this.applyPhaseResult(pipeline, phase, result);
   }
 
   /**
-   * Phase 5: Form Completion
-   * Fill out required forms and documents
+   * Store a phase's work item result where later phases read it
    */
-  private async executePhase5_FormCompletion(
-    pipeline: ProposalGenerationPipeline
-  ): Promise<void> {
-    console.log(
-      `📄 Phase 5: Form completion for pipeline ${pipeline.pipelineId}`
-    );
-
-    pipeline.currentPhase = 'form_completion';
-    pipeline.progress = 75;
+  private applyPhaseResult(
+    pipeline: ProposalGenerationPipeline,
+    phase: ProposalPhaseId,
+    result: any
+  ): void {
+    switch (phase) {
+      case 'outline':
+        pipeline.results.outline = result?.proposal_outline ?? result;
+        break;
+      case 'executive_summary':
+      case 'technical_content':
+      case 'qualifications':
+        pipeline.results.content = { ...pipeline.results.content, ...result };
+        break;
+      case 'pricing_analysis':
+        pipeline.results.pricing = result;
+        break;
+      case 'compliance_validation':
+        pipeline.results.compliance = result;
+        break;
+      case 'form_completion':
+        pipeline.results.forms = result;
+        break;
+      case 'final_assembly':
+        pipeline.results.proposalId = result?.proposal_metadata?.proposalId;
+        break;
+      case 'quality_assurance':
+        pipeline.qualityScore = result?.quality_score;
+        break;
+    }
     pipeline.updatedAt = new Date();
-
-    // Create work item for form completion
-    const formsWorkItem = await workflowCoordinator.createWorkItem({
-      sessionId: pipeline.sessionId,
-      taskType: 'proposal_form_completion',
-      inputs: {
-        rfpId: pipeline.rfpId,
-        companyProfileId: pipeline.companyProfileId,
-        outline: pipeline.results.outline,
-        content: pipeline.results.content,
-        pricing: pipeline.results.pricing,
-        compliance: pipeline.results.compliance,
-        pipelineId: pipeline.pipelineId,
-      },
-      expectedOutputs: [
-        'completed_forms',
-        'attachments_list',
-        'submission_package',
-      ],
-      priority: pipeline.metadata.priority,
-      deadline: new Date(Date.now() + this.phaseTimeout),
-      contextRef: pipeline.rfpId,
-      createdByAgentId: 'proposal-orchestrator',
-      metadata: { phase: 'form_completion', pipelineId: pipeline.pipelineId },
-    });
-
-    pipeline.workItems.push(formsWorkItem.id);
-
-    // Schedule phase monitoring
-    this.schedulePhaseCompletion(pipeline, formsWorkItem.id, 'final_assembly');
   }
 
-  /**
-   * Phase 6: Final Assembly
-   * Combine all components into complete proposal
-   */
-  private async executePhase6_FinalAssembly(
-    pipeline: ProposalGenerationPipeline
+  private async onPhaseStart(
+    pipeline: ProposalGenerationPipeline,
+    phase: ProposalPhaseId,
+    run: PhaseGraphRun
   ): Promise<void> {
+    const { stage, progressStep } = PHASE_WORK_ITEMS[phase];
     console.log(
-      `🔧 Phase 6: Final assembly for pipeline ${pipeline.pipelineId}`
+      `▶️ Phase ${phase} starting for pipeline ${pipeline.pipelineId}`
     );
 
-    // Complete compliance check (if tracking enabled)
-    if (pipeline.enableProgressTracking) {
-      await progressTracker.updateStep(
-        pipeline.sessionId,
-        'compliance_check',
-        'completed',
-        'Compliance validation complete'
-      );
+    // Several phases run at once; report the most recently started one
+    pipeline.currentPhase = stage;
+    pipeline.updatedAt = new Date();
 
-      // Start document assembly
+    if (pipeline.enableProgressTracking && !run.openedSteps.has(progressStep)) {
+      run.openedSteps.add(progressStep);
       await progressTracker.updateStep(
         pipeline.sessionId,
-        'document_assembly',
+        progressStep,
         'in_progress',
-        'Assembling final proposal documents'
+        PROGRESS_STEP_MESSAGES[progressStep].started
       );
     }
-
-    pipeline.currentPhase = 'final_assembly';
-    pipeline.progress = 85;
-    pipeline.updatedAt = new Date();
-
-    // Create work item for final assembly
-    const assemblyWorkItem = await workflowCoordinator.createWorkItem({
-      sessionId: pipeline.sessionId,
-      taskType: 'proposal_final_assembly',
-      inputs: {
-        rfpId: pipeline.rfpId,
-        companyProfileId: pipeline.companyProfileId,
-        outline: pipeline.results.outline,
-        content: pipeline.results.content,
-        pricing: pipeline.results.pricing,
-        compliance: pipeline.results.compliance,
-        forms: pipeline.results.forms,
-        pipelineId: pipeline.pipelineId,
-      },
-      expectedOutputs: [
-        'complete_proposal',
-        'proposal_metadata',
-        'submission_ready',
-      ],
-      priority: pipeline.metadata.priority,
-      deadline: new Date(Date.now() + this.phaseTimeout),
-      contextRef: pipeline.rfpId,
-      createdByAgentId: 'proposal-orchestrator',
-      metadata: { phase: 'final_assembly', pipelineId: pipeline.pipelineId },
-    });
-
-    pipeline.workItems.push(assemblyWorkItem.id);
-
-    // Schedule phase monitoring
-    this.schedulePhaseCompletion(
-      pipeline,
-      assemblyWorkItem.id,
-      'quality_assurance'
-    );
   }
 
-  /**
-   * Phase 7: Quality Assurance
-   * Validate and score the complete proposal
-   */
-  private async executePhase7_QualityAssurance(
-    pipeline: ProposalGenerationPipeline
+  private async onPhaseComplete(
+    pipeline: ProposalGenerationPipeline,
+    phase: ProposalPhaseId,
+    run: PhaseGraphRun
   ): Promise<void> {
-    console.log(
-      `🔍 Phase 7: Quality assurance for pipeline ${pipeline.pipelineId}`
-    );
+    run.completed.add(phase);
+    pipeline.progress =
+      10 + Math.round((85 * run.completed.size) / run.graph.length);
+    pipeline.updatedAt = new Date();
 
-    // Complete document assembly (if tracking enabled)
-    if (pipeline.enableProgressTracking) {
+    // A progress step is done once every phase counting toward it is done
+    const { progressStep } = PHASE_WORK_ITEMS[phase];
+    const stepDone = run.graph
+      .filter(node => PHASE_WORK_ITEMS[node.id].progressStep === progressStep)
+      .every(node => run.completed.has(node.id));
+    if (
+      pipeline.enableProgressTracking &&
+      stepDone &&
+      !run.closedSteps.has(progressStep)
+    ) {
+      run.closedSteps.add(progressStep);
       await progressTracker.updateStep(
         pipeline.sessionId,
-        'document_assembly',
+        progressStep,
         'completed',
-        'Document assembly complete'
-      );
-
-      // Start quality review
-      await progressTracker.updateStep(
-        pipeline.sessionId,
-        'quality_review',
-        'in_progress',
-        'Performing quality review and validation'
+        PROGRESS_STEP_MESSAGES[progressStep].completed
       );
     }
+  }
 
-    pipeline.currentPhase = 'quality_assurance';
-    pipeline.progress = 95;
-    pipeline.updatedAt = new Date();
-
-    // Create work item for quality assurance
-    const qaWorkItem = await workflowCoordinator.createWorkItem({
-      sessionId: pipeline.sessionId,
-      taskType: 'proposal_quality_assurance',
-      inputs: {
-        rfpId: pipeline.rfpId,
-        proposalId: pipeline.results.proposalId,
-        qualityThreshold: pipeline.metadata.qualityThreshold,
+  /**
+   * Resolve with a work item's result once it has finished. Completion on
+   * this node is reported through handleWorkItemSettled; a slow poll picks
+   * up items finished elsewhere. Phases run concurrently, so the phase is
+   * passed in rather than read from pipeline.currentPhase.
+   */
+  private waitForWorkItem(
+    pipeline: ProposalGenerationPipeline,
+    phase: ProposalPhaseId,
+    workItemId: string
+  ): Promise<any> {
+    return new Promise((resolve, reject) => {
+      const waiter: WorkItemWaiter = {
         pipelineId: pipeline.pipelineId,
-      },
-      expectedOutputs: [
-        'quality_score',
-        'validation_report',
-        'improvement_recommendations',
-      ],
-      priority: pipeline.metadata.priority,
-      deadline: new Date(Date.now() + this.phaseTimeout),
-      contextRef: pipeline.rfpId,
-      createdByAgentId: 'proposal-orchestrator',
-      metadata: { phase: 'quality_assurance', pipelineId: pipeline.pipelineId },
+        resolve,
+        reject,
+        poll: setInterval(async () => {
+          try {
+            const workItem = await storage.getWorkItem(workItemId);
+            if (workItem) this.handleWorkItemSettled(workItem);
+          } catch (error) {
+            console.error('❌ Error in work item completion check:', error);
+          }
+        }, this.workItemPollInterval),
+        timeout: setTimeout(() => {
+          this.settleWaiter(workItemId, new Error(`Phase ${phase} timeout`));
+        }, this.phaseTimeout),
+      };
+      this.workItemWaiters.set(workItemId, waiter);
     });
+  }
+
+  /**
+   * Called when a work item finishes or fails. Wakes the pipeline phase
+   * waiting on it, if any.
+   */
+  handleWorkItemSettled(workItem: WorkItem): void {
+    if (!this.workItemWaiters.has(workItem.id)) return;
+
+    if (workItem.status === 'completed') {
+      if (workItem.error) {
+        this.settleWaiter(workItem.id, new Error(workItem.error));
+      } else {
+        this.settleWaiter(workItem.id, undefined, workItem.result);
+      }
+      return;
+    }
 
-    pipeline.workItems.push(qaWorkItem.id);
+    // Failed items are retried by the retry scheduler until their policy
+    // gives up on them
+    if (
+      workItem.status === 'dlq' ||
+      (workItem.status === 'failed' && !workItem.canRetry)
+    ) {
+      this.settleWaiter(
+        workItem.id,
+        new Error(workItem.error || 'Work item failure in phase')
+      );
+    }
+  }
 
-    // Schedule phase monitoring
-    this.schedulePhaseCompletion(pipeline, qaWorkItem.id, 'completed');
+  private settleWaiter(workItemId: string, error?: Error, result?: any): void {
+    const waiter = this.workItemWaiters.get(workItemId);
+    if (!waiter) return;
+    this.workItemWaiters.delete(workItemId);
+    clearInterval(waiter.poll);
+    clearTimeout(waiter.timeout);
+    if (error) {
+      waiter.reject(error);
+    } else {
+      waiter.resolve(result);
+    }
   }
 
   /**
@@ -725,16 +684,8 @@ export class ProposalGenerationOrchestrator {
       `🎉 Completing proposal generation pipeline ${pipeline.pipelineId}`
     );
 
-    // Complete quality review (if tracking enabled)
+    // Mark completion step as completed (if tracking enabled)
     if (pipeline.enableProgressTracking) {
-      await progressTracker.updateStep(
-        pipeline.sessionId,
-        'quality_review',
-        'completed',
-        'Quality review complete'
-      );
-
-      // Mark completion step as completed
       await progressTracker.updateStep(
         pipeline.sessionId,
         'completion',
@@ -784,6 +735,7 @@ export class ProposalGenerationOrchestrator {
         qualityScore: pipeline.qualityScore,
         duration: pipeline.updatedAt.getTime() - pipeline.createdAt.getTime(),
         phases: Object.keys(pipeline.results).length,
+        schedule: pipeline.schedule,
       },
       importance: 9,
       tags: [
@@ -805,6 +757,9 @@ export class ProposalGenerationOrchestrator {
         qualityScore: pipeline.qualityScore,
         phases: Object.keys(pipeline.results).length,
         duration: pipeline.updatedAt.getTime() - pipeline.createdAt.getTime(),
+        criticalPath: pipeline.schedule?.criticalPath,
+        criticalPathMs: pipeline.schedule?.criticalPathMs,
+        sequentialMs: pipeline.schedule?.sequentialMs,
       },
     });
 
@@ -822,128 +777,6 @@ export class ProposalGenerationOrchestrator {
     console.log(`✅ Pipeline ${pipeline.pipelineId} completed successfully`);
   }
 
-  /**
-   * Handle phase completion and transition to next phase
-   */
-  async handlePhaseCompletion(
-    pipelineId: string,
-    workItemIds: string[],
-    nextPhase: string
-  ): Promise<void> {
-    const pipeline = this.activePipelines.get(pipelineId);
-    if (!pipeline) {
-      console.warn(`⚠️ Pipeline not found: ${pipelineId}`);
-      return;
-    }
-
-    try {
-      // Check if all work items for this phase are completed
-      const workItems = await Promise.all(
-        workItemIds.map(id => storage.getWorkItem(id))
-      );
-
-      const allCompleted = workItems.every(
-        item => item?.status === 'completed'
-      );
-      const hasFailures = workItems.some(item => item?.status === 'failed');
-
-      if (hasFailures) {
-        await this.handlePipelineFailure(
-          pipeline,
-          'Work item failure in phase'
-        );
-        return;
-      }
-
-      if (!allCompleted) {
-        console.log(
-          `⏳ Waiting for work items to complete in phase ${pipeline.currentPhase}`
-        );
-        return;
-      }
-
-      // Collect results from completed work items
-      const phaseResults = workItems.reduce((acc, item) => {
-        if (item?.result) {
-          return { ...acc, ...item.result };
-        }
-        return acc;
-      }, {});
-
-      // Store phase results
-      (pipeline.results as any)[pipeline.currentPhase] = phaseResults;
-
-      // Determine next phase based on execution mode
-      let actualNextPhase = nextPhase;
-
-      // Fast mode phase skipping logic
-      if (pipeline.executionMode === 'fast') {
-        console.log(
-          `⚡ Fast mode: Checking if phase ${nextPhase} should be skipped`
-        );
-
-        // Skip compliance, form completion, and quality assurance in fast mode
-        const skipPhases = [
-          'compliance_validation',
-          'form_completion',
-          'quality_assurance',
-        ];
-
-        if (skipPhases.includes(nextPhase)) {
-          console.log(`⚡ Fast mode: Skipping phase ${nextPhase}`);
-
-          // Fast mode phase flow: outline → content_generation → pricing_analysis → final_assembly → completed
-          const fastModePhaseFlow: Record<string, string> = {
-            compliance_validation: 'final_assembly', // After pricing, skip to assembly
-            form_completion: 'final_assembly', // Should not reach here, but safety
-            quality_assurance: 'completed', // After assembly, skip to completion
-          };
-
-          actualNextPhase = fastModePhaseFlow[nextPhase] || nextPhase;
-          console.log(
-            `⚡ Fast mode: Transitioning to ${actualNextPhase} instead`
-          );
-        }
-      }
-
-      // Transition to next phase
-      switch (actualNextPhase) {
-        case 'content_generation':
-          await this.executePhase2_ContentGeneration(pipeline);
-          break;
-        case 'pricing_analysis':
-          await this.executePhase3_PricingAnalysis(pipeline);
-          break;
-        case 'compliance_validation':
-          await this.executePhase4_ComplianceValidation(pipeline);
-          break;
-        case 'form_completion':
-          await this.executePhase5_FormCompletion(pipeline);
-          break;
-        case 'final_assembly':
-          await this.executePhase6_FinalAssembly(pipeline);
-          break;
-        case 'quality_assurance':
-          await this.executePhase7_QualityAssurance(pipeline);
-          break;
-        case 'completed':
-          await this.completePipeline(pipeline);
-          break;
-        default:
-          console.warn(`⚠️ Unknown next phase: ${actualNextPhase}`);
-      }
-    } catch (error) {
-      console.error(
-        `❌ Failed to handle phase completion for pipeline ${pipelineId}:`,
-        error
-      );
-      await this.handlePipelineFailure(
-        pipeline,
-        error instanceof Error ? error.message : 'Phase transition failed'
-      );
-    }
-  }
-
   /**
    * Handle pipeline failure
    */
@@ -988,6 +821,7 @@ export class ProposalGenerationOrchestrator {
         error,
         phase: pipeline.currentPhase,
         progress: pipeline.progress,
+        schedule: pipeline.schedule,
       },
       importance: 8,
       tags: ['failed_pipeline', 'proposal_generation', 'error'],
@@ -996,47 +830,18 @@ export class ProposalGenerationOrchestrator {
 
     // Remove from active pipelines
     this.activePipelines.delete(pipeline.pipelineId);
+    this.abandonWorkItems(pipeline.pipelineId, error);
   }
 
   /**
-   * Schedule phase completion monitoring
+   * Stop waiting on a pipeline's outstanding work items
    */
-  private schedulePhaseCompletion(
-    pipeline: ProposalGenerationPipeline,
-    workItemIds: string | string[],
-    nextPhase: string
-  ): void {
-    const itemIds = Array.isArray(workItemIds) ? workItemIds : [workItemIds];
-
-    // Check periodically for work item completion
-    const checkInterval = setInterval(async () => {
-      try {
-        await this.handlePhaseCompletion(
-          pipeline.pipelineId,
-          itemIds,
-          nextPhase
-        );
-
-        // Clear interval if pipeline is no longer active
-        if (!this.activePipelines.has(pipeline.pipelineId)) {
-          clearInterval(checkInterval);
-        }
-      } catch (error) {
-        console.error('❌ Error in phase completion check:', error);
-        clearInterval(checkInterval);
-      }
-    }, 10000); // Check every 10 seconds
-
-    // Set timeout for phase
-    setTimeout(() => {
-      clearInterval(checkInterval);
-      if (this.activePipelines.has(pipeline.pipelineId)) {
-        this.handlePipelineFailure(
-          pipeline,
-          `Phase ${pipeline.currentPhase} timeout`
-        );
+  private abandonWorkItems(pipelineId: string, reason: string): void {
+    for (const [workItemId, waiter] of Array.from(this.workItemWaiters)) {
+      if (waiter.pipelineId === pipelineId) {
+        this.settleWaiter(workItemId, new Error(reason));
       }
-    }, this.phaseTimeout);
+    }
   }
 
   /**
@@ -1144,6 +949,7 @@ export class ProposalGenerationOrchestrator {
 
       // Remove from active pipelines
       this.activePipelines.delete(pipelineId);
+      this.abandonWorkItems(pipelineId, 'Pipeline cancelled');
 
       return { success: true };
     } catch (error) {
@@ -1174,6 +980,7 @@ export class ProposalGenerationOrchestrator {
     generateCompliance?: boolean;
     executionMode?: 'fast' | 'standard'; // NEW: Fast mode for automated workflows
     enableProgressTracking?: boolean; // NEW: Toggle progress tracking
+    bypassCache?: boolean; // Skip cached LLM responses when regenerating
   }): Promise<{
     success: boolean;
     pipelineId?: string;
@@ -1216,6 +1023,7 @@ export class ProposalGenerationOrchestrator {
         metadata: {
           generatePricing: request.generatePricing !== false,
           generateCompliance: request.generateCompliance !== false,
+          bypassCache: request.bypassCache === true,
         },
       };
 
@@ -1230,18 +1038,22 @@ export class ProposalGenerationOrchestrator {
       }
 
       // Transform to expected API response format
-      // Fast mode: 4 phases (outline, content, pricing, assembly)
-      // Standard mode: 7 phases (outline, content, pricing, compliance, forms, assembly, QA)
-      const totalPhases = executionMode === 'fast' ? 4 : 7;
+      // Fast mode: 6 phases (outline, 3 content sections, pricing, assembly)
+      // Standard mode: 9 phases (adds compliance, forms and QA)
+      // Independent phases overlap, so duration follows the longest chain
+      const graph = this.getPhaseGraph(executionMode);
+      const totalPhases = graph.length;
       const phaseMinutes = executionMode === 'fast' ? 5 : 30; // Fast: ~5 min/phase, Standard: ~30 min/phase
-      const estimatedDurationMinutes = totalPhases * phaseMinutes;
+      const estimatedDurationMinutes = phaseGraphDepth(graph) * phaseMinutes;
 
       return {
         success: true,
         pipelineId: result.pipelineId,
         currentPhase: result.currentPhase,
         totalPhases,
-        workItemsCreated: 1, // Initial work items created
+        // Phases that start without waiting on others
+        workItemsCreated: graph.filter(node => node.dependsOn.length === 0)
+          .length,
         estimatedDuration: `${estimatedDurationMinutes} minutes`,
         executionMode,
       };
@@ -1257,30 +1069,16 @@ export class ProposalGenerationOrchestrator {
   }
 
   /**
-   * Calculate estimated completion time
+   * Calculate estimated completion time from the longest chain of phases
    */
   private calculateEstimatedCompletion(
     pipeline: ProposalGenerationPipeline
   ): Date {
     const phaseDuration = this.phaseTimeout;
-    const remainingPhases = 7 - this.getPhaseNumber(pipeline.currentPhase);
-    return new Date(Date.now() + remainingPhases * phaseDuration);
-  }
-
-  /**
-   * Get phase number for progress calculation
-   */
-  private getPhaseNumber(phase: string): number {
-    const phases = [
-      'outline-solid',
-      'content_generation',
-      'pricing_analysis',
-      'compliance_validation',
-      'form_completion',
-      'final_assembly',
-      'quality_assurance',
-    ];
-    return phases.indexOf(phase) + 1;
+    const chainLength = phaseGraphDepth(
+      this.getPhaseGraph(pipeline.executionMode)
+    );
+    return new Date(Date.now() + chainLength * phaseDuration);
   }
 
   /**
@@ -0,0 +1,324 @@
+import pLimit, { type LimitFunction } from 'p-limit';
+
+/**
+ * Proposal Phase Scheduler
+ *
+ * Runs proposal phases as a dependency graph instead of a fixed chain. A
+ * phase starts as soon as the phases it depends on have finished, so
+ * independent sections (pricing, compliance, forms, the content sections)
+ * are generated side by side and a proposal takes about as long as its
+ * longest chain of dependent phases rather than the sum of all of them.
+ *
+ * Concurrency is bounded twice: each proposal may run only a few phases
+ * at once, and phases that call a model also share one process-wide LLM
+ * budget so a burst of proposals cannot exceed provider rate limits.
+ */
+
+export type ProposalPhaseId =
+  | 'outline'
+  | 'executive_summary'
+  | 'technical_content'
+  | 'qualifications'
+  | 'pricing_analysis'
+  | 'compliance_validation'
+  | 'form_completion'
+  | 'final_assembly'
+  | 'quality_assurance';
+
+export interface ProposalPhaseNode<Id extends string = ProposalPhaseId> {
+  id: Id;
+  /** Phases whose results this phase reads */
+  dependsOn: Id[];
+  /** Holds a slot of the global LLM budget while running */
+  usesLLM: boolean;
+}
+
+/**
+ * Data dependencies between proposal phases. Technical content,
+ * qualifications, pricing, compliance and forms read only the RFP and the
+ * company profile; the executive summary builds on the outline; assembly
+ * needs everything and quality assurance reviews the assembled proposal.
+ */
+export const PROPOSAL_PHASE_GRAPH: ProposalPhaseNode[] = [
+  { id: 'outline', dependsOn: [], usesLLM: true },
+  { id: 'executive_summary', dependsOn: ['outline'], usesLLM: true },
+  { id: 'technical_content', dependsOn: [], usesLLM: true },
+  { id: 'qualifications', dependsOn: [], usesLLM: true },
+  { id: 'pricing_analysis', dependsOn: [], usesLLM: true },
+  { id: 'compliance_validation', dependsOn: [], usesLLM: true },
+  { id: 'form_completion', dependsOn: [], usesLLM: true },
+  {
+    id: 'final_assembly',
+    dependsOn: [
+      'outline',
+      'executive_summary',
+      'technical_content',
+      'qualifications',
+      'pricing_analysis',
+      'compliance_validation',
+      'form_completion',
+    ],
+    usesLLM: false,
+  },
+  {
+    id: 'quality_assurance',
+    dependsOn: ['final_assembly'],
+    usesLLM: false,
+  },
+];
+
+/**
+ * The graph without some phases. Dependencies on a removed phase are
+ * dropped, so its dependents no longer wait for it.
+ */
+export function withoutPhases<Id extends string>(
+  graph: ProposalPhaseNode<Id>[],
+  removed: Id[]
+): ProposalPhaseNode<Id>[] {
+  return graph
+    .filter(node => !removed.includes(node.id))
+    .map(node => ({
+      ...node,
+      dependsOn: node.dependsOn.filter(dep => !removed.includes(dep)),
+    }));
+}
+
+/**
+ * Number of phases on the longest dependency chain, i.e. the fewest phase
+ * durations a run of the graph can take
+ */
+export function phaseGraphDepth<Id extends string>(
+  graph: ProposalPhaseNode<Id>[]
+): number {
+  const depth = new Map<Id, number>();
+  for (const node of topologicalOrder(graph)) {
+    depth.set(
+      node.id,
+      1 + Math.max(0, ...node.dependsOn.map(dep => depth.get(dep)!))
+    );
+  }
+  return Math.max(0, ...Array.from(depth.values()));
+}
+
+export interface PhaseTiming {
+  /** All dependencies finished */
+  readyAt: number;
+  /** Concurrency slots acquired and the phase began */
+  startedAt: number;
+  finishedAt: number;
+  durationMs: number;
+  /** Time spent ready but waiting for a concurrency slot */
+  queuedMs: number;
+}
+
+export interface PhaseScheduleReport {
+  startedAt: number;
+  finishedAt: number;
+  /** Wall-clock time for the whole graph */
+  elapsedMs: number;
+  /** What a strictly sequential run of the same phases would have taken */
+  sequentialMs: number;
+  /** Chain of phases that determined when the graph finished */
+  criticalPath: string[];
+  criticalPathMs: number;
+  phases: Record<string, PhaseTiming>;
+}
+
+export class PhaseExecutionError extends Error {
+  constructor(
+    public readonly phase: string,
+    public readonly cause: unknown,
+    public readonly report: PhaseScheduleReport
+  ) {
+    super(
+      `Phase ${phase} failed: ${cause instanceof Error ? cause.message : String(cause)}`
+    );
+    this.name = 'PhaseExecutionError';
+  }
+}
+
+export interface ProposalPhaseSchedulerOptions {
+  /** Phases that may call a model at once across all proposals */
+  llmConcurrency?: number;
+  /** Phases one proposal may run at once */
+  proposalConcurrency?: number;
+}
+
+export interface RunPhasesOptions<Id extends string> {
+  onPhaseStart?: (phase: Id) => void | Promise<void>;
+  onPhaseComplete?: (phase: Id, timing: PhaseTiming) => void | Promise<void>;
+}
+
+export class ProposalPhaseScheduler {
+  private readonly llmLimit: LimitFunction;
+  private readonly proposalConcurrency: number;
+
+  constructor(options: ProposalPhaseSchedulerOptions = {}) {
+    this.llmLimit = pLimit(
+      options.llmConcurrency ??
+        (Number(process.env.PROPOSAL_LLM_CONCURRENCY) || 4)
+    );
+    this.proposalConcurrency =
+      options.proposalConcurrency ??
+      (Number(process.env.PROPOSAL_PHASE_CONCURRENCY) || 3);
+  }
+
+  /**
+   * Phases currently holding or waiting for the shared LLM budget
+   */
+  getLLMBudgetUsage(): { active: number; pending: number } {
+    return {
+      active: this.llmLimit.activeCount,
+      pending: this.llmLimit.pendingCount,
+    };
+  }
+
+  /**
+   * Run every phase once its dependencies have finished. Resolves with the
+   * timing report; rejects with a PhaseExecutionError for the first phase
+   * that fails, after phases already running have settled. Phases that
+   * have not started by then are not run.
+   */
+  async run<Id extends string>(
+    graph: ProposalPhaseNode<Id>[],
+    execute: (phase: Id) => Promise<void>,
+    options: RunPhasesOptions<Id> = {}
+  ): Promise<PhaseScheduleReport> {
+    const order = topologicalOrder(graph);
+    const proposalLimit = pLimit(this.proposalConcurrency);
+    const startedAt = Date.now();
+    const timings: Record<string, PhaseTiming> = {};
+    const done = new Map<Id, Promise<void>>();
+    // Set from inside the phase callbacks
+    let failure = null as { phase: Id; cause: unknown } | null;
+
+    const runPhase = async (node: ProposalPhaseNode<Id>): Promise<void> => {
+      const readyAt = Date.now();
+      const timed = async () => {
+        if (failure) return;
+        const phaseStartedAt = Date.now();
+        try {
+          await options.onPhaseStart?.(node.id);
+          await execute(node.id);
+          const finishedAt = Date.now();
+          timings[node.id] = {
+            readyAt,
+            startedAt: phaseStartedAt,
+            finishedAt,
+            durationMs: finishedAt - phaseStartedAt,
+            queuedMs: phaseStartedAt - readyAt,
+          };
+          await options.onPhaseComplete?.(node.id, timings[node.id]);
+        } catch (error) {
+          failure ??= { phase: node.id, cause: error };
+          throw error;
+        }
+      };
+
+      await proposalLimit(() =>
+        node.usesLLM ? this.llmLimit(timed) : timed()
+      );
+      if (failure) throw failure.cause;
+    };
+
+    for (const node of order) {
+      const deps = node.dependsOn.map(dep => done.get(dep)!);
+      done.set(node.id, Promise.all(deps).then(() => runPhase(node)));
+    }
+
+    await Promise.allSettled(done.values());
+    const report = buildReport(graph, timings, startedAt);
+    if (failure) {
+      const { phase, cause } = failure;
+      throw new PhaseExecutionError(phase, cause, report);
+    }
+    return report;
+  }
+}
+
+// Dependencies before dependents; rejects unknown dependencies and cycles
+function topologicalOrder<Id extends string>(
+  graph: ProposalPhaseNode<Id>[]
+): ProposalPhaseNode<Id>[] {
+  const byId = new Map(graph.map(node => [node.id, node]));
+  const order: ProposalPhaseNode<Id>[] = [];
+  const state = new Map<Id, 'visiting' | 'done'>();
+
+  const visit = (node: ProposalPhaseNode<Id>) => {
+    if (state.get(node.id) === 'done') return;
+    if (state.get(node.id) === 'visiting') {
+      throw new Error(`Phase dependency cycle at ${node.id}`);
+    }
+    state.set(node.id, 'visiting');
+    for (const dep of node.dependsOn) {
+      const depNode = byId.get(dep);
+      if (!depNode) {
+        throw new Error(`Phase ${node.id} depends on unknown phase ${dep}`);
+      }
+      visit(depNode);
+    }
+    state.set(node.id, 'done');
+    order.push(node);
+  };
+
+  graph.forEach(visit);
+  return order;
+}
+
+function buildReport<Id extends string>(
+  graph: ProposalPhaseNode<Id>[],
+  timings: Record<string, PhaseTiming>,
+  startedAt: number
+): PhaseScheduleReport {
+  const finished = graph.filter(node => timings[node.id]);
+  const finishedAt = Math.max(
+    startedAt,
+    ...finished.map(node => timings[node.id].finishedAt)
+  );
+
+  // Walk back from the last phase to finish through whichever dependency
+  // finished last, i.e. the one it was actually waiting on
+  const byId = new Map(graph.map(node => [node.id, node]));
+  const criticalPath: string[] = [];
+  let current = lastFinished(finished, timings);
+  while (current) {
+    criticalPath.unshift(current.id);
+    current = lastFinished(
+      current.dependsOn
+        .filter(dep => timings[dep])
+        .map(dep => byId.get(dep)!),
+      timings
+    );
+  }
+
+  return {
+    startedAt,
+    finishedAt,
+    elapsedMs: finishedAt - startedAt,
+    sequentialMs: finished.reduce(
+      (total, node) => total + timings[node.id].durationMs,
+      0
+    ),
+    criticalPath,
+    criticalPathMs: criticalPath.reduce(
+      (total, phase) => total + timings[phase].durationMs,
+      0
+    ),
+    phases: timings,
+  };
+}
+
+function lastFinished<Id extends string>(
+  nodes: ProposalPhaseNode<Id>[],
+  timings: Record<string, PhaseTiming>
+): ProposalPhaseNode<Id> | undefined {
+  return nodes.reduce<ProposalPhaseNode<Id> | undefined>(
+    (latest, node) =>
+      !latest || timings[node.id].finishedAt > timings[latest.id].finishedAt
+        ? node
+        : latest,
+    undefined
+  );
+}
+
+export const proposalPhaseScheduler = new ProposalPhaseScheduler();
@@ -1,4 +1,5 @@
 import { storage } from '../../storage';
+import { sessionManager } from '../../../src/mastra/tools/session-manager';
 import { workflowCoordinator } from '../workflows/workflowCoordinator';
 import { agentRegistryService } from '../agents/agentRegistryService';
 import { agentMemoryService } from '../agents/agentMemoryService';
@@ -793,6 +794,7 @@ export class SubmissionOrchestrator {
     pipeline.status = 'completed';
     pipeline.progress = 100;
     pipeline.updatedAt = new Date();
+    this.releaseBrowserSession(pipeline);
 
     // Update database
     await this.updatePipelineInDatabase(pipeline);
@@ -1040,6 +1042,7 @@ export class SubmissionOrchestrator {
 
     // Permanent failure
     pipeline.status = 'failed';
+    this.releaseBrowserSession(pipeline);
     const serializedFailures = failedWorkItems
       ?.filter((item): item is WorkItem => Boolean(item))
       .map(item => ({
@@ -1138,6 +1141,18 @@ export class SubmissionOrchestrator {
     console.log(`❌ Pipeline ${pipeline.pipelineId} failed permanently`);
   }
 
+  /**
+   * Hand the pipeline's browser session back to the pool. It is held from
+   * authentication through receipt verification, so this runs before any
+   * of the final bookkeeping that could throw.
+   */
+  private releaseBrowserSession(pipeline: SubmissionPipelineInstance): void {
+    const sessionId = pipeline.results.authentication?.browser_session_id;
+    if (typeof sessionId === 'string') {
+      sessionManager.releaseSession(sessionId);
+    }
+  }
+
   /**
    * Retry current phase
    */
@@ -1423,6 +1438,7 @@ export class SubmissionOrchestrator {
       pipeline.status = 'failed';
       pipeline.errorData = { error: 'Pipeline cancelled by user' };
       pipeline.updatedAt = new Date();
+      this.releaseBrowserSession(pipeline);
 
       // Update database
       await this.updatePipelineInDatabase(pipeline);
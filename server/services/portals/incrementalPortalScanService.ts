@@ -1,12 +1,19 @@
-import { eq, and, desc, or, sql } from 'drizzle-orm';
+import { eq, and, desc, inArray, or, sql } from 'drizzle-orm';
 import { db } from '../../db';
-import { portals, rfps, scans } from '@shared/schema';
-import { storage } from '../../storage';
+import { type InsertRFP, portals, rfps, scans } from '@shared/schema';
+import { storage, type RFPBulkUpdate } from '../../storage';
 import { pageExtractTool } from '../../../src/mastra/tools';
 import { z } from 'zod';
 import { PortalUrlResolver } from '../scraping/portal/PortalUrlResolver';
 import { AustinFinanceContentExtractor } from '../scraping/extraction/extractors/AustinFinanceContentExtractor';
 import { sessionManager } from '../../../src/mastra/tools/session-manager';
+import {
+  executeScans,
+  scanHostFor,
+  type ScanExecutorOptions,
+  type ScanTaskOutcome,
+} from './scanExecutor';
+import { scanEventWriter } from './scanEventWriter';
 
 /**
  * Incremental Portal Scanning Service
@@ -24,6 +31,13 @@ interface ScanOptions {
   sessionId?: string;
   forceFullScan?: boolean;
   maxRfpsToScan?: number;
+  signal?: AbortSignal; // Aborting fails the scan and closes its browser session
+}
+
+interface BatchScanOptions
+  extends Partial<Omit<ScanOptions, 'portalId' | 'signal'>>,
+    ScanExecutorOptions {
+  onResult?: (outcome: ScanTaskOutcome<ScanResult>) => void;
 }
 
 interface ScanResult {
@@ -50,6 +64,28 @@ interface RFPCandidate {
   category?: string;
 }
 
+type ReconcileResult = 'new' | 'updated' | 'unchanged';
+
+interface CandidateReconciliation {
+  candidate: RFPCandidate;
+  result?: ReconcileResult;
+  error?: string; // Set instead of result when the candidate failed
+}
+
+// Columns needed to match and diff a candidate against an existing RFP
+interface ExistingRFP {
+  id: string;
+  title: string;
+  description: string | null;
+  agency: string;
+  deadline: Date | null;
+  estimatedValue: string | null;
+  category: string | null;
+  sourceUrl: string;
+  analysisSourceId: string | null;
+  requirementsSourceId: string | null;
+}
+
 const rfpCandidateSchema = z.object({
   title: z.string(),
   description: z.string().optional(),
@@ -73,9 +109,11 @@ export class IncrementalPortalScanService {
       sessionId = `scan-${Date.now()}`,
       forceFullScan = false,
       maxRfpsToScan = 50,
+      signal,
     } = options;
 
     console.log(`🔍 Starting incremental scan for portal: ${portalId}`);
+    signal?.throwIfAborted();
 
     // Get portal details
     const portal = await storage.getPortalWithCredentials(portalId);
@@ -98,16 +136,27 @@ export class IncrementalPortalScanService {
     let unchangedRfpsCount = 0;
     let errorCount = 0;
 
+    // Reuse a pooled session that already holds this portal's cookies
+    sessionManager.setSessionAffinity(sessionId, portalId);
+
+    // Closing the session makes any in-flight page operation fail fast
+    const onAbort = () => {
+      sessionManager.closeSession(sessionId).catch(error => {
+        console.error(`Failed to close session ${sessionId}:`, error);
+      });
+    };
+    signal?.addEventListener('abort', onAbort, { once: true });
+
     try {
       // Emit scan started event
-      await this.emitScanEvent(scan.id, 'scan_started', {
+      this.emitScanEvent(scan.id, 'scan_started', {
         portalId,
         portalName: portal.name,
         forceFullScan,
       });
 
       // Step 1: Get last scan timestamp
-      await this.updateScanProgress(
+      this.updateScanProgress(
         scan.id,
         'navigating',
         10,
@@ -119,25 +168,26 @@ export class IncrementalPortalScanService {
 
       if (lastScanTime) {
         console.log(`📅 Last successful scan: ${lastScanTime.toISOString()}`);
-        await this.emitScanEvent(scan.id, 'log', {
+        this.emitScanEvent(scan.id, 'log', {
           level: 'info',
           message: `Incremental scan from ${lastScanTime.toISOString()}`,
         });
       } else {
         console.log(`📅 Full scan (no previous successful scan found)`);
-        await this.emitScanEvent(scan.id, 'log', {
+        this.emitScanEvent(scan.id, 'log', {
           level: 'info',
           message: 'Performing full scan',
         });
       }
 
       // Step 2: Extract RFP candidates from portal
-      await this.updateScanProgress(
+      this.updateScanProgress(
         scan.id,
         'extracting',
         30,
         'Extracting RFP opportunities...'
       );
+      signal?.throwIfAborted();
       const candidates = await this.extractRFPCandidates(
         portal,
         sessionId,
@@ -146,63 +196,50 @@ export class IncrementalPortalScanService {
       );
 
       console.log(`📊 Found ${candidates.length} RFP candidates`);
-      await this.emitScanEvent(scan.id, 'log', {
+      this.emitScanEvent(scan.id, 'log', {
         level: 'info',
         message: `Extracted ${candidates.length} RFP candidates`,
       });
 
-      // Step 3: Process each candidate
-      await this.updateScanProgress(
+      // Step 3: Reconcile candidates with existing RFPs
+      this.updateScanProgress(
         scan.id,
         'parsing',
         50,
         `Processing ${candidates.length} candidates...`
       );
 
-      for (let i = 0; i < candidates.length; i++) {
-        const candidate = candidates[i];
-        const progress = 50 + Math.floor((i / candidates.length) * 40);
-
-        try {
-          await this.updateScanProgress(
-            scan.id,
-            'parsing',
-            progress,
-            `Processing ${i + 1}/${candidates.length}: ${candidate.title.substring(0, 50)}...`
-          );
-
-          const result = await this.processRFPCandidate(portalId, candidate);
+      signal?.throwIfAborted();
+      const reconciled = await this.reconcileCandidates(portalId, candidates);
 
-          if (result === 'new') {
-            newRfpsCount++;
-            await this.emitScanEvent(scan.id, 'rfp_discovered', {
-              title: candidate.title,
-              url: candidate.url,
-            });
-          } else if (result === 'updated') {
-            updatedRfpsCount++;
-            await this.emitScanEvent(scan.id, 'log', {
-              level: 'info',
-              message: `Updated RFP: ${candidate.title}`,
-            });
-          } else {
-            unchangedRfpsCount++;
-          }
-        } catch (error) {
+      for (const { candidate, result, error } of reconciled) {
+        if (result === 'new') {
+          newRfpsCount++;
+          this.emitScanEvent(scan.id, 'rfp_discovered', {
+            title: candidate.title,
+            url: candidate.url,
+          });
+        } else if (result === 'updated') {
+          updatedRfpsCount++;
+          this.emitScanEvent(scan.id, 'log', {
+            level: 'info',
+            message: `Updated RFP: ${candidate.title}`,
+          });
+        } else if (result === 'unchanged') {
+          unchangedRfpsCount++;
+        } else {
           errorCount++;
-          const errorMsg =
-            error instanceof Error ? error.message : 'Unknown error';
-          errors.push(`Error processing ${candidate.title}: ${errorMsg}`);
+          errors.push(`Error processing ${candidate.title}: ${error}`);
 
-          await this.emitScanEvent(scan.id, 'error', {
+          this.emitScanEvent(scan.id, 'error', {
             message: `Failed to process RFP: ${candidate.title}`,
-            error: errorMsg,
+            error,
           });
         }
       }
 
       // Step 4: Finalize scan
-      await this.updateScanProgress(
+      this.updateScanProgress(
         scan.id,
         'completed',
         100,
@@ -221,20 +258,17 @@ export class IncrementalPortalScanService {
         })
         .where(eq(portals.id, portalId));
 
-      // Complete scan record
+      // Complete scan record (also adds it to the daily scan rollup)
       const duration = Date.now() - startTime;
-      await db
-        .update(scans)
-        .set({
-          status: 'completed',
-          completedAt: new Date(),
-          discoveredRfpsCount: newRfpsCount,
-          errorCount,
-          errors: errors.length > 0 ? errors : null,
-        })
-        .where(eq(scans.id, scan.id));
+      await storage.updateScan(scan.id, {
+        status: 'completed',
+        completedAt: new Date(),
+        discoveredRfpsCount: newRfpsCount,
+        errorCount,
+        errors: errors.length > 0 ? errors : null,
+      });
 
-      await this.emitScanEvent(scan.id, 'scan_completed', {
+      this.emitScanEvent(scan.id, 'scan_completed', {
         newRfps: newRfpsCount,
         updatedRfps: updatedRfpsCount,
         unchangedRfps: unchangedRfpsCount,
@@ -262,29 +296,32 @@ export class IncrementalPortalScanService {
       const errorMsg = error instanceof Error ? error.message : 'Unknown error';
       errors.push(errorMsg);
 
-      await this.updateScanProgress(
+      this.updateScanProgress(
         scan.id,
         'failed',
         0,
         `Scan failed: ${errorMsg}`
       );
 
-      await db
-        .update(scans)
-        .set({
-          status: 'failed',
-          completedAt: new Date(),
-          errorCount,
-          errors,
-        })
-        .where(eq(scans.id, scan.id));
+      await storage.updateScan(scan.id, {
+        status: 'failed',
+        completedAt: new Date(),
+        errorCount,
+        errors,
+      });
 
-      await this.emitScanEvent(scan.id, 'scan_failed', {
+      this.emitScanEvent(scan.id, 'scan_failed', {
         error: errorMsg,
         duration: Date.now() - startTime,
       });
 
       throw error;
+    } finally {
+      signal?.removeEventListener('abort', onAbort);
+      // Return the browser to the pool warm; a no-op after an abort closed it
+      sessionManager.releaseSession(sessionId);
+      // Write the scan's remaining events and final progress
+      await scanEventWriter.close(scan.id);
     }
   }
 
@@ -499,109 +536,222 @@ export class IncrementalPortalScanService {
   }
 
   /**
-   * Process a single RFP candidate (create new or update existing)
+   * Reconcile scraped candidates with the portal's existing RFPs in bulk:
+   * one query loads every possible match, candidates are diffed in memory,
+   * and new, changed and unchanged RFPs are each written with batched
+   * statements. A failed write only fails the candidates in that group.
    */
-  private async processRFPCandidate(
+  private async reconcileCandidates(
     portalId: string,
-    candidate: RFPCandidate
-  ): Promise<'new' | 'updated' | 'unchanged'> {
-    // Find existing RFP by source URL or source identifier
-    // Build conditions array to avoid passing undefined to or()
-    const conditions = [eq(rfps.sourceUrl, candidate.url)];
-    if (candidate.sourceIdentifier) {
-      conditions.push(
-        sql`${rfps.requirements}->>'sourceIdentifier' = ${candidate.sourceIdentifier}`
-      );
+    candidates: RFPCandidate[]
+  ): Promise<CandidateReconciliation[]> {
+    const existing = await this.loadExistingRFPs(portalId, candidates);
+    const byUrl = new Map<string, ExistingRFP>();
+    const byIdentifier = new Map<string, ExistingRFP>();
+    for (const rfp of existing) {
+      if (!byUrl.has(rfp.sourceUrl)) byUrl.set(rfp.sourceUrl, rfp);
+      for (const identifier of [
+        rfp.analysisSourceId,
+        rfp.requirementsSourceId,
+      ]) {
+        if (identifier && !byIdentifier.has(identifier)) {
+          byIdentifier.set(identifier, rfp);
+        }
+      }
     }
 
-    const existingRfps = await (db.query as any).rfps.findMany({
-      where: and(eq(rfps.portalId, portalId), or(...conditions)),
-    });
-
-    const existingRfp = existingRfps[0];
+    const checkedAt = new Date().toISOString();
+    const results: CandidateReconciliation[] = [];
+    const inserts: Array<{ result: CandidateReconciliation; row: InsertRFP }> =
+      [];
+    const updates: Array<{
+      result: CandidateReconciliation;
+      row: RFPBulkUpdate;
+    }> = [];
+    const unchanged: Array<{ result: CandidateReconciliation; id: string }> =
+      [];
+    const matchedIds = new Set<string>();
+    const newKeys = new Set<string>();
+
+    for (const candidate of candidates) {
+      const result: CandidateReconciliation = { candidate };
+      results.push(result);
 
-    // Parse deadline
-    const deadline = candidate.deadline
-      ? this.parseDeadline(candidate.deadline)
-      : null;
-
-    // Parse estimated value
-    const estimatedValueNum = candidate.estimatedValue
-      ? this.parseEstimatedValue(candidate.estimatedValue)
-      : null;
+      try {
+        const deadline = candidate.deadline
+          ? this.parseDeadline(candidate.deadline)
+          : null;
+        const estimatedValueNum = candidate.estimatedValue
+          ? this.parseEstimatedValue(candidate.estimatedValue)
+          : null;
+
+        // Find existing RFP by source URL or source identifier
+        const existingRfp =
+          byUrl.get(candidate.url) ??
+          (candidate.sourceIdentifier
+            ? byIdentifier.get(candidate.sourceIdentifier)
+            : undefined);
+
+        if (!existingRfp) {
+          // The same listing can appear twice in one extraction
+          const keys = [`url:${candidate.url}`];
+          if (candidate.sourceIdentifier) {
+            keys.push(`id:${candidate.sourceIdentifier}`);
+          }
+          if (keys.some(key => newKeys.has(key))) {
+            result.result = 'unchanged';
+            continue;
+          }
+          keys.forEach(key => newKeys.add(key));
 
-    if (!existingRfp) {
-      // Create new RFP
-      console.log(`✨ Creating new RFP: ${candidate.title}`);
+          inserts.push({
+            result,
+            row: {
+              title: candidate.title,
+              description: candidate.description || '',
+              agency: candidate.agency || 'Unknown',
+              portalId,
+              sourceUrl: candidate.url,
+              deadline,
+              estimatedValue: estimatedValueNum?.toString() || null,
+              status: 'discovered',
+              progress: 10,
+              category: candidate.category,
+              analysis: {
+                sourceIdentifier: candidate.sourceIdentifier,
+                lastModified: candidate.lastModified,
+                discoveredInScan: true,
+              },
+            },
+          });
+          continue;
+        }
 
-      await storage.createRFP({
-        title: candidate.title,
-        description: candidate.description || '',
-        agency: candidate.agency || 'Unknown',
-        portalId,
-        sourceUrl: candidate.url,
-        deadline,
-        estimatedValue: estimatedValueNum?.toString() || null,
-        status: 'discovered',
-        progress: 10,
-        category: candidate.category,
-        analysis: {
-          sourceIdentifier: candidate.sourceIdentifier,
-          lastModified: candidate.lastModified,
-          discoveredInScan: true,
-        },
-      });
+        if (matchedIds.has(existingRfp.id)) {
+          result.result = 'unchanged';
+          continue;
+        }
+        matchedIds.add(existingRfp.id);
 
-      return 'new';
+        // Check if RFP has been modified
+        if (
+          this.detectChanges(
+            existingRfp,
+            candidate,
+            deadline,
+            estimatedValueNum
+          )
+        ) {
+          updates.push({
+            result,
+            row: {
+              id: existingRfp.id,
+              title: candidate.title,
+              description: candidate.description || existingRfp.description,
+              agency: candidate.agency || existingRfp.agency,
+              deadline: deadline || existingRfp.deadline,
+              estimatedValue:
+                estimatedValueNum?.toString() || existingRfp.estimatedValue,
+              category: candidate.category || existingRfp.category,
+              analysisPatch: {
+                sourceIdentifier: candidate.sourceIdentifier,
+                lastModified: candidate.lastModified,
+                lastCheckedInScan: checkedAt,
+              },
+            },
+          });
+        } else {
+          unchanged.push({ result, id: existingRfp.id });
+        }
+      } catch (error) {
+        result.error = error instanceof Error ? error.message : 'Unknown error';
+      }
     }
 
-    // Check if RFP has been modified
-    const hasChanges = this.detectChanges(
-      existingRfp,
-      candidate,
-      deadline,
-      estimatedValueNum
+    await this.applyReconcileWrite(inserts, 'new', async () => {
+      console.log(`✨ Creating ${inserts.length} new RFPs`);
+      await storage.createRFPs(inserts.map(insert => insert.row));
+    });
+    await this.applyReconcileWrite(updates, 'updated', async () => {
+      console.log(`🔄 Updating ${updates.length} RFPs`);
+      await storage.updateRFPs(updates.map(update => update.row));
+    });
+    // No changes, just mark as checked
+    await this.applyReconcileWrite(unchanged, 'unchanged', () =>
+      storage.mergeRFPAnalysis(
+        unchanged.map(entry => entry.id),
+        { lastCheckedInScan: checkedAt }
+      )
     );
 
-    if (hasChanges) {
-      console.log(`🔄 Updating RFP: ${candidate.title}`);
-
-      await storage.updateRFP(existingRfp.id, {
-        title: candidate.title,
-        description: candidate.description || existingRfp.description,
-        agency: candidate.agency || existingRfp.agency,
-        deadline: deadline || existingRfp.deadline,
-        estimatedValue:
-          estimatedValueNum?.toString() || existingRfp.estimatedValue,
-        category: candidate.category || existingRfp.category,
-        updatedAt: new Date(),
-        analysis: {
-          ...((existingRfp.analysis as any) || {}),
-          sourceIdentifier: candidate.sourceIdentifier,
-          lastModified: candidate.lastModified,
-          lastCheckedInScan: new Date().toISOString(),
-        },
-      });
+    return results;
+  }
 
-      return 'updated';
+  private async applyReconcileWrite(
+    group: Array<{ result: CandidateReconciliation }>,
+    outcome: ReconcileResult,
+    write: () => Promise<void>
+  ): Promise<void> {
+    if (group.length === 0) return;
+
+    try {
+      await write();
+      group.forEach(({ result }) => (result.result = outcome));
+    } catch (error) {
+      const message = error instanceof Error ? error.message : 'Unknown error';
+      group.forEach(({ result }) => (result.error = message));
     }
+  }
 
-    // No changes, just mark as checked
-    await storage.updateRFP(existingRfp.id, {
-      analysis: {
-        ...((existingRfp.analysis as any) || {}),
-        lastCheckedInScan: new Date().toISOString(),
-      },
-    });
+  /**
+   * Load the portal's RFPs that could match any candidate, in one query
+   */
+  private async loadExistingRFPs(
+    portalId: string,
+    candidates: RFPCandidate[]
+  ): Promise<ExistingRFP[]> {
+    if (candidates.length === 0) return [];
+
+    const analysisSourceId = sql<string | null>`${rfps.analysis}->>'sourceIdentifier'`;
+    const requirementsSourceId = sql<string | null>`${rfps.requirements}->>'sourceIdentifier'`;
+
+    // Build conditions array to avoid passing empty lists to inArray()
+    const conditions = [
+      inArray(rfps.sourceUrl, candidates.map(candidate => candidate.url)),
+    ];
+    const identifiers = candidates
+      .map(candidate => candidate.sourceIdentifier)
+      .filter((identifier): identifier is string => !!identifier);
+    if (identifiers.length > 0) {
+      conditions.push(
+        inArray(analysisSourceId, identifiers),
+        inArray(requirementsSourceId, identifiers)
+      );
+    }
 
-    return 'unchanged';
+    return await db
+      .select({
+        id: rfps.id,
+        title: rfps.title,
+        description: rfps.description,
+        agency: rfps.agency,
+        deadline: rfps.deadline,
+        estimatedValue: rfps.estimatedValue,
+        category: rfps.category,
+        sourceUrl: rfps.sourceUrl,
+        analysisSourceId,
+        requirementsSourceId,
+      })
+      .from(rfps)
+      .where(and(eq(rfps.portalId, portalId), or(...conditions)))
+      .orderBy(rfps.discoveredAt);
   }
 
   /**
    * Detect if an RFP has changes that warrant an update
    */
   private detectChanges(
-    existingRfp: any,
+    existingRfp: ExistingRFP,
     candidate: RFPCandidate,
     deadline: Date | null,
     estimatedValue: number | null
@@ -676,69 +826,49 @@ export class IncrementalPortalScanService {
   }
 
   /**
-   * Update scan progress
+   * Update scan progress. Buffered: the write happens on the next flush.
    */
-  private async updateScanProgress(
+  private updateScanProgress(
     scanId: string,
     step: string,
     progress: number,
     message?: string
-  ): Promise<void> {
-    await db
-      .update(scans)
-      .set({
-        currentStep: step,
-        currentProgress: progress,
-        currentMessage: message || null,
-      })
-      .where(eq(scans.id, scanId));
-
-    await this.emitScanEvent(scanId, 'progress', {
-      step,
-      progress,
-      message,
-    });
+  ): void {
+    scanEventWriter.setProgress(scanId, step, progress, message);
   }
 
   /**
-   * Emit scan event
+   * Emit scan event. Live subscribers on every node see it immediately
+   * through the event bus; the insert is batched with other scans' events.
    */
-  private async emitScanEvent(
-    scanId: string,
-    type: string,
-    data?: any
-  ): Promise<void> {
-    await storage.appendScanEvent({
-      scanId,
-      type,
-      level: type === 'error' ? 'error' : 'info',
-      message: data?.message || null,
-      data,
-    });
+  private emitScanEvent(scanId: string, type: string, data?: any): void {
+    scanEventWriter.append(scanId, type, data);
   }
 
   /**
-   * Batch scan multiple portals
+   * Batch scan multiple portals concurrently, with per-host limits.
+   * Returns the successful results in completion order; use onResult or
+   * streamBatchScan to act on each portal as it finishes.
    */
   async batchScanPortals(
     portalIds: string[],
-    options?: Partial<ScanOptions>
+    options?: BatchScanOptions
   ): Promise<ScanResult[]> {
     console.log(`🚀 Starting batch scan of ${portalIds.length} portals`);
 
     const results: ScanResult[] = [];
 
-    for (const portalId of portalIds) {
-      try {
-        const result = await this.scanPortal({
-          portalId,
-          ...options,
-        });
-        results.push(result);
-      } catch (error) {
-        console.error(`❌ Failed to scan portal ${portalId}:`, error);
+    for await (const outcome of this.streamBatchScan(portalIds, options)) {
+      if (outcome.status === 'fulfilled') {
+        results.push(outcome.value);
+      } else {
+        console.error(
+          `❌ Failed to scan portal ${outcome.id}:`,
+          outcome.error
+        );
         // Continue with other portals
       }
+      options?.onResult?.(outcome);
     }
 
     console.log(
@@ -746,6 +876,53 @@ export class IncrementalPortalScanService {
     );
     return results;
   }
+
+  /**
+   * Scan portals concurrently, yielding each portal's outcome as it
+   * finishes. Breaking out of the loop cancels the scans still running.
+   */
+  async *streamBatchScan(
+    portalIds: string[],
+    options?: BatchScanOptions
+  ): AsyncGenerator<ScanTaskOutcome<ScanResult>> {
+    const { concurrency, perHostConcurrency, minHostDelayMs, signal } =
+      options ?? {};
+    const urls = await this.getPortalUrls(portalIds);
+    const batchId = options?.sessionId ?? `scan-${Date.now()}`;
+
+    const tasks = portalIds.map(portalId => ({
+      id: portalId,
+      host: scanHostFor(urls.get(portalId) ?? portalId),
+      run: (taskSignal: AbortSignal) =>
+        this.scanPortal({
+          portalId,
+          forceFullScan: options?.forceFullScan,
+          maxRfpsToScan: options?.maxRfpsToScan,
+          // Concurrent scans must not share a browser session
+          sessionId: `${batchId}-${portalId}`,
+          signal: taskSignal,
+        }),
+    }));
+
+    yield* executeScans(tasks, {
+      concurrency,
+      perHostConcurrency,
+      minHostDelayMs,
+      signal,
+    });
+  }
+
+  private async getPortalUrls(
+    portalIds: string[]
+  ): Promise<Map<string, string>> {
+    if (portalIds.length === 0) return new Map();
+
+    const rows = await db
+      .select({ id: portals.id, url: portals.url })
+      .from(portals)
+      .where(inArray(portals.id, portalIds));
+    return new Map(rows.map(row => [row.id, row.url]));
+  }
 }
 
 // Export singleton instance
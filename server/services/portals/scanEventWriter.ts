@@ -0,0 +1,265 @@
+import { EventEmitter } from 'events';
+import type { InsertScanEvent } from '@shared/schema';
+import { storage } from '../../storage';
+import { eventBus, type EventBus } from '../core/eventBus';
+
+/**
+ * Buffered Scan Event Writer
+ *
+ * Keeps scan bookkeeping off a scan's critical path. Events are delivered to
+ * live subscribers immediately from memory and queued for the database,
+ * where they are written with one multi-row insert per flush. Progress
+ * updates are coalesced so only the latest step per scan is written.
+ *
+ * A flush happens after flushIntervalMs, as soon as maxBufferedEvents are
+ * queued, or when a scan is closed on completion or failure.
+ *
+ * Given an event bus, live events are published on it instead, so a client
+ * streaming a scan from another node sees them too.
+ */
+
+// Event bus topic for live scan events, keyed by scan id
+export const SCAN_EVENTS_TOPIC = 'scan';
+
+export interface ScanProgressUpdate {
+  currentStep: string;
+  currentProgress: number;
+  currentMessage: string | null;
+}
+
+export interface LiveScanEvent {
+  type: string;
+  timestamp: Date;
+  data: any;
+  message?: string;
+}
+
+export interface ScanEventWriterOptions {
+  flushIntervalMs?: number;
+  maxBufferedEvents?: number;
+  persistEvents?: (events: InsertScanEvent[]) => Promise<void>;
+  persistProgress?: (
+    scanId: string,
+    progress: ScanProgressUpdate
+  ) => Promise<void>;
+  bus?: EventBus;
+}
+
+export interface ScanEventWriterStats {
+  bufferedEvents: number;
+  bufferedProgress: number;
+  eventsWritten: number;
+  progressWrites: number;
+  progressCoalesced: number;
+  flushes: number;
+  failedFlushes: number;
+}
+
+const DEFAULT_FLUSH_INTERVAL_MS = 250;
+const DEFAULT_MAX_BUFFERED_EVENTS = 100;
+
+export class ScanEventWriter {
+  private readonly flushIntervalMs: number;
+  private readonly maxBufferedEvents: number;
+  private readonly persistEvents: (events: InsertScanEvent[]) => Promise<void>;
+  private readonly persistProgress: (
+    scanId: string,
+    progress: ScanProgressUpdate
+  ) => Promise<void>;
+  private readonly bus?: EventBus;
+
+  private pendingEvents: InsertScanEvent[] = [];
+  private pendingProgress = new Map<string, ScanProgressUpdate>();
+  private emitters = new Map<string, EventEmitter>();
+  private flushTimer: NodeJS.Timeout | null = null;
+  private flushChain: Promise<void> = Promise.resolve();
+  private stats = {
+    eventsWritten: 0,
+    progressWrites: 0,
+    progressCoalesced: 0,
+    flushes: 0,
+    failedFlushes: 0,
+  };
+
+  constructor(options?: ScanEventWriterOptions) {
+    this.flushIntervalMs =
+      options?.flushIntervalMs ?? DEFAULT_FLUSH_INTERVAL_MS;
+    this.maxBufferedEvents =
+      options?.maxBufferedEvents ?? DEFAULT_MAX_BUFFERED_EVENTS;
+    this.persistEvents =
+      options?.persistEvents ?? (events => storage.appendScanEvents(events));
+    this.persistProgress =
+      options?.persistProgress ??
+      (async (scanId, progress) => {
+        await storage.updateScan(scanId, progress);
+      });
+
+    this.bus = options?.bus;
+    this.bus?.subscribe<LiveScanEvent>(
+      SCAN_EVENTS_TOPIC,
+      ({ key, payload }) => this.emitters.get(key)?.emit('event', payload)
+    );
+  }
+
+  /**
+   * Queue an event for the database and deliver it to live subscribers
+   */
+  append(scanId: string, type: string, data?: any): void {
+    // Set here so events written in one batch keep their order
+    const timestamp = new Date();
+    const event: InsertScanEvent = {
+      scanId,
+      type,
+      level: type === 'error' ? 'error' : 'info',
+      message: data?.message || null,
+      data,
+      timestamp,
+    };
+    this.pendingEvents.push(event);
+
+    const liveEvent: LiveScanEvent = {
+      type,
+      timestamp,
+      data,
+      message: data?.message,
+    };
+    if (this.bus) {
+      this.bus.publish(SCAN_EVENTS_TOPIC, scanId, liveEvent);
+    } else {
+      this.emitters.get(scanId)?.emit('event', liveEvent);
+    }
+
+    if (this.pendingEvents.length >= this.maxBufferedEvents) {
+      void this.flush();
+    } else {
+      this.scheduleFlush();
+    }
+  }
+
+  /**
+   * Record the scan's current step. Only the latest update per scan is
+   * written; a progress event is still queued for every call.
+   */
+  setProgress(
+    scanId: string,
+    step: string,
+    progress: number,
+    message?: string
+  ): void {
+    if (this.pendingProgress.has(scanId)) this.stats.progressCoalesced++;
+    this.pendingProgress.set(scanId, {
+      currentStep: step,
+      currentProgress: progress,
+      currentMessage: message || null,
+    });
+    this.append(scanId, 'progress', { step, progress, message });
+  }
+
+  /**
+   * Listen to a scan's events as they are appended
+   */
+  subscribe(
+    scanId: string,
+    listener: (event: LiveScanEvent) => void
+  ): () => void {
+    let emitter = this.emitters.get(scanId);
+    if (!emitter) {
+      emitter = new EventEmitter();
+      this.emitters.set(scanId, emitter);
+    }
+    emitter.on('event', listener);
+
+    return () => {
+      emitter!.off('event', listener);
+      if (
+        emitter!.listenerCount('event') === 0 &&
+        this.emitters.get(scanId) === emitter
+      ) {
+        this.emitters.delete(scanId);
+      }
+    };
+  }
+
+  hasSubscribers(scanId: string): boolean {
+    return this.emitters.has(scanId);
+  }
+
+  /**
+   * Write everything buffered so far. Flushes run one at a time, in order.
+   */
+  async flush(): Promise<void> {
+    if (this.flushTimer) {
+      clearTimeout(this.flushTimer);
+      this.flushTimer = null;
+    }
+
+    const run = this.flushChain.then(() => this.writePending());
+    this.flushChain = run;
+    await run;
+  }
+
+  /**
+   * Flush a finished scan's events and release its subscribers
+   */
+  async close(scanId: string): Promise<void> {
+    await this.flush();
+    this.emitters.get(scanId)?.removeAllListeners();
+    this.emitters.delete(scanId);
+  }
+
+  getStats(): ScanEventWriterStats {
+    return {
+      bufferedEvents: this.pendingEvents.length,
+      bufferedProgress: this.pendingProgress.size,
+      ...this.stats,
+    };
+  }
+
+  private scheduleFlush(): void {
+    if (this.flushTimer) return;
+    this.flushTimer = setTimeout(() => {
+      this.flushTimer = null;
+      void this.flush();
+    }, this.flushIntervalMs);
+    this.flushTimer.unref?.();
+  }
+
+  // Never throws: bookkeeping failures are logged and must not fail scans
+  private async writePending(): Promise<void> {
+    const events = this.pendingEvents;
+    const progress = Array.from(this.pendingProgress);
+    if (events.length === 0 && progress.length === 0) return;
+
+    this.pendingEvents = [];
+    this.pendingProgress.clear();
+    this.stats.flushes++;
+
+    if (events.length > 0) {
+      try {
+        await this.persistEvents(events);
+        this.stats.eventsWritten += events.length;
+      } catch (error) {
+        this.stats.failedFlushes++;
+        console.error(
+          `❌ Failed to write ${events.length} scan events:`,
+          error
+        );
+      }
+    }
+
+    for (const [scanId, update] of progress) {
+      try {
+        await this.persistProgress(scanId, update);
+        this.stats.progressWrites++;
+      } catch (error) {
+        this.stats.failedFlushes++;
+        console.error(
+          `❌ Failed to update progress for scan ${scanId}:`,
+          error
+        );
+      }
+    }
+  }
+}
+
+export const scanEventWriter = new ScanEventWriter({ bus: eventBus });
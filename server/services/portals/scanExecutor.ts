@@ -0,0 +1,209 @@
+/**
+ * Scan Executor
+ *
+ * Runs portal scans concurrently with a global concurrency limit plus
+ * per-host politeness: at most perHostConcurrency scans against one host at
+ * a time, and at least minHostDelayMs between one scan on a host finishing
+ * (or starting) and the next one starting. Outcomes are yielded as each task
+ * settles, so callers can stream results instead of waiting for the batch.
+ *
+ * Aborting the signal (or stopping iteration early) aborts every in-flight
+ * task's signal; tasks that never started are reported as rejected with the
+ * abort reason. A failing task never affects the others.
+ */
+
+export interface ScanTask<T> {
+  id: string;
+  host: string;
+  run: (signal: AbortSignal) => Promise<T>;
+}
+
+export type ScanTaskOutcome<T> =
+  | {
+      id: string;
+      host: string;
+      status: 'fulfilled';
+      value: T;
+      durationMs: number;
+    }
+  | {
+      id: string;
+      host: string;
+      status: 'rejected';
+      error: unknown;
+      durationMs: number;
+    };
+
+export interface ScanExecutorOptions {
+  concurrency?: number;
+  perHostConcurrency?: number;
+  minHostDelayMs?: number;
+  signal?: AbortSignal;
+}
+
+interface HostState {
+  active: number;
+  nextStartAt: number;
+}
+
+const DEFAULT_CONCURRENCY = 4;
+const DEFAULT_PER_HOST_CONCURRENCY = 1;
+const DEFAULT_MIN_HOST_DELAY_MS = 2000;
+
+/**
+ * Host name of a URL, falling back to the raw value so malformed URLs are
+ * still grouped together
+ */
+export function scanHostFor(url: string | null | undefined): string {
+  if (!url) return 'unknown';
+  try {
+    return new URL(url).hostname.toLowerCase();
+  } catch {
+    return url.toLowerCase();
+  }
+}
+
+export async function* executeScans<T>(
+  tasks: ScanTask<T>[],
+  options?: ScanExecutorOptions
+): AsyncGenerator<ScanTaskOutcome<T>> {
+  const concurrency = Math.max(1, options?.concurrency ?? DEFAULT_CONCURRENCY);
+  const perHostConcurrency = Math.max(
+    1,
+    options?.perHostConcurrency ?? DEFAULT_PER_HOST_CONCURRENCY
+  );
+  const minHostDelayMs = options?.minHostDelayMs ?? DEFAULT_MIN_HOST_DELAY_MS;
+
+  const controller = new AbortController();
+  const onAbort = () => controller.abort(options?.signal?.reason);
+  if (options?.signal?.aborted) {
+    onAbort();
+  } else {
+    options?.signal?.addEventListener('abort', onAbort, { once: true });
+  }
+
+  const pending = [...tasks];
+  const hosts = new Map<string, HostState>();
+  const settled: ScanTaskOutcome<T>[] = [];
+  let active = 0;
+  let remaining = tasks.length;
+  let timer: NodeJS.Timeout | undefined;
+  let wake: (() => void) | undefined;
+
+  const notify = () => {
+    const resolve = wake;
+    wake = undefined;
+    resolve?.();
+  };
+
+  const hostState = (host: string): HostState => {
+    let state = hosts.get(host);
+    if (!state) {
+      state = { active: 0, nextStartAt: 0 };
+      hosts.set(host, state);
+    }
+    return state;
+  };
+
+  const start = (task: ScanTask<T>, host: HostState) => {
+    const startedAt = Date.now();
+    active++;
+    host.active++;
+    host.nextStartAt = startedAt + minHostDelayMs;
+
+    const finish = (outcome: ScanTaskOutcome<T>) => {
+      active--;
+      host.active--;
+      host.nextStartAt = Math.max(
+        host.nextStartAt,
+        Date.now() + minHostDelayMs
+      );
+      settled.push(outcome);
+      schedule();
+      notify();
+    };
+
+    Promise.resolve()
+      .then(() => task.run(controller.signal))
+      .then(
+        value =>
+          finish({
+            id: task.id,
+            host: task.host,
+            status: 'fulfilled',
+            value,
+            durationMs: Date.now() - startedAt,
+          }),
+        error =>
+          finish({
+            id: task.id,
+            host: task.host,
+            status: 'rejected',
+            error,
+            durationMs: Date.now() - startedAt,
+          })
+      );
+  };
+
+  // Start every task that fits the limits; otherwise wake when the
+  // earliest delayed host becomes available
+  const schedule = () => {
+    if (timer) {
+      clearTimeout(timer);
+      timer = undefined;
+    }
+
+    if (controller.signal.aborted) {
+      for (const task of pending.splice(0)) {
+        settled.push({
+          id: task.id,
+          host: task.host,
+          status: 'rejected',
+          error: controller.signal.reason,
+          durationMs: 0,
+        });
+      }
+      notify();
+      return;
+    }
+
+    const now = Date.now();
+    let nextWakeAt = Infinity;
+    for (let i = 0; i < pending.length && active < concurrency; ) {
+      const host = hostState(pending[i].host);
+      if (host.active >= perHostConcurrency) {
+        i++;
+      } else if (host.nextStartAt > now) {
+        nextWakeAt = Math.min(nextWakeAt, host.nextStartAt);
+        i++;
+      } else {
+        start(pending.splice(i, 1)[0], host);
+      }
+    }
+
+    if (active < concurrency && nextWakeAt !== Infinity) {
+      timer = setTimeout(schedule, nextWakeAt - now);
+    }
+  };
+
+  controller.signal.addEventListener('abort', schedule, { once: true });
+
+  try {
+    schedule();
+    while (remaining > 0) {
+      if (settled.length === 0) {
+        await new Promise<void>(resolve => {
+          wake = resolve;
+        });
+        continue;
+      }
+      remaining--;
+      yield settled.shift()!;
+    }
+  } finally {
+    // Stopping early cancels whatever is still running
+    if (remaining > 0) controller.abort();
+    if (timer) clearTimeout(timer);
+    options?.signal?.removeEventListener('abort', onAbort);
+  }
+}
@@ -0,0 +1,323 @@
+import { Worker } from 'worker_threads';
+import os from 'os';
+
+/**
+ * Document Extraction Pool
+ *
+ * Runs pdf-parse and mammoth in worker threads so parsing a large RFP
+ * package never blocks the API event loop. Jobs queue in a bounded FIFO
+ * and run one per worker.
+ *
+ * Each job has a timeout and each worker a heap limit. A job that exceeds
+ * either gets its worker terminated; the pool starts a replacement for the
+ * next job. Buffers are transferred to the worker, not copied, unless the
+ * caller asks to keep its buffer.
+ */
+
+export type ExtractionKind = 'pdf' | 'docx';
+
+export interface ExtractionResult {
+  text: string;
+  pages?: number;
+  info?: Record<string, unknown>;
+  metadata?: Record<string, unknown>;
+}
+
+export interface ExtractOptions {
+  /**
+   * Move the buffer's memory to the worker (default). The caller's buffer
+   * is unusable afterwards; pass false to send a copy instead.
+   */
+  transfer?: boolean;
+}
+
+export interface DocumentExtractionPoolOptions {
+  size?: number;
+  maxQueue?: number;
+  timeoutMs?: number;
+  maxMemoryMb?: number;
+  /** Worker source evaluated in each thread; replaced in tests */
+  workerSource?: string;
+}
+
+export interface DocumentExtractionPoolStats {
+  size: number;
+  workers: number;
+  busy: number;
+  queued: number;
+  completed: number;
+  failed: number;
+  timedOut: number;
+  rejected: number;
+  workersReplaced: number;
+}
+
+export class ExtractionQueueFullError extends Error {
+  constructor(maxQueue: number) {
+    super(`Document extraction queue is full (${maxQueue} jobs waiting)`);
+    this.name = 'ExtractionQueueFullError';
+  }
+}
+
+// Evaluated as a CommonJS script in each worker: a file path would not
+// survive the esbuild bundle, and tsx does not hook into worker threads
+const EXTRACTION_WORKER_SOURCE = `
+const { parentPort } = require('worker_threads');
+let pdfParse;
+let mammoth;
+
+const plain = value =>
+  value == null ? undefined : JSON.parse(JSON.stringify(value));
+
+parentPort.on('message', async ({ id, kind, data }) => {
+  try {
+    const buffer = Buffer.from(data.buffer, data.byteOffset, data.byteLength);
+    let result;
+    if (kind === 'pdf') {
+      if (!pdfParse) {
+        const module = require('pdf-parse');
+        pdfParse = module.default || module;
+      }
+      const parsed = await pdfParse(buffer);
+      result = {
+        text: parsed.text,
+        pages: parsed.numpages,
+        info: plain(parsed.info),
+        metadata: plain(parsed.metadata),
+      };
+    } else {
+      if (!mammoth) mammoth = require('mammoth');
+      const parsed = await mammoth.extractRawText({ buffer });
+      result = { text: parsed.value };
+    }
+    parentPort.postMessage({ id, result });
+  } catch (error) {
+    parentPort.postMessage({
+      id,
+      error: error && error.message ? error.message : String(error),
+    });
+  }
+});
+`;
+
+interface ExtractionJob {
+  id: number;
+  kind: ExtractionKind;
+  data: Uint8Array;
+  resolve: (result: ExtractionResult) => void;
+  reject: (error: Error) => void;
+}
+
+interface PoolWorker {
+  worker: Worker;
+  job: ExtractionJob | null;
+  timer: NodeJS.Timeout | null;
+}
+
+const DEFAULT_MAX_QUEUE = 100;
+const DEFAULT_TIMEOUT_MS = 120000;
+const DEFAULT_MAX_MEMORY_MB = 512;
+
+function defaultPoolSize(): number {
+  const cores = os.availableParallelism?.() ?? os.cpus().length;
+  // Leave a core for the API event loop
+  return Math.max(1, Math.min(4, cores - 1));
+}
+
+export class DocumentExtractionPool {
+  private readonly size: number;
+  private readonly maxQueue: number;
+  private readonly timeoutMs: number;
+  private readonly maxMemoryMb: number;
+  private readonly workerSource: string;
+
+  private workers: PoolWorker[] = [];
+  private queue: ExtractionJob[] = [];
+  private nextJobId = 0;
+  private closed = false;
+  private stats = {
+    completed: 0,
+    failed: 0,
+    timedOut: 0,
+    rejected: 0,
+    workersReplaced: 0,
+  };
+
+  constructor(options?: DocumentExtractionPoolOptions) {
+    this.size = Math.max(1, options?.size ?? defaultPoolSize());
+    this.maxQueue = options?.maxQueue ?? DEFAULT_MAX_QUEUE;
+    this.timeoutMs = options?.timeoutMs ?? DEFAULT_TIMEOUT_MS;
+    this.maxMemoryMb = options?.maxMemoryMb ?? DEFAULT_MAX_MEMORY_MB;
+    this.workerSource = options?.workerSource ?? EXTRACTION_WORKER_SOURCE;
+  }
+
+  /**
+   * Extract text from a PDF or DOCX buffer on a worker thread
+   */
+  extract(
+    kind: ExtractionKind,
+    buffer: Buffer | Uint8Array,
+    options?: ExtractOptions
+  ): Promise<ExtractionResult> {
+    if (this.closed) {
+      return Promise.reject(new Error('Document extraction pool is closed'));
+    }
+    if (this.queue.length >= this.maxQueue) {
+      this.stats.rejected++;
+      return Promise.reject(new ExtractionQueueFullError(this.maxQueue));
+    }
+
+    // Only a buffer that owns its whole ArrayBuffer can be transferred;
+    // small Buffers share Node's allocation pool. Anything else is copied
+    // once here and the copy is transferred.
+    const data =
+      (options?.transfer ?? true) &&
+      buffer.buffer instanceof ArrayBuffer &&
+      buffer.byteOffset === 0 &&
+      buffer.byteLength === buffer.buffer.byteLength
+        ? buffer
+        : new Uint8Array(buffer);
+
+    return new Promise((resolve, reject) => {
+      this.queue.push({
+        id: ++this.nextJobId,
+        kind,
+        data,
+        resolve,
+        reject,
+      });
+      this.dispatch();
+    });
+  }
+
+  getStats(): DocumentExtractionPoolStats {
+    return {
+      size: this.size,
+      workers: this.workers.length,
+      busy: this.workers.filter(entry => entry.job).length,
+      queued: this.queue.length,
+      ...this.stats,
+    };
+  }
+
+  /**
+   * Fail queued and running jobs and stop every worker
+   */
+  async shutdown(): Promise<void> {
+    this.closed = true;
+    for (const job of this.queue.splice(0)) {
+      job.reject(new Error('Document extraction pool is shutting down'));
+    }
+    const workers = this.workers.splice(0);
+    await Promise.all(
+      workers.map(entry => {
+        this.settle(
+          entry,
+          new Error('Document extraction pool is shutting down')
+        );
+        return entry.worker.terminate();
+      })
+    );
+  }
+
+  private dispatch(): void {
+    while (this.queue.length > 0) {
+      let entry = this.workers.find(candidate => !candidate.job);
+      if (!entry) {
+        if (this.workers.length >= this.size) return;
+        entry = this.spawn();
+      }
+      this.run(entry, this.queue.shift()!);
+    }
+  }
+
+  private spawn(): PoolWorker {
+    const worker = new Worker(this.workerSource, {
+      eval: true,
+      resourceLimits: { maxOldGenerationSizeMb: this.maxMemoryMb },
+    });
+    const entry: PoolWorker = { worker, job: null, timer: null };
+
+    worker.on(
+      'message',
+      (message: { id: number; result?: ExtractionResult; error?: string }) => {
+        if (entry.job?.id !== message.id) return;
+        if (message.error !== undefined) {
+          this.stats.failed++;
+          this.settle(entry, new Error(message.error));
+        } else {
+          this.stats.completed++;
+          this.settle(entry, null, message.result);
+        }
+        worker.unref();
+        this.dispatch();
+      }
+    );
+    // Fires for crashes and for ERR_WORKER_OUT_OF_MEMORY
+    worker.on('error', error => {
+      this.stats.failed++;
+      this.settle(entry, error);
+      this.retire(entry);
+    });
+    worker.on('exit', () => {
+      this.settle(entry, new Error('Document extraction worker exited'));
+      this.retire(entry);
+    });
+
+    this.workers.push(entry);
+    return entry;
+  }
+
+  private run(entry: PoolWorker, job: ExtractionJob): void {
+    entry.job = job;
+    entry.worker.ref();
+    entry.timer = setTimeout(() => {
+      this.stats.timedOut++;
+      this.settle(
+        entry,
+        new Error(`Document extraction timed out after ${this.timeoutMs}ms`)
+      );
+      this.retire(entry);
+    }, this.timeoutMs);
+
+    entry.worker.postMessage(
+      { id: job.id, kind: job.kind, data: job.data },
+      [job.data.buffer as ArrayBuffer]
+    );
+  }
+
+  // Stop a worker that can take no more jobs and hand its slot to a
+  // fresh one
+  private retire(entry: PoolWorker): void {
+    const index = this.workers.indexOf(entry);
+    if (index === -1) return;
+    this.workers.splice(index, 1);
+    this.stats.workersReplaced++;
+    entry.worker.terminate().catch(() => {});
+    if (!this.closed) this.dispatch();
+  }
+
+  // Resolve or reject the worker's current job, if it has one
+  private settle(
+    entry: PoolWorker,
+    error: Error | null,
+    result?: ExtractionResult
+  ): void {
+    const job = entry.job;
+    if (!job) return;
+    entry.job = null;
+    if (entry.timer) {
+      clearTimeout(entry.timer);
+      entry.timer = null;
+    }
+    if (error) job.reject(error);
+    else job.resolve(result!);
+  }
+}
+
+export const documentExtractionPool = new DocumentExtractionPool({
+  size: Number(process.env.DOCUMENT_EXTRACTION_WORKERS) || undefined,
+  timeoutMs: Number(process.env.DOCUMENT_EXTRACTION_TIMEOUT_MS) || undefined,
+  maxMemoryMb:
+    Number(process.env.DOCUMENT_EXTRACTION_MAX_MEMORY_MB) || undefined,
+});
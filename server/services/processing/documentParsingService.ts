@@ -1,7 +1,9 @@
-import mammoth from 'mammoth';
+import { createHash } from 'crypto';
 import { ObjectStorageService } from '../../objectStorage';
 import { storage } from '../../storage';
 import { AIService } from '../core/aiService';
+import { documentContentStore } from '../downloads/documentContentStore';
+import { documentExtractionPool } from './documentExtractionPool';
 
 export class DocumentParsingService {
   private objectStorageService = new ObjectStorageService();
@@ -16,36 +18,61 @@ export class DocumentParsingService {
 
       console.log(`Starting to parse document: ${document.filename}`);
 
-      // Get file from object storage
-      const file = await this.objectStorageService.getObjectEntityFile(
-        document.objectPath
-      );
-      const buffer = await this.downloadFileAsBuffer(file);
-
-      let extractedText = '';
-
-      // Parse based on file type
-      switch (document.fileType.toLowerCase()) {
-        case 'application/pdf':
-        case 'pdf':
-          extractedText = await this.parsePDF(buffer);
-          break;
-        case 'application/vnd.openxmlformats-officedocument.wordprocessingml.document':
-        case 'docx':
-          extractedText = await this.parseDocx(buffer);
-          break;
-        case 'text/plain':
-        case 'txt':
-          extractedText = buffer.toString('utf-8');
-          break;
-        default:
-          console.warn(`Unsupported file type: ${document.fileType}`);
-          return;
+      // Documents with known bytes reuse text extracted from any copy
+      let contentHash = document.contentHash;
+      let extractedText = contentHash
+        ? await documentContentStore.getExtractedText(contentHash)
+        : undefined;
+
+      if (extractedText === undefined) {
+        // Get file from object storage
+        const file = await this.objectStorageService.getObjectEntityFile(
+          document.objectPath
+        );
+        const { buffer, contentHash: hash } =
+          await this.downloadFileAsBuffer(file);
+        contentHash = hash;
+        extractedText = await documentContentStore.getExtractedText(hash);
+
+        if (extractedText === undefined) {
+          // Read before parsing: the buffer is handed to a worker thread
+          const size = buffer.length;
+
+          // Parse based on file type
+          switch (document.fileType.toLowerCase()) {
+            case 'application/pdf':
+            case 'pdf':
+              extractedText = await this.parsePDF(buffer);
+              break;
+            case 'application/vnd.openxmlformats-officedocument.wordprocessingml.document':
+            case 'docx':
+              extractedText = await this.parseDocx(buffer);
+              break;
+            case 'text/plain':
+            case 'txt':
+              extractedText = buffer.toString('utf-8');
+              break;
+            default:
+              console.warn(`Unsupported file type: ${document.fileType}`);
+              return;
+          }
+
+          await documentContentStore.saveExtractedText(hash, extractedText, {
+            objectPath: document.objectPath,
+            size,
+            contentType: document.fileType,
+          });
+        } else {
+          console.log(`Reusing extracted text for ${document.filename}`);
+        }
+      } else {
+        console.log(`Reusing extracted text for ${document.filename}`);
       }
 
       // Update document with extracted text
       await storage.updateDocument(documentId, {
         extractedText,
+        contentHash,
       });
 
       // Get RFP for context
@@ -123,11 +150,30 @@ export class DocumentParsingService {
     }
   }
 
-  private async downloadFileAsBuffer(file: any): Promise<Buffer> {
+  /**
+   * Read an object into one buffer, hashing it on the way. When the object
+   * reports its size the buffer is allocated once up front.
+   */
+  private async downloadFileAsBuffer(
+    file: any
+  ): Promise<{ buffer: Buffer; contentHash: string }> {
     const MAX_FILE_SIZE = 50 * 1024 * 1024; // 50MB limit
+    const tooLarge = () =>
+      new Error(
+        `File size exceeds maximum allowed size of ${MAX_FILE_SIZE} bytes`
+      );
+
+    const [metadata] = await file.getMetadata();
+    const expectedSize = Number(metadata?.size);
+    if (expectedSize > MAX_FILE_SIZE) {
+      throw tooLarge();
+    }
 
     return new Promise((resolve, reject) => {
-      const chunks: Buffer[] = [];
+      const hash = createHash('sha256');
+      let buffer: Buffer | null =
+        expectedSize > 0 ? Buffer.allocUnsafe(expectedSize) : null;
+      let chunks: Buffer[] = [];
       let totalSize = 0;
       const stream = file.createReadStream();
 
@@ -137,24 +183,34 @@ export class DocumentParsingService {
       };
 
       stream.on('data', (chunk: Buffer) => {
-        totalSize += chunk.length;
-
-        if (totalSize > MAX_FILE_SIZE) {
+        if (totalSize + chunk.length > MAX_FILE_SIZE) {
           cleanup();
-          reject(
-            new Error(
-              `File size exceeds maximum allowed size of ${MAX_FILE_SIZE} bytes`
-            )
-          );
+          reject(tooLarge());
           return;
         }
 
-        chunks.push(chunk);
+        hash.update(chunk);
+        if (buffer && totalSize + chunk.length <= buffer.length) {
+          chunk.copy(buffer, totalSize);
+        } else {
+          // The object outgrew its reported size; collect chunks instead
+          if (buffer) {
+            chunks = [buffer.subarray(0, totalSize)];
+            buffer = null;
+          }
+          chunks.push(chunk);
+        }
+        totalSize += chunk.length;
       });
 
       stream.on('end', () => {
         cleanup();
-        resolve(Buffer.concat(chunks));
+        resolve({
+          buffer: buffer
+            ? buffer.subarray(0, totalSize)
+            : Buffer.concat(chunks, totalSize),
+          contentHash: hash.digest('hex'),
+        });
       });
 
       stream.on('error', (error: Error) => {
@@ -164,10 +220,10 @@ export class DocumentParsingService {
     });
   }
 
+  // Parsing runs on a worker thread; the buffer is transferred to it
   private async parsePDF(buffer: Buffer): Promise<string> {
     try {
-      const PDFParse = (await import('pdf-parse')).default;
-      const data = await PDFParse(buffer);
+      const data = await documentExtractionPool.extract('pdf', buffer);
       return data.text;
     } catch (error) {
       console.error('Error parsing PDF:', error);
@@ -177,8 +233,8 @@ export class DocumentParsingService {
 
   private async parseDocx(buffer: Buffer): Promise<string> {
     try {
-      const result = await mammoth.extractRawText({ buffer });
-      return result.value;
+      const result = await documentExtractionPool.extract('docx', buffer);
+      return result.text;
     } catch (error) {
       console.error('Error parsing DOCX:', error);
       throw new Error('Failed to parse DOCX document');
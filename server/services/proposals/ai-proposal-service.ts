@@ -8,6 +8,14 @@ import type {
 import OpenAI from 'openai';
 import { z } from 'zod';
 import type { DefaultCompanyMappingConfig } from '../../config/defaultCompanyMapping.js';
+import {
+  type LLMCacheOptions,
+  llmResponseCache,
+} from '../core/llmResponseCache';
+import type {
+  ProposalSectionSpec,
+  SectionTextStream,
+} from './proposalSectionStreamer';
 
 // Zod schemas for AI service validation
 const RFPAnalysisResultSchema = z.object({
@@ -79,6 +87,14 @@ const GeneratedProposalContentSchema = z.object({
 });
 
 // Types for AI-powered proposal generation
+const ProposalSupplementsSchema = GeneratedProposalContentSchema.pick({
+  certificationNarratives: true,
+  complianceMatrix: true,
+  attachmentRecommendations: true,
+});
+
+export type ProposalSupplements = z.infer<typeof ProposalSupplementsSchema>;
+
 export interface RFPAnalysisResult {
   requirements: {
     businessType?: string[];
@@ -196,7 +212,10 @@ export class AIProposalService {
   /**
    * Analyze RFP document using AI to extract requirements and identify risks
    */
-  async analyzeRFPDocument(rfpText: string): Promise<RFPAnalysisResult> {
+  async analyzeRFPDocument(
+    rfpText: string,
+    options: LLMCacheOptions = {}
+  ): Promise<RFPAnalysisResult> {
     // Validate input length (limit to ~50k chars to avoid token limits)
     if (rfpText.length > 50000) {
       throw new Error(
@@ -247,42 +266,57 @@ Return a JSON object with the following structure:
 }`;
 
     try {
-      const response = await this.openaiClient.chat.completions.create({
-        model: OPENAI_MODEL,
-        messages: [
-          {
-            role: 'system',
-            content:
-              'You are an expert RFP analyst that extracts structured requirements from procurement documents. Return only valid JSON that matches the requested schema exactly.',
-          },
-          {
-            role: 'user',
-            content: prompt,
-          },
-        ],
-        temperature: 0.3,
-        max_completion_tokens: Math.min(this.MAX_COMPLETION_TOKENS, 3000),
-        response_format: { type: 'json_object' },
-      });
-
-      const analysisText = response.choices[0]?.message?.content;
-      if (!analysisText) {
-        throw new Error('No analysis received from OpenAI');
-      }
-
-      // Parse and validate with Zod
-      const rawAnalysis = JSON.parse(analysisText);
-      const validatedAnalysis = RFPAnalysisResultSchema.safeParse(rawAnalysis);
-
-      if (!validatedAnalysis.success) {
-        console.error(
-          'Invalid analysis format from OpenAI:',
-          validatedAnalysis.error
-        );
-        throw new Error('Invalid analysis format from AI service');
-      }
+      return await llmResponseCache.getOrCompute(
+        {
+          operation: 'analyze-rfp-document',
+          model: OPENAI_MODEL,
+          templateVersion: '1',
+          input: [rfpText],
+          bypassCache: options.bypassCache,
+        },
+        async () => {
+          const response = await this.openaiClient.chat.completions.create({
+            model: OPENAI_MODEL,
+            messages: [
+              {
+                role: 'system',
+                content:
+                  'You are an expert RFP analyst that extracts structured requirements from procurement documents. Return only valid JSON that matches the requested schema exactly.',
+              },
+              {
+                role: 'user',
+                content: prompt,
+              },
+            ],
+            temperature: 0.3,
+            max_completion_tokens: Math.min(this.MAX_COMPLETION_TOKENS, 3000),
+            response_format: { type: 'json_object' },
+          });
 
-      return validatedAnalysis.data;
+          const analysisText = response.choices[0]?.message?.content;
+          if (!analysisText) {
+            throw new Error('No analysis received from OpenAI');
+          }
+
+          // Parse and validate with Zod
+          const rawAnalysis = JSON.parse(analysisText);
+          const validatedAnalysis =
+            RFPAnalysisResultSchema.safeParse(rawAnalysis);
+
+          if (!validatedAnalysis.success) {
+            console.error(
+              'Invalid analysis format from OpenAI:',
+              validatedAnalysis.error
+            );
+            throw new Error('Invalid analysis format from AI service');
+          }
+
+          return {
+            value: validatedAnalysis.data as RFPAnalysisResult,
+            tokens: response.usage?.total_tokens,
+          };
+        }
+      );
     } catch (error) {
       console.error('Error analyzing RFP document:', error);
       throw new Error(
@@ -373,7 +407,8 @@ Return a JSON object with the following structure:
   async generateProposalContent(
     analysis: RFPAnalysisResult,
     companyMapping: CompanyDataMapping | DefaultCompanyMappingConfig,
-    rfpText: string
+    rfpText: string,
+    options: LLMCacheOptions = {}
   ): Promise<GeneratedProposalContent> {
     const companyInfo = this.formatCompanyInformation(companyMapping);
     const companyName = companyMapping.profile.companyName;
@@ -419,45 +454,241 @@ ${this.buildCompanyFacts(companyMapping)}
 IMPORTANT: Generate actual detailed content, not placeholder text. Each section should be substantial and specific to this RFP and ${companyName}'s capabilities.`;
 
     try {
-      const response = await this.openaiClient.chat.completions.create({
-        model: OPENAI_MODEL,
-        messages: [
-          {
-            role: 'system',
-            content:
-              "You are an expert proposal writer for government contracting. Generate detailed, professional proposal content that highlights company qualifications and addresses RFP requirements directly. NEVER use placeholder text like 'content...', 'approach content...', or generic templates. Write specific, substantive content for each section. Return only valid JSON that matches the requested schema.",
-          },
-          {
-            role: 'user',
-            content: prompt,
-          },
-        ],
-        temperature: 0.4,
-        max_completion_tokens: Math.min(this.MAX_COMPLETION_TOKENS, 4000),
-        response_format: { type: 'json_object' },
-      });
+      // The prompt embeds the analysis and company data, so it is the key
+      return await llmResponseCache.getOrCompute(
+        {
+          operation: 'generate-proposal-content',
+          model: OPENAI_MODEL,
+          templateVersion: '1',
+          input: [prompt],
+          bypassCache: options.bypassCache,
+        },
+        async () => {
+          const response = await this.openaiClient.chat.completions.create({
+            model: OPENAI_MODEL,
+            messages: [
+              {
+                role: 'system',
+                content:
+                  "You are an expert proposal writer for government contracting. Generate detailed, professional proposal content that highlights company qualifications and addresses RFP requirements directly. NEVER use placeholder text like 'content...', 'approach content...', or generic templates. Write specific, substantive content for each section. Return only valid JSON that matches the requested schema.",
+              },
+              {
+                role: 'user',
+                content: prompt,
+              },
+            ],
+            temperature: 0.4,
+            max_completion_tokens: Math.min(this.MAX_COMPLETION_TOKENS, 4000),
+            response_format: { type: 'json_object' },
+          });
 
-      const contentText = response.choices[0]?.message?.content;
-      if (!contentText) {
-        throw new Error('No content generated from OpenAI');
-      }
+          const contentText = response.choices[0]?.message?.content;
+          if (!contentText) {
+            throw new Error('No content generated from OpenAI');
+          }
+
+          // Parse and validate with Zod
+          const rawContent = JSON.parse(contentText);
+          const validatedContent =
+            GeneratedProposalContentSchema.safeParse(rawContent);
+
+          if (!validatedContent.success) {
+            console.error(
+              'Invalid proposal content format from OpenAI:',
+              validatedContent.error
+            );
+            throw new Error('Invalid proposal content format from AI service');
+          }
+
+          return {
+            value: validatedContent.data as GeneratedProposalContent,
+            tokens: response.usage?.total_tokens,
+          };
+        }
+      );
+    } catch (error) {
+      console.error('Error generating proposal content:', error);
+      throw new Error(
+        `Failed to generate proposal: ${
+          error instanceof Error ? error.message : 'Unknown error'
+        }`
+      );
+    }
+  }
 
-      // Parse and validate with Zod
-      const rawContent = JSON.parse(contentText);
-      const validatedContent =
-        GeneratedProposalContentSchema.safeParse(rawContent);
+  /**
+   * Prompts for writing the narrative sections one at a time, so they can
+   * be streamed and checkpointed as they are generated
+   */
+  buildNarrativeSectionPrompts(
+    analysis: RFPAnalysisResult,
+    companyMapping: CompanyDataMapping | DefaultCompanyMappingConfig,
+    rfpText: string
+  ): {
+    systemPrompt: string;
+    contextPrompt: string;
+    sections: ProposalSectionSpec[];
+  } {
+    const companyName = companyMapping.profile.companyName;
 
-      if (!validatedContent.success) {
-        console.error(
-          'Invalid proposal content format from OpenAI:',
-          validatedContent.error
-        );
-        throw new Error('Invalid proposal content format from AI service');
-      }
+    return {
+      systemPrompt:
+        "You are an expert proposal writer for government contracting. Write detailed, professional proposal content that highlights company qualifications and addresses RFP requirements directly. NEVER use placeholder text like 'content...', 'approach content...', or generic templates.",
+      contextPrompt: `You are writing a professional proposal for ${companyName} in response to the following RFP.
+
+COMPANY INFORMATION:
+${this.formatCompanyInformation(companyMapping)}
 
-      return validatedContent.data;
+RFP DETAILS:
+${rfpText}
+
+REQUIREMENTS ANALYSIS:
+${JSON.stringify(analysis.requirements, null, 2)}
+
+${this.buildCompanyFacts(companyMapping)}
+
+Reference specific RFP requirements and explain how ${companyName} meets them, with concrete examples of its experience and capabilities, in persuasive language appropriate for government contracting.`,
+      sections: [
+        {
+          key: 'executiveSummary',
+          title: 'Executive Summary',
+          instructions: `Write 2-3 detailed paragraphs explaining why ${companyName} is uniquely qualified for this RFP, highlighting specific certifications, experience, and competitive advantages.`,
+        },
+        {
+          key: 'companyOverview',
+          title: 'Company Overview',
+          instructions: `Write a comprehensive overview of ${companyName}'s business, including years of experience, key capabilities, certifications, and relevant project history.`,
+        },
+        {
+          key: 'qualifications',
+          title: 'Qualifications',
+          instructions: `Detail ${companyName}'s specific qualifications, certifications, past performance, and technical capabilities relevant to this RFP.`,
+        },
+        {
+          key: 'approach',
+          title: 'Technical Approach',
+          instructions: `Describe ${companyName}'s specific methodology and approach for completing this project, including phases, deliverables, and quality assurance.`,
+        },
+        {
+          key: 'timeline',
+          title: 'Timeline',
+          instructions:
+            'Provide a realistic project timeline with specific phases, milestones, and deliverables based on the RFP requirements.',
+        },
+      ],
+    };
+  }
+
+  /**
+   * Stream the text of a single section as the model writes it
+   */
+  async *streamSectionText(
+    prompt: Parameters<SectionTextStream>[0]
+  ): AsyncGenerator<string> {
+    const stream = await this.openaiClient.chat.completions.create({
+      model: OPENAI_MODEL,
+      messages: [
+        { role: 'system', content: prompt.system },
+        { role: 'user', content: prompt.user },
+      ],
+      temperature: 0.4,
+      max_completion_tokens: Math.min(this.MAX_COMPLETION_TOKENS, 1500),
+      stream: true,
+    });
+
+    for await (const chunk of stream) {
+      const delta = chunk.choices[0]?.delta?.content;
+      if (delta) yield delta;
+    }
+  }
+
+  /**
+   * Generate the structured parts of a proposal (certification narratives,
+   * compliance matrix, attachment list) that accompany the streamed
+   * narrative sections
+   */
+  async generateProposalSupplements(
+    analysis: RFPAnalysisResult,
+    companyMapping: CompanyDataMapping | DefaultCompanyMappingConfig,
+    rfpText: string,
+    options: LLMCacheOptions = {}
+  ): Promise<ProposalSupplements> {
+    const companyName = companyMapping.profile.companyName;
+    const prompt = `Prepare the supporting material for ${companyName}'s proposal in response to the following RFP.
+
+COMPANY INFORMATION:
+${this.formatCompanyInformation(companyMapping)}
+
+RFP DETAILS:
+${rfpText}
+
+REQUIREMENTS ANALYSIS:
+${JSON.stringify(analysis.requirements, null, 2)}
+
+Return a JSON object with the following structure:
+{
+  "certificationNarratives": ["[Array of detailed explanations for each relevant certification and its value to the government]"],
+  "complianceMatrix": [
+    {
+      "requirement": "[Specific requirement from the RFP]",
+      "response": "[Detailed explanation of how ${companyName} meets this requirement]",
+      "evidence": ["[Specific documents or certifications that support compliance]"]
+    }
+  ],
+  "attachmentRecommendations": ["[List of specific documents ${companyName} should attach to support the proposal]"]
+}
+
+${this.buildCompanyFacts(companyMapping)}`;
+
+    try {
+      return await llmResponseCache.getOrCompute(
+        {
+          operation: 'generate-proposal-content',
+          model: OPENAI_MODEL,
+          templateVersion: 'supplements-1',
+          input: [prompt],
+          bypassCache: options.bypassCache,
+        },
+        async () => {
+          const response = await this.openaiClient.chat.completions.create({
+            model: OPENAI_MODEL,
+            messages: [
+              {
+                role: 'system',
+                content:
+                  'You are an expert proposal writer for government contracting. Return only valid JSON that matches the requested schema.',
+              },
+              { role: 'user', content: prompt },
+            ],
+            temperature: 0.4,
+            max_completion_tokens: Math.min(this.MAX_COMPLETION_TOKENS, 3000),
+            response_format: { type: 'json_object' },
+          });
+
+          const contentText = response.choices[0]?.message?.content;
+          if (!contentText) {
+            throw new Error('No content generated from OpenAI');
+          }
+
+          const validated = ProposalSupplementsSchema.safeParse(
+            JSON.parse(contentText)
+          );
+          if (!validated.success) {
+            console.error(
+              'Invalid proposal supplements format from OpenAI:',
+              validated.error
+            );
+            throw new Error('Invalid proposal content format from AI service');
+          }
+
+          return {
+            value: validated.data,
+            tokens: response.usage?.total_tokens,
+          };
+        }
+      );
     } catch (error) {
-      console.error('Error generating proposal content:', error);
+      console.error('Error generating proposal supplements:', error);
       throw new Error(
         `Failed to generate proposal: ${
           error instanceof Error ? error.message : 'Unknown error'
@@ -7,11 +7,17 @@ import {
   type HumanOversightItem,
 } from '../processing/documentIntelligenceService';
 import { AIProposalService } from './ai-proposal-service';
+import {
+  proposalSectionStreamer,
+  settleFailedDraft,
+  type ProposalGenerationDraft,
+} from './proposalSectionStreamer';
 import { submissionMaterialsService } from '../processing/submissionMaterialsService';
 import { createDefaultCompanyMapping } from '../../config/defaultCompanyMapping';
 import type {
   RFP,
   CompanyProfile,
+  Proposal,
   SubmissionLifecycleData,
 } from '@shared/schema';
 
@@ -20,6 +26,8 @@ export interface ProposalGenerationRequest {
   companyProfileId?: string;
   generatePricing: boolean;
   autoSubmit: boolean;
+  /** Progress session to report section-by-section progress to */
+  sessionId?: string;
 }
 
 export interface AutoSubmissionResult {
@@ -105,50 +113,75 @@ export class EnhancedProposalService {
 
     await storage.updateRFP(request.rfpId, { progress: 60 });
 
-    // Step 3: Generate AI proposal content for narrative sections
-    console.log(`🤖 Generating AI proposal content...`);
-    const proposalContent = await this.generateNarrativeContent(
-      rfp,
-      documentAnalysis,
-      request.companyProfileId
-    );
-
-    await storage.updateRFP(request.rfpId, { progress: 80 });
-
-    // Step 4: Check if proposal already exists for this RFP (enforce 1:1 relationship)
+    // Step 3: Check if proposal already exists for this RFP (enforce 1:1 relationship).
+    // Sections are checkpointed into this row's generation draft while they
+    // are generated; its live content is only replaced once all succeed.
     const existingProposal = await storage.getProposalByRFP(request.rfpId);
+    const draftProposal =
+      existingProposal ??
+      (await storage.createProposal({
+        rfpId: request.rfpId,
+        content: {},
+        status: 'draft',
+      }));
 
-    const proposalData = {
-      rfpId: request.rfpId,
-      content: proposalContent,
-      forms: filledForms,
-      pricingTables: documentAnalysis.competitiveBidAnalysis
-        ? [
-            {
-              bidAmount:
-                documentAnalysis.competitiveBidAnalysis.suggestedBidAmount,
-              strategy: documentAnalysis.competitiveBidAnalysis.pricingStrategy,
-              confidence:
-                documentAnalysis.competitiveBidAnalysis.confidenceLevel,
-              research: documentAnalysis.competitiveBidAnalysis.marketResearch,
-            },
-          ]
-        : null,
-      estimatedMargin: documentAnalysis.competitiveBidAnalysis
-        ? (
-            ((documentAnalysis.competitiveBidAnalysis.suggestedBidAmount *
-              0.15) /
-              documentAnalysis.competitiveBidAnalysis.suggestedBidAmount) *
-            100
-          ).toString()
-        : null,
-      status: 'draft',
-    };
+    let proposal: Proposal;
+    try {
+      // Step 4: Generate AI proposal content for narrative sections
+      console.log(`🤖 Generating AI proposal content...`);
+      const proposalContent = await this.generateNarrativeContent(
+        rfp,
+        documentAnalysis,
+        request.companyProfileId,
+        {
+          proposalId: draftProposal.id,
+          existingDraft:
+            draftProposal.generationDraft as ProposalGenerationDraft | null,
+          sessionId: request.sessionId,
+        }
+      );
 
-    // Create or update proposal (enforce business rule: one proposal per RFP)
-    const proposal = existingProposal
-      ? await storage.updateProposal(existingProposal.id, proposalData)
-      : await storage.createProposal(proposalData);
+      await storage.updateRFP(request.rfpId, { progress: 80 });
+
+      const proposalData = {
+        rfpId: request.rfpId,
+        content: proposalContent,
+        forms: filledForms,
+        pricingTables: documentAnalysis.competitiveBidAnalysis
+          ? [
+              {
+                bidAmount:
+                  documentAnalysis.competitiveBidAnalysis.suggestedBidAmount,
+                strategy:
+                  documentAnalysis.competitiveBidAnalysis.pricingStrategy,
+                confidence:
+                  documentAnalysis.competitiveBidAnalysis.confidenceLevel,
+                research:
+                  documentAnalysis.competitiveBidAnalysis.marketResearch,
+              },
+            ]
+          : null,
+        estimatedMargin: documentAnalysis.competitiveBidAnalysis
+          ? (
+              ((documentAnalysis.competitiveBidAnalysis.suggestedBidAmount *
+                0.15) /
+                documentAnalysis.competitiveBidAnalysis.suggestedBidAmount) *
+              100
+            ).toString()
+          : null,
+        status: 'draft',
+        generationDraft: null,
+      };
+
+      // Store the finished proposal over the draft (one proposal per RFP)
+      proposal = await storage.updateProposal(draftProposal.id, proposalData);
+    } catch (error) {
+      // Keep the draft this run created only if a retry can resume it
+      if (!existingProposal) {
+        await settleFailedDraft(draftProposal.id);
+      }
+      throw error;
+    }
 
     // Step 5: Create audit log
     await storage.createAuditLog({
@@ -496,12 +529,19 @@ export class EnhancedProposalService {
   }
 
   /**
-   * Generate narrative proposal content using AI
+   * Generate narrative proposal content using AI. Sections are streamed into
+   * the draft proposal so the proposals page shows them as they are written
+   * and an interrupted run resumes after the last completed section.
    */
   private async generateNarrativeContent(
     rfp: RFP,
     documentAnalysis: DocumentAnalysisResult,
-    companyProfileId?: string
+    companyProfileId: string | undefined,
+    draft: {
+      proposalId: string;
+      existingDraft: ProposalGenerationDraft | null;
+      sessionId?: string;
+    }
   ): Promise<any> {
     console.log(`📝 Generating narrative content for ${rfp.title}...`);
 
@@ -539,7 +579,7 @@ export class EnhancedProposalService {
       const aiAnalysis =
         await this.aiProposalService.analyzeRFPDocument(rfpText);
 
-      let proposalContent;
+      let companyMapping;
       if (companyProfile) {
         // Get additional company data for mapping
         const certifications = await storage.getCompanyCertifications(
@@ -548,7 +588,7 @@ export class EnhancedProposalService {
         const insurance = await storage.getCompanyInsurance(companyProfile.id);
         const contacts = await storage.getCompanyContacts(companyProfile.id);
 
-        const companyMapping =
+        companyMapping =
           await this.aiProposalService.mapCompanyDataToRequirements(
             aiAnalysis,
             companyProfile,
@@ -556,20 +596,34 @@ export class EnhancedProposalService {
             insurance,
             contacts
           );
-        proposalContent = await this.aiProposalService.generateProposalContent(
+      } else {
+        // Use shared default company mapping from config
+        companyMapping = createDefaultCompanyMapping();
+      }
+
+      const { systemPrompt, contextPrompt, sections } =
+        this.aiProposalService.buildNarrativeSectionPrompts(
           aiAnalysis,
           companyMapping,
           rfpText
         );
-      } else {
-        // Use shared default company mapping from config
-        const defaultMapping = createDefaultCompanyMapping();
-        proposalContent = await this.aiProposalService.generateProposalContent(
+      const narrativeSections = await proposalSectionStreamer.streamSections({
+        proposalId: draft.proposalId,
+        rfpId: rfp.id,
+        sessionId: draft.sessionId,
+        systemPrompt,
+        contextPrompt,
+        sections,
+        existingDraft: draft.existingDraft,
+        stream: prompt => this.aiProposalService.streamSectionText(prompt),
+      });
+      const supplements =
+        await this.aiProposalService.generateProposalSupplements(
           aiAnalysis,
-          defaultMapping,
+          companyMapping,
           rfpText
         );
-      }
+      const proposalContent = { ...narrativeSections, ...supplements };
 
       return {
         ...proposalContent,
@@ -594,13 +648,30 @@ export class EnhancedProposalService {
         captureException(error);
       });
 
+      // Sections checkpointed into the generation draft before the failure
+      // are kept
+      const checkpointed: Record<string, string> = await storage
+        .getProposal(draft.proposalId)
+        .then(
+          proposal =>
+            (proposal?.generationDraft as ProposalGenerationDraft | null)
+              ?.sections ?? {}
+        )
+        .catch(() => ({}));
+
       // Return basic content if AI fails
       return {
-        executiveSummary: `iByte Enterprises LLC is pleased to submit our proposal for ${rfp.title}.`,
+        ...checkpointed,
+        executiveSummary:
+          checkpointed.executiveSummary ??
+          `iByte Enterprises LLC is pleased to submit our proposal for ${rfp.title}.`,
         technicalApproach:
           'We will provide comprehensive services as outlined in the RFP requirements.',
-        timeline: 'Project timeline will be established upon contract award.',
+        timeline:
+          checkpointed.timeline ??
+          'Project timeline will be established upon contract award.',
         qualifications:
+          checkpointed.qualifications ??
           'iByte Enterprises LLC is a certified woman-owned business with extensive experience in construction and technology services.',
         analysisContext,
         generatedAt: new Date().toISOString(),
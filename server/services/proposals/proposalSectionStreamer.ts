@@ -0,0 +1,334 @@
+import { createHash } from 'crypto';
+import { storage } from '../../storage';
+import { logger } from '../../utils/logger';
+import { websocketService } from '../core/websocketService';
+import { progressTracker } from '../monitoring/progressTracker';
+
+const log = logger.child({ service: 'ProposalSectionStreamer' });
+
+export interface ProposalSectionSpec {
+  /** Key the section text is stored under in proposals.content */
+  key: string;
+  title: string;
+  instructions: string;
+}
+
+/**
+ * Produces the text of one section as it is generated
+ */
+export type SectionTextStream = (prompt: {
+  system: string;
+  user: string;
+}) => AsyncIterable<string>;
+
+/**
+ * Kept in proposals.generation_draft while sections are being written, so
+ * an interrupted run can tell which sections are already final. The live
+ * proposals.content is left alone until the caller stores the finished
+ * sections.
+ */
+export interface ProposalGenerationDraft {
+  status: 'generating' | 'completed';
+  inputHash: string;
+  completedSections: string[];
+  currentSection?: string;
+  /** Section text keyed by section key, including partial text */
+  sections: Record<string, string>;
+  updatedAt: string;
+}
+
+export interface ProposalSectionEvent {
+  proposalId: string;
+  rfpId: string;
+  section: string;
+  title: string;
+  status: 'streaming' | 'completed';
+  /** Text added since the previous event for this section */
+  delta: string;
+  /** Full section text so far */
+  text: string;
+  sectionIndex: number;
+  sectionCount: number;
+}
+
+export interface StreamSectionsRequest {
+  proposalId: string;
+  rfpId: string;
+  /** Progress session to report section progress to, if any */
+  sessionId?: string;
+  systemPrompt: string;
+  /** Shared RFP and company context included in every section prompt */
+  contextPrompt: string;
+  sections: ProposalSectionSpec[];
+  /** Current proposals.generation_draft, resumed when it matches */
+  existingDraft?: ProposalGenerationDraft | null;
+  stream: SectionTextStream;
+}
+
+export interface ProposalSectionStreamerOptions {
+  /** How often partial section text is written to the proposal row */
+  checkpointIntervalMs?: number;
+  /** How often live deltas are pushed to clients */
+  publishIntervalMs?: number;
+  persist?: (
+    proposalId: string,
+    draft: ProposalGenerationDraft
+  ) => Promise<void>;
+  publish?: (event: ProposalSectionEvent) => void;
+  reportProgress?: (sessionId: string, message: string) => void;
+}
+
+/**
+ * Streams proposal sections one at a time.
+ *
+ * Tokens are pushed to the proposals WebSocket channel as they arrive and
+ * the partial section is checkpointed to the proposal's generation draft at
+ * intervals, so the page shows text within seconds and a failure keeps what
+ * was written. A section is marked completed in the draft once it is final;
+ * a later run with the same inputs skips completed sections and rewrites
+ * only the one that was interrupted.
+ */
+export class ProposalSectionStreamer {
+  private readonly checkpointIntervalMs: number;
+  private readonly publishIntervalMs: number;
+  private readonly persist: NonNullable<
+    ProposalSectionStreamerOptions['persist']
+  >;
+  private readonly publish: NonNullable<
+    ProposalSectionStreamerOptions['publish']
+  >;
+  private readonly reportProgress: NonNullable<
+    ProposalSectionStreamerOptions['reportProgress']
+  >;
+
+  constructor(options: ProposalSectionStreamerOptions = {}) {
+    this.checkpointIntervalMs = options.checkpointIntervalMs ?? 2000;
+    this.publishIntervalMs = options.publishIntervalMs ?? 250;
+    this.persist =
+      options.persist ??
+      (async (proposalId, generationDraft) => {
+        await storage.updateProposal(proposalId, { generationDraft });
+      });
+    this.publish =
+      options.publish ??
+      (event => websocketService.notifyProposalSection(event));
+    this.reportProgress =
+      options.reportProgress ??
+      ((sessionId, message) =>
+        progressTracker.updateStep(
+          sessionId,
+          'content_generation',
+          'in_progress',
+          message
+        ));
+  }
+
+  /**
+   * Write every section, resuming after the last completed one when the
+   * proposal holds an interrupted run over the same inputs. Returns the
+   * section texts keyed by section key.
+   */
+  async streamSections(
+    request: StreamSectionsRequest
+  ): Promise<Record<string, string>> {
+    const { proposalId, rfpId, sections } = request;
+    const inputHash = hashSectionInputs(request);
+    const resumed = resumableSections(request.existingDraft, inputHash, sections);
+    const texts: Record<string, string> = {};
+    for (const key of resumed) {
+      texts[key] = request.existingDraft!.sections[key];
+    }
+
+    if (resumed.length > 0) {
+      log.info('Resuming proposal generation', {
+        proposalId,
+        completedSections: resumed,
+      });
+    }
+
+    const draft: ProposalGenerationDraft = {
+      status: 'generating',
+      inputHash,
+      completedSections: [...resumed],
+      sections: { ...texts },
+      updatedAt: new Date().toISOString(),
+    };
+
+    for (const [index, section] of sections.entries()) {
+      if (draft.completedSections.includes(section.key)) continue;
+
+      draft.currentSection = section.key;
+      if (request.sessionId) {
+        this.reportProgress(
+          request.sessionId,
+          `Writing ${section.title} (${index + 1}/${sections.length})`
+        );
+      }
+
+      const text = await this.streamSection(request, section, index, draft);
+      texts[section.key] = text;
+      draft.sections[section.key] = text;
+      draft.completedSections.push(section.key);
+      draft.currentSection = undefined;
+      await this.checkpoint(proposalId, draft);
+
+      this.publish({
+        proposalId,
+        rfpId,
+        section: section.key,
+        title: section.title,
+        status: 'completed',
+        delta: '',
+        text,
+        sectionIndex: index,
+        sectionCount: sections.length,
+      });
+    }
+
+    draft.status = 'completed';
+    await this.checkpoint(proposalId, draft);
+    return texts;
+  }
+
+  private async streamSection(
+    request: StreamSectionsRequest,
+    section: ProposalSectionSpec,
+    index: number,
+    draft: ProposalGenerationDraft
+  ): Promise<string> {
+    const { proposalId, rfpId } = request;
+    let text = '';
+    let published = 0;
+    let lastPublishAt = 0;
+    let lastCheckpointAt = Date.now();
+    let checkpointing: Promise<void> | null = null;
+
+    const stream = request.stream({
+      system: request.systemPrompt,
+      user: [
+        request.contextPrompt,
+        `SECTION: ${section.title}\n${section.instructions}`,
+        'Write only this section as plain prose. Do not repeat the section title and do not return JSON.',
+      ].join('\n\n'),
+    });
+
+    for await (const delta of stream) {
+      text += delta;
+      const now = Date.now();
+
+      // The first tokens go out immediately; later ones are batched
+      if (published === 0 || now - lastPublishAt >= this.publishIntervalMs) {
+        this.publish({
+          proposalId,
+          rfpId,
+          section: section.key,
+          title: section.title,
+          status: 'streaming',
+          delta: text.slice(published),
+          text,
+          sectionIndex: index,
+          sectionCount: request.sections.length,
+        });
+        published = text.length;
+        lastPublishAt = now;
+      }
+
+      // Never more than one checkpoint write in flight
+      if (
+        !checkpointing &&
+        now - lastCheckpointAt >= this.checkpointIntervalMs
+      ) {
+        lastCheckpointAt = now;
+        checkpointing = this.checkpoint(proposalId, {
+          ...draft,
+          sections: { ...draft.sections, [section.key]: text },
+        }).finally(() => {
+          checkpointing = null;
+        });
+      }
+    }
+
+    await checkpointing;
+    return text.trim();
+  }
+
+  private async checkpoint(
+    proposalId: string,
+    draft: ProposalGenerationDraft
+  ): Promise<void> {
+    draft.updatedAt = new Date().toISOString();
+    try {
+      await this.persist(proposalId, {
+        ...draft,
+        completedSections: [...draft.completedSections],
+        sections: { ...draft.sections },
+        updatedAt: draft.updatedAt,
+      });
+    } catch (error) {
+      // Losing a checkpoint only costs resumability; keep generating
+      log.warn('Failed to checkpoint proposal sections', {
+        proposalId,
+        error: (error as Error).message,
+      });
+    }
+  }
+}
+
+function hashSectionInputs(request: StreamSectionsRequest): string {
+  return createHash('sha256')
+    .update(
+      JSON.stringify([
+        request.systemPrompt,
+        request.contextPrompt,
+        request.sections.map(section => [section.key, section.instructions]),
+      ])
+    )
+    .digest('hex');
+}
+
+// Sections finished by an interrupted run over the same inputs
+function resumableSections(
+  draft: ProposalGenerationDraft | null | undefined,
+  inputHash: string,
+  sections: ProposalSectionSpec[]
+): string[] {
+  if (draft?.status !== 'generating' || draft.inputHash !== inputHash) {
+    return [];
+  }
+  return sections
+    .map(section => section.key)
+    .filter(
+      key =>
+        draft.completedSections.includes(key) &&
+        typeof draft.sections?.[key] === 'string'
+    );
+}
+
+function hasCompletedSections(draft: unknown): boolean {
+  const completed = (draft as ProposalGenerationDraft | null)?.completedSections;
+  return Array.isArray(completed) && completed.length > 0;
+}
+
+/**
+ * Settle the proposal a failed generation run created. One holding finished
+ * sections is kept for a retry to resume, hidden behind the
+ * generation_failed status; an empty one is deleted.
+ */
+export async function settleFailedDraft(proposalId: string): Promise<void> {
+  try {
+    const proposal = await storage.getProposal(proposalId);
+    if (!proposal) return;
+    if (hasCompletedSections(proposal.generationDraft)) {
+      await storage.updateProposal(proposalId, { status: 'generation_failed' });
+    } else {
+      await storage.deleteProposal(proposalId);
+    }
+  } catch (error) {
+    log.warn('Failed to settle failed proposal draft', {
+      proposalId,
+      error: (error as Error).message,
+    });
+  }
+}
+
+export const proposalSectionStreamer = new ProposalSectionStreamer();
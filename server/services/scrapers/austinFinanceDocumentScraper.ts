@@ -215,13 +215,9 @@ export class AustinFinanceDocumentScraper {
       console.error('❌ Error during document scraping:', error);
       throw error;
     } finally {
-      // Clean up browser session to prevent resource leaks
-      try {
-        await sessionManager.closeSession(this.sessionId);
-        console.log(`🧹 Cleaned up session: ${this.sessionId}`);
-      } catch (cleanupError) {
-        console.warn('⚠️ Session cleanup warning:', cleanupError);
-      }
+      // Return the browser session to the pool for the next download
+      sessionManager.releaseSession(this.sessionId);
+      console.log(`🧹 Released session: ${this.sessionId}`);
     }
   }
 
@@ -553,8 +553,8 @@ export class MastraScrapingService {
         );
 
         // Fallback: use Browserbase content scraping directly
+        const sessionId = `rescrape-${Date.now()}`;
         try {
-          const sessionId = `rescrape-${Date.now()}`;
           const content = await this.scrapeBrowserbaseContent(
             url,
             sessionId,
@@ -581,6 +581,9 @@ export class MastraScrapingService {
             message: `Both primary and fallback scraping failed`,
             documentsCount: 0,
           };
+        } finally {
+          // Return the browser to the pool for the next scrape
+          sessionManager.releaseSession(sessionId);
         }
       }
 
@@ -852,6 +855,7 @@ export class MastraScrapingService {
         console.log(
           `🔄 Agent returned no opportunities, calling unified Browserbase scrape directly for ${portal.name}`
         );
+        const directScrapeSessionId = `portal-${portal.id}-${Date.now()}`;
         try {
           console.log(
             `🔄 Calling unifiedBrowserbaseWebScrape for ${portal.name}...`
@@ -866,7 +870,7 @@ export class MastraScrapingService {
                 }
               : undefined,
             portalType: portal.name.toLowerCase(),
-            sessionId: `portal-${portal.id}-${Date.now()}`,
+            sessionId: directScrapeSessionId,
             searchFilter: searchFilter,
           });
 
@@ -901,6 +905,8 @@ export class MastraScrapingService {
             `Direct scrape failed for ${portal.name}:`,
             directScrapeError
           );
+        } finally {
+          sessionManager.releaseSession(directScrapeSessionId);
         }
       }
 
@@ -1256,6 +1262,8 @@ Use your specialized knowledge of this portal type to navigate efficiently and e
     context: UnifiedScrapeContext
   ): Promise<UnifiedScrapeResult> {
     return await this.requestLimiter(async () => {
+      // Browser sessions opened for this scrape, returned to the pool at the end
+      const browserSessionIds: string[] = [];
       try {
         const { url, loginRequired, credentials, searchFilter } = context;
 
@@ -1298,6 +1306,12 @@ Use your specialized knowledge of this portal type to navigate efficiently and e
             portalType: portalType || 'generic',
           });
 
+          if (
+            sessionData.sessionId &&
+            sessionData.method === 'browser_authentication'
+          ) {
+            browserSessionIds.push(sessionData.sessionId);
+          }
           if (!sessionData.authenticated) {
             throw new Error(`Authentication failed for ${url}`);
           }
@@ -1315,6 +1329,7 @@ Use your specialized knowledge of this portal type to navigate efficiently and e
             `🌐 Austin Finance detected: Using enhanced Browserbase scraping`
           );
           const sessionId = `austin-finance-${Date.now()}`;
+          browserSessionIds.push(sessionId);
           html = await this.scrapeBrowserbaseContent(
             url,
             sessionId,
@@ -1347,6 +1362,7 @@ Use your specialized knowledge of this portal type to navigate efficiently and e
           // HTTP with undici can hang indefinitely on response.body.text() for certain portals
           console.log(`🌐 Using Browserbase for reliable portal scraping`);
           const sessionId = `scrape-${Date.now()}`;
+          browserSessionIds.push(sessionId);
           html = await this.scrapeBrowserbaseContent(
             url,
             sessionId,
@@ -1567,6 +1583,10 @@ Use your specialized knowledge of this portal type to navigate efficiently and e
           error: error instanceof Error ? error.message : String(error),
           portalType: context.portalType,
         };
+      } finally {
+        for (const sessionId of browserSessionIds) {
+          sessionManager.releaseSession(sessionId);
+        }
       }
     });
   }
@@ -3829,12 +3849,13 @@ Use your specialized knowledge of this portal type to navigate efficiently and e
   private async handleBrowserAuthentication(context: any): Promise<any> {
     const { loginUrl, targetUrl, username, password, portal } = context;
 
+    // Generate a unique session ID for this portal. On success the caller
+    // owns it and must release it; on failure it goes straight back.
+    const sessionId = `portal_${portal?.id || 'unknown'}_${Date.now()}`;
+
     try {
       console.log(`🌐 Starting browser authentication for ${loginUrl}`);
 
-      // Generate a unique session ID for this portal
-      const sessionId = `portal_${portal?.id || 'unknown'}_${Date.now()}`;
-
       // Perform browser authentication using Stagehand
       const authResult = await performBrowserAuthentication(
         loginUrl,
@@ -3858,6 +3879,7 @@ Use your specialized knowledge of this portal type to navigate efficiently and e
         };
       } else {
         console.log(`❌ Browser authentication failed for ${loginUrl}`);
+        sessionManager.releaseSession(sessionId);
 
         return {
           authenticated: false,
@@ -3868,6 +3890,7 @@ Use your specialized knowledge of this portal type to navigate efficiently and e
       }
     } catch (error: any) {
       console.error(`Browser authentication error for ${loginUrl}:`, error);
+      sessionManager.releaseSession(sessionId);
 
       return {
         authenticated: false,
@@ -1,5 +1,6 @@
 import { Stagehand } from '@browserbasehq/stagehand';
 import { ObjectStorageService, objectStorageClient } from '../../objectStorage';
+import { documentContentStore } from '../downloads/documentContentStore';
 
 /**
  * Default timeout for Stagehand operations (observe, extract, act)
@@ -36,6 +37,7 @@ export interface PhiladelphiaDocument {
   name: string;
   url?: string;
   storagePath?: string;
+  contentHash?: string;
   downloadStatus?: 'pending' | 'downloading' | 'completed' | 'failed';
   error?: string;
 }
@@ -662,21 +664,28 @@ export class PhiladelphiaDocumentDownloader {
           try {
             console.log(`📤 Uploading ${doc.name} to object storage...`);
 
-            // Generate unique filename with proper content type
-            const timestamp = Date.now();
+            // Stored by content hash; addenda captured on an earlier scan
+            // are not uploaded again
             const fileExt = this.getFileExtension(
               doc.name,
               capturedFile.contentType
             );
-            const fileName = `rfp-${rfpId}-${timestamp}-${doc.name}${fileExt}`;
-
-            // Upload file buffer to storage
-            const storagePath = await this.uploadBufferToStorage(
+            const stored = await documentContentStore.ingestBuffer(
               capturedFile.buffer,
-              rfpId,
-              fileName,
-              capturedFile.contentType
+              {
+                fileName: `${doc.name}${fileExt}`,
+                contentType: capturedFile.contentType,
+              }
             );
+            const storagePath = stored.storagePath;
+            doc.contentHash = stored.contentHash;
+
+            if (stored.deduplicated) {
+              doc.storagePath = storagePath;
+              actuallyStoredCount++;
+              console.log(`♻️ Reusing stored copy of: ${doc.name}`);
+              continue;
+            }
 
             // Verify upload success with retry logic for eventual consistency
             const maxVerifyAttempts = 3;
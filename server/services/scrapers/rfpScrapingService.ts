@@ -266,12 +266,26 @@ export class RFPScrapingService {
             // Process each downloaded document
             for (const result of downloadResults) {
               if (result.downloadStatus === 'completed' && result.storagePath) {
+                // Repeat scans find the same addendum already on the RFP
+                const existingDoc = result.contentHash
+                  ? await storage.getDocumentByContentHash(
+                      rfpId,
+                      result.contentHash
+                    )
+                  : undefined;
+                if (existingDoc) {
+                  savedDocuments.push(existingDoc);
+                  console.log(`♻️ Document already saved: ${result.name}`);
+                  continue;
+                }
+
                 // Save document record to database using storage interface
                 const newDoc = await storage.createDocument({
                   rfpId,
                   filename: result.name,
                   fileType: result.storagePath.split('.').pop() || 'pdf',
                   objectPath: result.storagePath,
+                  contentHash: result.contentHash,
                   extractedText: null,
                   parsedData: {
                     downloadUrl: url,
@@ -1,6 +1,8 @@
 import axios from 'axios';
+import type { Readable } from 'stream';
 import { logger } from '../../utils/logger';
-import { ObjectStorageService, objectStorageClient } from '../../objectStorage';
+import { objectStorageClient } from '../../objectStorage';
+import { documentContentStore } from '../downloads/documentContentStore';
 
 /**
  * SAM.gov Document Download Result
@@ -13,6 +15,7 @@ export interface SAMGovDocument {
   error?: string;
   fileType?: string;
   size?: number;
+  contentHash?: string;
 }
 
 /**
@@ -25,11 +28,10 @@ export interface SAMGovDocument {
  */
 export class SAMGovDocumentDownloader {
   private readonly SAM_BASE_URL = 'https://api.sam.gov/opportunities/v2';
-  private objectStorage: ObjectStorageService;
+  private readonly MAX_FILE_SIZE = 100 * 1024 * 1024; // 100MB max
   private apiKey: string;
 
   constructor() {
-    this.objectStorage = new ObjectStorageService();
     this.validateEnvironment();
     this.apiKey = process.env.SAM_GOV_API_KEY as string;
   }
@@ -111,31 +113,34 @@ export class SAMGovDocumentDownloader {
 
           doc.downloadStatus = 'downloading';
 
-          // Download the file
-          const fileBuffer = await this.downloadFile(
+          // Stream the file into content-addressed storage; attachments
+          // already stored by an earlier scan are not uploaded again
+          const fileStream = await this.downloadFile(
             attachment.url,
             effectiveApiKey
           );
-
-          // Upload to object storage
-          const storagePath = await this.uploadBufferToStorage(
-            fileBuffer,
-            rfpId,
-            attachment.name,
-            attachment.fileType
-          );
+          const stored = await documentContentStore.ingestStream(fileStream, {
+            fileName: attachment.name,
+            contentType: attachment.fileType,
+            maxBytes: this.MAX_FILE_SIZE,
+          });
 
           // Verify upload
-          const verified = await this.verifyFileExists(storagePath);
+          const verified =
+            stored.deduplicated ||
+            (await this.verifyFileExists(stored.storagePath));
 
           if (verified) {
-            doc.storagePath = storagePath;
+            doc.storagePath = stored.storagePath;
+            doc.contentHash = stored.contentHash;
+            doc.size = stored.size;
             doc.downloadStatus = 'completed';
 
             logger.info('Successfully downloaded and stored attachment', {
               name: attachment.name,
-              size: fileBuffer.length,
-              storagePath,
+              size: stored.size,
+              storagePath: stored.storagePath,
+              deduplicated: stored.deduplicated,
             });
           } else {
             throw new Error('Upload verification failed');
@@ -299,9 +304,9 @@ export class SAMGovDocumentDownloader {
    *
    * @param url - File download URL
    * @param apiKey - SAM.gov API key
-   * @returns File buffer
+   * @returns Response body stream
    */
-  private async downloadFile(url: string, apiKey: string): Promise<Buffer> {
+  private async downloadFile(url: string, apiKey: string): Promise<Readable> {
     try {
       const response = await axios.get(url, {
         headers: {
@@ -309,9 +314,9 @@ export class SAMGovDocumentDownloader {
           'User-Agent':
             'RFPAgent/2.0 (Government RFP Management System; Contact: support@rfpagent.com)',
         },
-        responseType: 'arraybuffer',
+        responseType: 'stream',
         timeout: 60000, // 60 seconds for file download
-        maxContentLength: 100 * 1024 * 1024, // 100MB max
+        maxContentLength: this.MAX_FILE_SIZE,
       });
 
       if (response.status !== 200) {
@@ -320,7 +325,7 @@ export class SAMGovDocumentDownloader {
         );
       }
 
-      return Buffer.from(response.data);
+      return response.data;
     } catch (error: any) {
       if (error.response) {
         throw new Error(
@@ -334,74 +339,6 @@ export class SAMGovDocumentDownloader {
     }
   }
 
-  /**
-   * Upload file buffer to object storage
-   *
-   * @param fileBuffer - File data
-   * @param rfpId - RFP ID for organization
-   * @param fileName - Original filename
-   * @param contentType - MIME type
-   * @returns Storage path (public URL)
-   */
-  private async uploadBufferToStorage(
-    fileBuffer: Buffer,
-    rfpId: string,
-    fileName: string,
-    contentType: string = 'application/pdf'
-  ): Promise<string> {
-    try {
-      // Get the private directory for uploads
-      const privateDir = this.objectStorage.getPrivateObjectDir();
-      const bucketName = privateDir.split('/')[0];
-
-      // Sanitize filename
-      const safeFileName = fileName.replace(/[^a-zA-Z0-9._-]/g, '_');
-      const timestamp = Date.now();
-      const uniqueFileName = `${timestamp}-${safeFileName}`;
-      const objectPath = `rfp_documents/${rfpId}/${uniqueFileName}`;
-
-      // Get bucket reference
-      const bucket = objectStorageClient.bucket(bucketName);
-      const file = bucket.file(objectPath);
-
-      // Fallback for missing/unknown MIME types
-      const safeContentType = contentType || 'application/octet-stream';
-
-      // Upload buffer directly
-      await file.save(fileBuffer, {
-        metadata: {
-          contentType: safeContentType,
-          metadata: {
-            rfpId: rfpId,
-            originalFileName: fileName,
-            uploadedAt: new Date().toISOString(),
-            source: 'sam.gov',
-          },
-        },
-      });
-
-      // Generate public URL
-      const publicUrl = `https://storage.googleapis.com/${bucketName}/${objectPath}`;
-
-      logger.info('Uploaded file to object storage', {
-        fileName: safeFileName,
-        size: fileBuffer.length,
-        contentType: safeContentType,
-        storagePath: publicUrl,
-      });
-
-      return publicUrl;
-    } catch (error: any) {
-      logger.error('Failed to upload file to storage', error, {
-        fileName,
-        size: fileBuffer.length,
-      });
-      throw new Error(
-        `Storage upload failed: ${error.message || 'Unknown error'}`
-      );
-    }
-  }
-
   /**
    * Verify file exists in object storage
    *
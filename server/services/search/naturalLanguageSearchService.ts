@@ -3,7 +3,9 @@ import { z } from 'zod';
 import type { IStorage } from '../../storage';
 import { logger } from '../../utils/logger';
 import { circuitBreakerManager } from '../../utils/circuitBreaker';
+import { TieredResponseCache } from '../core/tieredResponseCache';
 import {
+  type SearchCountMode,
   type SearchFilters,
   SearchFiltersSchema,
   COMMON_NAICS_CODES,
@@ -25,15 +27,34 @@ const AIQueryParseResponseSchema = z.object({
 
 type AIQueryParseResponse = z.infer<typeof AIQueryParseResponseSchema>;
 
+/**
+ * Normalize a query so trivially different phrasings share a cache entry
+ */
+export function normalizeSearchQuery(query: string): string {
+  return query
+    .normalize('NFKC')
+    .toLowerCase()
+    .replace(/\s+/g, ' ')
+    .replace(/^["'\s]+|["'?.!\s]+$/g, '');
+}
+
 export class NaturalLanguageSearchService {
   private openai: OpenAI;
   private circuitBreaker;
+  private parseCache: TieredResponseCache<AIQueryParseResponse>;
 
   constructor(private storage: IStorage) {
     this.openai = new OpenAI({
       apiKey: process.env.OPENAI_API_KEY,
     });
 
+    this.parseCache = new TieredResponseCache(storage, {
+      namespace: 'nl-search-parse',
+      maxSize: Number(process.env.NL_SEARCH_CACHE_SIZE) || 500,
+      ttlMs: Number(process.env.NL_SEARCH_CACHE_TTL_MS) || 24 * 60 * 60 * 1000,
+      parse: value => AIQueryParseResponseSchema.parse(value),
+    });
+
     this.circuitBreaker = circuitBreakerManager.getBreaker('nl-search', {
       failureThreshold: 3,
       successThreshold: 2,
@@ -45,13 +66,28 @@ export class NaturalLanguageSearchService {
    * Parse a natural language query into structured search filters
    */
   async parseQuery(query: string): Promise<AIQueryParseResponse> {
+    const model = process.env.OPENAI_MODEL || 'gpt-4o';
+    // Relative dates ("next month") resolve against today, so key on the date
+    const today = new Date().toISOString().split('T')[0];
+    const cacheKey = this.parseCache.key(
+      model,
+      today,
+      normalizeSearchQuery(query)
+    );
+
+    const cached = await this.parseCache.get(cacheKey);
+    if (cached) {
+      log.debug('Query parse cache hit', { query });
+      return cached;
+    }
+
     const systemPrompt = this.buildSystemPrompt();
     const userPrompt = this.buildUserPrompt(query);
 
     try {
       const response = await this.circuitBreaker.execute(async () => {
         return this.openai.chat.completions.create({
-          model: process.env.OPENAI_MODEL || 'gpt-4o',
+          model,
           messages: [
             { role: 'system', content: systemPrompt },
             { role: 'user', content: userPrompt },
@@ -78,6 +114,9 @@ export class NaturalLanguageSearchService {
         confidence: validated.confidence,
       });
 
+      // Only successful parses are cached; fallbacks below are not
+      await this.parseCache.set(cacheKey, validated);
+
       return validated;
     } catch (error) {
       log.error('Failed to parse natural language query', error as Error, {
@@ -100,172 +139,45 @@ export class NaturalLanguageSearchService {
    */
   async search(
     query: string,
-    options: { limit?: number; offset?: number } = {}
+    options: {
+      limit?: number;
+      offset?: number;
+      cursor?: string;
+      countMode?: SearchCountMode;
+    } = {}
   ): Promise<{
     rfps: any[];
-    totalCount: number;
+    totalCount: number | null;
+    totalCountEstimated: boolean;
+    nextCursor: string | null;
     appliedFilters: SearchFilters;
     explanation: string;
     suggestions?: string[];
   }> {
-    const { limit = 20, offset = 0 } = options;
+    const { limit = 20, offset = 0, cursor, countMode = 'exact' } = options;
 
     // Step 1: Parse the natural language query
     const parseResult = await this.parseQuery(query);
 
-    // Step 2: Build database query from filters
-    const rfps = await this.executeSearch(parseResult.filters, limit, offset);
-
-    // Step 3: Get total count for pagination
-    const totalCount = await this.getSearchCount(parseResult.filters);
+    // Step 2: Fetch the page and total count from the same compiled predicate
+    const result = await this.storage.searchRFPs(parseResult.filters, {
+      limit,
+      offset,
+      cursor,
+      countMode,
+    });
 
     return {
-      rfps,
-      totalCount,
+      rfps: result.rfps,
+      totalCount: result.total,
+      totalCountEstimated: result.totalIsEstimate,
+      nextCursor: result.nextCursor,
       appliedFilters: parseResult.filters,
       explanation: parseResult.explanation,
       suggestions: parseResult.suggestions,
     };
   }
 
-  /**
-   * Execute the search with structured filters
-   */
-  private async executeSearch(
-    filters: SearchFilters,
-    limit: number,
-    offset: number
-  ): Promise<any[]> {
-    // Build query parameters for storage layer
-    const queryParams: {
-      limit: number;
-      offset: number;
-      status?: string;
-    } = {
-      limit: 500, // Fetch more to filter in memory
-      offset: 0,
-    };
-
-    // Apply filters
-    if (filters.statuses?.length === 1) {
-      queryParams.status = filters.statuses[0];
-    }
-
-    // Get all RFPs with basic filtering
-    const result = await this.storage.getAllRFPs(queryParams);
-    let rfps = result.rfps;
-
-    // Apply additional filters in memory (until we optimize with SQL)
-    rfps = this.applyFiltersInMemory(rfps, filters);
-
-    // Apply pagination after in-memory filtering
-    return rfps.slice(offset, offset + limit);
-  }
-
-  /**
-   * Apply filters that aren't yet supported in the database layer
-   */
-  private applyFiltersInMemory(rfps: any[], filters: SearchFilters): any[] {
-    let filtered = [...rfps];
-
-    // Keyword search in title and description
-    if (filters.keywords?.length) {
-      const keywords = filters.keywords.map(k => k.toLowerCase());
-      filtered = filtered.filter(rfp => {
-        const searchText =
-          `${rfp.title} ${rfp.description || ''} ${rfp.agency}`.toLowerCase();
-        return keywords.some(kw => searchText.includes(kw));
-      });
-    }
-
-    // Title search
-    if (filters.titleSearch) {
-      const search = filters.titleSearch.toLowerCase();
-      filtered = filtered.filter(rfp =>
-        rfp.title.toLowerCase().includes(search)
-      );
-    }
-
-    // Agency filter
-    if (filters.agencies?.length) {
-      const agencies = filters.agencies.map(a => a.toLowerCase());
-      filtered = filtered.filter(rfp =>
-        agencies.some(a => rfp.agency.toLowerCase().includes(a))
-      );
-    }
-
-    // State filter
-    if (filters.states?.length) {
-      filtered = filtered.filter(
-        rfp => rfp.state && filters.states!.includes(rfp.state)
-      );
-    }
-
-    // NAICS code filter
-    if (filters.naicsCodes?.length) {
-      filtered = filtered.filter(
-        rfp =>
-          rfp.naicsCode &&
-          filters.naicsCodes!.some(code => rfp.naicsCode.startsWith(code))
-      );
-    }
-
-    // Set-aside type filter
-    if (filters.setAsideTypes?.length) {
-      const setAsides = filters.setAsideTypes.map(s => s.toUpperCase());
-      filtered = filtered.filter(
-        rfp =>
-          rfp.setAsideType && setAsides.includes(rfp.setAsideType.toUpperCase())
-      );
-    }
-
-    // Deadline filters
-    if (filters.deadlineAfter) {
-      const afterDate = new Date(filters.deadlineAfter);
-      filtered = filtered.filter(
-        rfp => rfp.deadline && new Date(rfp.deadline) >= afterDate
-      );
-    }
-    if (filters.deadlineBefore) {
-      const beforeDate = new Date(filters.deadlineBefore);
-      filtered = filtered.filter(
-        rfp => rfp.deadline && new Date(rfp.deadline) <= beforeDate
-      );
-    }
-
-    // Value range filters
-    if (filters.minValue !== undefined) {
-      filtered = filtered.filter(
-        rfp =>
-          rfp.estimatedValue &&
-          parseFloat(rfp.estimatedValue) >= filters.minValue!
-      );
-    }
-    if (filters.maxValue !== undefined) {
-      filtered = filtered.filter(
-        rfp =>
-          rfp.estimatedValue &&
-          parseFloat(rfp.estimatedValue) <= filters.maxValue!
-      );
-    }
-
-    // Status filter (multiple)
-    if (filters.statuses?.length) {
-      filtered = filtered.filter(rfp => filters.statuses!.includes(rfp.status));
-    }
-
-    return filtered;
-  }
-
-  /**
-   * Get count of matching RFPs
-   */
-  private async getSearchCount(filters: SearchFilters): Promise<number> {
-    // For now, execute search without limit to get count
-    const rfps = await this.executeSearch(filters, 1000, 0);
-    return rfps.length;
-  }
-
   /**
    * Build system prompt for the AI
    */
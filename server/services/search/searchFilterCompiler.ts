@@ -0,0 +1,124 @@
+import { rfpSearchDocument, rfps } from '@shared/schema';
+import type { SearchFilters } from '@shared/searchTypes';
+import {
+  gte,
+  ilike,
+  inArray,
+  like,
+  lte,
+  or,
+  sql,
+  type SQL,
+} from 'drizzle-orm';
+
+/**
+ * Escape LIKE/ILIKE wildcards so user input is matched literally
+ */
+export function escapeLikePattern(value: string): string {
+  return value.replace(/[\\%_]/g, char => `\\${char}`);
+}
+
+/**
+ * Build a to_tsquery expression from search keywords.
+ *
+ * Each keyword becomes a conjunction of prefix terms (`cyber:*` also matches
+ * "cybersecurity"), and keywords are OR'ed together, mirroring the previous
+ * "any keyword appears" semantics. Returns null when no searchable terms remain.
+ */
+export function buildKeywordTsQuery(keywords: string[]): string | null {
+  const clauses = keywords
+    .map(keyword => keyword.toLowerCase().match(/[\p{L}\p{N}]+/gu) ?? [])
+    .filter(words => words.length > 0)
+    .map(words => `(${words.map(word => `${word}:*`).join(' & ')})`);
+
+  return clauses.length > 0 ? clauses.join(' | ') : null;
+}
+
+function parseFilterDate(value: string | undefined): Date | undefined {
+  if (!value) return undefined;
+  const date = new Date(value);
+  return Number.isNaN(date.getTime()) ? undefined : date;
+}
+
+/**
+ * Compile structured search filters into SQL predicates over the rfps table.
+ *
+ * Every predicate is shaped to hit an index declared on `rfps` in
+ * shared/schema.ts: the full-text GIN index for keywords, varchar_pattern_ops
+ * for NAICS prefixes, and btree indexes for deadline/value/state/status.
+ */
+export function compileSearchFilters(filters: SearchFilters): SQL[] {
+  const conditions: SQL[] = [];
+
+  if (filters.keywords?.length) {
+    const tsQuery = buildKeywordTsQuery(filters.keywords);
+    if (tsQuery) {
+      conditions.push(
+        sql`${rfpSearchDocument(rfps.title, rfps.description, rfps.agency)} @@ to_tsquery('english', ${tsQuery})`
+      );
+    }
+  }
+
+  if (filters.titleSearch) {
+    conditions.push(
+      ilike(rfps.title, `%${escapeLikePattern(filters.titleSearch)}%`)
+    );
+  }
+
+  if (filters.agencies?.length) {
+    const agencyCondition = or(
+      ...filters.agencies.map(agency =>
+        ilike(rfps.agency, `%${escapeLikePattern(agency)}%`)
+      )
+    );
+    if (agencyCondition) {
+      conditions.push(agencyCondition);
+    }
+  }
+
+  if (filters.states?.length) {
+    conditions.push(inArray(rfps.state, filters.states));
+  }
+
+  if (filters.naicsCodes?.length) {
+    const naicsCondition = or(
+      ...filters.naicsCodes.map(code =>
+        like(rfps.naicsCode, `${escapeLikePattern(code)}%`)
+      )
+    );
+    if (naicsCondition) {
+      conditions.push(naicsCondition);
+    }
+  }
+
+  if (filters.setAsideTypes?.length) {
+    conditions.push(
+      inArray(
+        sql`upper(${rfps.setAsideType})`,
+        filters.setAsideTypes.map(type => type.toUpperCase())
+      )
+    );
+  }
+
+  const deadlineAfter = parseFilterDate(filters.deadlineAfter);
+  if (deadlineAfter) {
+    conditions.push(gte(rfps.deadline, deadlineAfter));
+  }
+  const deadlineBefore = parseFilterDate(filters.deadlineBefore);
+  if (deadlineBefore) {
+    conditions.push(lte(rfps.deadline, deadlineBefore));
+  }
+
+  if (filters.minValue !== undefined) {
+    conditions.push(gte(rfps.estimatedValue, filters.minValue.toString()));
+  }
+  if (filters.maxValue !== undefined) {
+    conditions.push(lte(rfps.estimatedValue, filters.maxValue.toString()));
+  }
+
+  if (filters.statuses?.length) {
+    conditions.push(inArray(rfps.status, filters.statuses));
+  }
+
+  return conditions;
+}
@@ -3,6 +3,7 @@ import { ObjectStorageService } from '../../objectStorage';
 import { storage } from '../../storage';
 import { agentMemoryService } from '../agents/agentMemoryService';
 import { AIService } from '../core/aiService';
+import type { LLMCacheOptions } from '../core/llmResponseCache';
 import { DocumentIntelligenceService } from '../processing/documentIntelligenceService';
 import { DocumentParsingService } from '../processing/documentParsingService';
 
@@ -21,6 +22,10 @@ const asString = (value: unknown): string | undefined =>
     ? value.trim()
     : undefined;
 
+const cacheOptionsFromInputs = (
+  inputs: Record<string, unknown>
+): LLMCacheOptions => ({ bypassCache: inputs.bypassCache === true });
+
 /**
  * Analysis Specialists for the 3-Tier RFP Automation System
  *
@@ -440,7 +445,8 @@ export class RequirementsExtractorSpecialist {
       // Parse requirements using AI service
       const requirementResult = await this.extractRequirements(
         document.extractedText,
-        rfp
+        rfp,
+        cacheOptionsFromInputs(inputs)
       );
 
       // Update document with parsed requirements
@@ -497,12 +503,14 @@ export class RequirementsExtractorSpecialist {
    */
   private async extractRequirements(
     documentText: string,
-    rfp: RFP
+    rfp: RFP,
+    cacheOptions: LLMCacheOptions = {}
   ): Promise<RequirementParsingResult> {
     // Use AI service to extract structured requirements
     const aiAnalysis = await this.aiService.analyzeDocumentCompliance(
       documentText,
-      rfp
+      rfp,
+      cacheOptions
     );
 
     // Structure the results
@@ -580,7 +588,11 @@ export class ComplianceCheckerSpecialist {
       const documents = await storage.getDocumentsByRFP(rfpId);
 
       // Perform comprehensive compliance analysis
-      const complianceResult = await this.analyzeCompliance(rfp, documents);
+      const complianceResult = await this.analyzeCompliance(
+        rfp,
+        documents,
+        cacheOptionsFromInputs(inputs)
+      );
 
       // Update RFP with compliance analysis
       await storage.updateRFP(rfpId, {
@@ -644,7 +656,8 @@ export class ComplianceCheckerSpecialist {
    */
   private async analyzeCompliance(
     rfp: RFP,
-    documents: Document[]
+    documents: Document[],
+    cacheOptions: LLMCacheOptions = {}
   ): Promise<ComplianceAnalysisResult> {
     // Combine all extracted text
     const combinedText = documents
@@ -659,7 +672,8 @@ export class ComplianceCheckerSpecialist {
     // Use AI service for compliance analysis
     const aiCompliance = await this.aiService.analyzeDocumentCompliance(
       combinedText,
-      rfp
+      rfp,
+      cacheOptions
     );
 
     // Structure compliance results
@@ -28,6 +28,7 @@ export interface OutlineGenerationInputs {
   proposalType: string;
   companyProfileId?: string;
   pipelineId?: string;
+  bypassCache?: boolean;
 }
 
 export interface ContentGenerationInputs {
@@ -35,6 +36,7 @@ export interface ContentGenerationInputs {
   companyProfileId?: string;
   outline: any;
   pipelineId?: string;
+  bypassCache?: boolean;
 }
 
 export interface PricingGenerationInputs {
@@ -43,6 +45,7 @@ export interface PricingGenerationInputs {
   outline: any;
   proposalType: string;
   pipelineId?: string;
+  bypassCache?: boolean;
 }
 
 export interface ComplianceValidationInputs {
@@ -54,6 +57,7 @@ export interface ComplianceValidationInputs {
   pricing?: any;
   proposalType?: string;
   pipelineId?: string;
+  bypassCache?: boolean;
 }
 
 export interface FormCompletionInputs {
@@ -112,7 +116,8 @@ export class ContentGenerationSpecialist {
 
       // Analyze RFP to understand requirements
       const rfpAnalysis = await aiProposalService.analyzeRFPDocument(
-        `${rfp.title}\n${rfp.description || ''}\n${documentContext}`
+        `${rfp.title}\n${rfp.description || ''}\n${documentContext}`,
+        { bypassCache: inputs.bypassCache }
       );
 
       // Create proposal structure based on RFP type and requirements
@@ -228,7 +233,10 @@ export class ContentGenerationSpecialist {
         const contacts = await storage.getCompanyContacts(companyProfile.id);
 
         // Analyze RFP and map company data
-        const rfpAnalysis = await aiProposalService.analyzeRFPDocument(rfpText);
+        const rfpAnalysis = await aiProposalService.analyzeRFPDocument(
+          rfpText,
+          { bypassCache: inputs.bypassCache }
+        );
         const companyMapping =
           await aiProposalService.mapCompanyDataToRequirements(
             rfpAnalysis,
@@ -242,7 +250,8 @@ export class ContentGenerationSpecialist {
         const proposalContent = await aiProposalService.generateProposalContent(
           rfpAnalysis,
           companyMapping,
-          rfpText
+          rfpText,
+          { bypassCache: inputs.bypassCache }
         );
 
         executiveSummary = proposalContent.executiveSummary;
@@ -250,11 +259,15 @@ export class ContentGenerationSpecialist {
       } else {
         // Generate with default company information using shared config
         const defaultMapping = createDefaultCompanyMapping();
-        const rfpAnalysis = await aiProposalService.analyzeRFPDocument(rfpText);
+        const rfpAnalysis = await aiProposalService.analyzeRFPDocument(
+          rfpText,
+          { bypassCache: inputs.bypassCache }
+        );
         const proposalContent = await aiProposalService.generateProposalContent(
           rfpAnalysis,
           defaultMapping,
-          rfpText
+          rfpText,
+          { bypassCache: inputs.bypassCache }
         );
 
         executiveSummary = proposalContent.executiveSummary;
@@ -361,8 +374,10 @@ export class ContentGenerationSpecialist {
 
           // Analyze RFP to map company data
           const rfpText = `${rfp.title}\n${rfp.description || ''}\nAgency: ${rfp.agency}`;
-          const rfpAnalysis =
-            await aiProposalService.analyzeRFPDocument(rfpText);
+          const rfpAnalysis = await aiProposalService.analyzeRFPDocument(
+            rfpText,
+            { bypassCache: inputs.bypassCache }
+          );
           companyData = await aiProposalService.mapCompanyDataToRequirements(
             rfpAnalysis,
             companyProfile,
@@ -402,7 +417,8 @@ export class ContentGenerationSpecialist {
       const technicalContent = await aiProposalService.generateProposalContent(
         analysisForGeneration,
         companyData,
-        documentContext || 'No additional context available'
+        documentContext || 'No additional context available',
+        { bypassCache: inputs.bypassCache }
       );
 
       const technicalApproach =
@@ -903,7 +919,8 @@ export class ComplianceValidationSpecialist {
       // Analyze document compliance using AI
       const complianceAnalysis = await aiService.analyzeDocumentCompliance(
         documentContext,
-        { rfpId, proposalType: inputs.proposalType }
+        { rfpId, proposalType: inputs.proposalType },
+        { bypassCache: inputs.bypassCache }
       );
 
       // Validate company certifications if profile provided
@@ -66,7 +66,10 @@ export class PortalAuthenticationSpecialist {
         agentId: 'portal-authentication-specialist',
       });
 
-      // Initialize browser session
+      // Initialize browser session, preferring a pooled one that is already
+      // logged in to this portal. The orchestrator releases it when the
+      // pipeline ends.
+      sessionManager.setSessionAffinity(sessionId, portalId);
       const stagehand = await sessionManager.ensureStagehand(sessionId);
 
       try {
@@ -1108,6 +1108,8 @@ export class MastraWorkflowEngine {
           updatedAt: new Date(),
         });
 
+        retryBackoffDlqService.scheduleRetryWakeup(retryResult.nextRetryAt);
+
         console.log(
           `🔄 Scheduled retry for work item ${workItemId} at ${retryResult.nextRetryAt}`
         );
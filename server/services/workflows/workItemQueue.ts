@@ -0,0 +1,427 @@
+import { Client } from 'pg';
+import type { WorkItem } from '@shared/schema';
+import { storage, type ClaimedWorkItem } from '../../storage';
+
+/**
+ * Work Item Queue
+ *
+ * A queue engine over the work_items table. Workers claim runnable items in
+ * batches with FOR UPDATE SKIP LOCKED, so any number of workers across any
+ * number of nodes can pull from the table without double-claiming. Instead
+ * of polling on a short fixed interval, a worker wakes when Postgres sends
+ * NOTIFY work_items_ready (see migrations/add_work_item_queue.sql), when an
+ * item is created in-process, or when one of its own slots frees up. A slow
+ * safety-net poll covers missed notifications.
+ *
+ * Claimed items run with a global concurrency limit per node plus a limit
+ * per task type, so one flood of slow tasks cannot starve the rest.
+ *
+ * A claim is a lease: the worker keeps extending it while the item is held,
+ * and an item whose lease lapses (its node died mid-run) is claimed again
+ * by another worker.
+ */
+
+export const WORK_ITEMS_CHANNEL = 'work_items_ready';
+
+export interface WorkItemQueueOptions {
+  execute: (workItem: WorkItem) => Promise<void>;
+  /**
+   * Called with each claimed batch before execution. Returns the items to
+   * run; the rest are released back to the queue for releaseDelayMs.
+   */
+  prepare?: (workItems: WorkItem[]) => Promise<WorkItem[]>;
+  /** Called on every safety-net poll before claiming */
+  onPoll?: () => Promise<void>;
+  concurrency?: number;
+  taskConcurrency?: Record<string, number>;
+  defaultTaskConcurrency?: number;
+  claimBatchSize?: number;
+  pollIntervalMs?: number;
+  releaseDelayMs?: number;
+  /** How long a claim holds an item before other workers may reclaim it */
+  leaseMs?: number;
+  /** Connection used for LISTEN; null disables notifications */
+  listenConnectionString?: string | null;
+}
+
+export interface WorkItemQueueMetrics {
+  running: number;
+  runningByTaskType: Record<string, number>;
+  backlog: number;
+  listening: boolean;
+  claimed: number;
+  released: number;
+  completed: number;
+  failed: number;
+  claimBatches: number;
+  claimLatencyMs: { p50: number; p95: number; max: number };
+  lastClaimAt: Date | null;
+  queueDepth: Record<string, number>;
+  queueDepthTotal: number;
+}
+
+const DEFAULT_CONCURRENCY = 8;
+const DEFAULT_TASK_CONCURRENCY = 2;
+const DEFAULT_CLAIM_BATCH_SIZE = 10;
+const DEFAULT_POLL_INTERVAL_MS = 30000;
+const DEFAULT_RELEASE_DELAY_MS = 30000;
+const DEFAULT_LEASE_MS = 5 * 60 * 1000;
+const LISTEN_RECONNECT_DELAY_MS = 5000;
+const LATENCY_SAMPLE_SIZE = 500;
+
+export class WorkItemQueue {
+  private readonly options: WorkItemQueueOptions;
+  private readonly concurrency: number;
+  private readonly claimBatchSize: number;
+  private readonly leaseMs: number;
+
+  private started = false;
+  private claiming = false;
+  private wakeRequested = false;
+  private pollTimer: NodeJS.Timeout | null = null;
+  private leaseTimer: NodeJS.Timeout | null = null;
+  private listener: Client | null = null;
+  private reconnectTimer: NodeJS.Timeout | null = null;
+
+  private backlog: WorkItem[] = [];
+  // Claimed items this worker holds a lease on, backlogged or running
+  private leased = new Set<string>();
+  private runningTotal = 0;
+  private runningByTaskType = new Map<string, number>();
+  private claimLatencies: number[] = [];
+  private counters = {
+    claimed: 0,
+    released: 0,
+    completed: 0,
+    failed: 0,
+    claimBatches: 0,
+  };
+  private lastClaimAt: Date | null = null;
+
+  constructor(options: WorkItemQueueOptions) {
+    this.options = options;
+    this.concurrency = Math.max(1, options.concurrency ?? DEFAULT_CONCURRENCY);
+    this.claimBatchSize = Math.max(
+      1,
+      options.claimBatchSize ?? DEFAULT_CLAIM_BATCH_SIZE
+    );
+    this.leaseMs = options.leaseMs ?? DEFAULT_LEASE_MS;
+  }
+
+  get isRunning(): boolean {
+    return this.started;
+  }
+
+  start(): void {
+    if (this.started) return;
+    this.started = true;
+
+    this.pollTimer = setInterval(
+      () => void this.poll(),
+      this.options.pollIntervalMs ?? DEFAULT_POLL_INTERVAL_MS
+    );
+    if (!this.leaseTimer) {
+      this.leaseTimer = setInterval(
+        () => void this.extendLeases(),
+        Math.floor(this.leaseMs / 3)
+      );
+    }
+    void this.listen();
+    this.notify();
+  }
+
+  /**
+   * Stop claiming new work. Items already running are left to finish, and
+   * their leases are kept alive until they do.
+   */
+  async stop(): Promise<void> {
+    this.started = false;
+    if (this.pollTimer) {
+      clearInterval(this.pollTimer);
+      this.pollTimer = null;
+    }
+    if (this.reconnectTimer) {
+      clearTimeout(this.reconnectTimer);
+      this.reconnectTimer = null;
+    }
+
+    const listener = this.listener;
+    this.listener = null;
+    await listener?.end().catch(() => {});
+
+    // Claimed but unstarted items go back to the queue for other workers
+    const unstarted = this.backlog.splice(0);
+    if (unstarted.length > 0) {
+      unstarted.forEach(item => this.leased.delete(item.id));
+      await this.release(unstarted.map(item => item.id));
+    }
+    if (this.leased.size === 0 && this.leaseTimer) {
+      clearInterval(this.leaseTimer);
+      this.leaseTimer = null;
+    }
+  }
+
+  /**
+   * Claim and run whatever fits in the free slots. Safe to call often:
+   * concurrent calls coalesce into one more claim round.
+   */
+  notify(): void {
+    if (!this.started) return;
+    if (this.claiming) {
+      this.wakeRequested = true;
+      return;
+    }
+    void this.claimLoop();
+  }
+
+  async getMetrics(): Promise<WorkItemQueueMetrics> {
+    const queueDepth = await storage.getWorkItemQueueDepth();
+    const sorted = [...this.claimLatencies].sort((a, b) => a - b);
+    const percentile = (p: number) =>
+      sorted.length > 0
+        ? sorted[Math.min(sorted.length - 1, Math.floor(sorted.length * p))]
+        : 0;
+
+    return {
+      running: this.runningTotal,
+      runningByTaskType: Object.fromEntries(this.runningByTaskType),
+      backlog: this.backlog.length,
+      listening: this.listener !== null,
+      ...this.counters,
+      claimLatencyMs: {
+        p50: percentile(0.5),
+        p95: percentile(0.95),
+        max: sorted.length > 0 ? sorted[sorted.length - 1] : 0,
+      },
+      lastClaimAt: this.lastClaimAt,
+      queueDepth,
+      queueDepthTotal: Object.values(queueDepth).reduce(
+        (total, depth) => total + depth,
+        0
+      ),
+    };
+  }
+
+  private async poll(): Promise<void> {
+    try {
+      await this.options.onPoll?.();
+    } catch (error) {
+      console.error('❌ Work item queue poll hook failed:', error);
+    }
+    this.notify();
+  }
+
+  private async extendLeases(): Promise<void> {
+    if (this.leased.size === 0) {
+      // Nothing left to keep alive once stopped
+      if (!this.started && this.leaseTimer) {
+        clearInterval(this.leaseTimer);
+        this.leaseTimer = null;
+      }
+      return;
+    }
+
+    try {
+      await storage.extendWorkItemLeases(
+        Array.from(this.leased),
+        this.leaseMs
+      );
+    } catch (error) {
+      console.error('❌ Failed to extend work item leases:', error);
+    }
+  }
+
+  private async claimLoop(): Promise<void> {
+    this.claiming = true;
+    try {
+      do {
+        this.wakeRequested = false;
+        const claimed = await this.claimBatch();
+        // A full batch means more work is probably waiting
+        if (claimed >= this.claimBatchSize) this.wakeRequested = true;
+      } while (this.wakeRequested && this.started && this.freeSlots() > 0);
+    } catch (error) {
+      console.error('❌ Failed to claim work items:', error);
+    } finally {
+      this.claiming = false;
+    }
+  }
+
+  private freeSlots(): number {
+    return this.concurrency - this.runningTotal - this.backlog.length;
+  }
+
+  private taskLimit(taskType: string): number {
+    return (
+      this.options.taskConcurrency?.[taskType] ??
+      this.options.defaultTaskConcurrency ??
+      DEFAULT_TASK_CONCURRENCY
+    );
+  }
+
+  private async claimBatch(): Promise<number> {
+    const free = this.freeSlots();
+    if (free <= 0) return 0;
+
+    // Skip task types whose slots are already taken on this node
+    const inUse = new Map(this.runningByTaskType);
+    for (const item of this.backlog) {
+      inUse.set(item.taskType, (inUse.get(item.taskType) || 0) + 1);
+    }
+    const excludeTaskTypes = Array.from(inUse)
+      .filter(([taskType, used]) => used >= this.taskLimit(taskType))
+      .map(([taskType]) => taskType);
+
+    const claims = await storage.claimWorkItems({
+      limit: Math.min(this.claimBatchSize, free),
+      excludeTaskTypes,
+      leaseMs: this.leaseMs,
+    });
+    this.counters.claimBatches++;
+    if (claims.length === 0) return 0;
+
+    this.recordClaims(claims);
+
+    const claimed = claims.map(claim => claim.workItem);
+    let runnable = claimed;
+    if (this.options.prepare) {
+      try {
+        runnable = await this.options.prepare(claimed);
+      } catch (error) {
+        console.error('❌ Failed to prepare claimed work items:', error);
+        runnable = [];
+      }
+
+      const runnableIds = new Set(runnable.map(item => item.id));
+      const unrunnable = claimed.filter(item => !runnableIds.has(item.id));
+      if (unrunnable.length > 0) {
+        await this.release(
+          unrunnable.map(item => item.id),
+          new Date(
+            Date.now() +
+              (this.options.releaseDelayMs ?? DEFAULT_RELEASE_DELAY_MS)
+          )
+        );
+      }
+    }
+
+    runnable.forEach(item => this.leased.add(item.id));
+    this.backlog.push(...runnable);
+    this.drain();
+    return claims.length;
+  }
+
+  private recordClaims(claims: ClaimedWorkItem[]): void {
+    this.counters.claimed += claims.length;
+    this.lastClaimAt = new Date();
+    for (const claim of claims) {
+      this.claimLatencies.push(
+        Math.max(0, claim.claimedAt.getTime() - claim.readyAt.getTime())
+      );
+    }
+    if (this.claimLatencies.length > LATENCY_SAMPLE_SIZE) {
+      this.claimLatencies.splice(
+        0,
+        this.claimLatencies.length - LATENCY_SAMPLE_SIZE
+      );
+    }
+  }
+
+  private async release(workItemIds: string[], notBefore?: Date) {
+    try {
+      await storage.releaseWorkItems(workItemIds, notBefore);
+      this.counters.released += workItemIds.length;
+    } catch (error) {
+      console.error(
+        `❌ Failed to release ${workItemIds.length} work items:`,
+        error
+      );
+    }
+  }
+
+  // Start backlog items that fit the global and per-type limits
+  private drain(): void {
+    let i = 0;
+    while (i < this.backlog.length && this.runningTotal < this.concurrency) {
+      const { taskType } = this.backlog[i];
+      const running = this.runningByTaskType.get(taskType) || 0;
+      if (running >= this.taskLimit(taskType)) {
+        i++;
+      } else {
+        this.run(this.backlog.splice(i, 1)[0]);
+      }
+    }
+  }
+
+  private run(workItem: WorkItem): void {
+    const { taskType } = workItem;
+    this.runningTotal++;
+    this.runningByTaskType.set(
+      taskType,
+      (this.runningByTaskType.get(taskType) || 0) + 1
+    );
+
+    Promise.resolve()
+      .then(() => this.options.execute(workItem))
+      .then(
+        () => {
+          this.counters.completed++;
+        },
+        error => {
+          this.counters.failed++;
+          console.error(`❌ Work item ${workItem.id} failed:`, error);
+        }
+      )
+      .finally(() => {
+        this.leased.delete(workItem.id);
+        this.runningTotal--;
+        const running = (this.runningByTaskType.get(taskType) || 1) - 1;
+        if (running > 0) {
+          this.runningByTaskType.set(taskType, running);
+        } else {
+          this.runningByTaskType.delete(taskType);
+        }
+        this.drain();
+        this.notify();
+      });
+  }
+
+  private async listen(): Promise<void> {
+    const connectionString = this.options.listenConnectionString;
+    if (!connectionString || !this.started) return;
+
+    const client = new Client({ connectionString });
+    client.on('notification', () => this.notify());
+    client.on('error', error => {
+      console.error('❌ Work item queue listener error:', error);
+      this.reconnect(client);
+    });
+
+    try {
+      await client.connect();
+      await client.query(`LISTEN ${WORK_ITEMS_CHANNEL}`);
+      if (!this.started) {
+        await client.end();
+        return;
+      }
+      this.listener = client;
+      // Catch anything that became runnable while we were disconnected
+      this.notify();
+    } catch (error) {
+      console.error('❌ Failed to LISTEN for work items:', error);
+      this.reconnect(client);
+    }
+  }
+
+  private reconnect(client: Client): void {
+    if (this.listener === client) this.listener = null;
+    client.end().catch(() => {});
+    if (!this.started || this.reconnectTimer) return;
+
+    this.reconnectTimer = setTimeout(() => {
+      this.reconnectTimer = null;
+      void this.listen();
+    }, LISTEN_RECONNECT_DELAY_MS);
+    this.reconnectTimer.unref?.();
+  }
+}
@@ -2,6 +2,7 @@ import { captureException, withScope } from '@sentry/node';
 import { storage } from '../../storage';
 import { agentRegistryService } from '../agents/agentRegistryService';
 import { AIService } from '../core/aiService';
+import { retryBackoffDlqService } from '../core/retryBackoffDlqService';
 import { aiProposalService } from '../proposals/ai-proposal-service';
 import {
   complianceCheckerSpecialist,
@@ -39,6 +40,7 @@ import { proposalOutcomeTracker } from '../monitoring/proposalOutcomeTracker';
 import { intelligentDocumentProcessor } from '../processing/intelligentDocumentProcessor';
 import { proposalQualityEvaluator } from '../proposals/proposalQualityEvaluator';
 import { extractSaflaStrategyDetails } from './saflaStrategyUtils';
+import { WorkItemQueue, type WorkItemQueueMetrics } from './workItemQueue';
 
 // Lazy imports to break circular dependencies
 let _DiscoveryWorkflowProcessors:
@@ -135,7 +137,13 @@ export class WorkflowCoordinator {
   private portalMonitoringService = new PortalMonitoringService(storage);
   private enhancedProposalService = new EnhancedProposalService();
   private activeWorkflows: Map<string, WorkflowExecutionContext> = new Map();
-  private workItemProcessingInterval: NodeJS.Timeout | null = null;
+  private workItemQueue = new WorkItemQueue({
+    execute: workItem => this.runWorkItem(workItem).then(() => undefined),
+    prepare: workItems => this.assignClaimedWorkItems(workItems),
+    concurrency: Number(process.env.WORK_QUEUE_CONCURRENCY) || undefined,
+    listenConnectionString:
+      process.env.WORK_QUEUE_LISTEN_URL || process.env.DATABASE_URL || null,
+  });
 
   // SAFLA Self-Improving System Services
   private learningService = selfImprovingLearningService;
@@ -242,6 +250,7 @@ export class WorkflowCoordinator {
     console.log(
       `📋 Created work item ${newWorkItem.id} of type: ${newWorkItem.taskType}`
     );
+    this.workItemQueue.notify();
 
     return newWorkItem;
   }
@@ -292,6 +301,7 @@ export class WorkflowCoordinator {
       console.log(
         `🎯 Assigned work item ${workItem.id} to agent ${agent.displayName} (${agent.agentId})`
       );
+      this.workItemQueue.notify();
 
       return {
         success: true,
@@ -311,31 +321,41 @@ export class WorkflowCoordinator {
    * Execute a work item (simulate agent processing)
    */
   async executeWorkItem(workItemId: string): Promise<WorkItemAssignmentResult> {
+    const workItem = await storage.getWorkItem(workItemId);
+    if (!workItem) {
+      return { success: false, error: 'Work item not found' };
+    }
+
+    if (workItem.status !== 'assigned') {
+      return {
+        success: false,
+        error: `Work item is not assigned (status: ${workItem.status})`,
+      };
+    }
+
+    return this.runWorkItem(workItem, { markInProgress: true });
+  }
+
+  /**
+   * Run a work item that is assigned to this worker. Items claimed from the
+   * queue are already in_progress.
+   */
+  private async runWorkItem(
+    workItem: WorkItem,
+    options?: { markInProgress?: boolean }
+  ): Promise<WorkItemAssignmentResult> {
     const startTime = Date.now();
-    let workItemForExecution: WorkItem | null = null;
+    let workItemForExecution: WorkItem = workItem;
     let appliedStrategy: LearnedStrategy | null = null;
 
     try {
-      const workItem = await storage.getWorkItem(workItemId);
-      if (!workItem) {
-        return { success: false, error: 'Work item not found' };
-      }
-
-      if (workItem.status !== 'assigned') {
-        return {
-          success: false,
-          error: `Work item is not assigned (status: ${workItem.status})`,
-        };
+      if (options?.markInProgress) {
+        await storage.updateWorkItem(workItem.id, {
+          status: 'in_progress',
+          updatedAt: new Date(),
+        });
       }
 
-      workItemForExecution = workItem;
-
-      // Update status to in_progress
-      await storage.updateWorkItem(workItem.id, {
-        status: 'in_progress',
-        updatedAt: new Date(),
-      });
-
       console.log(
         `🚀 Executing work item ${workItem.id} of type: ${workItem.taskType}`
       );
@@ -386,11 +406,12 @@ export class WorkflowCoordinator {
         `✅ Completed work item ${workItem.id} with result:`,
         result.success ? 'SUCCESS' : 'FAILED'
       );
+      this.notifyPipelineWorkItemSettled(completedWorkItem);
 
       // SAFLA Learning Integration: Record execution outcome for learning
       if (this.enableLearning) {
         await this.recordWorkItemLearning(
-          workItemForExecution || workItem,
+          workItemForExecution,
           result,
           Date.now() - startTime
         );
@@ -401,31 +422,39 @@ export class WorkflowCoordinator {
         workItem: completedWorkItem,
       };
     } catch (error) {
-      console.error(`❌ Failed to execute work item ${workItemId}:`, error);
-
-      // Mark as failed and increment retry count
-      const existingWorkItem = await storage.getWorkItem(workItemId);
-      const failedWorkItem = await storage.updateWorkItem(workItemId, {
-        status: 'failed',
-        error: error instanceof Error ? error.message : 'Execution failed',
-        retries: (existingWorkItem?.retries ?? 0) + 1,
-        updatedAt: new Date(),
-      });
+      console.error(`❌ Failed to execute work item ${workItem.id}:`, error);
+
+      // The task type's retry policy either schedules a backoff retry (run
+      // by the retry scheduler) or moves the item to the DLQ
+      const message =
+        error instanceof Error ? error.message : 'Execution failed';
+      const failure = await mastraWorkflowEngine.handleWorkItemFailure(
+        workItem.id,
+        workItem.taskType,
+        message
+      );
+      const failedWorkItem = failure.success
+        ? await storage.getWorkItemById(workItem.id)
+        : await storage.updateWorkItem(workItem.id, {
+            status: 'failed',
+            error: message,
+            retries: (workItem.retries ?? 0) + 1,
+            canRetry: false,
+            failedAt: new Date(),
+            updatedAt: new Date(),
+          });
+      if (failedWorkItem) this.notifyPipelineWorkItemSettled(failedWorkItem);
 
       // SAFLA Learning Integration: Learn from failures
       if (this.enableLearning) {
-        const learningSource = workItemForExecution || existingWorkItem;
-        if (learningSource) {
-          await this.recordWorkItemLearning(
-            learningSource,
-            {
-              success: false,
-              error:
-                error instanceof Error ? error.message : 'Execution failed',
-            },
-            Date.now() - startTime
-          );
-        }
+        await this.recordWorkItemLearning(
+          workItemForExecution,
+          {
+            success: false,
+            error: error instanceof Error ? error.message : 'Execution failed',
+          },
+          Date.now() - startTime
+        );
       }
 
       return {
@@ -436,6 +465,23 @@ export class WorkflowCoordinator {
     }
   }
 
+  /**
+   * Wake the proposal pipeline phase waiting on this work item, if any
+   */
+  private notifyPipelineWorkItemSettled(workItem: WorkItem): void {
+    const metadata = workItem.metadata as WorkItemMetadata;
+    if (!metadata?.pipelineId) return;
+
+    getProposalGenerationOrchestrator()
+      .then(orchestrator => orchestrator.handleWorkItemSettled(workItem))
+      .catch(error => {
+        console.error(
+          `❌ Failed to notify pipeline ${metadata.pipelineId} of work item ${workItem.id}:`,
+          error
+        );
+      });
+  }
+
   /**
    * Distribute pending work items to available agents
    */
@@ -489,43 +535,33 @@ export class WorkflowCoordinator {
   }
 
   /**
-   * Start automatic work item processing loop (disabled by default)
+   * Start the work item queue: claims runnable items as they appear and
+   * executes them with per-task-type concurrency limits. Failed items come
+   * back through the retry scheduler once their backoff is due.
    */
   startWorkItemProcessing(): void {
-    if (this.workItemProcessingInterval) {
-      clearInterval(this.workItemProcessingInterval);
-    }
-
-    this.workItemProcessingInterval = setInterval(async () => {
-      try {
-        // 1. Distribute pending work items
-        await this.distributeWorkItems();
-
-        // 2. Execute assigned work items
-        const assignedItems = await storage.getWorkItemsByStatus('assigned');
-        for (const workItem of assignedItems) {
-          await this.executeWorkItem(workItem.id);
-        }
-
-        // 3. Retry failed items if retries < maxRetries
-        await this.retryFailedWorkItems();
-      } catch (error) {
-        console.error('❌ Work item processing loop error:', error);
-      }
-    }, 10000); // Process every 10 seconds
-
-    console.log('🔄 Work item processing loop started');
+    if (this.workItemQueue.isRunning) return;
+    this.workItemQueue.start();
+    retryBackoffDlqService.startRetryScheduler();
+    console.log('🔄 Work item queue started');
   }
 
   /**
-   * Stop work item processing loop
+   * Stop claiming work items. Items already running are left to finish.
    */
   stopWorkItemProcessing(): void {
-    if (this.workItemProcessingInterval) {
-      clearInterval(this.workItemProcessingInterval);
-      this.workItemProcessingInterval = null;
-      console.log('⏹️ Work item processing loop stopped');
-    }
+    if (!this.workItemQueue.isRunning) return;
+    this.workItemQueue.stop().catch(error => {
+      console.error('❌ Failed to stop work item queue:', error);
+    });
+    console.log('⏹️ Work item queue stopped');
+  }
+
+  /**
+   * Queue depth, throughput and claim latency of the work item queue
+   */
+  async getWorkItemQueueMetrics(): Promise<WorkItemQueueMetrics> {
+    return this.workItemQueue.getMetrics();
   }
 
   /**
@@ -535,7 +571,7 @@ export class WorkflowCoordinator {
   shutdown(): void {
     console.log('🛑 WorkflowCoordinator shutdown initiated...');
 
-    // Stop the work item processing loop
+    // Stop the work item queue
     this.stopWorkItemProcessing();
 
     // Clear active workflows
@@ -545,29 +581,46 @@ export class WorkflowCoordinator {
   }
 
   /**
-   * Retry failed work items that haven't exceeded max retries
+   * Assign agents to a claimed batch. One registry lookup per task type;
+   * items with no available agent are left out and released by the queue.
    */
-  private async retryFailedWorkItems(): Promise<void> {
-    try {
-      const failedItems = await storage.getWorkItemsByStatus('failed');
-
-      for (const workItem of failedItems) {
-        if (workItem.retries < workItem.maxRetries) {
-          // Reset to pending for retry
-          await storage.updateWorkItem(workItem.id, {
-            status: 'pending',
-            assignedAgentId: null,
-            updatedAt: new Date(),
-          });
+  private async assignClaimedWorkItems(
+    workItems: WorkItem[]
+  ): Promise<WorkItem[]> {
+    const ready = workItems.filter(workItem => workItem.assignedAgentId);
+    const unassignedByType = new Map<string, WorkItem[]>();
+    for (const workItem of workItems) {
+      if (workItem.assignedAgentId) continue;
+      const group = unassignedByType.get(workItem.taskType) || [];
+      group.push(workItem);
+      unassignedByType.set(workItem.taskType, group);
+    }
 
-          console.log(
-            `🔄 Retrying work item ${workItem.id} (attempt ${workItem.retries + 1}/${workItem.maxRetries})`
-          );
-        }
+    for (const [taskType, group] of Array.from(unassignedByType)) {
+      const agent = await agentRegistryService.findBestAgentForCapability(
+        this.getRequiredCapabilitiesForTask(taskType)[0],
+        this.getPreferredTierForTask(taskType)
+      );
+      if (!agent) {
+        console.warn(
+          `⚠️ No available agent for task type ${taskType}; releasing ${group.length} work items`
+        );
+        continue;
       }
-    } catch (error) {
-      console.error('❌ Failed to retry work items:', error);
+
+      await storage.assignWorkItemsToAgent(
+        group.map(workItem => workItem.id),
+        agent.agentId
+      );
+      ready.push(
+        ...group.map(workItem => ({
+          ...workItem,
+          assignedAgentId: agent.agentId,
+        }))
+      );
     }
+
+    return ready;
   }
 
   /**
@@ -3304,18 +3357,6 @@ export class WorkflowCoordinator {
       const result =
         await contentGenerationSpecialist.generateProposalOutline(workItem);
 
-      // Notify orchestrator of completion
-      const metadata = workItem.metadata as WorkItemMetadata;
-      if (result.success && metadata?.pipelineId) {
-        setTimeout(async () => {
-          (await getProposalGenerationOrchestrator()).handlePhaseCompletion(
-            metadata.pipelineId!,
-            [workItem.id],
-            'content_generation'
-          );
-        }, 1000); // Small delay to ensure work item is marked complete
-      }
-
       return {
         success: result.success,
         data: result.data,
@@ -3434,18 +3475,6 @@ export class WorkflowCoordinator {
     try {
       const result = await pricingAnalysisSpecialist.analyzePricing(workItem);
 
-      // Notify orchestrator of completion
-      const metadata = workItem.metadata as WorkItemMetadata;
-      if (result.success && metadata?.pipelineId) {
-        setTimeout(async () => {
-          (await getProposalGenerationOrchestrator()).handlePhaseCompletion(
-            metadata.pipelineId!,
-            [workItem.id],
-            'compliance_validation'
-          );
-        }, 1000);
-      }
-
       return {
         success: result.success,
         data: result.data,
@@ -3475,18 +3504,6 @@ export class WorkflowCoordinator {
       const result =
         await complianceValidationSpecialist.validateCompliance(workItem);
 
-      // Notify orchestrator of completion
-      const metadata = workItem.metadata as WorkItemMetadata;
-      if (result.success && metadata?.pipelineId) {
-        setTimeout(async () => {
-          (await getProposalGenerationOrchestrator()).handlePhaseCompletion(
-            metadata.pipelineId!,
-            [workItem.id],
-            'form_completion'
-          );
-        }, 1000);
-      }
-
       return {
         success: result.success,
         data: result.data,
@@ -3562,17 +3579,6 @@ export class WorkflowCoordinator {
         },
       };
 
-      // Notify orchestrator of completion
-      if (pipelineId) {
-        setTimeout(async () => {
-          (await getProposalGenerationOrchestrator()).handlePhaseCompletion(
-            pipelineId,
-            [workItem.id],
-            'final_assembly'
-          );
-        }, 1000);
-      }
-
       return {
         success: true,
         data: {
@@ -3631,7 +3637,9 @@ export class WorkflowCoordinator {
           : [],
         pricingTables: pricing?.pricing_breakdown || null,
         forms: forms?.completed_forms || null,
-        attachments: forms?.attachments_list || [],
+        // Forms are filled alongside content and pricing, so list the
+        // attachments here where every component is known
+        attachments: this.generateAttachmentsList(content, pricing, compliance),
         estimatedMargin: pricing?.competitive_strategy?.margin
           ? (pricing.competitive_strategy.margin * 100).toFixed(2)
           : '15.00',
@@ -3689,17 +3697,6 @@ export class WorkflowCoordinator {
         relatedEntityId: proposal.id,
       });
 
-      // Notify orchestrator of completion
-      if (pipelineId) {
-        setTimeout(async () => {
-          (await getProposalGenerationOrchestrator()).handlePhaseCompletion(
-            pipelineId,
-            [workItem.id],
-            'quality_assurance'
-          );
-        }, 1000);
-      }
-
       return {
         success: true,
         data: {
@@ -3733,7 +3730,7 @@ export class WorkflowCoordinator {
 
     try {
       const inputs = workItem.inputs as Record<string, any>;
-      const { rfpId, proposalId, qualityThreshold, pipelineId } = inputs;
+      const { rfpId, proposalId, qualityThreshold } = inputs;
 
       // Get proposal for quality assessment
       const proposal = await storage.getProposal(proposalId);
@@ -3803,17 +3800,6 @@ export class WorkflowCoordinator {
         relatedEntityId: proposalId,
       });
 
-      // Notify orchestrator of completion
-      if (pipelineId) {
-        setTimeout(async () => {
-          (await getProposalGenerationOrchestrator()).handlePhaseCompletion(
-            pipelineId,
-            [workItem.id],
-            'completed'
-          );
-        }, 1000);
-      }
-
       return {
         success: true,
         data: {
@@ -1,5 +1,13 @@
 import type { DashboardMetrics } from '@shared/api/dashboard';
-import type { RfpDetail } from '@shared/api/rfps';
+import {
+  PROPOSAL_SUMMARY_OMITTED_COLUMNS,
+  RFP_SUMMARY_OMITTED_COLUMNS,
+  type RfpDetail,
+  type RfpDetailPage,
+  type RfpDetailQuery,
+  type RfpDetailSummary,
+} from '@shared/api/rfps';
+import type { SearchCountMode, SearchFilters } from '@shared/searchTypes';
 import {
   agentCoordinationLog,
   agentKnowledgeBase,
@@ -8,6 +16,7 @@ import {
   agentRegistry,
   agentSessions,
   aiConversations,
+  aiResponseCache,
   auditLogs,
   companyAddresses,
   companyCertifications,
@@ -16,7 +25,9 @@ import {
   companyInsurance,
   companyProfiles,
   conversationMessages,
+  dashboardMetricCounters,
   deadLetterQueue,
+  documentBlobs,
   documents,
   historicalBids,
   notifications,
@@ -26,7 +37,9 @@ import {
   portals,
   proposals,
   researchFindings,
+  rfpEmbeddings,
   rfps,
+  scanDailyStats,
   scanEvents,
   scans,
   submissionEvents,
@@ -41,6 +54,7 @@ import {
   type AgentRegistry,
   type AgentSession,
   type AiConversation,
+  type AiResponseCacheEntry,
   type AuditLog,
   type CompanyAddress,
   type CompanyCertification,
@@ -50,10 +64,12 @@ import {
   type CompanyProfile,
   type ConversationMessage,
   type Document,
+  type DocumentBlob,
   type HistoricalBid,
   type InsertAgentRegistry,
   type InsertAgentSession,
   type InsertAiConversation,
+  type InsertAiResponseCacheEntry,
   type InsertAuditLog,
   type InsertCompanyAddress,
   type InsertCompanyCertification,
@@ -63,12 +79,14 @@ import {
   type InsertCompanyProfile,
   type InsertConversationMessage,
   type InsertDocument,
+  type InsertDocumentBlob,
   type InsertHistoricalBid,
   type InsertNotification,
   type InsertPortal,
   type InsertProposal,
   type InsertResearchFinding,
   type InsertRFP,
+  type InsertRFPEmbedding,
   type InsertScan,
   type InsertScanEvent,
   type InsertSubmission,
@@ -84,6 +102,7 @@ import {
   type PublicPortal,
   type ResearchFinding,
   type RFP,
+  type RFPEmbedding,
   type Scan,
   type ScanEvent,
   type Submission,
@@ -110,14 +129,28 @@ import {
   count,
   desc,
   eq,
+  getTableColumns,
   gte,
   inArray,
   lte,
+  min,
+  ne,
   or,
   sql,
   type SQL,
 } from 'drizzle-orm';
 import { db } from './db';
+import { compileSearchFilters } from './services/search/searchFilterCompiler';
+import { LRUCache } from './utils/lruCache';
+import {
+  cursorSortKey,
+  decodeCursor,
+  encodeCursor,
+  seekAfter,
+  toKeysetPage,
+  type KeysetCursor,
+  type KeysetPage,
+} from './utils/cursor';
 
 const toSubmission = (row: SubmissionRow): Submission => ({
   ...row,
@@ -167,6 +200,187 @@ type WorkItemActivityRow = {
   updatedAt: Date;
 };
 
+export type RFPEmbeddingWithMetadata = RFPEmbedding & {
+  agency: string;
+  category: string | null;
+};
+
+// One row of a batched scan update. Every column is written; the analysis
+// patch is merged into the existing analysis JSON.
+export interface RFPBulkUpdate {
+  id: string;
+  title: string;
+  description: string | null;
+  agency: string;
+  deadline: Date | null;
+  estimatedValue: string | null;
+  category: string | null;
+  analysisPatch: Record<string, unknown>;
+}
+
+// A work item claimed by a queue worker. readyAt is when it became
+// claimable, so claimedAt - readyAt is the claim latency.
+export interface ClaimedWorkItem {
+  workItem: WorkItem;
+  readyAt: Date;
+  claimedAt: Date;
+}
+
+export interface RFPListFilters {
+  status?: string;
+  portalId?: string;
+  excludeDemo?: boolean;
+}
+
+export interface ScanListFilters {
+  portalName?: string;
+  status?:
+    | 'all'
+    | 'completed'
+    | 'failed'
+    | 'completed_with_warnings'
+    | 'running';
+  startDate?: Date;
+  endDate?: Date;
+}
+
+// Keyset listings take a cursor from the previous page's nextCursor.
+// offset is still honoured when no cursor is given.
+export interface KeysetPageOptions {
+  limit: number;
+  cursor?: string;
+  offset?: number;
+}
+
+// Finished-scan totals for one portal over a time range
+export interface ScanPortalStats {
+  portalId: string;
+  portalName: string;
+  scanCount: number;
+  successCount: number;
+  failedCount: number;
+  rfpsDiscovered: number;
+  totalDurationMs: number;
+  timedScanCount: number;
+}
+
+// Cache reads accumulated in memory and written back in one statement
+export interface AiResponseCacheHit {
+  cacheKey: string;
+  hits: number;
+  lastHitAt: Date;
+}
+
+export interface RFPSearchResult {
+  rfps: RFP[];
+  nextCursor: string | null;
+  total: number | null;
+  totalIsEstimate: boolean;
+}
+
+// Planner estimates below this are replaced by an exact COUNT(*), which is
+// cheap for selective predicates and avoids showing "about 12" for 9 rows.
+const SEARCH_ESTIMATE_EXACT_THRESHOLD = 10000;
+
+// Rows per multi-row INSERT/UPDATE statement in bulk RFP writes
+const RFP_WRITE_BATCH_SIZE = 500;
+
+// How long dashboard and health summaries are served from memory. Writes
+// in this process invalidate them sooner.
+const METRICS_CACHE_TTL_MS = 10000;
+
+const ACTIVE_RFP_STATUSES = [
+  'discovered',
+  'parsing',
+  'drafting',
+  'review',
+  'approved',
+];
+
+// UTC YYYY-MM-DD. Timestamps are stored as UTC, so this matches to_char()
+// and ::date over them whatever the server's timezone
+const utcDayBucket = (date: Date): string => date.toISOString().slice(0, 10);
+
+const parseCursor = (cursor?: string): KeysetCursor | null => {
+  if (!cursor) return null;
+  const parsed = decodeCursor(cursor);
+  if (!parsed) {
+    throw new Error('Invalid pagination cursor');
+  }
+  return parsed;
+};
+
+const rfpListConditions = (filters: RFPListFilters = {}): SQL[] => {
+  const conditions: SQL[] = [];
+  if (filters.status) {
+    conditions.push(eq(rfps.status, filters.status));
+  }
+  if (filters.portalId) {
+    conditions.push(eq(rfps.portalId, filters.portalId));
+  }
+  if (filters.excludeDemo) {
+    conditions.push(eq(rfps.isDemo, false));
+  }
+  return conditions;
+};
+
+// Mirrors ScanHistoryService's status mapping: a completed scan with
+// errors is reported as completed_with_warnings
+const scanListConditions = (filters: ScanListFilters = {}): SQL[] => {
+  const conditions: SQL[] = [];
+  if (filters.portalName) {
+    conditions.push(eq(scans.portalName, filters.portalName));
+  }
+  switch (filters.status) {
+    case 'completed':
+      conditions.push(eq(scans.status, 'completed'), eq(scans.errorCount, 0));
+      break;
+    case 'completed_with_warnings':
+      conditions.push(
+        eq(scans.status, 'completed'),
+        sql`${scans.errorCount} > 0`
+      );
+      break;
+    case 'failed':
+    case 'running':
+      conditions.push(eq(scans.status, filters.status));
+      break;
+  }
+  if (filters.startDate) {
+    conditions.push(gte(scans.startedAt, filters.startDate));
+  }
+  if (filters.endDate) {
+    conditions.push(lte(scans.startedAt, filters.endDate));
+  }
+  return conditions;
+};
+
+const SCAN_FINISHED_STATUSES = ['completed', 'failed'];
+
+// Rows per multi-row INSERT when flushing buffered scan events
+const SCAN_EVENT_WRITE_BATCH_SIZE = 1000;
+
+// Page size for getRFPsWithDetails when paging by cursor without a limit
+const RFP_DETAIL_PAGE_SIZE = 100;
+
+const omitColumns = <T extends Record<string, unknown>, K extends keyof T>(
+  columns: T,
+  omit: readonly K[]
+): Omit<T, K> =>
+  Object.fromEntries(
+    Object.entries(columns).filter(([key]) => !omit.includes(key as K))
+  ) as Omit<T, K>;
+
+const rfpSummarySelection = omitColumns(
+  getTableColumns(rfps),
+  RFP_SUMMARY_OMITTED_COLUMNS
+);
+
+const proposalSummarySelection = omitColumns(
+  getTableColumns(proposals),
+  PROPOSAL_SUMMARY_OMITTED_COLUMNS
+);
+
 const publicPortalSelection = {
   id: portals.id,
   name: portals.name,
@@ -210,14 +424,50 @@ export interface IStorage {
     limit?: number;
     offset?: number;
   }): Promise<{ rfps: RFP[]; total: number }>;
+  getRFPsPage(
+    filters: RFPListFilters & KeysetPageOptions
+  ): Promise<KeysetPage<RFP>>;
+  countRFPs(filters?: RFPListFilters): Promise<number>;
+  searchRFPs(
+    filters: SearchFilters,
+    options: {
+      limit: number;
+      offset?: number;
+      cursor?: string;
+      countMode?: SearchCountMode;
+    }
+  ): Promise<RFPSearchResult>;
   getRFP(id: string): Promise<RFP | undefined>;
   getRFPBySourceUrl(sourceUrl: string): Promise<RFP | undefined>;
-  getRFPsWithDetails(): Promise<RfpDetail[]>;
+  getRFPsWithDetails(
+    options: RfpDetailQuery & { view: 'summary' }
+  ): Promise<RfpDetailPage<RfpDetailSummary>>;
+  getRFPsWithDetails(options?: RfpDetailQuery): Promise<RfpDetailPage>;
   createRFP(rfp: InsertRFP): Promise<RFP>;
+  createRFPs(rfps: InsertRFP[]): Promise<RFP[]>;
   updateRFP(id: string, updates: Partial<RFP>): Promise<RFP>;
+  updateRFPs(updates: RFPBulkUpdate[]): Promise<void>;
+  mergeRFPAnalysis(
+    ids: string[],
+    patch: Record<string, unknown>
+  ): Promise<void>;
   deleteRFP(id: string): Promise<void>;
   getRFPsByStatus(status: string): Promise<RFP[]>;
   getRFPsByPortal(portalId: string): Promise<RFP[]>;
+  getRFPsByIds(ids: string[]): Promise<RFP[]>;
+
+  // RFP Embeddings
+  getRFPEmbeddings(filter: {
+    model: string;
+    dimensions: number;
+    updatedSince?: Date;
+  }): Promise<RFPEmbeddingWithMetadata[]>;
+  upsertRFPEmbeddings(rows: InsertRFPEmbedding[]): Promise<void>;
+  getRFPIdsMissingEmbeddings(
+    model: string,
+    dimensions: number,
+    limit: number
+  ): Promise<string[]>;
 
   // Proposals
   getProposal(id: string): Promise<Proposal | undefined>;
@@ -231,6 +481,14 @@ export interface IStorage {
   getDocumentsByRFP(rfpId: string): Promise<Document[]>;
   createDocument(document: InsertDocument): Promise<Document>;
   updateDocument(id: string, updates: Partial<Document>): Promise<Document>;
+  getDocumentByContentHash(
+    rfpId: string,
+    contentHash: string
+  ): Promise<Document | undefined>;
+
+  // Document Blobs (content-addressed document bodies)
+  getDocumentBlob(contentHash: string): Promise<DocumentBlob | undefined>;
+  upsertDocumentBlob(blob: InsertDocumentBlob): Promise<DocumentBlob>;
 
   // Submissions
   getSubmission(id: string): Promise<Submission | undefined>;
@@ -238,6 +496,10 @@ export interface IStorage {
     limit?: number;
     status?: string;
   }): Promise<Submission[]>;
+  getSubmissionsPage(
+    options: { status?: string } & KeysetPageOptions
+  ): Promise<KeysetPage<Submission>>;
+  countSubmissions(filters?: { status?: string }): Promise<number>;
   getSubmissionsByRFP(rfpId: string): Promise<Submission[]>;
   getSubmissionsByDateRange(
     startDate: Date,
@@ -295,6 +557,11 @@ export interface IStorage {
     entityType: string,
     entityId: string
   ): Promise<AuditLog[]>;
+  getAuditLogsPage(
+    entityType: string,
+    entityId: string,
+    options: KeysetPageOptions
+  ): Promise<KeysetPage<AuditLog>>;
 
   // Notifications
   getAllNotifications(limit?: number): Promise<Notification[]>;
@@ -370,6 +637,7 @@ export interface IStorage {
 
   // Analytics
   getDashboardMetrics(): Promise<DashboardMetrics>;
+  reconcileDashboardRollup(): Promise<number>;
   getPortalActivity(): Promise<any>;
 
   // Scan Operations
@@ -380,8 +648,18 @@ export interface IStorage {
   getActiveScansByPortal(portalId: string): Promise<Scan[]>;
   getActiveScans(): Promise<Scan[]>;
   appendScanEvent(event: InsertScanEvent): Promise<ScanEvent>;
+  appendScanEvents(events: InsertScanEvent[]): Promise<void>;
   getScanEvents(scanId: string): Promise<ScanEvent[]>;
   getScanHistory(portalId: string, limit?: number): Promise<Scan[]>;
+  getScansPage(
+    filters: ScanListFilters & KeysetPageOptions
+  ): Promise<KeysetPage<Scan>>;
+  countScans(filters?: ScanListFilters): Promise<number>;
+  getScanPortalStats(
+    since: Date,
+    options?: { source?: 'rollup' | 'scans' }
+  ): Promise<ScanPortalStats[]>;
+  rebuildScanDailyStats(since: Date): Promise<number>;
 
   // AI Conversation Operations
   getAiConversation(id: string): Promise<AiConversation | undefined>;
@@ -566,6 +844,17 @@ export interface IStorage {
   assignWorkItem(workItemId: string, agentId: string): Promise<WorkItem>;
   completeWorkItem(workItemId: string, result: any): Promise<WorkItem>;
   failWorkItem(workItemId: string, error: string): Promise<WorkItem>;
+  claimWorkItems(options: {
+    limit: number;
+    excludeTaskTypes?: string[];
+    leaseMs: number;
+  }): Promise<ClaimedWorkItem[]>;
+  extendWorkItemLeases(workItemIds: string[], leaseMs: number): Promise<void>;
+  assignWorkItemsToAgent(workItemIds: string[], agentId: string): Promise<void>;
+  releaseWorkItems(workItemIds: string[], notBefore?: Date): Promise<void>;
+  requeueDueRetries(limit: number): Promise<WorkItem[]>;
+  getNextRetryAt(): Promise<Date | null>;
+  getWorkItemQueueDepth(): Promise<Record<string, number>>;
 
   // Agent Session Operations (3-Tier Agentic System)
   createAgentSession(session: InsertAgentSession): Promise<AgentSession>;
@@ -657,9 +946,23 @@ export interface IStorage {
 
   // Feedback
   getRecentFeedback(limit: number): Promise<Array<{ rating: number }>>;
+
+  // AI Response Cache
+  getAiResponseCacheEntry(
+    cacheKey: string
+  ): Promise<AiResponseCacheEntry | undefined>;
+  upsertAiResponseCacheEntry(entry: InsertAiResponseCacheEntry): Promise<void>;
+  recordAiResponseCacheHits(hits: AiResponseCacheHit[]): Promise<void>;
+  deleteExpiredAiResponseCacheEntries(): Promise<number>;
 }
 
 export class DatabaseStorage implements IStorage {
+  // Pending loads are cached too, so concurrent dashboard requests share one
+  private metricsCache = new LRUCache<string, Promise<unknown>>({
+    maxSize: 16,
+    ttlMs: METRICS_CACHE_TTL_MS,
+  });
+
   // Users
   async getUser(id: string): Promise<User | undefined> {
     const [user] = await db.select().from(users).where(eq(users.id, id));
@@ -823,6 +1126,7 @@ export class DatabaseStorage implements IStorage {
       createdAt: portals.createdAt,
       updatedAt: portals.updatedAt,
     });
+    this.invalidateMetrics();
     return newPortal;
   }
 
@@ -904,6 +1208,7 @@ export class DatabaseStorage implements IStorage {
 
     // Finally delete the portal itself
     await db.delete(portals).where(eq(portals.id, id));
+    this.invalidateMetrics();
 
     // Create audit log for the deletion
     await this.createAuditLog({
@@ -926,56 +1231,158 @@ export class DatabaseStorage implements IStorage {
     offset?: number;
     excludeDemo?: boolean;
   }): Promise<{ rfps: RFP[]; total: number }> {
-    const conditions = [];
-    if (filters?.status) {
-      conditions.push(eq(rfps.status, filters.status));
+    const conditions = rfpListConditions(filters);
+
+    let query = db
+      .select()
+      .from(rfps)
+      .where(conditions.length > 0 ? and(...conditions) : undefined)
+      .orderBy(desc(rfps.discoveredAt), desc(rfps.id))
+      .$dynamic();
+    if (filters?.limit) {
+      query = query.limit(filters.limit);
     }
-    if (filters?.portalId) {
-      conditions.push(eq(rfps.portalId, filters.portalId));
+    if (filters?.offset) {
+      query = query.offset(filters.offset);
     }
-    if (filters?.excludeDemo) {
-      conditions.push(eq(rfps.isDemo, false));
+
+    const [rfpData, total] = await Promise.all([
+      query,
+      this.countRFPs(filters),
+    ]);
+
+    return {
+      rfps: rfpData,
+      total,
+    };
+  }
+
+  /**
+   * One page of RFPs, newest first, without a count. Ordered by
+   * (discovered_at, id) so deep pages seek through idx_rfps_discovered_at_id
+   * instead of skipping rows with OFFSET.
+   */
+  async getRFPsPage(
+    filters: RFPListFilters & KeysetPageOptions
+  ): Promise<KeysetPage<RFP>> {
+    const cursor = parseCursor(filters.cursor);
+    const conditions = rfpListConditions(filters);
+    if (cursor) {
+      conditions.push(seekAfter(rfps.discoveredAt, rfps.id, cursor));
     }
 
-    // Build base queries
-    const baseMainQuery = db.select().from(rfps);
-    const baseCountQuery = db.select({ count: count() }).from(rfps);
+    const rows = await db
+      .select({ item: rfps, sortKey: cursorSortKey(rfps.discoveredAt) })
+      .from(rfps)
+      .where(conditions.length > 0 ? and(...conditions) : undefined)
+      .orderBy(desc(rfps.discoveredAt), desc(rfps.id))
+      .limit(filters.limit + 1)
+      .offset(cursor ? 0 : (filters.offset ?? 0));
 
-    // Apply conditions to both queries
-    const mainQueryWithConditions =
-      conditions.length > 0
-        ? baseMainQuery.where(and(...conditions))
-        : baseMainQuery;
-    const countQueryWithConditions =
-      conditions.length > 0
-        ? baseCountQuery.where(and(...conditions))
-        : baseCountQuery;
+    return toKeysetPage(rows, filters.limit);
+  }
 
-    // Build final main query with ordering and pagination
-    const orderedQuery = mainQueryWithConditions.orderBy(
-      desc(rfps.discoveredAt)
-    );
+  async countRFPs(filters?: RFPListFilters): Promise<number> {
+    const conditions = rfpListConditions(filters);
+    const [result] = await db
+      .select({ count: count() })
+      .from(rfps)
+      .where(conditions.length > 0 ? and(...conditions) : undefined);
+    return result?.count ?? 0;
+  }
 
-    const finalMainQuery =
-      filters?.limit && filters?.offset
-        ? orderedQuery.limit(filters.limit).offset(filters.offset)
-        : filters?.limit
-          ? orderedQuery.limit(filters.limit)
-          : filters?.offset
-            ? orderedQuery.offset(filters.offset)
-            : orderedQuery;
-
-    const [rfpData, totalData] = await Promise.all([
-      finalMainQuery,
-      countQueryWithConditions,
+  /**
+   * Search RFPs with structured filters compiled to indexed SQL predicates.
+   * Ordered by (discovered_at, id) descending; pass the returned nextCursor
+   * back as `cursor` for keyset pagination (offset is honoured otherwise).
+   * The total is computed in parallel from the same compiled predicate.
+   */
+  async searchRFPs(
+    filters: SearchFilters,
+    options: {
+      limit: number;
+      offset?: number;
+      cursor?: string;
+      countMode?: SearchCountMode;
+    }
+  ): Promise<RFPSearchResult> {
+    const filterConditions = compileSearchFilters(filters);
+    const where =
+      filterConditions.length > 0 ? and(...filterConditions) : undefined;
+
+    const cursor = options.cursor ? decodeCursor(options.cursor) : null;
+    if (options.cursor && !cursor) {
+      throw new Error('Invalid search cursor');
+    }
+    const pageWhere = cursor
+      ? and(where, seekAfter(rfps.discoveredAt, rfps.id, cursor))
+      : where;
+
+    // Fetch one extra row to learn whether another page exists
+    const pageQuery = db
+      .select({ rfp: rfps, sortKey: cursorSortKey(rfps.discoveredAt) })
+      .from(rfps)
+      .where(pageWhere)
+      .orderBy(desc(rfps.discoveredAt), desc(rfps.id))
+      .limit(options.limit + 1)
+      .offset(cursor ? 0 : (options.offset ?? 0));
+
+    const [rows, totals] = await Promise.all([
+      pageQuery,
+      this.countSearchMatches(where, options.countMode ?? 'exact'),
     ]);
 
+    const page = rows.slice(0, options.limit);
+    const last = page[page.length - 1];
+
     return {
-      rfps: rfpData,
-      total: totalData[0].count,
+      rfps: page.map(row => row.rfp),
+      nextCursor:
+        rows.length > options.limit && last
+          ? encodeCursor(last.sortKey, last.rfp.id)
+          : null,
+      ...totals,
     };
   }
 
+  private async countSearchMatches(
+    where: SQL | undefined,
+    mode: SearchCountMode
+  ): Promise<{ total: number | null; totalIsEstimate: boolean }> {
+    if (mode === 'none') {
+      return { total: null, totalIsEstimate: false };
+    }
+
+    if (mode === 'estimated') {
+      const estimate = await this.estimateRowCount(
+        sql`SELECT 1 FROM ${rfps}${where ? sql` WHERE ${where}` : sql``}`
+      );
+      if (estimate !== null && estimate >= SEARCH_ESTIMATE_EXACT_THRESHOLD) {
+        return { total: estimate, totalIsEstimate: true };
+      }
+    }
+
+    const [result] = await db.select({ count: count() }).from(rfps).where(where);
+    return { total: result?.count ?? 0, totalIsEstimate: false };
+  }
+
+  /**
+   * Read the planner's row estimate for a query from EXPLAIN without running it
+   */
+  private async estimateRowCount(query: SQL): Promise<number | null> {
+    try {
+      const result = await db.execute(sql`EXPLAIN (FORMAT JSON) ${query}`);
+      const plan = (result.rows[0] as Record<string, any> | undefined)?.[
+        'QUERY PLAN'
+      ];
+      const rows = Array.isArray(plan) ? plan[0]?.Plan?.['Plan Rows'] : null;
+      return typeof rows === 'number' ? rows : null;
+    } catch (error) {
+      console.error('Failed to estimate row count:', error);
+      return null;
+    }
+  }
+
   async getRFP(id: string): Promise<RFP | undefined> {
     const [rfp] = await db.select().from(rfps).where(eq(rfps.id, id));
     return rfp || undefined;
@@ -989,50 +1396,134 @@ export class DatabaseStorage implements IStorage {
     return rfp || undefined;
   }
 
-  async getRFPsWithDetails(): Promise<RfpDetail[]> {
-    // Get RFPs with portals first
-    const rfpsWithPortals = await db
+  /**
+   * One page of RFPs with their portal and latest proposal, newest first.
+   * Pages are keyset-ordered by (discovered_at, id); pass nextCursor back
+   * as `cursor` for the next one. Without a limit or cursor every RFP is
+   * returned in a single page. The `summary` view skips the large JSON
+   * columns on both RFPs and proposals.
+   */
+  async getRFPsWithDetails(
+    options: RfpDetailQuery & { view: 'summary' }
+  ): Promise<RfpDetailPage<RfpDetailSummary>>;
+  async getRFPsWithDetails(options?: RfpDetailQuery): Promise<RfpDetailPage>;
+  async getRFPsWithDetails(
+    options: RfpDetailQuery = {}
+  ): Promise<RfpDetailPage<RfpDetail | RfpDetailSummary>> {
+    const unbounded = options.limit === undefined && !options.cursor;
+    const limit = options.limit ?? RFP_DETAIL_PAGE_SIZE;
+    const summary = options.view === 'summary';
+    const cursor = options.cursor ? decodeCursor(options.cursor) : null;
+    if (options.cursor && !cursor) {
+      throw new Error('Invalid RFP cursor');
+    }
+
+    const conditions = rfpListConditions({ status: options.status });
+    if (options.q) {
+      const term = `%${options.q}%`;
+      conditions.push(
+        or(sql`${rfps.title} ILIKE ${term}`, sql`${rfps.agency} ILIKE ${term}`)!
+      );
+    }
+    if (cursor) {
+      conditions.push(seekAfter(rfps.discoveredAt, rfps.id, cursor));
+    }
+
+    const query = db
       .select({
-        rfp: rfps,
+        rfp: summary ? rfpSummarySelection : getTableColumns(rfps),
         portal: publicPortalSelection,
+        sortKey: cursorSortKey(rfps.discoveredAt),
       })
       .from(rfps)
       .leftJoin(portals, eq(rfps.portalId, portals.id))
-      .orderBy(desc(rfps.discoveredAt));
-
-    // Get the latest proposal for each RFP separately to avoid duplicates
-    const rfpIds = rfpsWithPortals.map(({ rfp }) => rfp.id);
-
-    if (rfpIds.length === 0) {
-      return [];
+      .where(conditions.length > 0 ? and(...conditions) : undefined)
+      .orderBy(desc(rfps.discoveredAt), desc(rfps.id))
+      .$dynamic();
+
+    // Fetch one extra row to learn whether another page exists
+    const rows = unbounded ? await query : await query.limit(limit + 1);
+    const page = unbounded ? rows : rows.slice(0, limit);
+    if (page.length === 0) {
+      return { items: [], nextCursor: null };
     }
 
-    const proposalsQuery = await db
-      .select()
+    // DISTINCT ON keeps the newest proposal per RFP, for this page only
+    // (every RFP's when unbounded, so no ID list is bound). Drafts kept after
+    // a failed generation are hidden until a retry completes them.
+    const latestProposals = await db
+      .selectDistinctOn(
+        [proposals.rfpId],
+        summary ? proposalSummarySelection : getTableColumns(proposals)
+      )
       .from(proposals)
-      .where(inArray(proposals.rfpId, rfpIds))
-      .orderBy(desc(proposals.generatedAt));
-
-    // Create a map of rfpId -> latest proposal
-    const proposalMap = new Map<string, (typeof proposalsQuery)[0]>();
-    for (const proposal of proposalsQuery) {
-      if (!proposalMap.has(proposal.rfpId)) {
-        proposalMap.set(proposal.rfpId, proposal);
-      }
-    }
+      .where(
+        and(
+          ne(proposals.status, 'generation_failed'),
+          unbounded
+            ? undefined
+            : inArray(
+                proposals.rfpId,
+                page.map(({ rfp }) => rfp.id)
+              )
+        )
+      )
+      .orderBy(proposals.rfpId, desc(proposals.generatedAt));
 
-    return rfpsWithPortals.map(({ rfp, portal }) => ({
-      rfp,
-      portal: portal ?? null,
-      proposal: proposalMap.get(rfp.id)
-        ? toProposal(proposalMap.get(rfp.id)!)
-        : null,
-    }));
+    const proposalByRfp = new Map(
+      latestProposals.map(proposal => [proposal.rfpId, proposal])
+    );
+    const last = page[page.length - 1];
+
+    return {
+      items: page.map(({ rfp, portal }) => {
+        const proposal = proposalByRfp.get(rfp.id);
+        return {
+          rfp,
+          portal: portal ?? null,
+          proposal:
+            proposal && !summary
+              ? toProposal(proposal as ProposalRow)
+              : (proposal ?? null),
+        } as RfpDetail | RfpDetailSummary;
+      }),
+      nextCursor:
+        !unbounded && rows.length > limit
+          ? encodeCursor(last.sortKey, last.rfp.id)
+          : null,
+    };
   }
 
   async createRFP(rfp: InsertRFP): Promise<RFP> {
     const [newRfp] = await db.insert(rfps).values(rfp).returning();
+    this.invalidateMetrics();
+    this.onRFPCreated(newRfp);
+    return newRfp;
+  }
 
+  /**
+   * Insert many RFPs with multi-row INSERTs. Rows that conflict with an
+   * existing key are skipped and not returned.
+   */
+  async createRFPs(rows: InsertRFP[]): Promise<RFP[]> {
+    const created: RFP[] = [];
+    for (let i = 0; i < rows.length; i += RFP_WRITE_BATCH_SIZE) {
+      const inserted = await db
+        .insert(rfps)
+        .values(rows.slice(i, i + RFP_WRITE_BATCH_SIZE))
+        .onConflictDoNothing()
+        .returning();
+      created.push(...inserted);
+    }
+
+    if (created.length > 0) this.invalidateMetrics();
+    for (const newRfp of created) {
+      this.onRFPCreated(newRfp);
+    }
+    return created;
+  }
+
+  private onRFPCreated(newRfp: RFP): void {
     // Trigger automatic compliance analysis for discovered RFPs
     if (newRfp.status === 'discovered') {
       // Import and trigger compliance analysis asynchronously
@@ -1051,7 +1542,7 @@ export class DatabaseStorage implements IStorage {
       });
     }
 
-    return newRfp;
+    this.scheduleEmbeddingRefresh(newRfp.id);
   }
 
   async updateRFP(id: string, updates: Partial<RFP>): Promise<RFP> {
@@ -1060,9 +1551,102 @@ export class DatabaseStorage implements IStorage {
       .set({ ...updates, updatedAt: new Date() })
       .where(eq(rfps.id, id))
       .returning();
+
+    if (
+      updates.status !== undefined ||
+      updates.estimatedValue !== undefined ||
+      updates.discoveredAt !== undefined
+    ) {
+      this.invalidateMetrics();
+    }
+
+    // Only text changes affect the RFP's embedding
+    if (
+      updatedRfp &&
+      (updates.title !== undefined ||
+        updates.description !== undefined ||
+        updates.agency !== undefined ||
+        updates.category !== undefined)
+    ) {
+      this.scheduleEmbeddingRefresh(id);
+    }
+
     return updatedRfp;
   }
 
+  /**
+   * Apply many RFP updates with one UPDATE ... FROM (VALUES ...) per batch
+   */
+  async updateRFPs(updates: RFPBulkUpdate[]): Promise<void> {
+    for (let i = 0; i < updates.length; i += RFP_WRITE_BATCH_SIZE) {
+      const values = sql.join(
+        updates
+          .slice(i, i + RFP_WRITE_BATCH_SIZE)
+          .map(
+            update =>
+              sql`(${update.id}, ${update.title}, ${update.description}, ${update.agency}, ${update.deadline?.toISOString() ?? null}::timestamp, ${update.estimatedValue}::numeric, ${update.category}, ${JSON.stringify(update.analysisPatch)}::jsonb)`
+          ),
+        sql`, `
+      );
+
+      await db.execute(sql`
+        UPDATE ${rfps} SET
+          title = v.title,
+          description = v.description,
+          agency = v.agency,
+          deadline = v.deadline,
+          estimated_value = v.estimated_value,
+          category = v.category,
+          analysis = coalesce(${rfps.analysis}, '{}'::jsonb) || v.analysis_patch,
+          updated_at = now()
+        FROM (VALUES ${values}) AS v(id, title, description, agency, deadline, estimated_value, category, analysis_patch)
+        WHERE ${rfps.id} = v.id
+      `);
+    }
+
+    if (updates.length > 0) this.invalidateMetrics();
+
+    // Text changes affect the RFPs' embeddings
+    for (const update of updates) {
+      this.scheduleEmbeddingRefresh(update.id);
+    }
+  }
+
+  /**
+   * Merge the same keys into the analysis JSON of many RFPs without
+   * touching updatedAt (e.g. marking RFPs as seen in a scan)
+   */
+  async mergeRFPAnalysis(
+    ids: string[],
+    patch: Record<string, unknown>
+  ): Promise<void> {
+    for (let i = 0; i < ids.length; i += RFP_WRITE_BATCH_SIZE) {
+      await db
+        .update(rfps)
+        .set({
+          analysis: sql`coalesce(${rfps.analysis}, '{}'::jsonb) || ${JSON.stringify(patch)}::jsonb`,
+        })
+        .where(inArray(rfps.id, ids.slice(i, i + RFP_WRITE_BATCH_SIZE)));
+    }
+  }
+
+  /**
+   * Queue an incremental embedding refresh for the persistent vector index.
+   * The index skips RFPs whose embedded text is unchanged.
+   */
+  private scheduleEmbeddingRefresh(rfpId: string): void {
+    import('./services/learning/rfpEmbeddingIndex')
+      .then(({ rfpEmbeddingIndex }) =>
+        rfpEmbeddingIndex.scheduleRefresh(rfpId)
+      )
+      .catch(error => {
+        console.error(
+          `❌ Failed to schedule embedding refresh for RFP ${rfpId}:`,
+          error
+        );
+      });
+  }
+
   async deleteRFP(id: string): Promise<void> {
     // Get RFP details for audit log before deletion
     const rfp = await this.getRFP(id);
@@ -1101,8 +1685,12 @@ export class DatabaseStorage implements IStorage {
     // Delete proposals
     await db.delete(proposals).where(eq(proposals.rfpId, id));
 
-    // Finally, delete the RFP itself
+    // Finally, delete the RFP itself (rfp_embeddings rows cascade)
     await db.delete(rfps).where(eq(rfps.id, id));
+    this.invalidateMetrics();
+    import('./services/learning/rfpEmbeddingIndex')
+      .then(({ rfpEmbeddingIndex }) => rfpEmbeddingIndex.remove(id))
+      .catch(() => {});
 
     // Create audit log
     await this.createAuditLog({
@@ -1126,6 +1714,80 @@ export class DatabaseStorage implements IStorage {
     return await db.select().from(rfps).where(eq(rfps.portalId, portalId));
   }
 
+  async getRFPsByIds(ids: string[]): Promise<RFP[]> {
+    if (ids.length === 0) return [];
+    return await db.select().from(rfps).where(inArray(rfps.id, ids));
+  }
+
+  // RFP Embeddings
+  async getRFPEmbeddings(filter: {
+    model: string;
+    dimensions: number;
+    updatedSince?: Date;
+  }): Promise<RFPEmbeddingWithMetadata[]> {
+    const conditions = [
+      eq(rfpEmbeddings.model, filter.model),
+      eq(rfpEmbeddings.dimensions, filter.dimensions),
+    ];
+    if (filter.updatedSince) {
+      conditions.push(gte(rfpEmbeddings.updatedAt, filter.updatedSince));
+    }
+
+    const rows = await db
+      .select({
+        embedding: rfpEmbeddings,
+        agency: rfps.agency,
+        category: rfps.category,
+      })
+      .from(rfpEmbeddings)
+      .innerJoin(rfps, eq(rfpEmbeddings.rfpId, rfps.id))
+      .where(and(...conditions));
+
+    return rows.map(row => ({
+      ...row.embedding,
+      agency: row.agency,
+      category: row.category,
+    }));
+  }
+
+  async upsertRFPEmbeddings(rows: InsertRFPEmbedding[]): Promise<void> {
+    if (rows.length === 0) return;
+    await db
+      .insert(rfpEmbeddings)
+      .values(rows)
+      .onConflictDoUpdate({
+        target: rfpEmbeddings.rfpId,
+        set: {
+          model: sql`excluded.model`,
+          dimensions: sql`excluded.dimensions`,
+          contentHash: sql`excluded.content_hash`,
+          embedding: sql`excluded.embedding`,
+          updatedAt: sql`now()`,
+        },
+      });
+  }
+
+  async getRFPIdsMissingEmbeddings(
+    model: string,
+    dimensions: number,
+    limit: number
+  ): Promise<string[]> {
+    const rows = await db
+      .select({ id: rfps.id })
+      .from(rfps)
+      .leftJoin(
+        rfpEmbeddings,
+        and(
+          eq(rfpEmbeddings.rfpId, rfps.id),
+          eq(rfpEmbeddings.model, model),
+          eq(rfpEmbeddings.dimensions, dimensions)
+        )
+      )
+      .where(sql`${rfpEmbeddings.rfpId} IS NULL`)
+      .limit(limit);
+    return rows.map(row => row.id);
+  }
+
   /**
    * Get RFPs that are stalled in "drafting" status beyond their timeout
    * Used by the stall detection service to identify stuck proposal generations
@@ -1243,6 +1905,51 @@ export class DatabaseStorage implements IStorage {
     return updatedDocument;
   }
 
+  async getDocumentByContentHash(
+    rfpId: string,
+    contentHash: string
+  ): Promise<Document | undefined> {
+    const [document] = await db
+      .select()
+      .from(documents)
+      .where(
+        and(
+          eq(documents.rfpId, rfpId),
+          eq(documents.contentHash, contentHash)
+        )
+      )
+      .limit(1);
+    return document || undefined;
+  }
+
+  // Document Blobs
+  async getDocumentBlob(
+    contentHash: string
+  ): Promise<DocumentBlob | undefined> {
+    const [blob] = await db
+      .select()
+      .from(documentBlobs)
+      .where(eq(documentBlobs.contentHash, contentHash));
+    return blob || undefined;
+  }
+
+  async upsertDocumentBlob(blob: InsertDocumentBlob): Promise<DocumentBlob> {
+    // The first upload of a hash owns its object; later writers may only
+    // fill in extracted text
+    const [stored] = await db
+      .insert(documentBlobs)
+      .values(blob)
+      .onConflictDoUpdate({
+        target: documentBlobs.contentHash,
+        set: {
+          extractedText: sql`coalesce(excluded.extracted_text, ${documentBlobs.extractedText})`,
+          textExtractedAt: sql`coalesce(excluded.text_extracted_at, ${documentBlobs.textExtractedAt})`,
+        },
+      })
+      .returning();
+    return stored;
+  }
+
   // Submissions
   async getSubmission(id: string): Promise<Submission | undefined> {
     const [submission] = await db
@@ -1272,6 +1979,47 @@ export class DatabaseStorage implements IStorage {
     return mapSubmissionRows(rows);
   }
 
+  /**
+   * One page of submissions, newest first, keyset-ordered by
+   * (created_at, id)
+   */
+  async getSubmissionsPage(
+    options: { status?: string } & KeysetPageOptions
+  ): Promise<KeysetPage<Submission>> {
+    const cursor = parseCursor(options.cursor);
+    const conditions: SQL[] = [];
+    if (options.status) {
+      conditions.push(eq(submissions.status, options.status));
+    }
+    if (cursor) {
+      conditions.push(seekAfter(submissions.createdAt, submissions.id, cursor));
+    }
+
+    const rows = await db
+      .select({
+        item: submissions,
+        sortKey: cursorSortKey(submissions.createdAt),
+      })
+      .from(submissions)
+      .where(conditions.length > 0 ? and(...conditions) : undefined)
+      .orderBy(desc(submissions.createdAt), desc(submissions.id))
+      .limit(options.limit + 1)
+      .offset(cursor ? 0 : (options.offset ?? 0));
+
+    const page = toKeysetPage(rows, options.limit);
+    return { ...page, items: mapSubmissionRows(page.items) };
+  }
+
+  async countSubmissions(filters?: { status?: string }): Promise<number> {
+    const [result] = await db
+      .select({ count: count() })
+      .from(submissions)
+      .where(
+        filters?.status ? eq(submissions.status, filters.status) : undefined
+      );
+    return result?.count ?? 0;
+  }
+
   async getSubmissionsByRFP(rfpId: string): Promise<Submission[]> {
     const rows = await db
       .select()
@@ -1312,6 +2060,7 @@ export class DatabaseStorage implements IStorage {
       .insert(submissions)
       .values(submission)
       .returning();
+    this.invalidateMetrics();
     return toSubmission(newSubmission);
   }
 
@@ -1324,6 +2073,9 @@ export class DatabaseStorage implements IStorage {
       .set(updates)
       .where(eq(submissions.id, id))
       .returning();
+    if (updates.status !== undefined || updates.submittedAt !== undefined) {
+      this.invalidateMetrics();
+    }
     return toSubmission(updatedSubmission);
   }
 
@@ -1525,6 +2277,35 @@ export class DatabaseStorage implements IStorage {
       .orderBy(desc(auditLogs.timestamp));
   }
 
+  /**
+   * One page of an entity's audit trail, newest first, keyset-ordered by
+   * (timestamp, id)
+   */
+  async getAuditLogsPage(
+    entityType: string,
+    entityId: string,
+    options: KeysetPageOptions
+  ): Promise<KeysetPage<AuditLog>> {
+    const cursor = parseCursor(options.cursor);
+    const rows = await db
+      .select({ item: auditLogs, sortKey: cursorSortKey(auditLogs.timestamp) })
+      .from(auditLogs)
+      .where(
+        and(
+          eq(auditLogs.entityType, entityType),
+          eq(auditLogs.entityId, entityId),
+          cursor
+            ? seekAfter(auditLogs.timestamp, auditLogs.id, cursor)
+            : undefined
+        )
+      )
+      .orderBy(desc(auditLogs.timestamp), desc(auditLogs.id))
+      .limit(options.limit + 1)
+      .offset(cursor ? 0 : (options.offset ?? 0));
+
+    return toKeysetPage(rows, options.limit);
+  }
+
   // Notifications
   async getAllNotifications(limit: number = 50): Promise<Notification[]> {
     return await db
@@ -1560,85 +2341,134 @@ export class DatabaseStorage implements IStorage {
   }
 
   // Analytics
+  private cachedMetrics<T>(key: string, load: () => Promise<T>): Promise<T> {
+    const cached = this.metricsCache.get(key) as Promise<T> | undefined;
+    if (cached) return cached;
+
+    const pending = load();
+    this.metricsCache.set(key, pending);
+    pending.catch(() => this.metricsCache.delete(key));
+    return pending;
+  }
+
+  private invalidateMetrics(): void {
+    this.metricsCache.clear();
+  }
+
+  /**
+   * Dashboard metrics from the rollup counters: one indexed read of a few
+   * rows, whatever the size of the rfps and submissions tables
+   */
   async getDashboardMetrics(): Promise<DashboardMetrics> {
-    const startOfToday = new Date();
-    startOfToday.setHours(0, 0, 0, 0);
-
-    const [
-      activeRfpsCount,
-      submittedCount,
-      totalValue,
-      portalsCount,
-      newRfpsToday,
-      pendingReviewCount,
-      submissionsToday,
-    ] = await Promise.all([
-      db
-        .select({ count: count() })
-        .from(rfps)
-        .where(
-          or(
-            eq(rfps.status, 'discovered'),
-            eq(rfps.status, 'parsing'),
-            eq(rfps.status, 'drafting'),
-            eq(rfps.status, 'review'),
-            eq(rfps.status, 'approved')
-          )
-        ),
-      db
-        .select({ count: count() })
-        .from(rfps)
-        .where(eq(rfps.status, 'submitted')),
-      db
-        .select({
-          total: sql`COALESCE(SUM(CAST(estimated_value AS DECIMAL)), 0)`,
-        })
-        .from(rfps)
-        .where(or(eq(rfps.status, 'approved'), eq(rfps.status, 'submitted'))),
-      db.select({ count: count() }).from(portals),
-      db
-        .select({ count: count() })
-        .from(rfps)
-        .where(gte(rfps.discoveredAt, startOfToday)),
-      db.select({ count: count() }).from(rfps).where(eq(rfps.status, 'review')),
-      db
-        .select({ count: count() })
-        .from(submissions)
-        .where(
+    return this.cachedMetrics('dashboard', async () => {
+      let counters = await this.readDashboardCounters();
+      if (!counters.has('reconciled_at:')) {
+        // Never built: seed the rollup before the triggers take over
+        await this.reconcileDashboardRollup();
+        counters = await this.readDashboardCounters();
+      }
+
+      const counter = (metric: string, bucket = '') =>
+        counters.get(`${metric}:${bucket}`) ?? 0;
+      const today = utcDayBucket(new Date());
+
+      const activeRfps = ACTIVE_RFP_STATUSES.reduce(
+        (total, status) => total + counter('rfp_status', status),
+        0
+      );
+      const submittedRfps = counter('rfp_status', 'submitted');
+
+      return {
+        activeRfps,
+        submittedRfps,
+        totalValue:
+          counter('rfp_value', 'approved') + counter('rfp_value', 'submitted'),
+        portalsTracked: counter('portals'),
+        newRfpsToday: counter('rfps_discovered', today),
+        pendingReview: counter('rfp_status', 'review'),
+        submittedToday: counter('submissions_submitted', today),
+        winRate:
+          submittedRfps === 0
+            ? 0
+            : Math.min(
+                100,
+                Math.round(
+                  (submittedRfps / Math.max(activeRfps + submittedRfps, 1)) *
+                    100
+                )
+              ),
+        avgResponseTime: 0,
+      };
+    });
+  }
+
+  private async readDashboardCounters(): Promise<Map<string, number>> {
+    const rows = await db
+      .select({
+        metric: dashboardMetricCounters.metric,
+        bucket: dashboardMetricCounters.bucket,
+        value: dashboardMetricCounters.value,
+      })
+      .from(dashboardMetricCounters)
+      .where(
+        or(
+          inArray(dashboardMetricCounters.metric, [
+            'rfp_status',
+            'rfp_value',
+            'portals',
+            'reconciled_at',
+          ]),
           and(
-            eq(submissions.status, 'submitted'),
-            gte(submissions.submittedAt, startOfToday)
+            inArray(dashboardMetricCounters.metric, [
+              'rfps_discovered',
+              'submissions_submitted',
+            ]),
+            eq(dashboardMetricCounters.bucket, utcDayBucket(new Date()))
           )
-        ),
-    ]);
+        )
+      );
+
+    return new Map(
+      rows.map(row => [`${row.metric}:${row.bucket}`, Number(row.value)])
+    );
+  }
 
-    const activeRfps = Number(activeRfpsCount[0]?.count ?? 0);
-    const submittedRfps = Number(submittedCount[0]?.count ?? 0);
-    const portalsTracked = Number(portalsCount[0]?.count ?? 0);
-    const totalPipelineValue = Number(totalValue[0]?.total ?? 0);
-    const discoveredToday = Number(newRfpsToday[0]?.count ?? 0);
-    const pendingReview = Number(pendingReviewCount[0]?.count ?? 0);
-    const submittedToday = Number(submissionsToday[0]?.count ?? 0);
+  /**
+   * Rebuild the dashboard rollup from the source tables, correcting any
+   * drift (rows written with triggers disabled, TRUNCATE, manual fixes).
+   * Concurrent trigger updates wait on the table lock, so none are lost.
+   * Returns the number of counters written.
+   */
+  async reconcileDashboardRollup(): Promise<number> {
+    const written = await db.transaction(async tx => {
+      await tx.execute(
+        sql`LOCK TABLE ${dashboardMetricCounters} IN EXCLUSIVE MODE`
+      );
+      await tx.delete(dashboardMetricCounters);
+      const result = await tx.execute(sql`
+        INSERT INTO ${dashboardMetricCounters} (metric, bucket, value)
+        SELECT 'rfp_status', status, COUNT(*) FROM ${rfps} GROUP BY status
+        UNION ALL
+        SELECT 'rfp_value', status, COALESCE(SUM(estimated_value), 0)
+        FROM ${rfps} GROUP BY status
+        UNION ALL
+        SELECT 'rfps_discovered', to_char(discovered_at, 'YYYY-MM-DD'), COUNT(*)
+        FROM ${rfps} GROUP BY to_char(discovered_at, 'YYYY-MM-DD')
+        UNION ALL
+        SELECT 'submissions_submitted', to_char(submitted_at, 'YYYY-MM-DD'), COUNT(*)
+        FROM ${submissions}
+        WHERE status = 'submitted' AND submitted_at IS NOT NULL
+        GROUP BY to_char(submitted_at, 'YYYY-MM-DD')
+        UNION ALL
+        SELECT 'portals', '', COUNT(*) FROM ${portals}
+        UNION ALL
+        SELECT 'reconciled_at', '', EXTRACT(EPOCH FROM NOW())
+      `);
+      return result.rowCount ?? 0;
+    });
 
-    return {
-      activeRfps,
-      submittedRfps,
-      totalValue: totalPipelineValue,
-      portalsTracked,
-      newRfpsToday: discoveredToday,
-      pendingReview,
-      submittedToday,
-      winRate:
-        submittedRfps === 0
-          ? 0
-          : Math.min(
-              100,
-              Math.round(
-                (submittedRfps / Math.max(activeRfps + submittedRfps, 1)) * 100
-              )
-            ),
-      avgResponseTime: 0,
-    };
+    this.invalidateMetrics();
+    return written;
   }
 
   // AGENT PERFORMANCE MONITORING METHODS
@@ -1658,97 +2488,73 @@ export class DatabaseStorage implements IStorage {
   }
 
   async getWorkflowExecutionMetrics(): Promise<any> {
-    const totalWorkflows = await db
-      .select({ count: count() })
-      .from(workflowState);
-
-    const suspendedWorkflows = await db
-      .select({ count: count() })
-      .from(workflowState)
-      .where(eq(workflowState.status, 'suspended'));
-
-    const completedWorkflows = await db
-      .select({ count: count() })
-      .from(workflowState)
-      .where(eq(workflowState.status, 'completed'));
-
-    const failedWorkflows = await db
-      .select({ count: count() })
-      .from(workflowState)
-      .where(eq(workflowState.status, 'failed'));
-
-    // Average execution time for completed workflows using correct column names
-    const avgExecutionTime = await db
-      .select({
-        avg: sql`AVG(EXTRACT(EPOCH FROM (${workflowState.updatedAt} - ${workflowState.createdAt})))`,
-      })
-      .from(workflowState)
-      .where(eq(workflowState.status, 'completed'));
-
-    return {
-      totalWorkflows: totalWorkflows[0].count,
-      suspendedWorkflows: suspendedWorkflows[0].count,
-      completedWorkflows: completedWorkflows[0].count,
-      failedWorkflows: failedWorkflows[0].count,
-      successRate:
-        totalWorkflows[0].count > 0
-          ? (Number(completedWorkflows[0].count) /
-              Number(totalWorkflows[0].count)) *
-            100
-          : 0,
-      avgExecutionTimeSeconds: Number(avgExecutionTime[0].avg) || 0,
-    };
+    return this.cachedMetrics('workflows', async () => {
+      const [row] = await db
+        .select({
+          total: count(),
+          suspended: sql<number>`COUNT(*) FILTER (WHERE ${workflowState.status} = 'suspended')`,
+          completed: sql<number>`COUNT(*) FILTER (WHERE ${workflowState.status} = 'completed')`,
+          failed: sql<number>`COUNT(*) FILTER (WHERE ${workflowState.status} = 'failed')`,
+          // Average execution time for completed workflows
+          avgExecutionTime: sql`AVG(EXTRACT(EPOCH FROM (${workflowState.updatedAt} - ${workflowState.createdAt}))) FILTER (WHERE ${workflowState.status} = 'completed')`,
+        })
+        .from(workflowState);
+
+      const total = Number(row?.total ?? 0);
+      const completed = Number(row?.completed ?? 0);
+
+      return {
+        totalWorkflows: total,
+        suspendedWorkflows: Number(row?.suspended ?? 0),
+        completedWorkflows: completed,
+        failedWorkflows: Number(row?.failed ?? 0),
+        successRate: total > 0 ? (completed / total) * 100 : 0,
+        avgExecutionTimeSeconds: Number(row?.avgExecutionTime) || 0,
+      };
+    });
   }
 
   async getPortalHealthSummary(): Promise<any> {
-    const totalPortals = await db.select({ count: count() }).from(portals);
-
-    const activePortals = await db
-      .select({ count: count() })
-      .from(portals)
-      .where(eq(portals.status, 'active'));
+    return this.cachedMetrics('portals', async () => {
+      const [row] = await db
+        .select({
+          total: count(),
+          active: sql<number>`COUNT(*) FILTER (WHERE ${portals.status} = 'active')`,
+          errors: sql<number>`COUNT(*) FILTER (WHERE ${portals.status} = 'error')`,
+        })
+        .from(portals);
 
-    const errorPortals = await db
-      .select({ count: count() })
-      .from(portals)
-      .where(eq(portals.status, 'error'));
+      const total = Number(row?.total ?? 0);
+      const active = Number(row?.active ?? 0);
 
-    return {
-      total: totalPortals[0].count,
-      active: activePortals[0].count,
-      errors: errorPortals[0].count,
-      healthPercentage:
-        totalPortals[0].count > 0
-          ? (Number(activePortals[0].count) / Number(totalPortals[0].count)) *
-            100
-          : 0,
-    };
+      return {
+        total,
+        active,
+        errors: Number(row?.errors ?? 0),
+        healthPercentage: total > 0 ? (active / total) * 100 : 0,
+      };
+    });
   }
 
   async getAgentHealthSummary(): Promise<any> {
-    // Get total registered agents from agent_registry
-    const totalAgents = await db
-      .select({
-        count: sql`COUNT(*)`,
-      })
-      .from(agentRegistry);
-
-    // Get active agents (those with status = 'active' or 'busy')
-    const activeAgents = await db
-      .select({
-        count: sql`COUNT(*)`,
-      })
-      .from(agentRegistry)
-      .where(sql`${agentRegistry.status} IN ('active', 'busy')`);
+    return this.cachedMetrics('agents', async () => {
+      // Active agents are those with status 'active' or 'busy'
+      const [row] = await db
+        .select({
+          total: count(),
+          active: sql<number>`COUNT(*) FILTER (WHERE ${agentRegistry.status} IN ('active', 'busy'))`,
+        })
+        .from(agentRegistry);
 
-    const total = Number(totalAgents[0].count);
-    const active = Number(activeAgents[0].count);
+      const total = Number(row?.total ?? 0);
+      const active = Number(row?.active ?? 0);
 
-    return {
-      totalAgents: total,
-      activeAgents: active,
-      healthPercentage: total > 0 ? (active / total) * 100 : 0,
-    };
+      return {
+        totalAgents: total,
+        activeAgents: active,
+        healthPercentage: total > 0 ? (active / total) * 100 : 0,
+      };
+    });
   }
 
   async getCoordinationLogs(limit: number = 50): Promise<any[]> {
@@ -2177,13 +2983,73 @@ export class DatabaseStorage implements IStorage {
     return newScan;
   }
 
+  /**
+   * Update a scan. The update that first moves a scan to completed or
+   * failed also adds it to scan_daily_stats, in the same transaction.
+   */
   async updateScan(scanId: string, updates: Partial<Scan>): Promise<Scan> {
-    const [updatedScan] = await db
-      .update(scans)
-      .set(updates)
-      .where(eq(scans.id, scanId))
-      .returning();
-    return updatedScan;
+    if (!updates.status || !SCAN_FINISHED_STATUSES.includes(updates.status)) {
+      const [updatedScan] = await db
+        .update(scans)
+        .set(updates)
+        .where(eq(scans.id, scanId))
+        .returning();
+      return updatedScan;
+    }
+
+    return await db.transaction(async tx => {
+      const [previous] = await tx
+        .select({ status: scans.status })
+        .from(scans)
+        .where(eq(scans.id, scanId))
+        .for('update');
+      const [updatedScan] = await tx
+        .update(scans)
+        .set(updates)
+        .where(eq(scans.id, scanId))
+        .returning();
+      if (
+        !updatedScan ||
+        !previous ||
+        SCAN_FINISHED_STATUSES.includes(previous.status)
+      ) {
+        return updatedScan;
+      }
+
+      const durationMs = updatedScan.completedAt
+        ? Math.max(
+            0,
+            updatedScan.completedAt.getTime() - updatedScan.startedAt.getTime()
+          )
+        : 0;
+      await tx
+        .insert(scanDailyStats)
+        .values({
+          portalId: updatedScan.portalId,
+          portalName: updatedScan.portalName,
+          day: utcDayBucket(updatedScan.startedAt),
+          scanCount: 1,
+          successCount: updatedScan.status === 'completed' ? 1 : 0,
+          failedCount: updatedScan.status === 'failed' ? 1 : 0,
+          rfpsDiscovered: updatedScan.discoveredRfpsCount,
+          totalDurationMs: durationMs,
+          timedScanCount: updatedScan.completedAt ? 1 : 0,
+        })
+        .onConflictDoUpdate({
+          target: [scanDailyStats.portalId, scanDailyStats.day],
+          set: {
+            portalName: sql`excluded.portal_name`,
+            scanCount: sql`${scanDailyStats.scanCount} + excluded.scan_count`,
+            successCount: sql`${scanDailyStats.successCount} + excluded.success_count`,
+            failedCount: sql`${scanDailyStats.failedCount} + excluded.failed_count`,
+            rfpsDiscovered: sql`${scanDailyStats.rfpsDiscovered} + excluded.rfps_discovered`,
+            totalDurationMs: sql`${scanDailyStats.totalDurationMs} + excluded.total_duration_ms`,
+            timedScanCount: sql`${scanDailyStats.timedScanCount} + excluded.timed_scan_count`,
+            updatedAt: new Date(),
+          },
+        });
+      return updatedScan;
+    });
   }
 
   async getScan(scanId: string): Promise<Scan | undefined> {
@@ -2224,6 +3090,14 @@ export class DatabaseStorage implements IStorage {
     return newEvent;
   }
 
+  async appendScanEvents(events: InsertScanEvent[]): Promise<void> {
+    for (let i = 0; i < events.length; i += SCAN_EVENT_WRITE_BATCH_SIZE) {
+      await db
+        .insert(scanEvents)
+        .values(events.slice(i, i + SCAN_EVENT_WRITE_BATCH_SIZE));
+    }
+  }
+
   async getScanEvents(scanId: string): Promise<ScanEvent[]> {
     return await db
       .select()
@@ -2246,6 +3120,131 @@ export class DatabaseStorage implements IStorage {
       .limit(limit);
   }
 
+  /**
+   * One page of scans, newest first, keyset-ordered by (started_at, id)
+   */
+  async getScansPage(
+    filters: ScanListFilters & KeysetPageOptions
+  ): Promise<KeysetPage<Scan>> {
+    const cursor = parseCursor(filters.cursor);
+    const conditions = scanListConditions(filters);
+    if (cursor) {
+      conditions.push(seekAfter(scans.startedAt, scans.id, cursor));
+    }
+
+    const rows = await db
+      .select({ item: scans, sortKey: cursorSortKey(scans.startedAt) })
+      .from(scans)
+      .where(conditions.length > 0 ? and(...conditions) : undefined)
+      .orderBy(desc(scans.startedAt), desc(scans.id))
+      .limit(filters.limit + 1)
+      .offset(cursor ? 0 : (filters.offset ?? 0));
+
+    return toKeysetPage(rows, filters.limit);
+  }
+
+  /**
+   * Finished-scan totals per portal since a point in time. The rollup
+   * source reads scan_daily_stats at day granularity (from the start of
+   * `since`'s day); the scans source aggregates scan rows over the exact
+   * range.
+   */
+  async getScanPortalStats(
+    since: Date,
+    options: { source?: 'rollup' | 'scans' } = {}
+  ): Promise<ScanPortalStats[]> {
+    const rows =
+      options.source === 'scans'
+        ? await db
+            .select({
+              portalId: scans.portalId,
+              portalName: sql<string>`MAX(${scans.portalName})`,
+              scanCount: count(),
+              successCount: sql<number>`COUNT(*) FILTER (WHERE ${scans.status} = 'completed')`,
+              failedCount: sql<number>`COUNT(*) FILTER (WHERE ${scans.status} = 'failed')`,
+              rfpsDiscovered: sql<number>`COALESCE(SUM(${scans.discoveredRfpsCount}), 0)`,
+              totalDurationMs: sql<number>`COALESCE(SUM(EXTRACT(EPOCH FROM (${scans.completedAt} - ${scans.startedAt})) * 1000), 0)`,
+              timedScanCount: sql<number>`COUNT(${scans.completedAt})`,
+            })
+            .from(scans)
+            .where(
+              and(
+                gte(scans.startedAt, since),
+                inArray(scans.status, SCAN_FINISHED_STATUSES)
+              )
+            )
+            .groupBy(scans.portalId)
+        : await db
+            .select({
+              portalId: scanDailyStats.portalId,
+              portalName: sql<string>`MAX(${scanDailyStats.portalName})`,
+              scanCount: sql<number>`SUM(${scanDailyStats.scanCount})`,
+              successCount: sql<number>`SUM(${scanDailyStats.successCount})`,
+              failedCount: sql<number>`SUM(${scanDailyStats.failedCount})`,
+              rfpsDiscovered: sql<number>`SUM(${scanDailyStats.rfpsDiscovered})`,
+              totalDurationMs: sql<number>`SUM(${scanDailyStats.totalDurationMs})`,
+              timedScanCount: sql<number>`SUM(${scanDailyStats.timedScanCount})`,
+            })
+            .from(scanDailyStats)
+            .where(gte(scanDailyStats.day, utcDayBucket(since)))
+            .groupBy(scanDailyStats.portalId);
+
+    // SUM and COUNT come back from node-postgres as strings
+    return rows.map(row => ({
+      portalId: row.portalId,
+      portalName: row.portalName,
+      scanCount: Number(row.scanCount),
+      successCount: Number(row.successCount),
+      failedCount: Number(row.failedCount),
+      rfpsDiscovered: Number(row.rfpsDiscovered),
+      totalDurationMs: Number(row.totalDurationMs),
+      timedScanCount: Number(row.timedScanCount),
+    }));
+  }
+
+  /**
+   * Re-derive scan_daily_stats from scans for every day from `since`'s
+   * day onward. Corrects drift from scans finished outside updateScan.
+   */
+  async rebuildScanDailyStats(since: Date): Promise<number> {
+    const fromDay = utcDayBucket(since);
+    return await db.transaction(async tx => {
+      // Block concurrent completions so none is counted twice or lost
+      await tx.execute(sql`LOCK TABLE scan_daily_stats IN EXCLUSIVE MODE`);
+      await tx.delete(scanDailyStats).where(gte(scanDailyStats.day, fromDay));
+      const result = await tx.execute(sql`
+        INSERT INTO scan_daily_stats (
+          portal_id, portal_name, day, scan_count, success_count,
+          failed_count, rfps_discovered, total_duration_ms, timed_scan_count
+        )
+        SELECT
+          portal_id,
+          MAX(portal_name),
+          started_at::date,
+          COUNT(*),
+          COUNT(*) FILTER (WHERE status = 'completed'),
+          COUNT(*) FILTER (WHERE status = 'failed'),
+          COALESCE(SUM(discovered_rfps_count), 0),
+          COALESCE(SUM(EXTRACT(EPOCH FROM (completed_at - started_at)) * 1000), 0)::bigint,
+          COUNT(completed_at)
+        FROM scans
+        WHERE status IN ('completed', 'failed')
+          AND started_at >= ${fromDay}::date
+        GROUP BY portal_id, started_at::date
+      `);
+      return result.rowCount ?? 0;
+    });
+  }
+
+  async countScans(filters?: ScanListFilters): Promise<number> {
+    const conditions = scanListConditions(filters);
+    const [result] = await db
+      .select({ count: count() })
+      .from(scans)
+      .where(conditions.length > 0 ? and(...conditions) : undefined);
+    return result?.count ?? 0;
+  }
+
   // AI Conversation Operations
   async getAiConversation(id: string): Promise<AiConversation | undefined> {
     const [conversation] = await db
@@ -3221,6 +4220,208 @@ export class DatabaseStorage implements IStorage {
     return failedWorkItem;
   }
 
+  /**
+   * Atomically claim up to limit runnable work items (pending, or assigned
+   * but not yet started) and mark them in_progress under a lease of leaseMs.
+   * In-progress items whose lease has lapsed are reclaimed first. SKIP
+   * LOCKED lets any number of workers on any number of nodes claim
+   * concurrently without blocking each other or claiming the same row twice.
+   */
+  async claimWorkItems(options: {
+    limit: number;
+    excludeTaskTypes?: string[];
+    leaseMs: number;
+  }): Promise<ClaimedWorkItem[]> {
+    if (options.limit <= 0) return [];
+
+    const excluded = options.excludeTaskTypes ?? [];
+    const taskTypeFilter =
+      excluded.length > 0
+        ? sql`AND task_type NOT IN (${sql.join(
+            excluded.map(taskType => sql`${taskType}`),
+            sql`, `
+          )})`
+        : sql``;
+
+    const result = await db.execute(sql`
+      WITH expired AS (
+        SELECT id, lease_expires_at AS ready_at
+        FROM work_items
+        WHERE status = 'in_progress'
+          AND lease_expires_at < NOW()
+          ${taskTypeFilter}
+        ORDER BY lease_expires_at ASC
+        LIMIT ${options.limit}
+        FOR UPDATE SKIP LOCKED
+      ),
+      runnable AS (
+        SELECT id,
+               GREATEST(updated_at, COALESCE(next_retry_at, updated_at))
+                 AS ready_at
+        FROM work_items
+        WHERE status IN ('pending', 'assigned')
+          AND (next_retry_at IS NULL OR next_retry_at <= NOW())
+          ${taskTypeFilter}
+        ORDER BY priority ASC, deadline ASC NULLS LAST, created_at ASC
+        LIMIT ${options.limit} - (SELECT COUNT(*) FROM expired)
+        FOR UPDATE SKIP LOCKED
+      ),
+      candidates AS (
+        SELECT id, ready_at FROM expired
+        UNION ALL
+        SELECT id, ready_at FROM runnable
+      )
+      UPDATE work_items AS w
+      SET status = 'in_progress',
+          assigned_at = COALESCE(w.assigned_at, NOW()),
+          started_at = NOW(),
+          lease_expires_at = NOW() + ${options.leaseMs} * INTERVAL '1 millisecond',
+          updated_at = NOW()
+      FROM candidates
+      WHERE w.id = candidates.id
+      RETURNING w.id, candidates.ready_at, w.started_at AS claimed_at
+    `);
+
+    const claims = result.rows as Array<{
+      id: string;
+      ready_at: Date | string;
+      claimed_at: Date | string;
+    }>;
+    if (claims.length === 0) return [];
+
+    const rows = await db
+      .select()
+      .from(workItems)
+      .where(inArray(workItems.id, claims.map(claim => claim.id)));
+    const rowsById = new Map(rows.map(row => [row.id, row]));
+
+    return claims
+      .filter(claim => rowsById.has(claim.id))
+      .map(claim => ({
+        workItem: rowsById.get(claim.id)!,
+        readyAt: new Date(claim.ready_at),
+        claimedAt: new Date(claim.claimed_at),
+      }))
+      .sort(
+        (a, b) =>
+          a.workItem.priority - b.workItem.priority ||
+          (a.workItem.deadline?.getTime() ?? Infinity) -
+            (b.workItem.deadline?.getTime() ?? Infinity)
+      );
+  }
+
+  /**
+   * Push out the lease on in-progress work items this worker still holds
+   */
+  async extendWorkItemLeases(
+    workItemIds: string[],
+    leaseMs: number
+  ): Promise<void> {
+    if (workItemIds.length === 0) return;
+    await db
+      .update(workItems)
+      .set({
+        leaseExpiresAt: sql`NOW() + ${leaseMs} * INTERVAL '1 millisecond'`,
+      })
+      .where(
+        and(
+          inArray(workItems.id, workItemIds),
+          eq(workItems.status, 'in_progress')
+        )
+      );
+  }
+
+  async assignWorkItemsToAgent(
+    workItemIds: string[],
+    agentId: string
+  ): Promise<void> {
+    if (workItemIds.length === 0) return;
+    await db
+      .update(workItems)
+      .set({ assignedAgentId: agentId, updatedAt: sql`NOW()` })
+      .where(inArray(workItems.id, workItemIds));
+  }
+
+  /**
+   * Hand claimed work items back to the queue, optionally not claimable
+   * again before notBefore
+   */
+  async releaseWorkItems(
+    workItemIds: string[],
+    notBefore?: Date
+  ): Promise<void> {
+    if (workItemIds.length === 0) return;
+    await db
+      .update(workItems)
+      .set({
+        status: 'pending',
+        assignedAgentId: null,
+        startedAt: null,
+        leaseExpiresAt: null,
+        nextRetryAt: notBefore ?? null,
+        updatedAt: sql`NOW()`,
+      })
+      .where(inArray(workItems.id, workItemIds));
+  }
+
+  /**
+   * Move failed work items whose retry is due back to pending, oldest due
+   * first. Served by the partial work_items_due_retry_idx index, so the
+   * cost does not grow with the size of the work item history.
+   */
+  async requeueDueRetries(limit: number): Promise<WorkItem[]> {
+    const due = db
+      .select({ id: workItems.id })
+      .from(workItems)
+      .where(
+        and(
+          eq(workItems.status, 'failed'),
+          eq(workItems.canRetry, true),
+          lte(workItems.nextRetryAt, sql`NOW()`)
+        )
+      )
+      .orderBy(asc(workItems.nextRetryAt))
+      .limit(limit)
+      .for('update', { skipLocked: true });
+
+    return await db
+      .update(workItems)
+      .set({
+        status: 'pending',
+        assignedAgentId: null,
+        nextRetryAt: null,
+        lastRetryAt: sql`NOW()`,
+        updatedAt: sql`NOW()`,
+      })
+      .where(inArray(workItems.id, due))
+      .returning();
+  }
+
+  /**
+   * Earliest scheduled retry among failed work items, or null if none
+   */
+  async getNextRetryAt(): Promise<Date | null> {
+    const [row] = await db
+      .select({ nextRetryAt: min(workItems.nextRetryAt) })
+      .from(workItems)
+      .where(and(eq(workItems.status, 'failed'), eq(workItems.canRetry, true)));
+    return row?.nextRetryAt ?? null;
+  }
+
+  async getWorkItemQueueDepth(): Promise<Record<string, number>> {
+    const rows = await db
+      .select({ taskType: workItems.taskType, count: count() })
+      .from(workItems)
+      .where(inArray(workItems.status, ['pending', 'assigned']))
+      .groupBy(workItems.taskType);
+
+    const depth: Record<string, number> = {};
+    for (const row of rows) {
+      depth[row.taskType] = Number(row.count);
+    }
+    return depth;
+  }
+
   // Agent Session Operations (3-Tier Agentic System)
   async createAgentSession(session: InsertAgentSession): Promise<AgentSession> {
     const [newSession] = await db
@@ -3847,6 +5048,72 @@ export class DatabaseStorage implements IStorage {
       rating: parseFloat(metric.metricValue) * 5,
     }));
   }
+
+  // AI Response Cache
+  async getAiResponseCacheEntry(
+    cacheKey: string
+  ): Promise<AiResponseCacheEntry | undefined> {
+    const [entry] = await db
+      .select()
+      .from(aiResponseCache)
+      .where(
+        and(
+          eq(aiResponseCache.cacheKey, cacheKey),
+          gte(aiResponseCache.expiresAt, new Date())
+        )
+      );
+    return entry || undefined;
+  }
+
+  /**
+   * Add batched hit counts to cache entries, one UPDATE ... FROM (VALUES)
+   * statement per batch
+   */
+  async recordAiResponseCacheHits(hits: AiResponseCacheHit[]): Promise<void> {
+    for (let i = 0; i < hits.length; i += RFP_WRITE_BATCH_SIZE) {
+      const values = sql.join(
+        hits
+          .slice(i, i + RFP_WRITE_BATCH_SIZE)
+          .map(
+            hit =>
+              sql`(${hit.cacheKey}, ${hit.hits}::integer, ${hit.lastHitAt.toISOString()}::timestamp)`
+          ),
+        sql`, `
+      );
+
+      await db.execute(sql`
+        UPDATE ${aiResponseCache} SET
+          hit_count = ${aiResponseCache.hitCount} + v.hits,
+          last_hit_at = greatest(${aiResponseCache.lastHitAt}, v.last_hit_at)
+        FROM (VALUES ${values}) AS v(cache_key, hits, last_hit_at)
+        WHERE ${aiResponseCache.cacheKey} = v.cache_key
+      `);
+    }
+  }
+
+  async upsertAiResponseCacheEntry(
+    entry: InsertAiResponseCacheEntry
+  ): Promise<void> {
+    await db
+      .insert(aiResponseCache)
+      .values(entry)
+      .onConflictDoUpdate({
+        target: aiResponseCache.cacheKey,
+        set: {
+          value: entry.value,
+          expiresAt: entry.expiresAt,
+          createdAt: new Date(),
+        },
+      });
+  }
+
+  async deleteExpiredAiResponseCacheEntries(): Promise<number> {
+    const deleted = await db
+      .delete(aiResponseCache)
+      .where(lte(aiResponseCache.expiresAt, new Date()))
+      .returning({ cacheKey: aiResponseCache.cacheKey });
+    return deleted.length;
+  }
 }
 
 export const storage = new DatabaseStorage();
@@ -0,0 +1,82 @@
+import { sql, type SQL } from 'drizzle-orm';
+import type { AnyPgColumn } from 'drizzle-orm/pg-core';
+
+/**
+ * Opaque keyset pagination cursors.
+ *
+ * A cursor records the `(timestamp, id)` sort key of the last row on a page so
+ * the next page can seek past it with a row comparison instead of OFFSET.
+ * The timestamp is carried as Postgres text to keep microsecond precision;
+ * a JS Date would truncate to milliseconds and skip rows sharing that ms.
+ */
+export interface KeysetCursor {
+  sortKey: string;
+  id: string;
+}
+
+export function encodeCursor(sortKey: string, id: string): string {
+  return Buffer.from(JSON.stringify([sortKey, id])).toString('base64url');
+}
+
+export function decodeCursor(cursor: string): KeysetCursor | null {
+  try {
+    const parsed = JSON.parse(Buffer.from(cursor, 'base64url').toString());
+    if (
+      Array.isArray(parsed) &&
+      parsed.length === 2 &&
+      typeof parsed[0] === 'string' &&
+      typeof parsed[1] === 'string' &&
+      !Number.isNaN(Date.parse(parsed[0]))
+    ) {
+      return { sortKey: parsed[0], id: parsed[1] };
+    }
+  } catch {
+    // Fall through - malformed cursor
+  }
+  return null;
+}
+
+/**
+ * Select expression producing the cursor sort key for a timestamp column
+ */
+export function cursorSortKey(column: AnyPgColumn): SQL<string> {
+  return sql<string>`${column}::text`;
+}
+
+/**
+ * Row comparison that seeks past `cursor` for an `ORDER BY (column, id)`
+ * listing. Backed by a composite btree index on `(column, id)`.
+ */
+export function seekAfter(
+  column: AnyPgColumn,
+  idColumn: AnyPgColumn,
+  cursor: KeysetCursor,
+  direction: 'asc' | 'desc' = 'desc'
+): SQL {
+  const operator = direction === 'desc' ? sql.raw('<') : sql.raw('>');
+  return sql`(${column}, ${idColumn}) ${operator} (${cursor.sortKey}::timestamp, ${cursor.id})`;
+}
+
+export interface KeysetPage<T> {
+  items: T[];
+  nextCursor: string | null;
+}
+
+/**
+ * Trim a `limit + 1` row fetch down to one page. The extra row only tells
+ * us whether another page exists; the cursor points at the page's last row.
+ */
+export function toKeysetPage<T extends { id: string }>(
+  rows: Array<{ item: T; sortKey: string }>,
+  limit: number
+): KeysetPage<T> {
+  const page = rows.slice(0, limit);
+  const last = page[page.length - 1];
+  return {
+    items: page.map(row => row.item),
+    nextCursor:
+      rows.length > limit && last
+        ? encodeCursor(last.sortKey, last.item.id)
+        : null,
+  };
+}
@@ -0,0 +1,103 @@
+/**
+ * In-memory LRU cache with optional per-entry TTL.
+ *
+ * Backed by a Map, whose insertion order doubles as recency order: reads
+ * re-insert the entry, and eviction removes the first (least recent) key.
+ */
+
+export interface LRUCacheOptions {
+  maxSize: number;
+  ttlMs?: number; // Default TTL; entries never expire when omitted
+}
+
+export interface LRUCacheStats {
+  size: number;
+  maxSize: number;
+  hits: number;
+  misses: number;
+  evictions: number;
+  hitRate: number;
+}
+
+interface CacheEntry<V> {
+  value: V;
+  expiresAt: number | null;
+}
+
+export class LRUCache<K, V> {
+  private cache = new Map<K, CacheEntry<V>>();
+  private hits = 0;
+  private misses = 0;
+  private evictions = 0;
+
+  constructor(private readonly options: LRUCacheOptions) {}
+
+  get(key: K): V | undefined {
+    const entry = this.cache.get(key);
+    if (!entry) {
+      this.misses++;
+      return undefined;
+    }
+
+    if (entry.expiresAt !== null && entry.expiresAt <= Date.now()) {
+      this.cache.delete(key);
+      this.misses++;
+      return undefined;
+    }
+
+    // Move to end (most recently used)
+    this.cache.delete(key);
+    this.cache.set(key, entry);
+    this.hits++;
+    return entry.value;
+  }
+
+  set(key: K, value: V, ttlMs: number | undefined = this.options.ttlMs): void {
+    if (this.cache.has(key)) {
+      this.cache.delete(key);
+    } else if (this.cache.size >= this.options.maxSize) {
+      const oldestKey = this.cache.keys().next().value as K;
+      this.cache.delete(oldestKey);
+      this.evictions++;
+    }
+
+    this.cache.set(key, {
+      value,
+      expiresAt: ttlMs !== undefined ? Date.now() + ttlMs : null,
+    });
+  }
+
+  has(key: K): boolean {
+    const entry = this.cache.get(key);
+    if (!entry) return false;
+    if (entry.expiresAt !== null && entry.expiresAt <= Date.now()) {
+      this.cache.delete(key);
+      return false;
+    }
+    return true;
+  }
+
+  delete(key: K): boolean {
+    return this.cache.delete(key);
+  }
+
+  clear(): void {
+    this.cache.clear();
+  }
+
+  get size(): number {
+    return this.cache.size;
+  }
+
+  getStats(): LRUCacheStats {
+    const lookups = this.hits + this.misses;
+    return {
+      size: this.cache.size,
+      maxSize: this.options.maxSize,
+      hits: this.hits,
+      misses: this.misses,
+      evictions: this.evictions,
+      hitRate: lookups > 0 ? this.hits / lookups : 0,
+    };
+  }
+}
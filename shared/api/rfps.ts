@@ -6,6 +6,54 @@ export interface RfpDetail {
   proposal: Proposal | null;
 }
 
+/**
+ * `full` returns whole rows. `summary` leaves out the large JSON documents
+ * that list views never render.
+ */
+export const RFP_DETAIL_VIEWS = ['full', 'summary'] as const;
+
+export type RfpDetailView = (typeof RFP_DETAIL_VIEWS)[number];
+
+export const RFP_SUMMARY_OMITTED_COLUMNS = [
+  'requirements',
+  'complianceItems',
+  'analysis',
+] as const;
+
+export const PROPOSAL_SUMMARY_OMITTED_COLUMNS = [
+  'content',
+  'narratives',
+  'pricingTables',
+  'forms',
+  'attachments',
+  'proposalData',
+  'receiptData',
+  'generationDraft',
+] as const;
+
+export interface RfpDetailSummary {
+  rfp: Omit<RFP, (typeof RFP_SUMMARY_OMITTED_COLUMNS)[number]>;
+  portal: PublicPortal | null;
+  proposal: Omit<
+    Proposal,
+    (typeof PROPOSAL_SUMMARY_OMITTED_COLUMNS)[number]
+  > | null;
+}
+
+export interface RfpDetailQuery {
+  limit?: number;
+  cursor?: string;
+  view?: RfpDetailView;
+  status?: string;
+  /** Matched against title and agency, case-insensitively */
+  q?: string;
+}
+
+export interface RfpDetailPage<T = RfpDetail> {
+  items: T[];
+  nextCursor: string | null;
+}
+
 export const SUBMISSION_PROGRESS_STATUSES = ['approved', 'submitted'] as const;
 
 export type SubmissionProgressStatus =
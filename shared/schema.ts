@@ -1,11 +1,16 @@
 import { relations, sql } from 'drizzle-orm';
 import {
+  type AnyPgColumn,
+  bigint,
   boolean,
+  customType,
+  date,
   decimal,
   index,
   integer,
   jsonb,
   pgTable,
+  real,
   text,
   timestamp,
   unique,
@@ -14,6 +19,13 @@ import {
 import { createInsertSchema } from 'drizzle-zod';
 import { z } from 'zod';
 
+// Raw binary column (used for packed Float32Array embedding vectors)
+const bytea = customType<{ data: Buffer; driverData: Buffer }>({
+  dataType() {
+    return 'bytea';
+  },
+});
+
 // Helper to fix drizzle-zod type compatibility with newer Zod versions
 // Remove this helper and use direct type inference from drizzle-zod
 
@@ -68,6 +80,18 @@ export const portals = pgTable(
   })
 );
 
+/**
+ * Full-text search document for RFPs (title + description + agency).
+ * Search queries must build the tsvector with this exact expression so the
+ * planner can use idx_rfps_search_document_gin.
+ */
+export const rfpSearchDocument = (
+  title: AnyPgColumn,
+  description: AnyPgColumn,
+  agency: AnyPgColumn
+) =>
+  sql`to_tsvector('english', coalesce(${title}, '') || ' ' || coalesce(${description}, '') || ' ' || coalesce(${agency}, ''))`;
+
 export const rfps = pgTable(
   'rfps',
   {
@@ -129,6 +153,36 @@ export const rfps = pgTable(
       'gin',
       table.riskFlags
     ),
+    // Search indexes (see NaturalLanguageSearchService / storage.searchRFPs)
+    searchDocumentGinIdx: index('idx_rfps_search_document_gin').using(
+      'gin',
+      rfpSearchDocument(table.title, table.description, table.agency)
+    ),
+    discoveredAtIdIdx: index('idx_rfps_discovered_at_id').on(
+      table.discoveredAt,
+      table.id
+    ),
+    deadlineIdx: index('idx_rfps_deadline').on(table.deadline),
+    estimatedValueIdx: index('idx_rfps_estimated_value').on(
+      table.estimatedValue
+    ),
+    naicsCodeIdx: index('idx_rfps_naics_code').on(
+      table.naicsCode.op('varchar_pattern_ops')
+    ),
+    stateIdx: index('idx_rfps_state').on(table.state),
+    statusIdx: index('idx_rfps_status').on(table.status),
+    // Scan reconciliation (IncrementalPortalScanService) matches candidates
+    // within a portal by URL or portal-specific identifier
+    portalSourceUrlIdx: index('idx_rfps_portal_source_url').on(
+      table.portalId,
+      table.sourceUrl
+    ),
+    portalAnalysisSourceIdIdx: index(
+      'idx_rfps_portal_analysis_source_id'
+    ).on(table.portalId, sql`(${table.analysis}->>'sourceIdentifier')`),
+    portalRequirementsSourceIdIdx: index(
+      'idx_rfps_portal_requirements_source_id'
+    ).on(table.portalId, sql`(${table.requirements}->>'sourceIdentifier')`),
   })
 );
 
@@ -147,11 +201,12 @@ export const proposals = pgTable(
     forms: jsonb('forms'), // filled forms
     attachments: jsonb('attachments'), // file references
     proposalData: jsonb('proposal_data'), // structured proposal metadata
+    generationDraft: jsonb('generation_draft'), // sections checkpointed during generation
     estimatedCost: decimal('estimated_cost', { precision: 12, scale: 2 }),
     estimatedMargin: decimal('estimated_margin', { precision: 5, scale: 2 }),
     receiptData: jsonb('receipt_data'), // submission confirmation details
     submittedAt: timestamp('submitted_at'),
-    status: text('status').notNull().default('draft'), // draft, review, approved, submitted
+    status: text('status').notNull().default('draft'), // draft, review, approved, submitted, generation_failed
     generatedAt: timestamp('generated_at').defaultNow().notNull(),
     updatedAt: timestamp('updated_at').defaultNow().notNull(),
   },
@@ -170,33 +225,45 @@ export const proposals = pgTable(
   })
 );
 
-export const documents = pgTable('documents', {
-  id: varchar('id')
-    .primaryKey()
-    .default(sql`gen_random_uuid()`),
-  rfpId: varchar('rfp_id')
-    .references(() => rfps.id)
-    .notNull(),
-  filename: text('filename').notNull(),
-  fileType: text('file_type').notNull(),
-  objectPath: text('object_path').notNull(),
-  extractedText: text('extracted_text'),
-  parsedData: jsonb('parsed_data'),
-  uploadedAt: timestamp('uploaded_at').defaultNow().notNull(),
-
-  // Download tracking fields
-  sourceUrl: text('source_url'), // Original URL where document was found
-  sourceSize: integer('source_size'), // Expected size in bytes from source metadata
-  downloadedSize: integer('downloaded_size'), // Actual size after download
-  downloadStatus: text('download_status', {
-    enum: ['pending', 'downloading', 'completed', 'failed', 'verified'],
-  }).default('pending'),
-  downloadError: text('download_error'), // Error message if download failed
-  verificationStatus: text('verification_status', {
-    enum: ['pending', 'passed', 'failed', 'skipped'],
-  }).default('pending'),
-  downloadedAt: timestamp('downloaded_at'), // When the download completed
-});
+export const documents = pgTable(
+  'documents',
+  {
+    id: varchar('id')
+      .primaryKey()
+      .default(sql`gen_random_uuid()`),
+    rfpId: varchar('rfp_id')
+      .references(() => rfps.id)
+      .notNull(),
+    filename: text('filename').notNull(),
+    fileType: text('file_type').notNull(),
+    objectPath: text('object_path').notNull(),
+    extractedText: text('extracted_text'),
+    parsedData: jsonb('parsed_data'),
+    uploadedAt: timestamp('uploaded_at').defaultNow().notNull(),
+
+    // Download tracking fields
+    sourceUrl: text('source_url'), // Original URL where document was found
+    sourceSize: integer('source_size'), // Expected size in bytes from source metadata
+    downloadedSize: integer('downloaded_size'), // Actual size after download
+    downloadStatus: text('download_status', {
+      enum: ['pending', 'downloading', 'completed', 'failed', 'verified'],
+    }).default('pending'),
+    downloadError: text('download_error'), // Error message if download failed
+    verificationStatus: text('verification_status', {
+      enum: ['pending', 'passed', 'failed', 'skipped'],
+    }).default('pending'),
+    downloadedAt: timestamp('downloaded_at'), // When the download completed
+
+    // SHA-256 of the file bytes; shared with document_blobs
+    contentHash: varchar('content_hash', { length: 64 }),
+  },
+  table => ({
+    rfpContentHashIdx: index('idx_documents_rfp_content_hash').on(
+      table.rfpId,
+      table.contentHash
+    ),
+  })
+);
 
 export const submissions = pgTable(
   'submissions',
@@ -226,6 +293,11 @@ export const submissions = pgTable(
       'gin',
       table.submissionData
     ),
+    // Keyset pagination (storage.getSubmissionsPage)
+    createdAtIdIdx: index('idx_submissions_created_at_id').on(
+      table.createdAt,
+      table.id
+    ),
   })
 );
 
@@ -495,17 +567,29 @@ export const submissionStatusHistory = pgTable(
   })
 );
 
-export const auditLogs = pgTable('audit_logs', {
-  id: varchar('id')
-    .primaryKey()
-    .default(sql`gen_random_uuid()`),
-  entityType: text('entity_type').notNull(), // rfp, proposal, submission
-  entityId: varchar('entity_id').notNull(),
-  action: text('action').notNull(),
-  details: jsonb('details'),
-  userId: varchar('user_id').references(() => users.id),
-  timestamp: timestamp('timestamp').defaultNow().notNull(),
-});
+export const auditLogs = pgTable(
+  'audit_logs',
+  {
+    id: varchar('id')
+      .primaryKey()
+      .default(sql`gen_random_uuid()`),
+    entityType: text('entity_type').notNull(), // rfp, proposal, submission
+    entityId: varchar('entity_id').notNull(),
+    action: text('action').notNull(),
+    details: jsonb('details'),
+    userId: varchar('user_id').references(() => users.id),
+    timestamp: timestamp('timestamp').defaultNow().notNull(),
+  },
+  table => ({
+    // Keyset pagination of one entity's trail (storage.getAuditLogsPage)
+    entityTimestampIdIdx: index('idx_audit_logs_entity_timestamp_id').on(
+      table.entityType,
+      table.entityId,
+      table.timestamp,
+      table.id
+    ),
+  })
+);
 
 export const notifications = pgTable('notifications', {
   id: varchar('id')
@@ -521,27 +605,47 @@ export const notifications = pgTable('notifications', {
 });
 
 // Scan Management Tables
-export const scans = pgTable('scans', {
-  id: varchar('id')
-    .primaryKey()
-    .default(sql`gen_random_uuid()`),
-  portalId: varchar('portal_id')
-    .references(() => portals.id)
-    .notNull(),
-  portalName: text('portal_name').notNull(),
-  scanType: text('scan_type').notNull().default('Automated'), // Automated, Manual
-  status: text('status').notNull().default('running'), // running, completed, failed
-  startedAt: timestamp('started_at').defaultNow().notNull(),
-  completedAt: timestamp('completed_at'),
-  currentStep: text('current_step').notNull().default('initializing'), // initializing, authenticating, authenticated, navigating, extracting, parsing, saving, completed, failed
-  currentProgress: integer('current_progress').default(0).notNull(),
-  currentMessage: text('current_message'),
-  discoveredRfpsCount: integer('discovered_rfps_count').default(0).notNull(),
-  errorCount: integer('error_count').default(0).notNull(),
-  errors: jsonb('errors'), // array of error messages
-  discoveredRfps: jsonb('discovered_rfps'), // array of discovered RFP objects
-  createdAt: timestamp('created_at').defaultNow().notNull(),
-});
+export const scans = pgTable(
+  'scans',
+  {
+    id: varchar('id')
+      .primaryKey()
+      .default(sql`gen_random_uuid()`),
+    portalId: varchar('portal_id')
+      .references(() => portals.id)
+      .notNull(),
+    portalName: text('portal_name').notNull(),
+    scanType: text('scan_type').notNull().default('Automated'), // Automated, Manual
+    status: text('status').notNull().default('running'), // running, completed, failed
+    startedAt: timestamp('started_at').defaultNow().notNull(),
+    completedAt: timestamp('completed_at'),
+    currentStep: text('current_step').notNull().default('initializing'), // initializing, authenticating, authenticated, navigating, extracting, parsing, saving, completed, failed
+    currentProgress: integer('current_progress').default(0).notNull(),
+    currentMessage: text('current_message'),
+    discoveredRfpsCount: integer('discovered_rfps_count').default(0).notNull(),
+    errorCount: integer('error_count').default(0).notNull(),
+    errors: jsonb('errors'), // array of error messages
+    discoveredRfps: jsonb('discovered_rfps'), // array of discovered RFP objects
+    createdAt: timestamp('created_at').defaultNow().notNull(),
+  },
+  table => ({
+    // Keyset pagination of scan history (storage.getScansPage)
+    startedAtIdIdx: index('idx_scans_started_at_id').on(
+      table.startedAt,
+      table.id
+    ),
+    // Per-portal scan statistics over a time range
+    portalStartedAtIdx: index('idx_scans_portal_started_at').on(
+      table.portalId,
+      table.startedAt
+    ),
+    portalNameStartedAtIdx: index('idx_scans_portal_name_started_at_id').on(
+      table.portalName,
+      table.startedAt,
+      table.id
+    ),
+  })
+);
 
 export const scanEvents = pgTable('scan_events', {
   id: varchar('id')
@@ -757,29 +861,38 @@ export const agentMemory = pgTable('agent_memory', {
   updatedAt: timestamp('updated_at').defaultNow().notNull(),
 });
 
-export const agentKnowledgeBase = pgTable('agent_knowledge_base', {
-  id: varchar('id')
-    .primaryKey()
-    .default(sql`gen_random_uuid()`),
-  agentId: text('agent_id').notNull(),
-  knowledgeType: text('knowledge_type').notNull(), // rfp_pattern, compliance_rule, market_insight, pricing_data
-  domain: text('domain').notNull(), // technology, healthcare, construction, etc.
-  title: text('title').notNull(),
-  description: text('description'),
-  content: jsonb('content').notNull(), // structured knowledge data
-  confidenceScore: decimal('confidence_score', {
-    precision: 3,
-    scale: 2,
-  }).default('0.50'),
-  validationStatus: text('validation_status').default('pending').notNull(), // pending, validated, disputed, obsolete
-  sourceType: text('source_type').notNull(), // experience, training, research, feedback
-  sourceId: varchar('source_id'), // references source entity (RFP, conversation, etc.)
-  usageCount: integer('usage_count').default(0).notNull(),
-  successRate: decimal('success_rate', { precision: 3, scale: 2 }), // success rate when this knowledge is applied
-  tags: text('tags').array(),
-  createdAt: timestamp('created_at').defaultNow().notNull(),
-  updatedAt: timestamp('updated_at').defaultNow().notNull(),
-});
+export const agentKnowledgeBase = pgTable(
+  'agent_knowledge_base',
+  {
+    id: varchar('id')
+      .primaryKey()
+      .default(sql`gen_random_uuid()`),
+    agentId: text('agent_id').notNull(),
+    knowledgeType: text('knowledge_type').notNull(), // rfp_pattern, compliance_rule, market_insight, pricing_data
+    domain: text('domain').notNull(), // technology, healthcare, construction, etc.
+    title: text('title').notNull(),
+    description: text('description'),
+    content: jsonb('content').notNull(), // structured knowledge data
+    confidenceScore: decimal('confidence_score', {
+      precision: 3,
+      scale: 2,
+    }).default('0.50'),
+    validationStatus: text('validation_status').default('pending').notNull(), // pending, validated, disputed, obsolete
+    sourceType: text('source_type').notNull(), // experience, training, research, feedback
+    sourceId: varchar('source_id'), // references source entity (RFP, conversation, etc.)
+    usageCount: integer('usage_count').default(0).notNull(),
+    successRate: decimal('success_rate', { precision: 3, scale: 2 }), // success rate when this knowledge is applied
+    tags: text('tags').array(),
+    createdAt: timestamp('created_at').defaultNow().notNull(),
+    updatedAt: timestamp('updated_at').defaultNow().notNull(),
+  },
+  table => ({
+    // Incremental knowledge graph sync reads rows changed since a watermark
+    updatedAtIdx: index('agent_knowledge_base_updated_at_idx').on(
+      table.updatedAt
+    ),
+  })
+);
 
 export const agentCoordinationLog = pgTable('agent_coordination_log', {
   id: varchar('id')
@@ -1196,6 +1309,7 @@ export const workItems = pgTable(
     updatedAt: timestamp('updated_at').defaultNow().notNull(),
     assignedAt: timestamp('assigned_at'),
     startedAt: timestamp('started_at'),
+    leaseExpiresAt: timestamp('lease_expires_at'), // claim may be taken over after this
     completedAt: timestamp('completed_at'),
     failedAt: timestamp('failed_at'),
     cancelledAt: timestamp('cancelled_at'),
@@ -1223,6 +1337,18 @@ export const workItems = pgTable(
       table.priority,
       table.deadline
     ),
+    // Claim order for the work item queue, over runnable rows only
+    claimIdx: index('work_items_claim_idx')
+      .on(table.priority, table.deadline, table.createdAt)
+      .where(sql`${table.status} IN ('pending', 'assigned')`),
+    // Lapsed claims for the work item queue to reclaim
+    leaseIdx: index('work_items_lease_idx')
+      .on(table.leaseExpiresAt)
+      .where(sql`${table.status} = 'in_progress'`),
+    // Due-retry lookups for the retry scheduler
+    dueRetryIdx: index('work_items_due_retry_idx')
+      .on(table.nextRetryAt)
+      .where(sql`${table.status} = 'failed' AND ${table.canRetry}`),
     // GIN indexes for JSONB columns
     inputsGinIdx: index('idx_work_items_inputs_gin').using('gin', table.inputs),
     metadataGinIdx: index('idx_work_items_metadata_gin').using(
@@ -1276,6 +1402,160 @@ export const agentSessions = pgTable(
   })
 );
 
+// Persistent embedding per RFP. contentHash identifies the embedded text
+// version so unchanged RFPs are never re-embedded.
+export const rfpEmbeddings = pgTable(
+  'rfp_embeddings',
+  {
+    rfpId: varchar('rfp_id')
+      .primaryKey()
+      .references(() => rfps.id, { onDelete: 'cascade' }),
+    model: text('model').notNull(),
+    dimensions: integer('dimensions').notNull(),
+    contentHash: varchar('content_hash', { length: 64 }).notNull(), // sha256 hex
+    embedding: bytea('embedding').notNull(), // packed little-endian Float32Array
+    updatedAt: timestamp('updated_at').defaultNow().notNull(),
+  },
+  table => ({
+    modelIdx: index('rfp_embeddings_model_idx').on(
+      table.model,
+      table.dimensions
+    ),
+    updatedAtIdx: index('rfp_embeddings_updated_at_idx').on(table.updatedAt),
+  })
+);
+
+// Shared cache for AI responses (parsed search queries, LLM completions).
+// Backs the in-process LRU caches so entries survive restarts and are shared
+// across instances.
+export const aiResponseCache = pgTable(
+  'ai_response_cache',
+  {
+    cacheKey: varchar('cache_key', { length: 64 }).primaryKey(), // sha256 hex
+    namespace: text('namespace').notNull(), // e.g. nl-search-parse
+    value: jsonb('value').notNull(),
+    hitCount: integer('hit_count').default(0).notNull(),
+    expiresAt: timestamp('expires_at').notNull(),
+    createdAt: timestamp('created_at').defaultNow().notNull(),
+    lastHitAt: timestamp('last_hit_at'),
+  },
+  table => ({
+    namespaceIdx: index('ai_response_cache_namespace_idx').on(table.namespace),
+    expiresAtIdx: index('ai_response_cache_expires_at_idx').on(
+      table.expiresAt
+    ),
+  })
+);
+
+// Knowledge graph adjacency. Nodes are agent_knowledge_base rows; edges are
+// kept here so the graph can be updated one node at a time.
+export const knowledgeGraphEdges = pgTable(
+  'knowledge_graph_edges',
+  {
+    graphKey: text('graph_key').notNull(), // knowledge domain, or '*' for all domains
+    fromId: varchar('from_id').notNull(),
+    toId: varchar('to_id').notNull(),
+    relationship: text('relationship').notNull(), // causes, enables, conflicts, supports, requires, similar
+    strength: real('strength').notNull(),
+    confidence: real('confidence').notNull(),
+    evidence: jsonb('evidence').$type<string[]>().default([]).notNull(),
+    updatedAt: timestamp('updated_at').defaultNow().notNull(),
+  },
+  table => ({
+    uniqueEdge: unique('knowledge_graph_edges_unique_edge').on(
+      table.graphKey,
+      table.fromId,
+      table.toId
+    ),
+    toIdx: index('knowledge_graph_edges_to_idx').on(
+      table.graphKey,
+      table.toId
+    ),
+  })
+);
+
+// Dashboard metrics rollup, kept current by statement-level triggers on rfps,
+// submissions and portals (migrations/add_dashboard_metric_rollup.sql) and
+// rebuilt by the reconciliation job
+export const dashboardMetricCounters = pgTable(
+  'dashboard_metric_counters',
+  {
+    metric: text('metric').notNull(), // rfp_status, rfp_value, rfps_discovered, submissions_submitted, portals
+    bucket: text('bucket').notNull().default(''), // status, YYYY-MM-DD day, or '' for totals
+    value: decimal('value', { precision: 18, scale: 2 }).notNull().default('0'),
+    updatedAt: timestamp('updated_at').defaultNow().notNull(),
+  },
+  table => ({
+    uniqueCounter: unique('dashboard_metric_counters_unique_counter').on(
+      table.metric,
+      table.bucket
+    ),
+  })
+);
+
+// Finished scans per portal per day (by started_at), updated as each scan
+// completes or fails. Backs scan statistics without scanning history.
+export const scanDailyStats = pgTable(
+  'scan_daily_stats',
+  {
+    portalId: varchar('portal_id')
+      .references(() => portals.id)
+      .notNull(),
+    portalName: text('portal_name').notNull(),
+    day: date('day', { mode: 'string' }).notNull(),
+    scanCount: integer('scan_count').default(0).notNull(),
+    successCount: integer('success_count').default(0).notNull(),
+    failedCount: integer('failed_count').default(0).notNull(),
+    rfpsDiscovered: integer('rfps_discovered').default(0).notNull(),
+    totalDurationMs: bigint('total_duration_ms', { mode: 'number' })
+      .default(0)
+      .notNull(),
+    timedScanCount: integer('timed_scan_count').default(0).notNull(), // scans with a completedAt, the divisor for average duration
+    updatedAt: timestamp('updated_at').defaultNow().notNull(),
+  },
+  table => ({
+    uniquePortalDay: unique('scan_daily_stats_unique_portal_day').on(
+      table.portalId,
+      table.day
+    ),
+    dayIdx: index('idx_scan_daily_stats_day').on(table.day),
+  })
+);
+
+// Latest state per stream (e.g. a proposal session's progress) published on
+// the cross-instance event bus, replayed to clients that connect to another
+// node after the event was sent
+export const eventBusSnapshots = pgTable(
+  'event_bus_snapshots',
+  {
+    topic: text('topic').notNull(),
+    key: text('key').notNull(),
+    payload: jsonb('payload').notNull(),
+    updatedAt: timestamp('updated_at').defaultNow().notNull(),
+  },
+  table => ({
+    uniqueTopicKey: unique('event_bus_snapshots_unique_topic_key').on(
+      table.topic,
+      table.key
+    ),
+    updatedAtIdx: index('idx_event_bus_snapshots_updated_at').on(
+      table.updatedAt
+    ),
+  })
+);
+
+// One row per distinct document body, keyed by its SHA-256. Downloads with
+// a known hash reuse the stored object and its extracted text.
+export const documentBlobs = pgTable('document_blobs', {
+  contentHash: varchar('content_hash', { length: 64 }).primaryKey(), // sha256 hex
+  objectPath: text('object_path').notNull(),
+  size: integer('size').notNull(),
+  contentType: text('content_type'),
+  extractedText: text('extracted_text'),
+  textExtractedAt: timestamp('text_extracted_at'),
+  createdAt: timestamp('created_at').defaultNow().notNull(),
+});
+
 // Relations
 export const portalsRelations = relations(portals, ({ many }) => ({
   rfps: many(rfps),
@@ -2187,3 +2467,17 @@ export type WorkflowDependency = typeof workflowDependencies.$inferSelect;
 export type InsertWorkflowDependency = z.infer<
   typeof insertWorkflowDependenciesSchema & any
 >;
+
+export type AiResponseCacheEntry = typeof aiResponseCache.$inferSelect;
+export type InsertAiResponseCacheEntry = typeof aiResponseCache.$inferInsert;
+
+export type RFPEmbedding = typeof rfpEmbeddings.$inferSelect;
+export type InsertRFPEmbedding = typeof rfpEmbeddings.$inferInsert;
+
+export type KnowledgeGraphEdgeRow = typeof knowledgeGraphEdges.$inferSelect;
+export type InsertKnowledgeGraphEdge = typeof knowledgeGraphEdges.$inferInsert;
+export type DashboardMetricCounter = typeof dashboardMetricCounters.$inferSelect;
+export type ScanDailyStats = typeof scanDailyStats.$inferSelect;
+export type EventBusSnapshot = typeof eventBusSnapshots.$inferSelect;
+export type DocumentBlob = typeof documentBlobs.$inferSelect;
+export type InsertDocumentBlob = typeof documentBlobs.$inferInsert;
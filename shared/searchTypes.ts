@@ -38,6 +38,16 @@ export const SearchFiltersSchema = z.object({
 
 export type SearchFilters = z.infer<typeof SearchFiltersSchema>;
 
+/**
+ * How the total match count is computed:
+ * - exact: COUNT(*) over the compiled predicate
+ * - estimated: planner row estimate for broad queries (exact when small)
+ * - none: skip counting
+ */
+export const SearchCountModeSchema = z.enum(['exact', 'estimated', 'none']);
+
+export type SearchCountMode = z.infer<typeof SearchCountModeSchema>;
+
 /**
  * Natural language search request
  */
@@ -46,6 +56,8 @@ export const NaturalLanguageSearchRequestSchema = z.object({
   conversationId: z.string().optional(),
   limit: z.number().int().min(1).max(100).default(20),
   offset: z.number().int().min(0).default(0),
+  cursor: z.string().optional(), // Opaque keyset cursor from a previous page
+  countMode: SearchCountModeSchema.default('exact'),
 });
 
 export type NaturalLanguageSearchRequest = z.infer<
@@ -57,7 +69,9 @@ export type NaturalLanguageSearchRequest = z.infer<
  */
 export const NaturalLanguageSearchResponseSchema = z.object({
   rfps: z.array(z.any()), // Will be typed as RFP[]
-  totalCount: z.number(),
+  totalCount: z.number().nullable(),
+  totalCountEstimated: z.boolean().optional(),
+  nextCursor: z.string().nullable().optional(),
   appliedFilters: SearchFiltersSchema,
   explanation: z.string(),
   suggestions: z.array(z.string()).optional(), // Related search suggestions
@@ -68,6 +68,12 @@ export interface PoolConfig {
 
     /** Cooldown period between scaling operations (ms) */
     cooldownPeriod: number;
+
+    /** Scale up when the p95 checkout wait exceeds this (ms, default 100) */
+    targetWaitMs?: number;
+
+    /** Interval between background scaling evaluations (ms, default 5000) */
+    evaluationInterval?: number;
   };
 
   /** Health check configuration */
@@ -117,6 +123,9 @@ export interface PoolStats {
   /** Average task execution time */
   avgExecutionTime: number;
 
+  /** Checkouts waiting for an agent */
+  queuedRequests: number;
+
   /** Pool configuration */
   config: PoolConfig;
 
@@ -129,12 +138,99 @@ export interface PoolStats {
   };
 }
 
+/**
+ * Distribution of checkout wait times for a pool
+ */
+export interface WaitTimeHistogram {
+  /** Checkouts that received an agent */
+  count: number;
+
+  /** Checkouts that found no idle agent and did not wait */
+  misses: number;
+
+  /** Checkouts that timed out waiting */
+  timeouts: number;
+
+  /** Wait percentiles in milliseconds (bucket upper bounds) */
+  p50: number;
+  p95: number;
+  p99: number;
+  maxMs: number;
+
+  /** Cumulative counts of waits at or below each bound (ms) */
+  buckets: Array<{ le: number | '+Inf'; count: number }>;
+}
+
+export interface AcquireOptions {
+  /** How long to wait for an idle agent before rejecting (default 30000) */
+  timeoutMs?: number;
+}
+
+/**
+ * Thrown by acquire when no agent became idle in time
+ */
+export class AgentPoolTimeoutError extends Error {
+  constructor(poolName: string, timeoutMs: number) {
+    super(
+      `Timed out after ${timeoutMs}ms waiting for an agent from pool '${poolName}'`
+    );
+    this.name = 'AgentPoolTimeoutError';
+  }
+}
+
+const WAIT_BUCKETS_MS = [
+  0, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000,
+];
+const MAX_RECENT_WAITS = 1000;
+const DEFAULT_TARGET_WAIT_MS = 100;
+const DEFAULT_EVALUATION_INTERVAL_MS = 5000;
+const DEFAULT_ACQUIRE_TIMEOUT_MS = 30000;
+
+interface PoolWaiter {
+  enqueuedAt: number;
+  resolve: (agent: Agent) => void;
+  reject: (error: Error) => void;
+  timer: NodeJS.Timeout;
+}
+
+/**
+ * Internal state of one pool. Idle instances are kept in a Map whose
+ * insertion order is least recently used first, and busy instances are
+ * indexed by their agent for release, so neither checkout nor release
+ * scans the pool.
+ */
+interface PoolState {
+  config: PoolConfig;
+  instances: Map<string, PooledAgent>;
+  idle: Map<string, PooledAgent>;
+  busy: Map<Agent, PooledAgent[]>;
+  busyCount: number;
+  waiters: PoolWaiter[];
+  waitBuckets: number[];
+  waitCount: number;
+  maxWaitMs: number;
+  misses: number;
+  timeouts: number;
+  /** Waits and misses since the last scaling evaluation */
+  recentWaits: number[];
+  recentMisses: number;
+  lastScaling?: PoolStats['lastScaling'];
+  lastScaledAt?: number;
+  evaluationPending: boolean;
+}
+
 /**
  * Agent Pool Manager
  *
  * Manages pools of agent instances for load balancing and auto-scaling.
  * Provides strategies for agent selection and automatic pool size management.
  *
+ * Checkout and release only touch the pool's idle and busy indexes. Sizing
+ * is not decided on checkout: a background evaluator per auto-scaled pool
+ * looks at recent checkout waits (p95 against autoScale.targetWaitMs),
+ * queued and missed checkouts, and utilization, and is also woken as soon
+ * as a checkout has to queue or comes back empty.
+ *
  * @example
  * ```typescript
  * const poolManager = new AgentPoolManager();
@@ -154,8 +250,10 @@ export interface PoolStats {
  *   }
  * });
  *
- * // Get an agent from pool
- * const agent = poolManager.getAgent('proposal-workers');
+ * // Get an agent from pool, waiting up to 10s for one to become idle
+ * const agent = await poolManager.acquire('proposal-workers', {
+ *   timeoutMs: 10000,
+ * });
  *
  * // Execute task
  * await agent.execute(task);
@@ -165,9 +263,8 @@ export interface PoolStats {
  * ```
  */
 export class AgentPoolManager {
-  private pools = new Map<string, PooledAgent[]>();
-  private configs = new Map<string, PoolConfig>();
-  private scalingCooldowns = new Map<string, Date>();
+  private pools = new Map<string, PoolState>();
+  private evaluators = new Map<string, NodeJS.Timeout>();
   private nextInstanceId = 0;
 
   /**
@@ -193,57 +290,95 @@ export class AgentPoolManager {
       }
     }
 
-    // Store configuration
-    this.configs.set(config.name, config);
+    const state: PoolState = {
+      config,
+      instances: new Map(),
+      idle: new Map(),
+      busy: new Map(),
+      busyCount: 0,
+      waiters: [],
+      waitBuckets: new Array(WAIT_BUCKETS_MS.length + 1).fill(0),
+      waitCount: 0,
+      maxWaitMs: 0,
+      misses: 0,
+      timeouts: 0,
+      recentWaits: [],
+      recentMisses: 0,
+      evaluationPending: false,
+    };
 
     // Initialize pool with minimum size
-    const pooledAgents: PooledAgent[] = [];
     for (let i = 0; i < config.minSize; i++) {
-      const agent = this.createPooledAgent(config.agentIds);
-      if (agent) {
-        pooledAgents.push(agent);
-      }
+      this.addInstance(state);
     }
 
-    this.pools.set(config.name, pooledAgents);
+    this.pools.set(config.name, state);
+
+    if (config.autoScale?.enabled) {
+      const timer = setInterval(
+        () => this.evaluateScaling(config.name),
+        config.autoScale.evaluationInterval ?? DEFAULT_EVALUATION_INTERVAL_MS
+      );
+      timer.unref();
+      this.evaluators.set(config.name, timer);
+    }
   }
 
   /**
-   * Get an agent from the pool using the configured strategy
+   * Get an idle agent from the pool using the configured strategy
    *
    * @param poolName - Name of the pool
-   * @returns Agent instance or null if none available
+   * @returns Agent instance or null if none is idle
    */
   getAgent(poolName: string): Agent | null {
-    const pool = this.pools.get(poolName);
-    const config = this.configs.get(poolName);
-
-    if (!pool || !config) {
-      throw new Error(`Pool '${poolName}' not found`);
-    }
+    const state = this.getState(poolName);
+    const selected = this.selectAgent(state);
 
-    // Check if auto-scaling needed
-    this.checkAutoScale(poolName);
-
-    // Get idle agents
-    const idleAgents = pool.filter(pa => pa.status === 'idle');
-
-    if (idleAgents.length === 0) {
+    if (!selected) {
+      state.misses++;
+      state.recentMisses++;
+      this.requestEvaluation(poolName);
       return null;
     }
 
-    // Select agent based on strategy
-    const selectedAgent = this.selectAgent(idleAgents, config.strategy);
-
-    if (!selectedAgent) {
-      return null;
-    }
-
-    // Mark as busy
-    selectedAgent.status = 'busy';
-    selectedAgent.lastUsed = new Date();
+    this.recordWait(state, 0);
+    return this.checkOut(state, selected);
+  }
 
-    return selectedAgent.agent;
+  /**
+   * Get an agent from the pool, waiting for one to be released or added
+   * when none is idle
+   *
+   * @param poolName - Name of the pool
+   * @param options - Wait timeout
+   * @throws AgentPoolTimeoutError if no agent became idle in time
+   */
+  acquire(poolName: string, options: AcquireOptions = {}): Promise<Agent> {
+    const state = this.getState(poolName);
+    const selected = this.selectAgent(state);
+
+    if (selected) {
+      this.recordWait(state, 0);
+      return Promise.resolve(this.checkOut(state, selected));
+    }
+
+    const timeoutMs = options.timeoutMs ?? DEFAULT_ACQUIRE_TIMEOUT_MS;
+    return new Promise<Agent>((resolve, reject) => {
+      const waiter: PoolWaiter = {
+        enqueuedAt: Date.now(),
+        resolve,
+        reject,
+        timer: setTimeout(() => {
+          const index = state.waiters.indexOf(waiter);
+          if (index !== -1) state.waiters.splice(index, 1);
+          state.timeouts++;
+          this.recordRecentWait(state, Date.now() - waiter.enqueuedAt);
+          reject(new AgentPoolTimeoutError(poolName, timeoutMs));
+        }, timeoutMs),
+      };
+      state.waiters.push(waiter);
+      this.requestEvaluation(poolName);
+    });
   }
 
   /**
@@ -262,17 +397,21 @@ export class AgentPoolManager {
       error?: Error;
     }
   ): void {
-    const pool = this.pools.get(poolName);
+    const state = this.getState(poolName);
+    const pooledAgent = state.busy.get(agent)?.pop();
 
-    if (!pool) {
-      throw new Error(`Pool '${poolName}' not found`);
+    if (!pooledAgent) {
+      if (!this.containsAgent(state, agent)) {
+        throw new Error(`Agent not found in pool '${poolName}'`);
+      }
+      // Already idle or failed; nothing is checked out for this agent
+      return;
     }
 
-    const pooledAgent = pool.find(pa => pa.agent === agent);
-
-    if (!pooledAgent) {
-      throw new Error(`Agent not found in pool '${poolName}'`);
+    if (state.busy.get(agent)!.length === 0) {
+      state.busy.delete(agent);
     }
+    state.busyCount--;
 
     // Update agent state
     if (taskInfo) {
@@ -297,14 +436,13 @@ export class AgentPoolManager {
         // Mark as failed if too many errors
         if (pooledAgent.errorCount > 3) {
           pooledAgent.status = 'failed';
+          pooledAgent.currentTask = undefined;
           return;
         }
       }
     }
 
-    // Mark as idle
-    pooledAgent.status = 'idle';
-    pooledAgent.currentTask = undefined;
+    this.makeIdle(state, pooledAgent);
   }
 
   /**
@@ -314,12 +452,8 @@ export class AgentPoolManager {
    * @param targetSize - Target number of instances
    */
   scalePool(poolName: string, targetSize: number): void {
-    const pool = this.pools.get(poolName);
-    const config = this.configs.get(poolName);
-
-    if (!pool || !config) {
-      throw new Error(`Pool '${poolName}' not found`);
-    }
+    const state = this.getState(poolName);
+    const { config } = state;
 
     // Validate target size
     if (targetSize < config.minSize || targetSize > config.maxSize) {
@@ -328,50 +462,111 @@ export class AgentPoolManager {
       );
     }
 
-    const currentSize = pool.length;
+    const previousSize = state.instances.size;
 
-    if (currentSize === targetSize) {
+    if (previousSize === targetSize) {
       return; // Already at target size
     }
 
-    const previousSize = currentSize;
-
-    if (targetSize > currentSize) {
+    if (targetSize > previousSize) {
       // Scale up - add instances
-      const instancesToAdd = targetSize - currentSize;
-      for (let i = 0; i < instancesToAdd; i++) {
-        const agent = this.createPooledAgent(config.agentIds);
-        if (agent) {
-          pool.push(agent);
-        }
+      for (let i = previousSize; i < targetSize; i++) {
+        const added = this.addInstance(state);
+        if (added) this.makeIdle(state, added);
       }
     } else {
-      // Scale down - remove idle instances
-      const instancesToRemove = currentSize - targetSize;
-      const idleAgents = pool.filter(pa => pa.status === 'idle');
-
-      const removed = idleAgents.slice(0, instancesToRemove);
-      for (const agent of removed) {
-        const index = pool.indexOf(agent);
-        if (index !== -1) {
-          pool.splice(index, 1);
-        }
+      // Scale down - remove idle instances, least recently used first
+      let instancesToRemove = previousSize - targetSize;
+      for (const pooledAgent of state.idle.values()) {
+        if (instancesToRemove-- <= 0) break;
+        state.idle.delete(pooledAgent.instanceId);
+        state.instances.delete(pooledAgent.instanceId);
       }
     }
 
     // Record scaling operation
-    const stats = this.getPoolStats(poolName);
-    if (stats) {
-      stats.lastScaling = {
-        action: targetSize > previousSize ? 'scale-up' : 'scale-down',
-        timestamp: new Date(),
-        fromSize: previousSize,
-        toSize: pool.length,
-      };
+    const now = Date.now();
+    state.lastScaling = {
+      action: targetSize > previousSize ? 'scale-up' : 'scale-down',
+      timestamp: new Date(now),
+      fromSize: previousSize,
+      toSize: state.instances.size,
+    };
+
+    // Set cooldown; later decisions only look at waits after this one
+    state.lastScaledAt = now;
+    state.recentWaits = [];
+    state.recentMisses = 0;
+  }
+
+  /**
+   * Decide whether an auto-scaled pool should grow or shrink, and do it.
+   * Runs on each pool's evaluation interval and whenever a checkout has
+   * to wait or finds no idle agent.
+   *
+   * Scales up when checkouts are queued or missed, or when the p95 wait
+   * since the previous evaluation exceeds targetWaitMs and utilization is
+   * at or above scaleUpThreshold. Scales down when nothing waited and
+   * utilization is at or below scaleDownThreshold.
+   *
+   * @param poolName - Name of the pool
+   */
+  evaluateScaling(poolName: string): void {
+    const state = this.pools.get(poolName);
+    const autoScale = state?.config.autoScale;
+
+    if (!state || !autoScale?.enabled) {
+      return;
+    }
+
+    // Check cooldown
+    if (
+      state.lastScaledAt !== undefined &&
+      Date.now() - state.lastScaledAt < autoScale.cooldownPeriod
+    ) {
+      return;
     }
 
-    // Set cooldown
-    this.scalingCooldowns.set(poolName, new Date());
+    const { config } = state;
+    const currentSize = state.instances.size;
+    const utilization = currentSize > 0 ? state.busyCount / currentSize : 1;
+    const queued = state.waiters.length;
+    const p95Wait = percentile(state.recentWaits, 0.95);
+    const targetWaitMs = autoScale.targetWaitMs ?? DEFAULT_TARGET_WAIT_MS;
+    const misses = state.recentMisses;
+
+    // Each evaluation starts a new observation window
+    state.recentWaits = [];
+    state.recentMisses = 0;
+
+    const saturated =
+      queued > 0 ||
+      misses > 0 ||
+      (p95Wait > targetWaitMs && utilization >= autoScale.scaleUpThreshold);
+
+    if (saturated) {
+      const targetSize = Math.min(
+        // 50% increase, and at least enough for every queued checkout
+        Math.max(Math.ceil(currentSize * 1.5), currentSize + queued),
+        config.maxSize
+      );
+
+      if (targetSize > currentSize) {
+        this.scalePool(poolName, targetSize);
+      }
+    } else if (
+      p95Wait === 0 &&
+      utilization <= autoScale.scaleDownThreshold
+    ) {
+      const targetSize = Math.max(
+        Math.ceil(currentSize * 0.7), // 30% decrease
+        config.minSize
+      );
+
+      if (targetSize < currentSize) {
+        this.scalePool(poolName, targetSize);
+      }
+    }
   }
 
   /**
@@ -381,15 +576,13 @@ export class AgentPoolManager {
    * @returns Pool statistics or null if pool not found
    */
   getPoolStats(poolName: string): PoolStats | null {
-    const pool = this.pools.get(poolName);
-    const config = this.configs.get(poolName);
+    const state = this.pools.get(poolName);
 
-    if (!pool || !config) {
+    if (!state) {
       return null;
     }
 
-    const idleCount = pool.filter(pa => pa.status === 'idle').length;
-    const busyCount = pool.filter(pa => pa.status === 'busy').length;
+    const pool = Array.from(state.instances.values());
     const failedCount = pool.filter(pa => pa.status === 'failed').length;
     const warmingUpCount = pool.filter(pa => pa.status === 'warming-up').length;
 
@@ -402,24 +595,70 @@ export class AgentPoolManager {
 
     const avgExecutionTime =
       avgExecutionTimes.length > 0
-        ? avgExecutionTimes.reduce((sum, t) => sum + t, 0) / avgExecutionTimes.length
+        ? avgExecutionTimes.reduce((sum, t) => sum + t, 0) /
+          avgExecutionTimes.length
         : 0;
 
-    const utilization =
-      pool.length > 0 ? busyCount / pool.length : 0;
+    const utilization = pool.length > 0 ? state.busyCount / pool.length : 0;
 
     return {
       poolName,
       totalInstances: pool.length,
-      idleInstances: idleCount,
-      busyInstances: busyCount,
+      idleInstances: state.idle.size,
+      busyInstances: state.busyCount,
       failedInstances: failedCount,
       warmingUpInstances: warmingUpCount,
       utilization,
       totalTasks,
       totalErrors,
       avgExecutionTime,
-      config,
+      queuedRequests: state.waiters.length,
+      config: state.config,
+      lastScaling: state.lastScaling,
+    };
+  }
+
+  /**
+   * Get the checkout wait-time histogram of a pool
+   *
+   * @param poolName - Name of the pool
+   * @returns Histogram or null if pool not found
+   */
+  getWaitTimeHistogram(poolName: string): WaitTimeHistogram | null {
+    const state = this.pools.get(poolName);
+
+    if (!state) {
+      return null;
+    }
+
+    let cumulative = 0;
+    const buckets = state.waitBuckets.map((count, index) => {
+      cumulative += count;
+      return {
+        le:
+          index < WAIT_BUCKETS_MS.length
+            ? WAIT_BUCKETS_MS[index]
+            : ('+Inf' as const),
+        count: cumulative,
+      };
+    });
+
+    const bucketPercentile = (p: number): number => {
+      if (state.waitCount === 0) return 0;
+      const rank = Math.ceil(state.waitCount * p);
+      const bucket = buckets.find(b => b.count >= rank)!;
+      return bucket.le === '+Inf' ? state.maxWaitMs : bucket.le;
+    };
+
+    return {
+      count: state.waitCount,
+      misses: state.misses,
+      timeouts: state.timeouts,
+      p50: bucketPercentile(0.5),
+      p95: bucketPercentile(0.95),
+      p99: bucketPercentile(0.99),
+      maxMs: state.maxWaitMs,
+      buckets,
     };
   }
 
@@ -437,24 +676,22 @@ export class AgentPoolManager {
    * @param force - Force removal even if agents are busy
    */
   removePool(poolName: string, force: boolean = false): void {
-    const pool = this.pools.get(poolName);
+    const state = this.getState(poolName);
 
-    if (!pool) {
-      throw new Error(`Pool '${poolName}' not found`);
+    if (!force && state.busyCount > 0) {
+      throw new Error(
+        `Cannot remove pool '${poolName}': ${state.busyCount} agents are busy. Use force=true to override.`
+      );
     }
 
-    if (!force) {
-      const busyAgents = pool.filter(pa => pa.status === 'busy');
-      if (busyAgents.length > 0) {
-        throw new Error(
-          `Cannot remove pool '${poolName}': ${busyAgents.length} agents are busy. Use force=true to override.`
-        );
-      }
+    for (const waiter of state.waiters.splice(0)) {
+      clearTimeout(waiter.timer);
+      waiter.reject(new Error(`Pool '${poolName}' was removed`));
     }
 
+    clearInterval(this.evaluators.get(poolName));
+    this.evaluators.delete(poolName);
     this.pools.delete(poolName);
-    this.configs.delete(poolName);
-    this.scalingCooldowns.delete(poolName);
   }
 
   /**
@@ -464,27 +701,19 @@ export class AgentPoolManager {
    * @param agentInstanceId - Instance ID of failed agent
    */
   replaceFailedAgent(poolName: string, agentInstanceId: string): void {
-    const pool = this.pools.get(poolName);
-    const config = this.configs.get(poolName);
+    const state = this.getState(poolName);
+    const failed = state.instances.get(agentInstanceId);
 
-    if (!pool || !config) {
-      throw new Error(`Pool '${poolName}' not found`);
-    }
-
-    const failedIndex = pool.findIndex(pa => pa.instanceId === agentInstanceId);
-
-    if (failedIndex === -1) {
+    if (!failed) {
       throw new Error(`Agent instance '${agentInstanceId}' not found in pool`);
     }
 
     // Remove failed agent
-    pool.splice(failedIndex, 1);
+    this.removeInstance(state, failed);
 
     // Add new agent
-    const newAgent = this.createPooledAgent(config.agentIds);
-    if (newAgent) {
-      pool.push(newAgent);
-    }
+    const replacement = this.addInstance(state);
+    if (replacement) this.makeIdle(state, replacement);
   }
 
   /**
@@ -496,10 +725,135 @@ export class AgentPoolManager {
       .filter((stats): stats is PoolStats => stats !== null);
   }
 
+  /**
+   * Stop the background scaling evaluators
+   */
+  shutdown(): void {
+    for (const timer of this.evaluators.values()) {
+      clearInterval(timer);
+    }
+    this.evaluators.clear();
+  }
+
   // ============================================================================
   // PRIVATE METHODS
   // ============================================================================
 
+  private getState(poolName: string): PoolState {
+    const state = this.pools.get(poolName);
+
+    if (!state) {
+      throw new Error(`Pool '${poolName}' not found`);
+    }
+
+    return state;
+  }
+
+  /**
+   * Create a pooled agent instance and add it to the pool as idle
+   */
+  private addInstance(state: PoolState): PooledAgent | null {
+    const pooledAgent = this.createPooledAgent(state.config.agentIds);
+
+    if (!pooledAgent) {
+      return null;
+    }
+
+    state.instances.set(pooledAgent.instanceId, pooledAgent);
+    state.idle.set(pooledAgent.instanceId, pooledAgent);
+    return pooledAgent;
+  }
+
+  private removeInstance(state: PoolState, pooledAgent: PooledAgent): void {
+    state.instances.delete(pooledAgent.instanceId);
+    state.idle.delete(pooledAgent.instanceId);
+
+    const busy = state.busy.get(pooledAgent.agent);
+    const index = busy?.indexOf(pooledAgent) ?? -1;
+    if (busy && index !== -1) {
+      busy.splice(index, 1);
+      if (busy.length === 0) state.busy.delete(pooledAgent.agent);
+      state.busyCount--;
+    }
+  }
+
+  /**
+   * Hand an instance to the longest waiting checkout, or return it to the
+   * end of the idle order
+   */
+  private makeIdle(state: PoolState, pooledAgent: PooledAgent): void {
+    const waiter = state.waiters.shift();
+
+    if (waiter) {
+      clearTimeout(waiter.timer);
+      state.idle.delete(pooledAgent.instanceId);
+      this.recordWait(state, Date.now() - waiter.enqueuedAt);
+      waiter.resolve(this.checkOut(state, pooledAgent));
+      return;
+    }
+
+    pooledAgent.status = 'idle';
+    pooledAgent.currentTask = undefined;
+    // Re-inserting moves it to the most recently used end
+    state.idle.delete(pooledAgent.instanceId);
+    state.idle.set(pooledAgent.instanceId, pooledAgent);
+  }
+
+  private checkOut(state: PoolState, pooledAgent: PooledAgent): Agent {
+    state.idle.delete(pooledAgent.instanceId);
+    pooledAgent.status = 'busy';
+    pooledAgent.lastUsed = new Date();
+
+    const busy = state.busy.get(pooledAgent.agent);
+    if (busy) {
+      busy.push(pooledAgent);
+    } else {
+      state.busy.set(pooledAgent.agent, [pooledAgent]);
+    }
+    state.busyCount++;
+
+    return pooledAgent.agent;
+  }
+
+  private containsAgent(state: PoolState, agent: Agent): boolean {
+    for (const pooledAgent of state.instances.values()) {
+      if (pooledAgent.agent === agent) return true;
+    }
+    return false;
+  }
+
+  private recordWait(state: PoolState, waitMs: number): void {
+    const bucket = WAIT_BUCKETS_MS.findIndex(bound => waitMs <= bound);
+    state.waitBuckets[bucket === -1 ? WAIT_BUCKETS_MS.length : bucket]++;
+    state.waitCount++;
+    state.maxWaitMs = Math.max(state.maxWaitMs, waitMs);
+    this.recordRecentWait(state, waitMs);
+  }
+
+  private recordRecentWait(state: PoolState, waitMs: number): void {
+    state.recentWaits.push(waitMs);
+    if (state.recentWaits.length > MAX_RECENT_WAITS) {
+      state.recentWaits.shift();
+    }
+  }
+
+  /**
+   * Run the scaling evaluation soon, outside the checkout that asked for it
+   */
+  private requestEvaluation(poolName: string): void {
+    const state = this.pools.get(poolName);
+
+    if (!state?.config.autoScale?.enabled || state.evaluationPending) {
+      return;
+    }
+
+    state.evaluationPending = true;
+    setImmediate(() => {
+      state.evaluationPending = false;
+      this.evaluateScaling(poolName);
+    });
+  }
+
   /**
    * Create a pooled agent instance
    */
@@ -525,99 +879,58 @@ export class AgentPoolManager {
   }
 
   /**
-   * Select an agent from idle agents based on strategy
+   * Select an idle agent based on the pool's strategy. Round-robin takes
+   * the least recently used instance from the front of the idle order; the
+   * other strategies compare idle instances only.
    */
-  private selectAgent(
-    idleAgents: PooledAgent[],
-    strategy: PoolConfig['strategy']
-  ): PooledAgent | null {
-    if (idleAgents.length === 0) {
+  private selectAgent(state: PoolState): PooledAgent | null {
+    const { idle } = state;
+
+    if (idle.size === 0) {
       return null;
     }
 
-    switch (strategy) {
-      case 'least-busy':
+    switch (state.config.strategy) {
+      case 'least-busy': {
         // Select agent with lowest task count
-        return idleAgents.reduce((prev, curr) =>
-          prev.taskCount < curr.taskCount ? prev : curr
-        );
+        let selected: PooledAgent | null = null;
+        for (const pa of idle.values()) {
+          if (!selected || pa.taskCount <= selected.taskCount) selected = pa;
+        }
+        return selected;
+      }
 
-      case 'fastest':
+      case 'fastest': {
         // Select agent with best average execution time
-        const agentsWithTime = idleAgents.filter(
-          pa => pa.avgExecutionTime !== undefined
-        );
-        if (agentsWithTime.length > 0) {
-          return agentsWithTime.reduce((prev, curr) =>
-            (prev.avgExecutionTime || Infinity) < (curr.avgExecutionTime || Infinity)
-              ? prev
-              : curr
-          );
+        let selected: PooledAgent | null = null;
+        for (const pa of idle.values()) {
+          if (
+            pa.avgExecutionTime !== undefined &&
+            (!selected || pa.avgExecutionTime < selected.avgExecutionTime!)
+          ) {
+            selected = pa;
+          }
         }
         // Fall through to random if no timing data
-        return idleAgents[Math.floor(Math.random() * idleAgents.length)];
+        return selected ?? this.randomIdle(idle);
+      }
 
       case 'random':
-        return idleAgents[Math.floor(Math.random() * idleAgents.length)];
+        return this.randomIdle(idle);
 
       case 'round-robin':
       default:
         // Select least recently used agent
-        return idleAgents.reduce((prev, curr) =>
-          prev.lastUsed < curr.lastUsed ? prev : curr
-        );
+        return idle.values().next().value ?? null;
     }
   }
 
-  /**
-   * Check if auto-scaling is needed and perform if necessary
-   */
-  private checkAutoScale(poolName: string): void {
-    const pool = this.pools.get(poolName);
-    const config = this.configs.get(poolName);
-
-    if (!pool || !config || !config.autoScale?.enabled) {
-      return;
-    }
-
-    // Check cooldown
-    const lastScaling = this.scalingCooldowns.get(poolName);
-    if (lastScaling) {
-      const elapsed = Date.now() - lastScaling.getTime();
-      if (elapsed < config.autoScale.cooldownPeriod) {
-        return; // Still in cooldown
-      }
-    }
-
-    const stats = this.getPoolStats(poolName);
-    if (!stats) return;
-
-    const { utilization } = stats;
-
-    // Scale up if utilization too high
-    if (utilization >= config.autoScale.scaleUpThreshold) {
-      const currentSize = pool.length;
-      const targetSize = Math.min(
-        Math.ceil(currentSize * 1.5), // 50% increase
-        config.maxSize
-      );
-
-      if (targetSize > currentSize) {
-        this.scalePool(poolName, targetSize);
-      }
-    }
-    // Scale down if utilization too low
-    else if (utilization <= config.autoScale.scaleDownThreshold) {
-      const currentSize = pool.length;
-      const targetSize = Math.max(
-        Math.ceil(currentSize * 0.7), // 30% decrease
-        config.minSize
-      );
-
-      if (targetSize < currentSize) {
-        this.scalePool(poolName, targetSize);
-      }
+  private randomIdle(idle: Map<string, PooledAgent>): PooledAgent | null {
+    let index = Math.floor(Math.random() * idle.size);
+    for (const pa of idle.values()) {
+      if (index-- === 0) return pa;
     }
+    return null;
   }
 
   /**
@@ -665,10 +978,30 @@ export class AgentPoolManager {
       if (config.autoScale.cooldownPeriod < 0) {
         throw new Error('cooldownPeriod must be >= 0');
       }
+
+      if (
+        config.autoScale.targetWaitMs !== undefined &&
+        config.autoScale.targetWaitMs < 0
+      ) {
+        throw new Error('targetWaitMs must be >= 0');
+      }
+
+      if (
+        config.autoScale.evaluationInterval !== undefined &&
+        config.autoScale.evaluationInterval <= 0
+      ) {
+        throw new Error('evaluationInterval must be > 0');
+      }
     }
   }
 }
 
+function percentile(values: number[], p: number): number {
+  if (values.length === 0) return 0;
+  const sorted = [...values].sort((a, b) => a - b);
+  return sorted[Math.min(sorted.length - 1, Math.floor(sorted.length * p))];
+}
+
 /**
  * Singleton instance of the agent pool manager
  */
@@ -1,6 +1,7 @@
 import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
 import {
   AgentPoolManager,
+  AgentPoolTimeoutError,
   PoolConfig,
   PooledAgent,
 } from '../coordination/agent-pool-manager';
@@ -52,6 +53,7 @@ describe('AgentPoolManager', () => {
   });
 
   afterEach(() => {
+    poolManager.shutdown();
     agentRegistry.clear();
   });
 
@@ -408,23 +410,28 @@ describe('AgentPoolManager', () => {
       });
     });
 
-    it('should scale up when utilization exceeds threshold', async () => {
-      vi.useFakeTimers();
-
-      // Mark most agents as busy (80%+ utilization)
-      poolManager.getAgent('auto-pool'); // 50% busy
+    it('should scale up when a checkout has to wait', async () => {
+      poolManager.getAgent('auto-pool');
       poolManager.getAgent('auto-pool'); // 100% busy
 
-      // Advance timers by the exact cooldown period
-      vi.advanceTimersByTime(100);
-
-      // Next getAgent should trigger scale-up
-      poolManager.getAgent('auto-pool');
+      // The queued checkout wakes the evaluator, which adds instances
+      const agent = await poolManager.acquire('auto-pool', {
+        timeoutMs: 1000,
+      });
 
+      expect(agent).toBe(mockAgent1);
       const stats = poolManager.getPoolStats('auto-pool');
       expect(stats!.totalInstances).toBeGreaterThan(2);
+      expect(stats!.lastScaling!.action).toBe('scale-up');
+    });
+
+    it('should not scale on checkout', () => {
+      poolManager.getAgent('auto-pool');
+      poolManager.getAgent('auto-pool');
+      poolManager.getAgent('auto-pool'); // miss
 
-      vi.useRealTimers();
+      const stats = poolManager.getPoolStats('auto-pool');
+      expect(stats!.totalInstances).toBe(2);
     });
 
     it('should scale down when utilization below threshold', async () => {
@@ -434,24 +441,59 @@ describe('AgentPoolManager', () => {
       // Wait for cooldown
       await new Promise(resolve => setTimeout(resolve, 150));
 
-      // Low utilization should trigger scale-down
-      poolManager.getAgent('auto-pool');
+      // Low utilization with no waiting should trigger scale-down
+      poolManager.evaluateScaling('auto-pool');
 
       const stats = poolManager.getPoolStats('auto-pool');
       expect(stats!.totalInstances).toBeLessThan(6);
     });
 
     it('should respect cooldown period', () => {
-      poolManager.getAgent('auto-pool');
-      poolManager.getAgent('auto-pool');
+      poolManager.scalePool('auto-pool', 6);
 
-      const initialSize = poolManager.getPoolStats('auto-pool')!.totalInstances;
+      // Immediate evaluation should not scale down (cooldown)
+      poolManager.evaluateScaling('auto-pool');
 
-      // Immediate second call should not scale (cooldown)
-      poolManager.getAgent('auto-pool');
+      const stats = poolManager.getPoolStats('auto-pool');
+      expect(stats!.totalInstances).toBe(6);
+    });
+  });
+
+  describe('acquire', () => {
+    beforeEach(() => {
+      poolManager.createPool({
+        name: 'wait-pool',
+        agentIds: ['test-agent-1'],
+        minSize: 1,
+        maxSize: 1,
+        strategy: 'round-robin',
+      });
+    });
+
+    it('should wait for a released agent', async () => {
+      const held = poolManager.getAgent('wait-pool')!;
+      const waiting = poolManager.acquire('wait-pool', { timeoutMs: 1000 });
+
+      setTimeout(() => poolManager.releaseAgent('wait-pool', held), 20);
 
-      const newSize = poolManager.getPoolStats('auto-pool')!.totalInstances;
-      expect(newSize).toBe(initialSize);
+      expect(await waiting).toBe(held);
+      const histogram = poolManager.getWaitTimeHistogram('wait-pool')!;
+      expect(histogram.count).toBe(2);
+      expect(histogram.maxMs).toBeGreaterThan(0);
+      expect(histogram.buckets[histogram.buckets.length - 1]).toEqual({
+        le: '+Inf',
+        count: 2,
+      });
+    });
+
+    it('should reject when no agent is released in time', async () => {
+      poolManager.getAgent('wait-pool');
+
+      await expect(
+        poolManager.acquire('wait-pool', { timeoutMs: 20 })
+      ).rejects.toBeInstanceOf(AgentPoolTimeoutError);
+      expect(poolManager.getPoolStats('wait-pool')!.queuedRequests).toBe(0);
+      expect(poolManager.getWaitTimeHistogram('wait-pool')!.timeouts).toBe(1);
     });
   });
 
@@ -493,10 +535,11 @@ describe('AgentPoolManager', () => {
 
   describe('replaceFailedAgent', () => {
     it('should replace a failed agent instance', () => {
+      // A single instance, so every failed task lands on the same one
       poolManager.createPool({
         name: 'replace-pool',
         agentIds: ['test-agent-1'],
-        minSize: 2,
+        minSize: 1,
         maxSize: 5,
         strategy: 'round-robin',
       });
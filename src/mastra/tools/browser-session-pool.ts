@@ -0,0 +1,547 @@
+/**
+ * Browser Session Pool
+ *
+ * Keeps browser sessions warm between scans. Sessions are leased and
+ * returned instead of created and closed, so a scan usually starts on a
+ * session that is already initialized. A session returned after working on
+ * a portal remembers it (its affinity key) and is preferred the next time
+ * that portal is scanned, which keeps its cookies and login.
+ *
+ * The pool is generic over the session type: it only creates, health
+ * checks and destroys sessions through the callbacks it is given, so it can
+ * be exercised with a fake browser.
+ */
+
+export interface BrowserSessionPoolOptions<T> {
+  /** Create and initialize a session ready for use */
+  create: () => Promise<T>;
+  destroy: (session: T) => Promise<void>;
+  /** Resolves true while the session can still drive its browser */
+  checkHealth?: (session: T) => Promise<boolean>;
+  /** Called when a lease is reclaimed because its holder stopped using it */
+  onLeaseReclaimed?: (lease: BrowserLease<T>) => void;
+  /** Idle sessions kept ready ahead of demand */
+  minIdle?: number;
+  /** Sessions open at once, leased or idle */
+  maxSize?: number;
+  /** Idle sessions above minIdle are closed after this long unused */
+  idleTimeoutMs?: number;
+  /** Sessions are replaced before the provider's session timeout */
+  maxSessionAgeMs?: number;
+  /** A lease not touched for this long is treated as orphaned and closed */
+  leaseTimeoutMs?: number;
+  /** How long acquire waits for a free session when the pool is full */
+  acquireTimeoutMs?: number;
+  healthCheckTimeoutMs?: number;
+  /** How often idle sessions are health checked and evicted */
+  maintenanceIntervalMs?: number;
+}
+
+export interface AcquireSessionOptions {
+  /** Prefer a session that last worked with this key, e.g. a portal ID */
+  affinityKey?: string;
+}
+
+export interface BrowserLease<T> {
+  readonly id: string;
+  readonly session: T;
+  readonly affinityKey?: string;
+  /** False when the session was created for this lease */
+  readonly reused: boolean;
+}
+
+export interface BrowserSessionPoolStats {
+  size: number;
+  idle: number;
+  leased: number;
+  creating: number;
+  waiting: number;
+  minIdle: number;
+  maxSize: number;
+  created: number;
+  destroyed: number;
+  acquired: number;
+  reused: number;
+  affinityHits: number;
+  idleEvicted: number;
+  expired: number;
+  leasesReclaimed: number;
+  healthCheckFailures: number;
+  acquireTimeouts: number;
+  acquireLatencyMs: { p50: number; p95: number; max: number };
+}
+
+export class BrowserPoolTimeoutError extends Error {
+  constructor(timeoutMs: number) {
+    super(`No browser session became available within ${timeoutMs}ms`);
+    this.name = 'BrowserPoolTimeoutError';
+  }
+}
+
+interface PoolEntry<T> {
+  id: number;
+  session: T;
+  state: 'idle' | 'leased' | 'checking';
+  createdAt: number;
+  lastUsedAt: number;
+  affinityKey?: string;
+  /** Changes on every lease so a stale lease cannot release a newer one */
+  leaseId?: string;
+  touchedAt: number;
+}
+
+interface Waiter<T> {
+  affinityKey?: string;
+  resolve: (lease: BrowserLease<T>) => void;
+  reject: (error: Error) => void;
+  timer: NodeJS.Timeout;
+}
+
+const LATENCY_SAMPLE_SIZE = 200;
+
+export class BrowserSessionPool<T> {
+  private readonly options: Required<
+    Omit<BrowserSessionPoolOptions<T>, 'checkHealth' | 'onLeaseReclaimed'>
+  > &
+    Pick<BrowserSessionPoolOptions<T>, 'checkHealth' | 'onLeaseReclaimed'>;
+  private entries = new Map<number, PoolEntry<T>>();
+  private waiters: Waiter<T>[] = [];
+  private creating = 0;
+  private nextEntryId = 1;
+  private leaseCounter = 0;
+  private replenishing: Promise<void> | null = null;
+  private maintenanceTimer: NodeJS.Timeout | null = null;
+  private draining = false;
+  private latencies: number[] = [];
+  private counters = {
+    created: 0,
+    destroyed: 0,
+    acquired: 0,
+    reused: 0,
+    affinityHits: 0,
+    idleEvicted: 0,
+    expired: 0,
+    leasesReclaimed: 0,
+    healthCheckFailures: 0,
+    acquireTimeouts: 0,
+  };
+
+  constructor(options: BrowserSessionPoolOptions<T>) {
+    const maxSize = Math.max(1, options.maxSize ?? 5);
+    this.options = {
+      ...options,
+      minIdle: Math.min(Math.max(0, options.minIdle ?? 1), maxSize),
+      maxSize,
+      idleTimeoutMs: options.idleTimeoutMs ?? 5 * 60 * 1000,
+      // Browserbase sessions are created with a one hour timeout
+      maxSessionAgeMs: options.maxSessionAgeMs ?? 50 * 60 * 1000,
+      leaseTimeoutMs: options.leaseTimeoutMs ?? 15 * 60 * 1000,
+      acquireTimeoutMs: options.acquireTimeoutMs ?? 60 * 1000,
+      healthCheckTimeoutMs: options.healthCheckTimeoutMs ?? 5000,
+      maintenanceIntervalMs: options.maintenanceIntervalMs ?? 30 * 1000,
+    };
+  }
+
+  /**
+   * Lease a session: an idle one with the same affinity key if there is
+   * one, else any idle session, else a new one while below maxSize. When
+   * the pool is full the call waits for a session to be returned and
+   * rejects with BrowserPoolTimeoutError after acquireTimeoutMs.
+   */
+  async acquire(
+    options: AcquireSessionOptions = {}
+  ): Promise<BrowserLease<T>> {
+    if (this.draining) {
+      throw new Error('Browser session pool is shutting down');
+    }
+    this.startMaintenance();
+    const startedAt = Date.now();
+
+    const lease =
+      (await this.tryAcquire(options.affinityKey)) ??
+      (await this.enqueue(options.affinityKey));
+
+    this.recordLatency(Date.now() - startedAt);
+    void this.replenish();
+    return lease;
+  }
+
+  /**
+   * Return a leased session for reuse. Unknown or reclaimed leases are
+   * ignored, so releasing twice is harmless.
+   */
+  release(lease: BrowserLease<T>): void {
+    const entry = this.entryFor(lease);
+    if (!entry) return;
+
+    entry.state = 'idle';
+    entry.leaseId = undefined;
+    entry.lastUsedAt = Date.now();
+    if (entry.lastUsedAt - entry.createdAt >= this.options.maxSessionAgeMs) {
+      this.counters.expired++;
+      void this.remove(entry);
+      return;
+    }
+    this.dispatch();
+  }
+
+  /**
+   * Close a leased session instead of returning it, e.g. after its browser
+   * crashed or the work was aborted
+   */
+  async destroy(lease: BrowserLease<T>): Promise<void> {
+    const entry = this.entryFor(lease);
+    if (entry) await this.remove(entry);
+  }
+
+  /**
+   * Record that a lease is still in use so it is not reclaimed
+   */
+  touch(lease: BrowserLease<T>): void {
+    const entry = this.entryFor(lease);
+    if (entry) entry.touchedAt = Date.now();
+  }
+
+  /**
+   * Create sessions until minIdle are ready
+   */
+  async warm(): Promise<void> {
+    this.startMaintenance();
+    await this.replenish();
+  }
+
+  /**
+   * Close every session, idle or leased, and reject waiting acquires
+   */
+  async drain(): Promise<void> {
+    this.draining = true;
+    if (this.maintenanceTimer) {
+      clearInterval(this.maintenanceTimer);
+      this.maintenanceTimer = null;
+    }
+    for (const waiter of this.waiters.splice(0)) {
+      clearTimeout(waiter.timer);
+      waiter.reject(new Error('Browser session pool is shutting down'));
+    }
+    await this.replenishing;
+    await Promise.all(
+      Array.from(this.entries.values()).map(entry => this.remove(entry))
+    );
+    this.draining = false;
+  }
+
+  getStats(): BrowserSessionPoolStats {
+    const entries = Array.from(this.entries.values());
+    const sorted = [...this.latencies].sort((a, b) => a - b);
+    const percentile = (p: number) =>
+      sorted.length === 0
+        ? 0
+        : sorted[Math.min(sorted.length - 1, Math.floor(sorted.length * p))];
+
+    return {
+      size: this.size,
+      idle: entries.filter(entry => entry.state === 'idle').length,
+      leased: entries.filter(entry => entry.state === 'leased').length,
+      creating: this.creating,
+      waiting: this.waiters.length,
+      minIdle: this.options.minIdle,
+      maxSize: this.options.maxSize,
+      ...this.counters,
+      acquireLatencyMs: {
+        p50: percentile(0.5),
+        p95: percentile(0.95),
+        max: sorted.length > 0 ? sorted[sorted.length - 1] : 0,
+      },
+    };
+  }
+
+  /**
+   * Evict idle sessions past their idle timeout or age, replace idle
+   * sessions that fail their health check, reclaim orphaned leases and top
+   * the pool back up to minIdle. Runs on a timer once the pool is in use.
+   */
+  async runMaintenance(): Promise<void> {
+    const now = Date.now();
+    let idle = this.idleEntries().length;
+
+    for (const entry of Array.from(this.entries.values())) {
+      if (entry.state === 'leased') {
+        if (now - entry.touchedAt >= this.options.leaseTimeoutMs) {
+          this.counters.leasesReclaimed++;
+          const lease = this.toLease(entry, true);
+          await this.remove(entry);
+          this.options.onLeaseReclaimed?.(lease);
+        }
+        continue;
+      }
+      if (entry.state !== 'idle') continue;
+
+      if (now - entry.createdAt >= this.options.maxSessionAgeMs) {
+        this.counters.expired++;
+        idle--;
+        await this.remove(entry);
+      } else if (
+        now - entry.lastUsedAt >= this.options.idleTimeoutMs &&
+        idle > this.options.minIdle
+      ) {
+        this.counters.idleEvicted++;
+        idle--;
+        await this.remove(entry);
+      } else {
+        // Held out of the idle set so it is not leased mid-check
+        entry.state = 'checking';
+        const healthy = await this.isHealthy(entry);
+        if (!this.entries.has(entry.id)) continue;
+        if (healthy) {
+          entry.state = 'idle';
+        } else {
+          idle--;
+          await this.remove(entry);
+        }
+      }
+    }
+
+    this.dispatch();
+    await this.replenish();
+  }
+
+  private get size(): number {
+    return this.entries.size + this.creating;
+  }
+
+  private async tryAcquire(
+    affinityKey?: string
+  ): Promise<BrowserLease<T> | null> {
+    for (let entry = this.pickIdle(affinityKey); entry; ) {
+      entry.state = 'checking';
+      if (await this.isHealthy(entry)) {
+        if (this.entries.has(entry.id)) {
+          this.counters.reused++;
+          return this.lease(entry, affinityKey);
+        }
+      } else {
+        await this.remove(entry);
+      }
+      entry = this.pickIdle(affinityKey);
+    }
+
+    if (this.size < this.options.maxSize) {
+      return this.createLeased(affinityKey);
+    }
+    return null;
+  }
+
+  private enqueue(affinityKey?: string): Promise<BrowserLease<T>> {
+    return new Promise((resolve, reject) => {
+      const waiter: Waiter<T> = {
+        affinityKey,
+        resolve,
+        reject,
+        timer: setTimeout(() => {
+          this.waiters = this.waiters.filter(w => w !== waiter);
+          this.counters.acquireTimeouts++;
+          reject(new BrowserPoolTimeoutError(this.options.acquireTimeoutMs));
+        }, this.options.acquireTimeoutMs),
+      };
+      this.waiters.push(waiter);
+      // A session may have been returned while tryAcquire was settling
+      this.dispatch();
+    });
+  }
+
+  // Hand idle sessions, or room for new ones, to waiting acquires
+  private dispatch(): void {
+    while (this.waiters.length > 0) {
+      const idle = this.idleEntries();
+      if (idle.length > 0) {
+        // A waiter whose portal matches an idle session goes first
+        const index = Math.max(
+          0,
+          this.waiters.findIndex(waiter =>
+            idle.some(entry => entry.affinityKey === waiter.affinityKey)
+          )
+        );
+        const [waiter] = this.waiters.splice(index, 1);
+        clearTimeout(waiter.timer);
+        const entry = this.pickIdle(waiter.affinityKey)!;
+        this.counters.reused++;
+        waiter.resolve(this.lease(entry, waiter.affinityKey));
+      } else if (this.size < this.options.maxSize) {
+        const waiter = this.waiters.shift()!;
+        clearTimeout(waiter.timer);
+        this.createLeased(waiter.affinityKey).then(
+          waiter.resolve,
+          waiter.reject
+        );
+      } else {
+        return;
+      }
+    }
+  }
+
+  // Same affinity first, then a session with none, then the least recently used
+  private pickIdle(affinityKey?: string): PoolEntry<T> | undefined {
+    const idle = this.idleEntries();
+    const byRecency = (a: PoolEntry<T>, b: PoolEntry<T>) =>
+      b.lastUsedAt - a.lastUsedAt;
+
+    if (affinityKey) {
+      const matching = idle
+        .filter(entry => entry.affinityKey === affinityKey)
+        .sort(byRecency);
+      if (matching.length > 0) {
+        this.counters.affinityHits++;
+        return matching[0];
+      }
+    }
+    return (
+      idle.find(entry => !entry.affinityKey) ??
+      idle.sort(byRecency)[idle.length - 1]
+    );
+  }
+
+  private idleEntries(): PoolEntry<T>[] {
+    return Array.from(this.entries.values()).filter(
+      entry => entry.state === 'idle'
+    );
+  }
+
+  private async createLeased(affinityKey?: string): Promise<BrowserLease<T>> {
+    const entry = await this.createEntry();
+    return this.lease(entry, affinityKey, false);
+  }
+
+  private async createEntry(): Promise<PoolEntry<T>> {
+    this.creating++;
+    let session: T;
+    try {
+      session = await this.options.create();
+    } catch (error) {
+      this.creating--;
+      // The slot this creation held is free again
+      this.dispatch();
+      throw error;
+    }
+    this.creating--;
+    this.counters.created++;
+
+    const now = Date.now();
+    const entry: PoolEntry<T> = {
+      id: this.nextEntryId++,
+      session,
+      state: 'leased',
+      createdAt: now,
+      lastUsedAt: now,
+      touchedAt: now,
+    };
+    this.entries.set(entry.id, entry);
+    return entry;
+  }
+
+  private lease(
+    entry: PoolEntry<T>,
+    affinityKey?: string,
+    reused = true
+  ): BrowserLease<T> {
+    const now = Date.now();
+    entry.state = 'leased';
+    entry.leaseId = `${entry.id}:${++this.leaseCounter}`;
+    entry.touchedAt = now;
+    entry.lastUsedAt = now;
+    // A session keeps its previous portal's cookies until reassigned
+    if (affinityKey) entry.affinityKey = affinityKey;
+    this.counters.acquired++;
+    return this.toLease(entry, reused);
+  }
+
+  private toLease(entry: PoolEntry<T>, reused: boolean): BrowserLease<T> {
+    return {
+      id: entry.leaseId!,
+      session: entry.session,
+      affinityKey: entry.affinityKey,
+      reused,
+    };
+  }
+
+  private entryFor(lease: BrowserLease<T>): PoolEntry<T> | undefined {
+    const entry = this.entries.get(Number(lease.id.split(':')[0]));
+    return entry?.state === 'leased' && entry.leaseId === lease.id
+      ? entry
+      : undefined;
+  }
+
+  private async remove(entry: PoolEntry<T>): Promise<void> {
+    if (!this.entries.delete(entry.id)) return;
+    this.counters.destroyed++;
+    try {
+      await this.options.destroy(entry.session);
+    } catch (error) {
+      console.warn('⚠️ Error closing pooled browser session:', error);
+    }
+    this.dispatch();
+    if (!this.draining) void this.replenish();
+  }
+
+  private async isHealthy(entry: PoolEntry<T>): Promise<boolean> {
+    const check = this.options.checkHealth;
+    if (!check) return true;
+
+    let timer: NodeJS.Timeout | undefined;
+    const healthy = await Promise.race([
+      check(entry.session).catch(() => false),
+      new Promise<boolean>(resolve => {
+        timer = setTimeout(
+          () => resolve(false),
+          this.options.healthCheckTimeoutMs
+        );
+      }),
+    ]);
+    clearTimeout(timer);
+    if (!healthy) this.counters.healthCheckFailures++;
+    return healthy;
+  }
+
+  // Serialized so concurrent callers do not overshoot minIdle
+  private replenish(): Promise<void> {
+    if (!this.replenishing) {
+      this.replenishing = this.fillToMinIdle().finally(() => {
+        this.replenishing = null;
+      });
+    }
+    return this.replenishing;
+  }
+
+  private async fillToMinIdle(): Promise<void> {
+    while (
+      !this.draining &&
+      this.idleEntries().length < this.options.minIdle &&
+      this.size < this.options.maxSize
+    ) {
+      try {
+        const entry = await this.createEntry();
+        entry.state = 'idle';
+      } catch (error) {
+        console.warn('⚠️ Failed to pre-warm browser session:', error);
+        return;
+      }
+      this.dispatch();
+    }
+  }
+
+  private startMaintenance(): void {
+    if (this.maintenanceTimer) return;
+    this.maintenanceTimer = setInterval(() => {
+      this.runMaintenance().catch(error =>
+        console.warn('⚠️ Browser session pool maintenance failed:', error)
+      );
+    }, this.options.maintenanceIntervalMs);
+    this.maintenanceTimer.unref();
+  }
+
+  private recordLatency(ms: number): void {
+    this.latencies.push(ms);
+    if (this.latencies.length > LATENCY_SAMPLE_SIZE) {
+      this.latencies.shift();
+    }
+  }
+}
@@ -29,10 +29,12 @@ export const pageActTool = createTool({
   }),
   execute: async ({ context }) => {
     const { url, action, sessionId } = context;
-    const stagehand = await sessionManager.ensureStagehand(sessionId);
-    const page = await sessionManager.getPage(sessionId);
+    const returnSession = sessionManager.borrowSession(sessionId);
 
     try {
+      const stagehand = await sessionManager.ensureStagehand(sessionId);
+      const page = await sessionManager.getPage(sessionId);
+
       console.log(`🎭 Performing action: "${action}"`);
 
       if (url) {
@@ -55,6 +57,8 @@ export const pageActTool = createTool({
     } catch (error: any) {
       console.error(`❌ Stagehand action failed:`, error);
       throw new Error(`Browserbase action failed: ${error.message}`);
+    } finally {
+      returnSession();
     }
   },
 });
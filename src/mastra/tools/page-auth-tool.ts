@@ -57,10 +57,12 @@ export const pageAuthTool = createTool({
       onePasswordItem,
     } = context;
     let { username, password } = context;
-    const stagehand = await sessionManager.ensureStagehand(sessionId);
-    const page = await sessionManager.getPage(sessionId);
+    const returnSession = sessionManager.borrowSession(sessionId);
 
     try {
+      const stagehand = await sessionManager.ensureStagehand(sessionId);
+      const page = await sessionManager.getPage(sessionId);
+
       // Retrieve credentials from 1Password if enabled
       if (useOnePassword && process.env.OP_SERVICE_ACCOUNT_TOKEN) {
         console.log(`🔑 Retrieving credentials from 1Password vault...`);
@@ -186,6 +188,8 @@ export const pageAuthTool = createTool({
     } catch (error: any) {
       console.error(`❌ Portal authentication failed:`, error);
       throw new Error(`Browserbase authentication failed: ${error.message}`);
+    } finally {
+      returnSession();
     }
   },
 });
@@ -38,10 +38,12 @@ export const pageExtractTool = createTool({
   }),
   execute: async ({ context }) => {
     const { url, instruction, schema, sessionId } = context;
-    const stagehand = await sessionManager.ensureStagehand(sessionId);
-    const page = await sessionManager.getPage(sessionId);
+    const returnSession = sessionManager.borrowSession(sessionId);
 
     try {
+      const stagehand = await sessionManager.ensureStagehand(sessionId);
+      const page = await sessionManager.getPage(sessionId);
+
       console.log(`📊 Extracting: "${instruction}"`);
 
       if (url) {
@@ -100,6 +102,8 @@ export const pageExtractTool = createTool({
     } catch (error: any) {
       console.error(`❌ Stagehand extraction failed:`, error);
       throw new Error(`Browserbase extraction failed: ${error.message}`);
+    } finally {
+      returnSession();
     }
   },
 });
@@ -25,10 +25,11 @@ export const pageNavigateTool = createTool({
   }),
   execute: async ({ context }) => {
     const { url, sessionId, waitFor } = context;
-    const stagehand = await sessionManager.ensureStagehand(sessionId);
-    const page = await sessionManager.getPage(sessionId);
+    const returnSession = sessionManager.borrowSession(sessionId);
 
     try {
+      const page = await sessionManager.getPage(sessionId);
+
       console.log(`🌐 Navigating to: ${url}`);
 
       await page.goto(url);
@@ -58,6 +59,8 @@ export const pageNavigateTool = createTool({
     } catch (error: any) {
       console.error(`❌ Page navigation failed:`, error);
       throw new Error(`Browserbase navigation failed: ${error.message}`);
+    } finally {
+      returnSession();
     }
   },
 });
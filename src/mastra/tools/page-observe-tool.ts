@@ -31,10 +31,12 @@ export const pageObserveTool = createTool({
   }),
   execute: async ({ context }) => {
     const { url, instruction, sessionId } = context;
-    const stagehand = await sessionManager.ensureStagehand(sessionId);
-    const page = await sessionManager.getPage(sessionId);
+    const returnSession = sessionManager.borrowSession(sessionId);
 
     try {
+      const stagehand = await sessionManager.ensureStagehand(sessionId);
+      const page = await sessionManager.getPage(sessionId);
+
       console.log(`🔍 Observing: "${instruction}"`);
 
       if (url) {
@@ -62,6 +64,8 @@ export const pageObserveTool = createTool({
     } catch (error: any) {
       console.error(`❌ Stagehand observation failed:`, error);
       throw new Error(`Browserbase observation failed: ${error.message}`);
+    } finally {
+      returnSession();
     }
   },
 });
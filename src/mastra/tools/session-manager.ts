@@ -1,4 +1,10 @@
 import { Stagehand } from '@browserbasehq/stagehand';
+import {
+  BrowserSessionPool,
+  type BrowserLease,
+  type BrowserSessionPoolOptions,
+  type BrowserSessionPoolStats,
+} from './browser-session-pool';
 
 // Stagehand's Page type doesn't fully expose all Playwright Page methods in TypeScript
 // At runtime, this IS a Playwright Page with all standard methods like content(), goto(), etc.
@@ -10,64 +16,163 @@ export interface PageWithContent {
   [key: string]: any; // Allow other Playwright Page methods
 }
 
+export interface BrowserbaseSessionManagerOptions {
+  /** Creates an initialized session; defaults to a Browserbase Stagehand */
+  createStagehand?: () => Promise<Stagehand>;
+  /** Pool sizing and timeouts; defaults come from BROWSER_POOL_* env vars */
+  pool?: Omit<
+    BrowserSessionPoolOptions<Stagehand>,
+    'create' | 'destroy' | 'checkHealth' | 'onLeaseReclaimed'
+  >;
+}
+
+const envNumber = (name: string): number | undefined => {
+  const value = Number(process.env[name]);
+  return process.env[name] && Number.isFinite(value) ? value : undefined;
+};
+
 // Session manager for consistent Browserbase sessions
+//
+// Local session IDs lease Stagehand instances from a warm pool. Releasing a
+// session returns it to the pool for the next scan; closing it destroys it.
 export class BrowserbaseSessionManager {
-  private sessions: Map<string, Stagehand> = new Map();
-  private browserbaseSessionIds: Map<string, string> = new Map(); // Track BB session IDs
+  private pool: BrowserSessionPool<Stagehand>;
+  private leases: Map<string, BrowserLease<Stagehand>> = new Map();
+  private pendingLeases: Map<string, Promise<BrowserLease<Stagehand>>> =
+    new Map();
+  private affinities: Map<string, string> = new Map();
+  private borrowers: Map<string, number> = new Map();
   private defaultSessionId = 'default';
 
+  constructor(options: BrowserbaseSessionManagerOptions = {}) {
+    const createStagehand =
+      options.createStagehand ?? (() => this.createStagehand());
+
+    this.pool = new BrowserSessionPool<Stagehand>({
+      minIdle: envNumber('BROWSER_POOL_MIN_IDLE'),
+      maxSize: envNumber('BROWSER_POOL_MAX_SIZE'),
+      idleTimeoutMs: envNumber('BROWSER_POOL_IDLE_TIMEOUT_MS'),
+      leaseTimeoutMs: envNumber('BROWSER_POOL_LEASE_TIMEOUT_MS'),
+      acquireTimeoutMs: envNumber('BROWSER_POOL_ACQUIRE_TIMEOUT_MS'),
+      ...options.pool,
+      create: createStagehand,
+      destroy: stagehand => stagehand.close(),
+      checkHealth: async stagehand => {
+        await stagehand.context.pages();
+        return true;
+      },
+      onLeaseReclaimed: lease => this.forgetLease(lease),
+    });
+  }
+
   async ensureStagehand(
     sessionId: string = this.defaultSessionId
   ): Promise<Stagehand> {
-    let stagehand = this.sessions.get(sessionId);
-
-    if (!stagehand) {
-      console.log(`🌐 Creating new Browserbase session: ${sessionId}`);
-
-      stagehand = new Stagehand({
-        env: 'BROWSERBASE',
-        apiKey: process.env.BROWSERBASE_API_KEY,
-        projectId: process.env.BROWSERBASE_PROJECT_ID,
-        verbose: 1,
-        // V3 API: model configuration moved to method calls
-        browserbaseSessionCreateParams: {
-          projectId: process.env.BROWSERBASE_PROJECT_ID!,
-          keepAlive: true,
-          timeout: 3600, // 1 hour session timeout
-          browserSettings: {
-            advancedStealth: false, // Disable advanced stealth to avoid Enterprise plan errors
-            solveCaptchas: false, // Disable enterprise features
-            blockAds: true,
-            recordSession: true,
-            logSession: true,
-            viewport: {
-              width: 1920,
-              height: 1080,
-            },
-          },
-          region: 'us-west-2',
-        },
-      });
+    const lease = this.leases.get(sessionId);
+    if (lease) {
+      this.pool.touch(lease);
+      return lease.session;
+    }
 
-      await stagehand.init();
+    let pending = this.pendingLeases.get(sessionId);
+    if (!pending) {
+      pending = this.pool
+        .acquire({ affinityKey: this.affinities.get(sessionId) })
+        .then(acquired => {
+          this.leases.set(sessionId, acquired);
+          console.log(
+            acquired.reused
+              ? `♻️ Leased warm Browserbase session for ${sessionId}`
+              : `✅ Browserbase session ${sessionId} initialized with downloads enabled`
+          );
+          return acquired;
+        })
+        .finally(() => this.pendingLeases.delete(sessionId));
+      this.pendingLeases.set(sessionId, pending);
+    }
+
+    return (await pending).session;
+  }
 
-      // Enable download behavior for this session
-      await this.enableDownloadBehavior(stagehand);
+  /**
+   * Prefer a pooled session that last worked with this key (e.g. a portal
+   * ID) when the session is first used, so its cookies and login carry over
+   */
+  setSessionAffinity(sessionId: string, affinityKey: string): void {
+    this.affinities.set(sessionId, affinityKey);
+  }
 
-      this.sessions.set(sessionId, stagehand);
+  /**
+   * Borrow a session for a single tool or workflow run. If nobody else holds
+   * it (e.g. a portal scan that leased it up front), the returned callback
+   * hands it back to the pool once the last borrower is done. The session
+   * stays keyed to its ID, so the next run for it gets the same warm
+   * browser back.
+   */
+  borrowSession(sessionId: string = this.defaultSessionId): () => void {
+    const borrowers = this.borrowers.get(sessionId);
+    const heldElsewhere =
+      this.leases.has(sessionId) || this.pendingLeases.has(sessionId);
+    if (borrowers === undefined && heldElsewhere) {
+      return () => {};
+    }
 
-      // Store the Browserbase session ID from the initialized stagehand
-      // The browserbaseSessionId property is available after init()
-      const bbSessionId = (stagehand as any).browserbaseSessionId;
+    this.borrowers.set(sessionId, (borrowers ?? 0) + 1);
+    if (!this.affinities.has(sessionId)) {
+      this.affinities.set(sessionId, `session:${sessionId}`);
+    }
 
-      if (bbSessionId) {
-        this.browserbaseSessionIds.set(sessionId, bbSessionId);
-        console.log(`📌 Browserbase session ID stored: ${bbSessionId}`);
+    let returned = false;
+    return () => {
+      if (returned) return;
+      returned = true;
+      const remaining = (this.borrowers.get(sessionId) ?? 1) - 1;
+      if (remaining > 0) {
+        this.borrowers.set(sessionId, remaining);
+        return;
       }
+      this.borrowers.delete(sessionId);
+      this.releaseSession(sessionId);
+    };
+  }
 
-      console.log(
-        `✅ Browserbase session ${sessionId} initialized with downloads enabled`
-      );
+  private async createStagehand(): Promise<Stagehand> {
+    console.log('🌐 Creating new Browserbase session');
+
+    const stagehand = new Stagehand({
+      env: 'BROWSERBASE',
+      apiKey: process.env.BROWSERBASE_API_KEY,
+      projectId: process.env.BROWSERBASE_PROJECT_ID,
+      verbose: 1,
+      // V3 API: model configuration moved to method calls
+      browserbaseSessionCreateParams: {
+        projectId: process.env.BROWSERBASE_PROJECT_ID!,
+        keepAlive: true,
+        timeout: 3600, // 1 hour session timeout
+        browserSettings: {
+          advancedStealth: false, // Disable advanced stealth to avoid Enterprise plan errors
+          solveCaptchas: false, // Disable enterprise features
+          blockAds: true,
+          recordSession: true,
+          logSession: true,
+          viewport: {
+            width: 1920,
+            height: 1080,
+          },
+        },
+        region: 'us-west-2',
+      },
+    });
+
+    await stagehand.init();
+
+    // Enable download behavior for this session
+    await this.enableDownloadBehavior(stagehand);
+
+    // The browserbaseSessionId property is available after init()
+    const bbSessionId = (stagehand as any).browserbaseSessionId;
+    if (bbSessionId) {
+      console.log(`📌 Browserbase session ID: ${bbSessionId}`);
     }
 
     return stagehand;
@@ -117,8 +222,11 @@ export class BrowserbaseSessionManager {
    * Get the Browserbase session ID for a given local session
    * Required for accessing Browserbase cloud features like downloads
    */
-  getBrowserbaseSessionId(sessionId: string = this.defaultSessionId): string | undefined {
-    return this.browserbaseSessionIds.get(sessionId);
+  getBrowserbaseSessionId(
+    sessionId: string = this.defaultSessionId
+  ): string | undefined {
+    const lease = this.leases.get(sessionId);
+    return lease ? (lease.session as any).browserbaseSessionId : undefined;
   }
 
   /**
@@ -162,17 +270,29 @@ export class BrowserbaseSessionManager {
     }
   }
 
+  /**
+   * Return a session to the pool so a later scan can reuse it warm
+   */
+  releaseSession(sessionId: string): void {
+    const lease = this.leases.get(sessionId);
+    this.affinities.delete(sessionId);
+    if (lease) {
+      this.leases.delete(sessionId);
+      this.pool.release(lease);
+      console.log(`↩️ Browserbase session ${sessionId} returned to pool`);
+    }
+  }
+
+  /**
+   * Close a session instead of returning it, e.g. after an aborted scan
+   */
   async closeSession(sessionId: string): Promise<void> {
-    const stagehand = this.sessions.get(sessionId);
-    if (stagehand) {
-      try {
-        await stagehand.close();
-        this.sessions.delete(sessionId);
-        this.browserbaseSessionIds.delete(sessionId); // Clean up BB session ID
-        console.log(`🔒 Browserbase session ${sessionId} closed`);
-      } catch (error) {
-        console.warn(`⚠️ Error closing session ${sessionId}:`, error);
-      }
+    const lease = this.leases.get(sessionId);
+    this.affinities.delete(sessionId);
+    if (lease) {
+      this.leases.delete(sessionId);
+      await this.pool.destroy(lease);
+      console.log(`🔒 Browserbase session ${sessionId} closed`);
     }
   }
 
@@ -184,9 +304,37 @@ export class BrowserbaseSessionManager {
     await this.cleanup();
   }
 
+  /**
+   * Close every session, including idle pooled ones
+   */
   async cleanup(): Promise<void> {
-    const sessionIds = Array.from(this.sessions.keys());
-    await Promise.all(sessionIds.map(id => this.closeSession(id)));
+    this.leases.clear();
+    this.affinities.clear();
+    this.borrowers.clear();
+    await this.pool.drain();
+  }
+
+  /**
+   * Open sessions ahead of demand, up to the pool's minimum idle size
+   */
+  async warmPool(): Promise<void> {
+    await this.pool.warm();
+  }
+
+  getPoolStats(): BrowserSessionPoolStats {
+    return this.pool.getStats();
+  }
+
+  private forgetLease(lease: BrowserLease<Stagehand>): void {
+    for (const [sessionId, held] of this.leases) {
+      if (held.id === lease.id) {
+        this.leases.delete(sessionId);
+        this.affinities.delete(sessionId);
+        console.warn(
+          `⚠️ Browserbase session ${sessionId} was idle past its lease timeout and has been closed`
+        );
+      }
+    }
   }
 }
 
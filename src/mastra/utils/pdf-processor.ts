@@ -7,16 +7,7 @@ import {
   StandardFonts,
 } from 'pdf-lib';
 import { logger } from '../../../server/utils/logger';
-
-// pdf-parse is a CommonJS module - load it dynamically to avoid bundler conflicts
-let pdfParse: any;
-async function loadPdfParse() {
-  if (!pdfParse) {
-    const module = await import('pdf-parse');
-    pdfParse = module.default || module;
-  }
-  return pdfParse;
-}
+import { documentExtractionPool } from '../../../server/services/processing/documentExtractionPool';
 
 export interface PDFParseResult {
   text: string;
@@ -55,20 +46,20 @@ export async function parsePDFFile(filePath: string): Promise<PDFParseResult> {
   try {
     logger.info(`Starting PDF parsing for: ${filePath}`);
 
-    const parser = await loadPdfParse();
-    const dataBuffer = fs.readFileSync(filePath);
-    const data = await parser(dataBuffer);
+    const dataBuffer = await fs.promises.readFile(filePath);
+    // Parsed on a worker thread; the file buffer is transferred, not copied
+    const data = await documentExtractionPool.extract('pdf', dataBuffer);
 
     logger.info(`Successfully parsed PDF: ${filePath}`, {
-      pages: data.numpages,
+      pages: data.pages,
       textLength: data.text.length,
     });
 
     return {
       text: data.text,
-      pages: data.numpages,
-      metadata: data.metadata as Record<string, unknown> | undefined,
-      info: data.info as Record<string, unknown> | undefined,
+      pages: data.pages ?? 0,
+      metadata: data.metadata,
+      info: data.info,
     };
   } catch (error) {
     logger.error(`Failed to parse PDF: ${filePath}`, error as Error);
@@ -87,19 +78,21 @@ export async function parsePDFBuffer(buffer: Buffer): Promise<PDFParseResult> {
   try {
     logger.info('Starting PDF parsing from buffer');
 
-    const parser = await loadPdfParse();
-    const data = await parser(buffer);
+    // The caller keeps its buffer, so the worker gets a copy
+    const data = await documentExtractionPool.extract('pdf', buffer, {
+      transfer: false,
+    });
 
     logger.info('Successfully parsed PDF from buffer', {
-      pages: data.numpages,
+      pages: data.pages,
       textLength: data.text.length,
     });
 
     return {
       text: data.text,
-      pages: data.numpages,
-      metadata: data.metadata as Record<string, unknown> | undefined,
-      info: data.info as Record<string, unknown> | undefined,
+      pages: data.pages ?? 0,
+      metadata: data.metadata,
+      info: data.info,
     };
   } catch (error) {
     logger.error('Failed to parse PDF buffer', error as Error);
@@ -5,7 +5,10 @@
  * Supports dashboard display, logging, and alerting
  */
 
-import { agentPoolManager } from '../coordination/agent-pool-manager';
+import {
+  agentPoolManager,
+  type WaitTimeHistogram,
+} from '../coordination/agent-pool-manager';
 import { featureFlags } from '../config/feature-flags';
 
 /**
@@ -28,6 +31,8 @@ export interface PoolHealthMetrics {
   totalTasksCompleted: number;
   totalTasksFailed: number;
   successRate: number;
+  queuedRequests: number;
+  waitTime: WaitTimeHistogram | null;
   warnings: string[];
   recommendations: string[];
 }
@@ -126,6 +131,24 @@ function generateInsights(
     recommendations.push('Check agent error logs for failure causes');
   }
 
+  // Checkouts waiting for an agent
+  const waitTime = agentPoolManager.getWaitTimeHistogram(stats.poolName);
+  const targetWaitMs = stats.config.autoScale?.targetWaitMs ?? 100;
+  if (stats.queuedRequests > 0) {
+    warnings.push(`${stats.queuedRequests} checkout(s) waiting for an agent`);
+  }
+  if (waitTime && waitTime.p95 > targetWaitMs) {
+    warnings.push(`p95 checkout wait is ${waitTime.p95}ms`);
+    recommendations.push(
+      stats.totalInstances >= stats.config.maxSize
+        ? 'Pool is at maxSize - consider raising it'
+        : 'Auto-scaling should add instances; check autoScale settings'
+    );
+  }
+  if (waitTime && waitTime.timeouts > 0) {
+    warnings.push(`${waitTime.timeouts} checkout(s) timed out waiting`);
+  }
+
   // Low utilization (potential waste)
   if (utilization < 0.2 && totalInstances > 1) {
     warnings.push(`Low utilization: ${(utilization * 100).toFixed(1)}%`);
@@ -177,6 +200,8 @@ function buildPoolHealthMetricsFromStats(
     totalTasksCompleted: stats.totalTasks,
     totalTasksFailed: stats.totalErrors,
     successRate,
+    queuedRequests: stats.queuedRequests,
+    waitTime: agentPoolManager.getWaitTimeHistogram(stats.poolName),
     warnings,
     recommendations,
   };
@@ -217,6 +242,25 @@ export function getAllPoolsHealth(): PoolHealthMetrics[] {
     });
 }
 
+/**
+ * Get checkout wait-time histograms for all pools
+ * @returns Histograms keyed by pool name
+ */
+export function getPoolWaitTimeHistograms(): Record<string, WaitTimeHistogram> {
+  if (!featureFlags.useAgentPools) {
+    return {};
+  }
+
+  const histograms: Record<string, WaitTimeHistogram> = {};
+  for (const poolName of agentPoolManager.getPoolNames()) {
+    const histogram = agentPoolManager.getWaitTimeHistogram(poolName);
+    if (histogram) {
+      histograms[poolName] = histogram;
+    }
+  }
+  return histograms;
+}
+
 /**
  * Log pool health metrics to console
  * @param poolName - Pool to log (or undefined for all pools)
@@ -256,6 +300,12 @@ export function logPoolHealth(poolName?: string): void {
       `   Tasks: ${metrics.totalTasksCompleted} completed, ${metrics.totalTasksFailed} failed (${(metrics.successRate * 100).toFixed(1)}% success rate)`
     );
 
+    if (metrics.waitTime && metrics.waitTime.count > 0) {
+      console.log(
+        `   Checkout Wait: p50 ${metrics.waitTime.p50}ms, p95 ${metrics.waitTime.p95}ms, p99 ${metrics.waitTime.p99}ms (${metrics.queuedRequests} queued, ${metrics.waitTime.timeouts} timed out)`
+      );
+    }
+
     if (metrics.avgExecutionTime !== null) {
       console.log(
         `   Avg Execution Time: ${metrics.avgExecutionTime.toFixed(0)}ms`
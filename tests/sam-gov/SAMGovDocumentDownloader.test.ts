@@ -1,6 +1,7 @@
 import { describe, it, expect, beforeEach, jest } from '@jest/globals';
 import { SAMGovDocumentDownloader } from '../../server/services/scrapers/samGovDocumentDownloader';
 import axios from 'axios';
+import { Readable } from 'stream';
 import { storage } from '../../server/storage';
 import {
   mockOpportunityDetailsResponse,
@@ -320,13 +321,13 @@ describe('SAMGovDocumentDownloader', () => {
   });
 
   describe('downloadFile()', () => {
-    it('should download file with correct headers and response type', async () => {
+    it('should stream the file with the API key header', async () => {
       // Arrange
       const fileUrl = 'https://sam.gov/download/test.pdf';
-      const mockBuffer = Buffer.from('test content');
+      const mockStream = Readable.from([Buffer.from('test content')]);
 
       mockedAxios.get.mockResolvedValueOnce({
-        data: mockBuffer,
+        data: mockStream,
         status: 200,
         headers: { 'content-type': 'application/pdf' },
       });
@@ -335,15 +336,15 @@ describe('SAMGovDocumentDownloader', () => {
       const result = await downloader['downloadFile'](fileUrl, mockApiKey);
 
       // Assert
-      expect(result).toEqual(mockBuffer);
-      expect(mockedAxios.get).toHaveBeenCalledWith(fileUrl, {
-        responseType: 'arraybuffer',
-        headers: {
-          'X-Api-Key': mockApiKey,
-          'User-Agent': 'RFP-Agent/1.0',
-        },
-        timeout: 60000,
-      });
+      expect(result).toBe(mockStream);
+      expect(mockedAxios.get).toHaveBeenCalledWith(
+        fileUrl,
+        expect.objectContaining({
+          responseType: 'stream',
+          headers: expect.objectContaining({ 'X-Api-Key': mockApiKey }),
+          timeout: 60000,
+        })
+      );
     });
   });
 
@@ -0,0 +1,200 @@
+import { describe, it, expect, jest } from '@jest/globals';
+import {
+  BrowserPoolTimeoutError,
+  BrowserSessionPool,
+  type BrowserSessionPoolOptions,
+} from '../../src/mastra/tools/browser-session-pool';
+import { BrowserbaseSessionManager } from '../../src/mastra/tools/session-manager';
+
+const sleep = (ms: number) => new Promise(resolve => setTimeout(resolve, ms));
+
+// Stands in for an initialized Stagehand instance
+class FakeStagehand {
+  static created = 0;
+  readonly browserbaseSessionId = `bb-${++FakeStagehand.created}`;
+  healthy = true;
+  closed = false;
+  context = {
+    pages: async () => {
+      if (!this.healthy) throw new Error('Target closed');
+      return [{ url: () => 'about:blank' }];
+    },
+  };
+  close = jest.fn(async () => {
+    this.closed = true;
+  });
+}
+
+const createPool = (
+  options: Partial<BrowserSessionPoolOptions<FakeStagehand>> = {}
+) => {
+  const sessions: FakeStagehand[] = [];
+  const pool = new BrowserSessionPool<FakeStagehand>({
+    minIdle: 0,
+    maxSize: 2,
+    create: async () => {
+      const session = new FakeStagehand();
+      sessions.push(session);
+      return session;
+    },
+    destroy: session => session.close(),
+    checkHealth: async session => {
+      await session.context.pages();
+      return true;
+    },
+    ...options,
+  });
+  return { pool, sessions };
+};
+
+describe('BrowserSessionPool', () => {
+  it('should reuse a returned session, preferring the same portal', async () => {
+    const { pool, sessions } = createPool();
+
+    const first = await pool.acquire({ affinityKey: 'portal-a' });
+    const second = await pool.acquire({ affinityKey: 'portal-b' });
+    pool.release(first);
+    pool.release(second);
+
+    const again = await pool.acquire({ affinityKey: 'portal-a' });
+
+    expect(sessions).toHaveLength(2);
+    expect(again.session).toBe(first.session);
+    expect(again.reused).toBe(true);
+    expect(pool.getStats()).toMatchObject({ affinityHits: 1, created: 2 });
+    await pool.drain();
+  });
+
+  it('should pre-warm idle sessions up to minIdle', async () => {
+    const { pool, sessions } = createPool({ minIdle: 2, maxSize: 3 });
+
+    await pool.warm();
+    expect(pool.getStats()).toMatchObject({ idle: 2, leased: 0 });
+
+    const lease = await pool.acquire();
+    expect(lease.reused).toBe(true);
+
+    // The pool tops itself back up behind the lease
+    await sleep(0);
+    expect(pool.getStats()).toMatchObject({
+      idle: 2,
+      leased: 1,
+      created: 3,
+    });
+    await pool.drain();
+    expect(sessions.every(session => session.closed)).toBe(true);
+  });
+
+  it('should make acquire wait for a returned session and time out when none is', async () => {
+    const { pool } = createPool({ maxSize: 1, acquireTimeoutMs: 30 });
+
+    const held = await pool.acquire();
+    const waiting = pool.acquire();
+    pool.release(held);
+    expect((await waiting).session).toBe(held.session);
+
+    await expect(pool.acquire()).rejects.toBeInstanceOf(
+      BrowserPoolTimeoutError
+    );
+    expect(pool.getStats().acquireTimeouts).toBe(1);
+    await pool.drain();
+  });
+
+  it('should replace sessions that fail their health check', async () => {
+    const { pool, sessions } = createPool();
+
+    const lease = await pool.acquire();
+    pool.release(lease);
+    sessions[0].healthy = false;
+
+    const next = await pool.acquire();
+
+    expect(next.session).not.toBe(sessions[0]);
+    expect(sessions[0].closed).toBe(true);
+    expect(pool.getStats().healthCheckFailures).toBe(1);
+    await pool.drain();
+  });
+
+  it('should evict idle sessions and reclaim leases that stopped being used', async () => {
+    const onLeaseReclaimed = jest.fn();
+    const { pool, sessions } = createPool({
+      idleTimeoutMs: 0,
+      leaseTimeoutMs: 10,
+      onLeaseReclaimed,
+    });
+
+    const idle = await pool.acquire();
+    const orphaned = await pool.acquire();
+    pool.release(idle);
+    await sleep(20);
+    await pool.runMaintenance();
+
+    expect(sessions.every(session => session.closed)).toBe(true);
+    expect(onLeaseReclaimed).toHaveBeenCalledWith(
+      expect.objectContaining({ id: orphaned.id })
+    );
+    expect(pool.getStats()).toMatchObject({
+      size: 0,
+      idleEvicted: 1,
+      leasesReclaimed: 1,
+    });
+
+    // A stale holder releasing late does not resurrect the session
+    pool.release(orphaned);
+    expect(pool.getStats().idle).toBe(0);
+    await pool.drain();
+  });
+});
+
+describe('BrowserbaseSessionManager pooling', () => {
+  it('should hand a released session to the next scan of the same portal', async () => {
+    const manager = new BrowserbaseSessionManager({
+      createStagehand: async () => new FakeStagehand() as any,
+      pool: { minIdle: 0 },
+    });
+
+    manager.setSessionAffinity('scan-1', 'portal-a');
+    const first = await manager.ensureStagehand('scan-1');
+    expect(await manager.ensureStagehand('scan-1')).toBe(first);
+    const bbSessionId = manager.getBrowserbaseSessionId('scan-1');
+    expect(bbSessionId).toBeDefined();
+
+    manager.releaseSession('scan-1');
+    expect(manager.getBrowserbaseSessionId('scan-1')).toBeUndefined();
+
+    manager.setSessionAffinity('scan-2', 'portal-a');
+    expect(await manager.ensureStagehand('scan-2')).toBe(first);
+    expect(manager.getBrowserbaseSessionId('scan-2')).toBe(bbSessionId);
+
+    await manager.closeSession('scan-2');
+    expect((first as unknown as FakeStagehand).closed).toBe(true);
+    expect(manager.getPoolStats()).toMatchObject({ size: 0, reused: 1 });
+    await manager.cleanup();
+  });
+
+  it('should return a borrowed session only if the borrower leased it', async () => {
+    const manager = new BrowserbaseSessionManager({
+      createStagehand: async () => new FakeStagehand() as any,
+      pool: { minIdle: 0 },
+    });
+
+    // A tool run leases the session itself and hands it back when done
+    const returnSession = manager.borrowSession('agent-1');
+    const first = await manager.ensureStagehand('agent-1');
+    returnSession();
+    expect(manager.getBrowserbaseSessionId('agent-1')).toBeUndefined();
+    expect(manager.getPoolStats()).toMatchObject({ idle: 1, leased: 0 });
+
+    // The next run for the same session gets the same warm browser back
+    const returnAgain = manager.borrowSession('agent-1');
+    expect(await manager.ensureStagehand('agent-1')).toBe(first);
+    returnAgain();
+
+    // A session a scan already holds is left to the scan
+    await manager.ensureStagehand('scan-1');
+    manager.borrowSession('scan-1')();
+    expect(manager.getBrowserbaseSessionId('scan-1')).toBeDefined();
+
+    await manager.cleanup();
+  });
+});
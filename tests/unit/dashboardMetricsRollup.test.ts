@@ -0,0 +1,81 @@
+import { describe, it, expect, jest, beforeEach } from '@jest/globals';
+import { DatabaseStorage } from '../../server/storage';
+
+const today = () => new Date().toISOString().slice(0, 10);
+
+const counters = () =>
+  new Map<string, number>([
+    ['reconciled_at:', 1],
+    ['rfp_status:discovered', 4],
+    ['rfp_status:review', 2],
+    ['rfp_status:approved', 1],
+    ['rfp_status:submitted', 3],
+    ['rfp_status:closed', 9],
+    ['rfp_value:approved', 1000],
+    ['rfp_value:submitted', 2500.5],
+    ['rfp_value:closed', 99999],
+    ['portals:', 6],
+    [`rfps_discovered:${today()}`, 2],
+    [`submissions_submitted:${today()}`, 1],
+  ]);
+
+describe('DatabaseStorage dashboard metrics rollup', () => {
+  let storage: DatabaseStorage;
+  let readDashboardCounters: jest.Mock<() => Promise<Map<string, number>>>;
+
+  beforeEach(() => {
+    storage = new DatabaseStorage();
+    readDashboardCounters = jest.fn(async () => counters());
+    (storage as any).readDashboardCounters = readDashboardCounters;
+  });
+
+  it('should derive dashboard metrics from the rollup counters', async () => {
+    const metrics = await storage.getDashboardMetrics();
+
+    expect(metrics).toEqual({
+      activeRfps: 7,
+      submittedRfps: 3,
+      totalValue: 3500.5,
+      portalsTracked: 6,
+      newRfpsToday: 2,
+      pendingReview: 2,
+      submittedToday: 1,
+      winRate: 30,
+      avgResponseTime: 0,
+    });
+  });
+
+  it('should serve repeat reads from the cache until invalidated', async () => {
+    await Promise.all([
+      storage.getDashboardMetrics(),
+      storage.getDashboardMetrics(),
+    ]);
+    await storage.getDashboardMetrics();
+    expect(readDashboardCounters).toHaveBeenCalledTimes(1);
+
+    (storage as any).invalidateMetrics();
+    await storage.getDashboardMetrics();
+    expect(readDashboardCounters).toHaveBeenCalledTimes(2);
+  });
+
+  it('should seed the rollup when it has never been reconciled', async () => {
+    readDashboardCounters.mockResolvedValueOnce(new Map());
+    const reconcile = jest
+      .spyOn(storage, 'reconcileDashboardRollup')
+      .mockResolvedValue(12);
+
+    const metrics = await storage.getDashboardMetrics();
+
+    expect(reconcile).toHaveBeenCalledTimes(1);
+    expect(metrics.activeRfps).toBe(7);
+  });
+
+  it('should not cache a failed read', async () => {
+    readDashboardCounters.mockRejectedValueOnce(new Error('timeout'));
+
+    await expect(storage.getDashboardMetrics()).rejects.toThrow('timeout');
+    await expect(storage.getDashboardMetrics()).resolves.toMatchObject({
+      portalsTracked: 6,
+    });
+  });
+});
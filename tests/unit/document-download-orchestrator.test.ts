@@ -1,19 +1,49 @@
 import { DocumentDownloadOrchestrator } from '../../server/services/downloads/documentDownloadOrchestrator';
 import { browserbaseDownloadService } from '../../server/services/downloads/browserbaseDownloadService';
+import { DocumentContentStore } from '../../server/services/downloads/documentContentStore';
 import { ObjectStorageService } from '../../server/objectStorage';
 import { db } from '../../server/db';
 
 // Mock dependencies
 jest.mock('../../server/services/downloads/browserbaseDownloadService');
 jest.mock('../../server/objectStorage');
+jest.mock('../../server/storage');
 jest.mock('../../server/db');
 
 describe('DocumentDownloadOrchestrator', () => {
   let orchestrator: DocumentDownloadOrchestrator;
+  let contentStore: DocumentContentStore;
+  let mockUpload: jest.Mock;
+  let existingDocuments: any[];
 
   beforeEach(() => {
     jest.clearAllMocks();
-    orchestrator = new DocumentDownloadOrchestrator();
+    existingDocuments = [];
+    mockUpload = jest.fn(async (_source: any, objectPath: string) =>
+      `https://storage.googleapis.com/test-bucket/${objectPath}`,
+    );
+    const blobs = new Map<string, any>();
+    contentStore = new DocumentContentStore({
+      blobs: {
+        getDocumentBlob: async (contentHash) => blobs.get(contentHash),
+        upsertDocumentBlob: async (blob) => {
+          if (!blobs.has(blob.contentHash)) blobs.set(blob.contentHash, blob);
+          return blobs.get(blob.contentHash);
+        },
+      },
+      upload: mockUpload as any,
+    });
+
+    // Lookup of an existing document with the same content hash
+    (db as any).select = jest.fn().mockReturnValue({
+      from: jest.fn().mockReturnValue({
+        where: jest.fn().mockReturnValue({
+          limit: jest.fn(async () => existingDocuments),
+        }),
+      }),
+    });
+
+    orchestrator = new DocumentDownloadOrchestrator(contentStore);
   });
 
   describe('processRfpDocuments', () => {
@@ -77,7 +107,7 @@ describe('DocumentDownloadOrchestrator', () => {
       (db as any).insert = mockDbInsert;
 
       // Re-create orchestrator after mocks are set
-      orchestrator = new DocumentDownloadOrchestrator();
+      orchestrator = new DocumentDownloadOrchestrator(contentStore);
 
       const result = await orchestrator.processRfpDocuments({
         rfpId: 'test-rfp-123',
@@ -99,8 +129,12 @@ describe('DocumentDownloadOrchestrator', () => {
         30,
       );
 
-      // Verify upload was called
-      expect(mockUploadPrivateObject).toHaveBeenCalled();
+      // Verify the bytes were uploaded under their content hash
+      expect(mockUpload).toHaveBeenCalledTimes(1);
+      expect(mockUpload.mock.calls[0][1]).toMatch(
+        /^rfp_documents\/blobs\/[0-9a-f]{64}\.pdf$/,
+      );
+      expect(result.processed[0].contentHash).toMatch(/^[0-9a-f]{64}$/);
 
       // Verify database insert was called
       expect(mockDbInsert).toHaveBeenCalled();
@@ -238,5 +272,46 @@ describe('DocumentDownloadOrchestrator', () => {
       expect(result.failed[1].filename).toBe('document3.pdf');
       expect(result.failed[0].error).toContain('not found');
     });
+
+    it('should skip upload and insert when a repeat scan finds the same bytes', async () => {
+      const mockFiles = [
+        {
+          name: 'addendum-1234567890123.pdf',
+          originalName: 'addendum.pdf',
+          size: 7,
+          buffer: Buffer.from('addenda'),
+          mimeType: 'application/pdf',
+        },
+      ];
+      (browserbaseDownloadService.retrieveDownloads as jest.Mock).mockResolvedValue({
+        success: true,
+        files: mockFiles,
+        sessionId: 'bb-session-456',
+        retrievedAt: new Date().toISOString(),
+      });
+
+      const mockDbInsert = jest.fn().mockReturnValue({
+        values: jest.fn().mockReturnValue({
+          returning: jest.fn().mockResolvedValue([{ id: 'doc-123' }]),
+        }),
+      });
+      (db as any).insert = mockDbInsert;
+
+      const input = { rfpId: 'test-rfp-123', browserbaseSessionId: 'bb-session-456' };
+      const first = await orchestrator.processRfpDocuments(input);
+
+      existingDocuments = [
+        { id: 'doc-123', objectPath: first.processed[0].objectPath },
+      ];
+      const second = await orchestrator.processRfpDocuments(input);
+
+      expect(mockUpload).toHaveBeenCalledTimes(1);
+      expect(mockDbInsert).toHaveBeenCalledTimes(1);
+      expect(second.processed[0]).toMatchObject({
+        id: 'doc-123',
+        reused: true,
+        contentHash: first.processed[0].contentHash,
+      });
+    });
   });
 });
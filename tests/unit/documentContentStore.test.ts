@@ -0,0 +1,150 @@
+import { describe, it, expect, jest } from '@jest/globals';
+import { promises as fs } from 'fs';
+import os from 'os';
+import path from 'path';
+import { Readable } from 'stream';
+import type { DocumentBlob, InsertDocumentBlob } from '@shared/schema';
+import {
+  DocumentContentStore,
+  DocumentTooLargeError,
+  hashContent,
+} from '../../server/services/downloads/documentContentStore';
+
+const createStore = () => {
+  const rows = new Map<string, DocumentBlob>();
+  const uploads: Array<{ objectPath: string; data: Buffer }> = [];
+  const blobs = {
+    getDocumentBlob: jest.fn(async (contentHash: string) =>
+      rows.get(contentHash)
+    ),
+    upsertDocumentBlob: jest.fn(async (blob: InsertDocumentBlob) => {
+      // First writer keeps the object; later writers only add text
+      const existing = rows.get(blob.contentHash);
+      const row = {
+        createdAt: new Date(),
+        contentType: null,
+        textExtractedAt: null,
+        ...(existing ?? blob),
+        extractedText: blob.extractedText ?? existing?.extractedText ?? null,
+      } as DocumentBlob;
+      rows.set(blob.contentHash, row);
+      return row;
+    }),
+  };
+  const store = new DocumentContentStore({
+    blobs,
+    spoolDir: os.tmpdir(),
+    upload: async (source, objectPath) => {
+      const data =
+        'buffer' in source
+          ? source.buffer
+          : await fs.readFile(source.filePath);
+      uploads.push({ objectPath, data });
+      return `https://storage.googleapis.com/bucket/${objectPath}`;
+    },
+  });
+  return { store, blobs, rows, uploads };
+};
+
+describe('DocumentContentStore', () => {
+  it('should upload new bytes once and reuse them on later ingests', async () => {
+    const { store, uploads } = createStore();
+    const body = Buffer.from('addendum 1 contents');
+
+    const first = await store.ingestStream(Readable.from([body]), {
+      fileName: 'Addendum 1.PDF',
+      contentType: 'application/pdf',
+    });
+    const second = await store.ingestBuffer(Buffer.from(body), {
+      fileName: 'addendum-1-copy.pdf',
+    });
+
+    expect(first).toMatchObject({
+      contentHash: hashContent(body),
+      size: body.length,
+      deduplicated: false,
+    });
+    expect(first.storagePath).toBe(
+      `https://storage.googleapis.com/bucket/rfp_documents/blobs/${hashContent(body)}.pdf`
+    );
+    expect(second).toMatchObject({
+      storagePath: first.storagePath,
+      contentType: 'application/pdf',
+      deduplicated: true,
+    });
+    expect(uploads).toHaveLength(1);
+    expect(uploads[0].data.equals(body)).toBe(true);
+    expect(store.getStats()).toMatchObject({
+      ingested: 2,
+      uploaded: 1,
+      deduplicated: 1,
+      bytesSkipped: body.length,
+    });
+  });
+
+  it('should share one upload between concurrent ingests of the same bytes', async () => {
+    const { store, uploads } = createStore();
+    const body = Buffer.from('same bytes');
+
+    const results = await Promise.all([
+      store.ingestBuffer(body, { fileName: 'a.pdf' }),
+      store.ingestBuffer(body, { fileName: 'b.pdf' }),
+    ]);
+
+    expect(uploads).toHaveLength(1);
+    expect(results.map(result => result.deduplicated)).toEqual([false, true]);
+  });
+
+  it('should reject oversized streams and remove the spool file', async () => {
+    const spoolDir = await fs.mkdtemp(path.join(os.tmpdir(), 'spool-'));
+    const store = new DocumentContentStore({
+      spoolDir,
+      blobs: {
+        getDocumentBlob: async () => undefined,
+        upsertDocumentBlob: async () => {
+          throw new Error('should not store');
+        },
+      },
+      upload: async () => {
+        throw new Error('should not upload');
+      },
+    });
+
+    await expect(
+      store.ingestStream(Readable.from([Buffer.alloc(8), Buffer.alloc(8)]), {
+        fileName: 'big.pdf',
+        maxBytes: 10,
+      })
+    ).rejects.toBeInstanceOf(DocumentTooLargeError);
+    await expect(fs.readdir(spoolDir)).resolves.toEqual([]);
+    await fs.rm(spoolDir, { recursive: true, force: true });
+  });
+
+  it('should cache extracted text by content hash', async () => {
+    const { store, blobs } = createStore();
+    const contentHash = hashContent(Buffer.from('scope of work'));
+
+    await expect(store.getExtractedText(contentHash)).resolves.toBeUndefined();
+    await store.saveExtractedText(contentHash, 'Scope of work', {
+      objectPath: 'rfp_documents/rfp-1/sow.pdf',
+      size: 13,
+      contentType: 'application/pdf',
+    });
+    await expect(store.getExtractedText(contentHash)).resolves.toBe(
+      'Scope of work'
+    );
+
+    // A fresh process reads the text back from the blob row
+    const restarted = new DocumentContentStore({
+      blobs,
+      upload: async () => '',
+    });
+    await expect(restarted.getExtractedText(contentHash)).resolves.toBe(
+      'Scope of work'
+    );
+    expect(store.getStats()).toMatchObject({
+      textCacheHits: 1,
+      textCacheMisses: 1,
+    });
+  });
+});
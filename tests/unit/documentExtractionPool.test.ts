@@ -0,0 +1,106 @@
+import { describe, it, expect, afterEach } from '@jest/globals';
+import {
+  DocumentExtractionPool,
+  ExtractionQueueFullError,
+} from '../../server/services/processing/documentExtractionPool';
+
+// Echoes the upper-cased buffer back; "hang" never answers, "fail" errors
+const FAKE_WORKER_SOURCE = `
+const { parentPort } = require('worker_threads');
+parentPort.on('message', ({ id, kind, data }) => {
+  const text = Buffer.from(data.buffer, data.byteOffset, data.byteLength)
+    .toString();
+  if (text === 'hang') return;
+  if (text === 'fail') {
+    parentPort.postMessage({ id, error: 'corrupt ' + kind });
+    return;
+  }
+  parentPort.postMessage({ id, result: { text: text.toUpperCase() } });
+});
+`;
+
+describe('DocumentExtractionPool', () => {
+  let pool: DocumentExtractionPool;
+
+  afterEach(async () => {
+    await pool.shutdown();
+  });
+
+  it('should run jobs on worker threads and queue the overflow', async () => {
+    pool = new DocumentExtractionPool({
+      size: 2,
+      workerSource: FAKE_WORKER_SOURCE,
+    });
+
+    const jobs = ['one', 'two', 'three'].map(text =>
+      pool.extract('pdf', Buffer.from(text))
+    );
+    expect(pool.getStats()).toMatchObject({ workers: 2, busy: 2, queued: 1 });
+
+    await expect(Promise.all(jobs)).resolves.toEqual([
+      { text: 'ONE' },
+      { text: 'TWO' },
+      { text: 'THREE' },
+    ]);
+    await expect(pool.extract('docx', Buffer.from('fail'))).rejects.toThrow(
+      'corrupt docx'
+    );
+    expect(pool.getStats()).toMatchObject({ completed: 3, failed: 1 });
+  });
+
+  it('should transfer buffers that own their memory', async () => {
+    pool = new DocumentExtractionPool({
+      size: 1,
+      workerSource: FAKE_WORKER_SOURCE,
+    });
+    const owned = new Uint8Array(Buffer.from('owned'));
+    const kept = new Uint8Array(Buffer.from('kept'));
+
+    const [transferred, copied] = await Promise.all([
+      pool.extract('pdf', owned),
+      pool.extract('pdf', kept, { transfer: false }),
+    ]);
+
+    expect(transferred.text).toBe('OWNED');
+    expect(owned.byteLength).toBe(0);
+    expect(copied.text).toBe('KEPT');
+    expect(Buffer.from(kept).toString()).toBe('kept');
+  });
+
+  it('should reject when the queue is full', async () => {
+    pool = new DocumentExtractionPool({
+      size: 1,
+      maxQueue: 1,
+      workerSource: FAKE_WORKER_SOURCE,
+    });
+
+    const running = pool.extract('pdf', Buffer.from('hang'));
+    const queued = pool.extract('pdf', Buffer.from('queued'));
+    await expect(pool.extract('pdf', Buffer.from('more'))).rejects.toThrow(
+      ExtractionQueueFullError
+    );
+    expect(pool.getStats().rejected).toBe(1);
+
+    void running.catch(() => {});
+    void queued.catch(() => {});
+  });
+
+  it('should replace a worker whose job times out', async () => {
+    pool = new DocumentExtractionPool({
+      size: 1,
+      timeoutMs: 50,
+      workerSource: FAKE_WORKER_SOURCE,
+    });
+
+    const hung = pool.extract('pdf', Buffer.from('hang'));
+    const next = pool.extract('pdf', Buffer.from('next'));
+
+    await expect(hung).rejects.toThrow('timed out after 50ms');
+    await expect(next).resolves.toEqual({ text: 'NEXT' });
+    expect(pool.getStats()).toMatchObject({
+      timedOut: 1,
+      workersReplaced: 1,
+      workers: 1,
+    });
+  });
+});
@@ -0,0 +1,114 @@
+import { describe, it, expect, jest } from '@jest/globals';
+import {
+  EventBus,
+  type BusMessage,
+  type BusPublishOptions,
+  type EventBusBackend,
+} from '../../server/services/core/eventBus';
+
+// Stands in for Postgres: fans each publish out to every started node and
+// keeps snapshots like the event_bus_snapshots table
+const createNetwork = () => {
+  type Receive = (message: BusMessage, options: BusPublishOptions) => void;
+  const nodes: Receive[] = [];
+  const snapshots = new Map<string, unknown>();
+
+  const backend = (): EventBusBackend => ({
+    name: 'fake',
+    start: async receive => {
+      nodes.push(receive);
+    },
+    publish: async (message, options) => {
+      const key = `${message.topic}/${message.key}`;
+      if (options.final) snapshots.delete(key);
+      else if (options.snapshot) snapshots.set(key, message.payload);
+      nodes.forEach(receive => receive(message, options));
+    },
+    loadSnapshot: async (topic, key) => snapshots.get(`${topic}/${key}`),
+    stop: async () => {},
+    isConnected: () => true,
+  });
+
+  return { backend };
+};
+
+describe('EventBus', () => {
+  it('should deliver locally at once and to each other node once', async () => {
+    const network = createNetwork();
+    const nodeA = new EventBus(network.backend());
+    const nodeB = new EventBus(network.backend());
+    await Promise.all([nodeA.start(), nodeB.start()]);
+
+    const onA = jest.fn();
+    const onB = jest.fn();
+    nodeA.subscribe('progress', onA);
+    nodeB.subscribe('progress', onB);
+
+    nodeA.publish('progress', 'session-1', { step: 1 });
+    expect(onA).toHaveBeenCalledTimes(1);
+
+    await Promise.resolve();
+    expect(onA).toHaveBeenCalledTimes(1);
+    expect(onB).toHaveBeenCalledTimes(1);
+    expect(onB).toHaveBeenCalledWith(
+      expect.objectContaining({
+        topic: 'progress',
+        key: 'session-1',
+        payload: { step: 1 },
+        origin: nodeA.nodeId,
+      })
+    );
+    expect(nodeB.getStats()).toMatchObject({ received: 1, publishErrors: 0 });
+  });
+
+  it('should replay the latest snapshot until the stream ends', async () => {
+    const network = createNetwork();
+    const producer = new EventBus(network.backend());
+    await producer.start();
+
+    producer.publish('progress', 's', { step: 1 }, { snapshot: true });
+    producer.publish('progress', 's', { step: 2 }, { snapshot: true });
+    await Promise.resolve();
+
+    // A node that started after the events were sent
+    const lateNode = new EventBus(network.backend());
+    await expect(lateNode.getSnapshot('progress', 's')).resolves.toEqual({
+      step: 2,
+    });
+
+    producer.publish('progress', 's', { done: true }, { final: true });
+    await Promise.resolve();
+    await expect(producer.getSnapshot('progress', 's')).resolves.toBe(
+      undefined
+    );
+    await expect(lateNode.getSnapshot('progress', 's')).resolves.toBe(
+      undefined
+    );
+  });
+
+  it('should isolate listener failures and count publish errors', async () => {
+    const bus = new EventBus({
+      ...createNetwork().backend(),
+      publish: async () => {
+        throw new Error('connection lost');
+      },
+    });
+    const errors = jest.spyOn(console, 'error').mockImplementation(() => {});
+    const healthy = jest.fn();
+    bus.subscribe('scan', () => {
+      throw new Error('listener bug');
+    });
+    bus.subscribe('scan', healthy);
+
+    bus.publish('scan', 'scan-1', { type: 'log' });
+    await new Promise(resolve => setImmediate(resolve));
+
+    expect(healthy).toHaveBeenCalledTimes(1);
+    expect(bus.getStats()).toMatchObject({
+      published: 1,
+      publishErrors: 1,
+      listenerErrors: 1,
+    });
+    errors.mockRestore();
+  });
+});
@@ -0,0 +1,96 @@
+import { describe, it, expect, jest } from '@jest/globals';
+import {
+  FanOutHub,
+  type FanOutTransport,
+} from '../../server/services/core/fanOutHub';
+
+const fakeTransport = () => {
+  const transport = {
+    buffered: 0,
+    frames: [] as string[],
+    terminated: false,
+    bufferedBytes: () => transport.buffered,
+    write: (frame: string) => {
+      transport.frames.push(frame);
+    },
+    terminate: () => {
+      transport.terminated = true;
+    },
+  };
+  return transport satisfies FanOutTransport;
+};
+
+const sleep = (ms: number) => new Promise(resolve => setTimeout(resolve, ms));
+
+describe('FanOutHub', () => {
+  it('should encode once and deliver only to channel subscribers', () => {
+    const encode = jest.fn((message: { n: number }) => JSON.stringify(message));
+    const hub = new FanOutHub({ encode });
+    const a = fakeTransport();
+    const b = fakeTransport();
+    const c = fakeTransport();
+    hub.subscribe(hub.addSubscriber('a', a), 'rfps');
+    hub.subscribe(hub.addSubscriber('b', b), 'rfps');
+    hub.subscribe(hub.addSubscriber('c', c), 'scans');
+
+    expect(hub.publish('rfps', { n: 1 })).toBe(2);
+
+    expect(encode).toHaveBeenCalledTimes(1);
+    expect(a.frames).toEqual(['{"n":1}']);
+    expect(b.frames).toEqual(['{"n":1}']);
+    expect(c.frames).toEqual([]);
+    expect(hub.getStats().channels).toEqual({ rfps: 2, scans: 1 });
+    hub.shutdown();
+  });
+
+  it('should keep only the latest keyed frame for a lagging client', async () => {
+    const hub = new FanOutHub<number>({
+      encode: String,
+      lagBytes: 100,
+      flushIntervalMs: 5,
+    });
+    const slow = fakeTransport();
+    hub.subscribe(hub.addSubscriber('slow', slow), 'progress');
+    slow.buffered = 500;
+
+    hub.publish('progress', 1, { coalesceKey: 'p' });
+    hub.publish('progress', 2, { coalesceKey: 'p' });
+    hub.publish('progress', 3, { coalesceKey: 'p' });
+    hub.publish('progress', 99);
+
+    expect(slow.frames).toEqual(['99']);
+    expect(hub.getStats()).toMatchObject({
+      coalesced: 2,
+      pendingFrames: 1,
+      laggingSubscribers: 1,
+    });
+
+    slow.buffered = 0;
+    await sleep(20);
+
+    expect(slow.frames).toEqual(['99', '3']);
+    expect(hub.getStats().laggingSubscribers).toBe(0);
+    hub.shutdown();
+  });
+
+  it('should disconnect a client past the high-water mark', () => {
+    const onDisconnect = jest.fn();
+    const hub = new FanOutHub<string>({
+      encode: message => message,
+      maxBufferedBytes: 1000,
+      onDisconnect,
+    });
+    const stuck = fakeTransport();
+    const subscriber = hub.addSubscriber('stuck', stuck);
+    hub.subscribe(subscriber, 'rfps');
+    stuck.buffered = 2000;
+
+    expect(hub.publish('rfps', 'update')).toBe(0);
+
+    expect(stuck.terminated).toBe(true);
+    expect(stuck.frames).toEqual([]);
+    expect(onDisconnect).toHaveBeenCalledWith(subscriber);
+    expect(hub.getStats()).toMatchObject({ subscribers: 0, disconnected: 1 });
+    expect(hub.subscribersOf('rfps')).toEqual([]);
+  });
+});
@@ -0,0 +1,90 @@
+import { describe, it, expect, jest, beforeEach } from '@jest/globals';
+import { IncrementalPortalScanService } from '../../server/services/portals/incrementalPortalScanService';
+import { storage } from '../../server/storage';
+
+const existingRfp = (overrides: Record<string, unknown>) => ({
+  id: 'rfp-1',
+  title: 'Road Resurfacing',
+  description: 'Resurface main street',
+  agency: 'City of Austin',
+  deadline: null,
+  estimatedValue: null,
+  category: null,
+  sourceUrl: 'https://portal.gov/rfp/1',
+  analysisSourceId: null,
+  requirementsSourceId: null,
+  ...overrides,
+});
+
+describe('IncrementalPortalScanService reconciliation', () => {
+  let service: IncrementalPortalScanService;
+  let createRFPs: jest.SpiedFunction<typeof storage.createRFPs>;
+  let updateRFPs: jest.SpiedFunction<typeof storage.updateRFPs>;
+  let mergeRFPAnalysis: jest.SpiedFunction<typeof storage.mergeRFPAnalysis>;
+
+  beforeEach(() => {
+    service = new IncrementalPortalScanService();
+    (service as any).loadExistingRFPs = async () => [
+      existingRfp({ id: 'rfp-1', sourceUrl: 'https://portal.gov/rfp/1' }),
+      existingRfp({
+        id: 'rfp-2',
+        title: 'Bridge Repair',
+        sourceUrl: 'https://portal.gov/old-url/2',
+        analysisSourceId: 'SOL-2',
+      }),
+    ];
+    createRFPs = jest.spyOn(storage, 'createRFPs').mockResolvedValue([]);
+    updateRFPs = jest.spyOn(storage, 'updateRFPs').mockResolvedValue();
+    mergeRFPAnalysis = jest
+      .spyOn(storage, 'mergeRFPAnalysis')
+      .mockResolvedValue();
+  });
+
+  it('should diff candidates in memory and write each group once', async () => {
+    const results = await (service as any).reconcileCandidates('portal-1', [
+      { title: 'Road Resurfacing', url: 'https://portal.gov/rfp/1' },
+      {
+        title: 'Bridge Repair (Amended)',
+        url: 'https://portal.gov/rfp/2',
+        sourceIdentifier: 'SOL-2',
+      },
+      { title: 'Park Lighting', url: 'https://portal.gov/rfp/3' },
+      { title: 'Park Lighting', url: 'https://portal.gov/rfp/3' },
+    ]);
+
+    expect(results.map((entry: any) => entry.result)).toEqual([
+      'unchanged',
+      'updated',
+      'new',
+      'unchanged',
+    ]);
+    expect(createRFPs).toHaveBeenCalledTimes(1);
+    expect(createRFPs.mock.calls[0][0]).toEqual([
+      expect.objectContaining({
+        portalId: 'portal-1',
+        sourceUrl: 'https://portal.gov/rfp/3',
+        status: 'discovered',
+      }),
+    ]);
+    expect(updateRFPs).toHaveBeenCalledTimes(1);
+    expect(updateRFPs.mock.calls[0][0]).toEqual([
+      expect.objectContaining({ id: 'rfp-2', title: 'Bridge Repair (Amended)' }),
+    ]);
+    expect(mergeRFPAnalysis).toHaveBeenCalledWith(['rfp-1'], {
+      lastCheckedInScan: expect.any(String),
+    });
+  });
+
+  it('should fail only the candidates whose write failed', async () => {
+    updateRFPs.mockRejectedValue(new Error('deadlock detected'));
+
+    const results = await (service as any).reconcileCandidates('portal-1', [
+      { title: 'Road Resurfacing', url: 'https://portal.gov/rfp/1' },
+      { title: 'Bridge Repair v2', url: 'https://portal.gov/old-url/2' },
+    ]);
+
+    expect(results[0]).toMatchObject({ result: 'unchanged' });
+    expect(results[1]).toMatchObject({ error: 'deadlock detected' });
+    expect(results[1].result).toBeUndefined();
+  });
+});
@@ -0,0 +1,154 @@
+import { describe, it, expect } from '@jest/globals';
+import {
+  KnowledgeGraphStore,
+  type KnowledgeRelationship,
+} from '../../server/services/learning/knowledgeGraphStore';
+
+interface Item {
+  id: string;
+  title: string;
+  tags: string[];
+  usageCount: number;
+}
+
+// Strength is the tag Jaccard similarity, so tag changes move edges
+const relate = (a: Item, b: Item): KnowledgeRelationship => {
+  const common = a.tags.filter(tag => b.tags.includes(tag)).length;
+  const union = new Set([...a.tags, ...b.tags]).size;
+  return {
+    type: 'similar',
+    strength: union > 0 ? common / union : 0,
+    confidence: 1,
+    evidence: [],
+  };
+};
+
+const createStore = (scored: Array<[string, string]> = []) =>
+  new KnowledgeGraphStore({
+    toNode: (item: Item) => ({
+      id: item.id,
+      type: 'concept',
+      label: item.title,
+      content: {},
+      importance: item.usageCount,
+      connections: 0,
+      lastActivated: new Date(),
+    }),
+    relate: (a: Item, b: Item) => {
+      scored.push([a.id, b.id]);
+      return relate(a, b);
+    },
+    tokenSets: (item: Item) => [item.tags],
+    relationKey: (item: Item) => item.tags.join(','),
+    searchText: (item: Item) => item.title.toLowerCase(),
+  });
+
+const item = (id: string, tags: string[], usageCount = 1): Item => ({
+  id,
+  title: `Knowledge ${id}`,
+  tags,
+  usageCount,
+});
+
+describe('KnowledgeGraphStore', () => {
+  it('should score each pair once when building from scratch', async () => {
+    const scored: Array<[string, string]> = [];
+    const store = createStore(scored);
+
+    await store.upsert([
+      item('a', ['x', 'y']),
+      item('b', ['x', 'y']),
+      item('c', ['z']),
+    ]);
+
+    expect(scored).toEqual([
+      ['a', 'b'],
+      ['a', 'c'],
+      ['b', 'c'],
+    ]);
+    expect(store.getAllEdges().map(edge => edge.id)).toEqual(['edge_a_b']);
+    expect(store.getNeighbors('a').map(node => node.id)).toEqual(['b']);
+    expect(store.getClusters()).toEqual([
+      expect.objectContaining({ id: 'cluster_a', nodes: ['a', 'b'] }),
+    ]);
+  });
+
+  it('should only rescore an item whose relationship features changed', async () => {
+    const scored: Array<[string, string]> = [];
+    const store = createStore(scored);
+    await store.upsert([item('a', ['x']), item('b', ['x']), item('c', ['z'])]);
+    scored.length = 0;
+
+    const usageOnly = await store.upsert([item('a', ['x'], 5)]);
+    expect(usageOnly.changedNodeIds).toEqual([]);
+    expect(scored).toEqual([]);
+    expect(store.getNode('a')).toMatchObject({ importance: 5, connections: 1 });
+
+    const retagged = await store.upsert([item('c', ['x'])]);
+    expect(retagged.changedNodeIds).toEqual(['c']);
+    expect(scored).toEqual([
+      ['a', 'c'],
+      ['b', 'c'],
+    ]);
+    expect(store.getStats()).toMatchObject({ nodes: 3, edges: 3, clusters: 1 });
+  });
+
+  it('should drop edges and clusters when an item is removed', async () => {
+    const store = createStore();
+    await store.upsert([item('a', ['x']), item('b', ['x']), item('c', ['y'])]);
+
+    const change = store.remove(['a', 'missing']);
+
+    expect(change.removedNodeIds).toEqual(['a']);
+    expect(store.getEdges('b')).toEqual([]);
+    expect(store.getNode('b')?.connections).toBe(0);
+    expect(store.getClusters()).toEqual([]);
+    expect(store.getStats().edges).toBe(0);
+  });
+
+  it('should restore a graph from persisted edges without scoring', async () => {
+    const scored: Array<[string, string]> = [];
+    const store = createStore(scored);
+
+    store.load(
+      [item('a', ['x']), item('b', ['x'])],
+      [
+        {
+          id: 'edge_a_b',
+          from: 'a',
+          to: 'b',
+          relationship: 'similar',
+          strength: 1,
+          confidence: 1,
+          evidence: [],
+        },
+        {
+          id: 'edge_a_gone',
+          from: 'a',
+          to: 'gone',
+          relationship: 'similar',
+          strength: 1,
+          confidence: 1,
+          evidence: [],
+        },
+      ]
+    );
+
+    expect(scored).toEqual([]);
+    expect(store.getStats()).toMatchObject({ nodes: 2, edges: 1, clusters: 1 });
+  });
+
+  it('should rank keyword matches by importance and connections', async () => {
+    const store = createStore();
+    await store.upsert([
+      item('a', ['x'], 1),
+      item('b', ['x'], 3),
+      item('c', ['y'], 10),
+    ]);
+
+    const results = store.findNodes({ keywords: ['KNOWLEDGE'], limit: 2 });
+
+    expect(results.map(node => node.id)).toEqual(['c', 'b']);
+    expect(store.findNodes({ keywords: ['missing'] })).toEqual([]);
+  });
+});
@@ -0,0 +1,95 @@
+import { describe, it, expect, jest } from '@jest/globals';
+import {
+  LLMResponseCache,
+  normalizeLLMInput,
+} from '../../server/services/core/llmResponseCache';
+
+const createStorage = () => {
+  const rows = new Map<string, any>();
+  return {
+    rows,
+    getAiResponseCacheEntry: jest.fn(async (key: string) => rows.get(key)),
+    upsertAiResponseCacheEntry: jest.fn(async (entry: any) => {
+      rows.set(entry.cacheKey, entry);
+    }),
+    recordAiResponseCacheHits: jest.fn(async (_hits: any[]) => {}),
+    deleteExpiredAiResponseCacheEntries: jest.fn(async () => 0),
+  };
+};
+
+const request = (input: string, bypassCache?: boolean) => ({
+  operation: 'analyze-compliance' as const,
+  model: 'gpt-5',
+  templateVersion: '1',
+  input: [input],
+  bypassCache,
+});
+
+describe('LLMResponseCache', () => {
+  it('should answer repeat requests from the cache and count tokens saved', async () => {
+    const cache = new LLMResponseCache(createStorage() as any, {
+      enabled: true,
+    });
+    const compute = jest.fn(async () => ({
+      value: { requirements: ['bond'] },
+      tokens: 1200,
+    }));
+
+    const first = await cache.getOrCompute(request('Scope:\n  bonds'), compute);
+    const second = await cache.getOrCompute(request('Scope: bonds '), compute);
+
+    expect(compute).toHaveBeenCalledTimes(1);
+    expect(second).toEqual(first);
+    expect(second).not.toBe(first);
+    expect(cache.getStats()).toMatchObject({
+      tokensSaved: 1200,
+      operations: {
+        'analyze-compliance': { hits: 1, misses: 1, tokensSaved: 1200 },
+      },
+    });
+  });
+
+  it('should share entries across instances through Postgres', async () => {
+    const storage = createStorage();
+    const compute = jest.fn(async () => ({ value: 'summary', tokens: 10 }));
+
+    await new LLMResponseCache(storage as any, {
+      enabled: true,
+    }).getOrCompute(request('rfp text'), compute);
+    const value = await new LLMResponseCache(storage as any, {
+      enabled: true,
+    }).getOrCompute(request('rfp text'), compute);
+
+    expect(value).toBe('summary');
+    expect(compute).toHaveBeenCalledTimes(1);
+  });
+
+  it('should refresh entries on bypass and never cache fallbacks', async () => {
+    const cache = new LLMResponseCache(createStorage() as any, {
+      enabled: true,
+    });
+
+    await cache.getOrCompute(request('a'), async () => ({
+      value: 'fallback',
+      cacheable: false,
+    }));
+    await cache.getOrCompute(request('a'), async () => ({ value: 'old' }));
+    await cache.getOrCompute(request('a', true), async () => ({
+      value: 'new',
+    }));
+    const value = await cache.getOrCompute(request('a'), async () => ({
+      value: 'unused',
+    }));
+
+    expect(value).toBe('new');
+    expect(cache.getStats().operations['analyze-compliance']).toMatchObject({
+      hits: 1,
+      misses: 2,
+      bypassed: 1,
+    });
+  });
+
+  it('should normalize whitespace and unicode in inputs', () => {
+    expect(normalizeLLMInput('  Café\n\n\tbid ')).toBe('Café bid');
+  });
+});
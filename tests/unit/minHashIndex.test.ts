@@ -0,0 +1,101 @@
+import { describe, it, expect } from '@jest/globals';
+import { MinHashLSH } from '../../server/services/learning/minHashIndex';
+
+const words = (prefix: string, count: number) =>
+  Array.from({ length: count }, (_, i) => `${prefix}${i}`);
+
+describe('MinHashLSH', () => {
+  it('should make near-duplicate token sets candidates', () => {
+    const lsh = new MinHashLSH();
+    const base = words('proposal', 30);
+    lsh.add(0, base);
+    lsh.add(1, [...base.slice(0, 27), 'extra1', 'extra2', 'extra3']);
+    lsh.add(2, words('unrelated', 30));
+
+    expect(lsh.candidates(0)).toEqual([1]);
+    expect(lsh.candidates(2)).toEqual([]);
+    expect(lsh.candidatePairs()).toEqual([[0, 1]]);
+  });
+
+  it('should produce identical signatures for identical sets', () => {
+    const lsh = new MinHashLSH({ seed: 7 });
+    const a = lsh.signature(['alpha', 'beta', 'gamma']);
+    const b = lsh.signature(['gamma', 'alpha', 'beta', 'alpha']);
+
+    expect(a).toEqual(b);
+    expect(lsh.signature([])).toBeNull();
+  });
+
+  it('should cap buckets larger than maxBucketSize to nearby members', () => {
+    const lsh = new MinHashLSH({ maxBucketSize: 3 });
+    for (let i = 0; i < 5; i++) {
+      lsh.add(i, ['shared-tag']);
+    }
+
+    expect(lsh.candidates(0)).toEqual([1, 2]);
+    expect(lsh.candidates(2)).toEqual([0, 1, 3, 4]);
+    expect(lsh.candidatePairs()).toEqual([
+      [0, 1],
+      [0, 2],
+      [1, 2],
+      [1, 3],
+      [2, 3],
+      [2, 4],
+      [3, 4],
+    ]);
+    expect(lsh.getStats().oversizedBuckets).toBeGreaterThan(0);
+  });
+
+  it('should keep exact duplicates as candidates inside a large bucket', () => {
+    const lsh = new MinHashLSH({ bands: 2, rowsPerBand: 1, maxBucketSize: 2 });
+    const duplicate = words('section', 5);
+    const [first, second] = lsh.signature(duplicate)!;
+    lsh.add(0, duplicate);
+
+    // Fill both band buckets with near-duplicates that match one band each
+    let id = 1;
+    const perBand = [0, 0];
+    for (let n = 0; perBand[0] + perBand[1] < 6 && n < 1000; n++) {
+      const tokens = [...duplicate, `filler${n}`];
+      const [a, b] = lsh.signature(tokens)!;
+      const band =
+        a === first && b !== second ? 0 : a !== first && b === second ? 1 : -1;
+      if (band === -1 || perBand[band] === 3) continue;
+      perBand[band]++;
+      lsh.add(id++, tokens);
+    }
+    lsh.add(id, duplicate);
+
+    expect(perBand).toEqual([3, 3]);
+    expect(lsh.candidates(0)).toContain(id);
+    expect(lsh.candidates(id)).toContain(0);
+  });
+
+  it('should report each candidate pair once', () => {
+    const lsh = new MinHashLSH();
+    const tokens = words('requirement', 10);
+    lsh.add(0, tokens);
+    lsh.add(1, tokens);
+    lsh.add(2, tokens);
+
+    expect(lsh.candidatePairs()).toEqual([
+      [0, 1],
+      [0, 2],
+      [1, 2],
+    ]);
+  });
+
+  it('should stop returning removed items as candidates', () => {
+    const lsh = new MinHashLSH();
+    const tokens = words('clause', 10);
+    lsh.add(0, tokens);
+    lsh.add(1, tokens);
+    lsh.add(2, tokens);
+
+    lsh.remove(1);
+
+    expect(lsh.candidates(0)).toEqual([2]);
+    expect(lsh.candidates(1)).toEqual([]);
+    expect(lsh.getStats().items).toBe(2);
+  });
+});
@@ -0,0 +1,116 @@
+import { describe, it, expect } from '@jest/globals';
+import {
+  PROPOSAL_PHASE_GRAPH,
+  PhaseExecutionError,
+  ProposalPhaseScheduler,
+  phaseGraphDepth,
+  withoutPhases,
+  type ProposalPhaseNode,
+} from '../../server/services/orchestrators/proposalPhaseScheduler';
+
+const sleep = (ms: number) => new Promise(resolve => setTimeout(resolve, ms));
+
+const graph: ProposalPhaseNode<string>[] = [
+  { id: 'outline', dependsOn: [], usesLLM: true },
+  { id: 'summary', dependsOn: ['outline'], usesLLM: true },
+  { id: 'pricing', dependsOn: [], usesLLM: true },
+  { id: 'assembly', dependsOn: ['summary', 'pricing'], usesLLM: false },
+];
+
+describe('ProposalPhaseScheduler', () => {
+  it('should run independent phases concurrently and report the critical path', async () => {
+    const scheduler = new ProposalPhaseScheduler({
+      llmConcurrency: 4,
+      proposalConcurrency: 4,
+    });
+    const durations: Record<string, number> = {
+      outline: 40,
+      summary: 40,
+      pricing: 60,
+      assembly: 10,
+    };
+    const started: string[] = [];
+
+    const report = await scheduler.run(graph, async phase => {
+      started.push(phase);
+      await sleep(durations[phase]);
+    });
+
+    expect(started.slice(0, 2).sort()).toEqual(['outline', 'pricing']);
+    expect(report.criticalPath).toEqual(['outline', 'summary', 'assembly']);
+    expect(report.phases.summary.startedAt).toBeGreaterThanOrEqual(
+      report.phases.outline.finishedAt
+    );
+    expect(report.phases.assembly.startedAt).toBeGreaterThanOrEqual(
+      report.phases.pricing.finishedAt
+    );
+    // Pricing overlaps the outline → summary chain
+    expect(report.elapsedMs).toBeLessThan(report.sequentialMs);
+  });
+
+  it('should hold phases to the shared LLM budget across proposals', async () => {
+    const scheduler = new ProposalPhaseScheduler({
+      llmConcurrency: 2,
+      proposalConcurrency: 4,
+    });
+    let running = 0;
+    let peak = 0;
+    const execute = async () => {
+      running++;
+      peak = Math.max(peak, running);
+      await sleep(10);
+      running--;
+    };
+    const flat = graph.map(node => ({ ...node, dependsOn: [] }));
+
+    await Promise.all([
+      scheduler.run(flat, execute),
+      scheduler.run(flat, execute),
+    ]);
+
+    // Two LLM slots plus the assembly phases, which need none
+    expect(peak).toBeLessThanOrEqual(4);
+    expect(scheduler.getLLMBudgetUsage()).toEqual({ active: 0, pending: 0 });
+  });
+
+  it('should stop scheduling dependents after a phase fails', async () => {
+    const scheduler = new ProposalPhaseScheduler();
+    const ran: string[] = [];
+
+    const run = scheduler.run(graph, async phase => {
+      ran.push(phase);
+      if (phase === 'outline') throw new Error('model unavailable');
+      await sleep(5);
+    });
+
+    await expect(run).rejects.toBeInstanceOf(PhaseExecutionError);
+    await expect(run).rejects.toMatchObject({ phase: 'outline' });
+    expect(ran).not.toContain('summary');
+    expect(ran).not.toContain('assembly');
+  });
+
+  it('should reject graphs with cycles', async () => {
+    const scheduler = new ProposalPhaseScheduler();
+    const cyclic: ProposalPhaseNode<string>[] = [
+      { id: 'a', dependsOn: ['b'], usesLLM: false },
+      { id: 'b', dependsOn: ['a'], usesLLM: false },
+    ];
+
+    await expect(scheduler.run(cyclic, async () => {})).rejects.toThrow(
+      'cycle'
+    );
+  });
+
+  it('should shorten the proposal chain when phases are removed', () => {
+    expect(phaseGraphDepth(PROPOSAL_PHASE_GRAPH)).toBe(4);
+    const fast = withoutPhases(PROPOSAL_PHASE_GRAPH, [
+      'compliance_validation',
+      'form_completion',
+      'quality_assurance',
+    ]);
+    expect(phaseGraphDepth(fast)).toBe(3);
+    expect(
+      fast.find(node => node.id === 'final_assembly')?.dependsOn
+    ).not.toContain('form_completion');
+  });
+});
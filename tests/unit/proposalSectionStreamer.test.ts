@@ -0,0 +1,135 @@
+import { describe, it, expect, jest } from '@jest/globals';
+import {
+  ProposalSectionStreamer,
+  type ProposalGenerationDraft,
+  type ProposalSectionEvent,
+} from '../../server/services/proposals/proposalSectionStreamer';
+
+const sections = [
+  {
+    key: 'executiveSummary',
+    title: 'Executive Summary',
+    instructions: 'Summarize.',
+  },
+  { key: 'approach', title: 'Approach', instructions: 'Explain the approach.' },
+];
+
+const createStreamer = () => {
+  const saved: ProposalGenerationDraft[] = [];
+  const events: ProposalSectionEvent[] = [];
+  const progress: string[] = [];
+  const streamer = new ProposalSectionStreamer({
+    checkpointIntervalMs: 0,
+    publishIntervalMs: 0,
+    persist: async (_proposalId, draft) => {
+      saved.push(structuredClone(draft));
+    },
+    publish: event => events.push(event),
+    reportProgress: (_sessionId, message) => progress.push(message),
+  });
+  return { streamer, saved, events, progress };
+};
+
+const fakeStream = jest.fn((prompt: { system: string; user: string }) => {
+  const title = prompt.user.includes('SECTION: Approach')
+    ? 'approach'
+    : 'summary';
+  return (async function* () {
+    yield `${title} `;
+    yield 'text';
+  })();
+});
+
+const request = (existingDraft?: ProposalGenerationDraft) => ({
+  proposalId: 'proposal-1',
+  rfpId: 'rfp-1',
+  sessionId: 'session-1',
+  systemPrompt: 'You write proposals.',
+  contextPrompt: 'RFP: water delivery',
+  sections,
+  existingDraft,
+  stream: fakeStream,
+});
+
+describe('ProposalSectionStreamer', () => {
+  it('should stream each section, publish deltas and checkpoint partial text', async () => {
+    fakeStream.mockClear();
+    const { streamer, saved, events, progress } = createStreamer();
+
+    const texts = await streamer.streamSections(request());
+
+    expect(texts).toEqual({
+      executiveSummary: 'summary text',
+      approach: 'approach text',
+    });
+    expect(fakeStream).toHaveBeenCalledTimes(2);
+    expect(
+      events
+        .filter(event => event.section === 'executiveSummary')
+        .map(event => [event.status, event.delta])
+    ).toEqual([
+      ['streaming', 'summary '],
+      ['streaming', 'text'],
+      ['completed', ''],
+    ]);
+    expect(progress).toEqual([
+      'Writing Executive Summary (1/2)',
+      'Writing Approach (2/2)',
+    ]);
+
+    // A partial checkpoint lands before the section is complete
+    expect(
+      saved.some(
+        draft =>
+          draft.sections.executiveSummary === 'summary ' &&
+          draft.completedSections.length === 0
+      )
+    ).toBe(true);
+
+    const final = saved[saved.length - 1];
+    expect(final).toMatchObject({
+      status: 'completed',
+      completedSections: ['executiveSummary', 'approach'],
+      sections: {
+        executiveSummary: 'summary text',
+        approach: 'approach text',
+      },
+    });
+  });
+
+  it('should resume after the last completed section of an interrupted run', async () => {
+    const first = createStreamer();
+    await first.streamer.streamSections(request());
+    // The draft as it stood after the first section finished
+    const interrupted = first.saved.find(
+      draft =>
+        draft.status === 'generating' && draft.completedSections.length === 1
+    );
+
+    fakeStream.mockClear();
+    const { streamer, events } = createStreamer();
+    const texts = await streamer.streamSections(request(interrupted));
+
+    expect(fakeStream).toHaveBeenCalledTimes(1);
+    expect(events.every(event => event.section === 'approach')).toBe(true);
+    expect(texts.executiveSummary).toBe('summary text');
+  });
+
+  it('should regenerate everything when the inputs changed or the run finished', async () => {
+    const first = createStreamer();
+    await first.streamer.streamSections(request());
+    const finished = first.saved[first.saved.length - 1];
+    const stale = { ...finished, status: 'generating' as const };
+
+    fakeStream.mockClear();
+    await createStreamer().streamer.streamSections(request(finished));
+    expect(fakeStream).toHaveBeenCalledTimes(2);
+
+    fakeStream.mockClear();
+    await createStreamer().streamer.streamSections({
+      ...request(stale),
+      contextPrompt: 'RFP: amended water delivery',
+    });
+    expect(fakeStream).toHaveBeenCalledTimes(2);
+  });
+});
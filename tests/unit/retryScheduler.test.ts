@@ -0,0 +1,50 @@
+import { describe, it, expect, jest, afterEach } from '@jest/globals';
+import type { WorkItem } from '@shared/schema';
+import { RetryBackoffDlqService } from '../../server/services/core/retryBackoffDlqService';
+import { storage } from '../../server/storage';
+
+const sleep = (ms: number) => new Promise(resolve => setTimeout(resolve, ms));
+
+describe('RetryBackoffDlqService retry scheduler', () => {
+  afterEach(() => {
+    jest.restoreAllMocks();
+  });
+
+  it('should requeue due retries in set-based batches', async () => {
+    const requeueDueRetries = jest
+      .spyOn(storage, 'requeueDueRetries')
+      .mockResolvedValueOnce([{ id: 'a' }, { id: 'b' }] as WorkItem[])
+      .mockResolvedValue([]);
+    const getNextRetryAt = jest
+      .spyOn(storage, 'getNextRetryAt')
+      .mockResolvedValue(null);
+    const service = new RetryBackoffDlqService();
+
+    service.startRetryScheduler();
+    await sleep(20);
+
+    expect(requeueDueRetries).toHaveBeenCalledTimes(1);
+    expect(getNextRetryAt).toHaveBeenCalledTimes(1);
+    clearTimeout((service as any).retryTimer);
+  });
+
+  it('should wake at the earliest scheduled retry', async () => {
+    const requeueDueRetries = jest
+      .spyOn(storage, 'requeueDueRetries')
+      .mockResolvedValue([]);
+    jest.spyOn(storage, 'getNextRetryAt').mockResolvedValue(null);
+    const service = new RetryBackoffDlqService();
+
+    service.startRetryScheduler();
+    await sleep(20);
+    expect(requeueDueRetries).toHaveBeenCalledTimes(1);
+
+    // Idle until an earlier retry is scheduled
+    service.scheduleRetryWakeup(new Date(Date.now() + 30));
+    await sleep(10);
+    expect(requeueDueRetries).toHaveBeenCalledTimes(1);
+    await sleep(50);
+    expect(requeueDueRetries).toHaveBeenCalledTimes(2);
+    clearTimeout((service as any).retryTimer);
+  });
+});
@@ -0,0 +1,110 @@
+import { describe, it, expect, jest } from '@jest/globals';
+import {
+  RFPEmbeddingIndex,
+  RFP_EMBEDDING_DIMENSIONS,
+  buildRFPEmbeddingText,
+  hashEmbeddingText,
+  packEmbedding,
+  unpackEmbedding,
+} from '../../server/services/learning/rfpEmbeddingIndex';
+
+const vectorAlong = (axis: number, weight = 1): Float32Array => {
+  const vector = new Float32Array(RFP_EMBEDDING_DIMENSIONS);
+  vector[axis] = weight;
+  return vector;
+};
+
+const createLoadedIndex = () => {
+  const index = new RFPEmbeddingIndex();
+  // Skip the Postgres load; tests seed entries directly
+  (index as any).loadPromise = Promise.resolve();
+  (index as any).lastSyncAt = Date.now();
+  return index;
+};
+
+describe('RFPEmbeddingIndex', () => {
+  it('should round-trip packed Float32 embeddings', () => {
+    const vector = [0.25, -1.5, 3];
+    const packed = packEmbedding(vector);
+    expect(packed.byteLength).toBe(12);
+    expect(Array.from(unpackEmbedding(packed))).toEqual(vector);
+  });
+
+  it('should change the content hash only when embedded text changes', () => {
+    const rfp = {
+      title: 'Cloud Migration',
+      description: 'Move workloads',
+      agency: 'GSA',
+      category: 'IT',
+    };
+    const hash = hashEmbeddingText(buildRFPEmbeddingText(rfp));
+    expect(hashEmbeddingText(buildRFPEmbeddingText({ ...rfp }))).toBe(hash);
+    expect(
+      hashEmbeddingText(buildRFPEmbeddingText({ ...rfp, agency: 'DoD' }))
+    ).not.toBe(hash);
+  });
+
+  it('should return top-k matches above the similarity threshold', async () => {
+    const index = createLoadedIndex();
+    const seed = (id: string, vector: Float32Array) =>
+      (index as any).upsertEntry(id, vector, {
+        contentHash: id,
+        agency: 'A',
+        category: null,
+      });
+
+    const near = vectorAlong(0);
+    near[1] = 0.1;
+    seed('exact', vectorAlong(0));
+    seed('near', near.map(v => v / Math.hypot(1, 0.1)));
+    seed('orthogonal', vectorAlong(1));
+
+    const results = await index.query(vectorAlong(0, 5), {
+      topK: 5,
+      minSimilarity: 0.5,
+    });
+
+    expect(results.map(r => r.rfpId)).toEqual(['exact', 'near']);
+    expect(results[0].similarity).toBeCloseTo(1, 5);
+  });
+
+  it('should keep row mappings consistent after removals', async () => {
+    const index = createLoadedIndex();
+    ['a', 'b', 'c'].forEach((id, axis) =>
+      (index as any).upsertEntry(id, vectorAlong(axis), {
+        contentHash: id,
+        agency: 'A',
+        category: null,
+      })
+    );
+
+    index.remove('a'); // 'c' moves into row 0
+
+    const results = await index.query(vectorAlong(2), { topK: 3 });
+    expect(results.map(r => r.rfpId)).toEqual(['c', 'b']);
+    expect(results[0].similarity).toBeCloseTo(1, 5);
+    expect(index.getStats().size).toBe(2);
+  });
+
+  it('should reuse the stored vector for unchanged RFPs', async () => {
+    const index = createLoadedIndex();
+    const rfp: any = {
+      id: 'rfp-1',
+      title: 'Help Desk',
+      description: null,
+      agency: 'VA',
+      category: 'IT',
+    };
+    (index as any).upsertEntry('rfp-1', vectorAlong(0), {
+      contentHash: hashEmbeddingText(buildRFPEmbeddingText(rfp)),
+      agency: 'VA',
+      category: 'IT',
+    });
+
+    const embedSpy = jest.spyOn(index as any, 'embedRFPs');
+    await index.findSimilar(rfp);
+
+    expect(embedSpy).not.toHaveBeenCalled();
+    expect(index.getStats().embeddingCalls).toBe(0);
+  });
+});
@@ -0,0 +1,116 @@
+import { describe, it, expect, jest } from '@jest/globals';
+import {
+  ScanEventWriter,
+  type ScanProgressUpdate,
+} from '../../server/services/portals/scanEventWriter';
+import type { InsertScanEvent } from '@shared/schema';
+
+const createWriter = (options?: {
+  flushIntervalMs?: number;
+  maxBufferedEvents?: number;
+}) => {
+  const batches: InsertScanEvent[][] = [];
+  const progressWrites: Array<[string, ScanProgressUpdate]> = [];
+  const writer = new ScanEventWriter({
+    flushIntervalMs: 10_000,
+    ...options,
+    persistEvents: async events => {
+      batches.push(events);
+    },
+    persistProgress: async (scanId, progress) => {
+      progressWrites.push([scanId, progress]);
+    },
+  });
+  return { writer, batches, progressWrites };
+};
+
+describe('ScanEventWriter', () => {
+  it('should batch events and coalesce progress until flushed', async () => {
+    const { writer, batches, progressWrites } = createWriter();
+
+    writer.setProgress('scan-1', 'navigating', 10, 'Starting');
+    writer.append('scan-1', 'log', { message: 'Full scan' });
+    writer.setProgress('scan-1', 'parsing', 50);
+    writer.append('scan-2', 'error', { message: 'Timed out' });
+
+    expect(batches).toEqual([]);
+    await writer.flush();
+
+    expect(batches).toHaveLength(1);
+    expect(batches[0].map(event => [event.scanId, event.type])).toEqual([
+      ['scan-1', 'progress'],
+      ['scan-1', 'log'],
+      ['scan-1', 'progress'],
+      ['scan-2', 'error'],
+    ]);
+    expect(batches[0][3]).toMatchObject({
+      level: 'error',
+      message: 'Timed out',
+    });
+    expect(progressWrites).toEqual([
+      [
+        'scan-1',
+        { currentStep: 'parsing', currentProgress: 50, currentMessage: null },
+      ],
+    ]);
+    expect(writer.getStats()).toMatchObject({
+      bufferedEvents: 0,
+      eventsWritten: 4,
+      progressCoalesced: 1,
+    });
+  });
+
+  it('should flush once the buffer reaches its size threshold', async () => {
+    const { writer, batches } = createWriter({ maxBufferedEvents: 3 });
+
+    for (let i = 0; i < 3; i++) writer.append('scan-1', 'log', { i });
+    await new Promise(resolve => setImmediate(resolve));
+
+    expect(batches).toHaveLength(1);
+    expect(batches[0]).toHaveLength(3);
+  });
+
+  it('should flush on the interval', async () => {
+    const { writer, batches } = createWriter({ flushIntervalMs: 5 });
+
+    writer.append('scan-1', 'log', { message: 'hello' });
+    await new Promise(resolve => setTimeout(resolve, 30));
+
+    expect(batches).toHaveLength(1);
+  });
+
+  it('should deliver events to subscribers before they are written', async () => {
+    const { writer, batches } = createWriter();
+    const listener = jest.fn();
+    writer.subscribe('scan-1', listener);
+
+    writer.append('scan-1', 'rfp_discovered', { title: 'Road Work' });
+    writer.append('scan-2', 'log', {});
+
+    expect(batches).toEqual([]);
+    expect(listener).toHaveBeenCalledTimes(1);
+    expect(listener.mock.calls[0][0]).toMatchObject({
+      type: 'rfp_discovered',
+      data: { title: 'Road Work' },
+    });
+
+    await writer.close('scan-1');
+    expect(batches).toHaveLength(1);
+    expect(writer.hasSubscribers('scan-1')).toBe(false);
+  });
+
+  it('should not throw when a write fails', async () => {
+    const errorSpy = jest.spyOn(console, 'error').mockImplementation(() => {});
+    const writer = new ScanEventWriter({
+      persistEvents: async () => {
+        throw new Error('connection reset');
+      },
+      persistProgress: async () => {},
+    });
+
+    writer.append('scan-1', 'log', {});
+    await expect(writer.close('scan-1')).resolves.toBeUndefined();
+    expect(writer.getStats().failedFlushes).toBe(1);
+    errorSpy.mockRestore();
+  });
+});
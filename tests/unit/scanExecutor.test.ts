@@ -0,0 +1,161 @@
+import { describe, it, expect } from '@jest/globals';
+import {
+  executeScans,
+  scanHostFor,
+  type ScanTask,
+  type ScanTaskOutcome,
+} from '../../server/services/portals/scanExecutor';
+
+const sleep = (ms: number) => new Promise(resolve => setTimeout(resolve, ms));
+
+const collect = async <T>(outcomes: AsyncIterable<ScanTaskOutcome<T>>) => {
+  const results: ScanTaskOutcome<T>[] = [];
+  for await (const outcome of outcomes) results.push(outcome);
+  return results;
+};
+
+// Resolves when the signal aborts, or after ms
+const waitOrAbort = (ms: number, signal: AbortSignal) =>
+  new Promise<string>((resolve, reject) => {
+    const timer = setTimeout(() => resolve('done'), ms);
+    signal.addEventListener('abort', () => {
+      clearTimeout(timer);
+      reject(signal.reason);
+    });
+  });
+
+describe('executeScans', () => {
+  it('should respect global and per-host concurrency limits', async () => {
+    let active = 0;
+    let maxActive = 0;
+    const activeByHost: Record<string, number> = {};
+    let maxPerHost = 0;
+
+    const tasks: ScanTask<string>[] = Array.from({ length: 9 }, (_, i) => {
+      const host = `host${i % 3}`;
+      return {
+        id: `portal${i}`,
+        host,
+        run: async () => {
+          active++;
+          activeByHost[host] = (activeByHost[host] || 0) + 1;
+          maxActive = Math.max(maxActive, active);
+          maxPerHost = Math.max(maxPerHost, activeByHost[host]);
+          await sleep(10);
+          active--;
+          activeByHost[host]--;
+          return host;
+        },
+      };
+    });
+
+    const results = await collect(
+      executeScans(tasks, {
+        concurrency: 2,
+        perHostConcurrency: 1,
+        minHostDelayMs: 0,
+      })
+    );
+
+    expect(results).toHaveLength(9);
+    expect(maxActive).toBe(2);
+    expect(maxPerHost).toBe(1);
+  });
+
+  it('should yield in completion order and isolate failures', async () => {
+    const tasks: ScanTask<string>[] = [
+      { id: 'slow', host: 'a', run: () => sleep(30).then(() => 'slow') },
+      {
+        id: 'broken',
+        host: 'b',
+        run: async () => {
+          throw new Error('portal down');
+        },
+      },
+      { id: 'fast', host: 'c', run: () => sleep(5).then(() => 'fast') },
+    ];
+
+    const results = await collect(
+      executeScans(tasks, { concurrency: 3, minHostDelayMs: 0 })
+    );
+
+    expect(results.map(result => [result.id, result.status])).toEqual([
+      ['broken', 'rejected'],
+      ['fast', 'fulfilled'],
+      ['slow', 'fulfilled'],
+    ]);
+  });
+
+  it('should wait the minimum delay between scans of one host', async () => {
+    const startedAt: number[] = [];
+    const tasks: ScanTask<void>[] = ['first', 'second'].map(id => ({
+      id,
+      host: 'same-host',
+      run: async () => {
+        startedAt.push(Date.now());
+      },
+    }));
+
+    await collect(
+      executeScans(tasks, { concurrency: 2, minHostDelayMs: 40 })
+    );
+
+    expect(startedAt[1] - startedAt[0]).toBeGreaterThanOrEqual(35);
+  });
+
+  it('should abort in-flight scans and reject unstarted ones', async () => {
+    const controller = new AbortController();
+    const tasks: ScanTask<string>[] = ['a', 'b', 'c'].map(id => ({
+      id,
+      host: id,
+      run: signal => waitOrAbort(1000, signal),
+    }));
+
+    const outcomes = executeScans(tasks, {
+      concurrency: 1,
+      minHostDelayMs: 0,
+      signal: controller.signal,
+    });
+    setTimeout(() => controller.abort(new Error('cancelled')), 10);
+    const results = await collect(outcomes);
+
+    expect(results.map(result => result.status)).toEqual([
+      'rejected',
+      'rejected',
+      'rejected',
+    ]);
+    expect(results.map(result => result.id).sort()).toEqual(['a', 'b', 'c']);
+  });
+
+  it('should cancel running scans when iteration stops early', async () => {
+    let aborted = false;
+    const tasks: ScanTask<string>[] = [
+      { id: 'quick', host: 'a', run: async () => 'quick' },
+      {
+        id: 'long',
+        host: 'b',
+        run: signal =>
+          waitOrAbort(1000, signal).catch(error => {
+            aborted = true;
+            throw error;
+          }),
+      },
+    ];
+
+    for await (const outcome of executeScans(tasks, { minHostDelayMs: 0 })) {
+      expect(outcome.id).toBe('quick');
+      break;
+    }
+    await sleep(0);
+
+    expect(aborted).toBe(true);
+  });
+});
+
+describe('scanHostFor', () => {
+  it('should group portals by host name', () => {
+    expect(scanHostFor('https://Example.gov/rfps?page=1')).toBe('example.gov');
+    expect(scanHostFor('not a url')).toBe('not a url');
+    expect(scanHostFor(undefined)).toBe('unknown');
+  });
+});
@@ -0,0 +1,90 @@
+import { describe, it, expect, jest } from '@jest/globals';
+import { ScanHistoryService } from '../../server/services/monitoring/scanHistoryService';
+import type { IStorage, ScanPortalStats } from '../../server/storage';
+
+const portalStats = (
+  overrides: Partial<ScanPortalStats> & { portalName: string }
+): ScanPortalStats => ({
+  portalId: overrides.portalName.toLowerCase(),
+  scanCount: 0,
+  successCount: 0,
+  failedCount: 0,
+  rfpsDiscovered: 0,
+  totalDurationMs: 0,
+  timedScanCount: 0,
+  ...overrides,
+});
+
+describe('ScanHistoryService.getScanStatistics', () => {
+  it('should combine per-portal aggregates into totals', async () => {
+    const getScanPortalStats = jest.fn(async () => [
+      portalStats({
+        portalName: 'Austin',
+        scanCount: 4,
+        successCount: 3,
+        failedCount: 1,
+        rfpsDiscovered: 10,
+        totalDurationMs: 4000,
+        timedScanCount: 4,
+      }),
+      portalStats({
+        portalName: 'Philadelphia',
+        scanCount: 1,
+        successCount: 1,
+        rfpsDiscovered: 25,
+        totalDurationMs: 6000,
+        timedScanCount: 1,
+      }),
+    ]);
+    const service = new ScanHistoryService({
+      getScanPortalStats,
+    } as unknown as IStorage);
+
+    const stats = await service.getScanStatistics(7);
+
+    const [since, options] = getScanPortalStats.mock.calls[0] as unknown as [
+      Date,
+      { source: string },
+    ];
+    expect(Date.now() - since.getTime()).toBeGreaterThanOrEqual(
+      7 * 24 * 60 * 60 * 1000 - 60 * 60 * 1000
+    );
+    expect(options.source).toBe('rollup');
+    expect(stats).toEqual({
+      totalScans: 5,
+      successfulScans: 4,
+      failedScans: 1,
+      successRate: 80,
+      totalRfpsDiscovered: 35,
+      avgRfpsPerScan: 7,
+      avgScanDuration: 2000,
+      topPortals: [
+        {
+          portalName: 'Philadelphia',
+          scanCount: 1,
+          successRate: 100,
+          rfpsDiscovered: 25,
+        },
+        {
+          portalName: 'Austin',
+          scanCount: 4,
+          successRate: 75,
+          rfpsDiscovered: 10,
+        },
+      ],
+    });
+  });
+
+  it('should report zeros when there are no finished scans', async () => {
+    const service = new ScanHistoryService({
+      getScanPortalStats: async () => [],
+    } as unknown as IStorage);
+
+    await expect(service.getScanStatistics()).resolves.toMatchObject({
+      totalScans: 0,
+      successRate: 0,
+      avgScanDuration: 0,
+      topPortals: [],
+    });
+  });
+});
@@ -0,0 +1,97 @@
+import { PgDialect } from 'drizzle-orm/pg-core';
+import { and } from 'drizzle-orm';
+import {
+  buildKeywordTsQuery,
+  compileSearchFilters,
+  escapeLikePattern,
+} from '../../server/services/search/searchFilterCompiler';
+import {
+  decodeCursor,
+  encodeCursor,
+  toKeysetPage,
+} from '../../server/utils/cursor';
+
+const dialect = new PgDialect();
+
+describe('searchFilterCompiler', () => {
+  describe('buildKeywordTsQuery', () => {
+    it('should OR keywords and AND prefix terms within a keyword', () => {
+      expect(buildKeywordTsQuery(['cyber', 'help desk'])).toBe(
+        '(cyber:*) | (help:* & desk:*)'
+      );
+    });
+
+    it('should strip tsquery operators from user input', () => {
+      expect(buildKeywordTsQuery(["it's & (cloud)!"])).toBe(
+        '(it:* & s:* & cloud:*)'
+      );
+    });
+
+    it('should return null when no searchable terms remain', () => {
+      expect(buildKeywordTsQuery(['&&', '  '])).toBeNull();
+    });
+  });
+
+  it('should escape LIKE wildcards', () => {
+    expect(escapeLikePattern('100%_a\\b')).toBe('100\\%\\_a\\\\b');
+  });
+
+  it('should compile no predicates for empty filters', () => {
+    expect(compileSearchFilters({})).toEqual([]);
+  });
+
+  it('should compile each filter into a parameterized predicate', () => {
+    const conditions = compileSearchFilters({
+      keywords: ['cloud'],
+      naicsCodes: ['5415'],
+      setAsideTypes: ['sdvosb'],
+      deadlineAfter: '2025-01-01',
+      deadlineBefore: 'not-a-date',
+      minValue: 50000,
+      statuses: ['discovered'],
+    });
+
+    // Invalid dates are skipped rather than filtering everything out
+    expect(conditions).toHaveLength(6);
+
+    const query = dialect.sqlToQuery(and(...conditions)!);
+    expect(query.sql).toContain("to_tsquery('english'");
+    expect(query.sql).toContain('upper(');
+    expect(query.params).toEqual(
+      expect.arrayContaining(['(cloud:*)', '5415%', 'SDVOSB', '50000'])
+    );
+  });
+});
+
+describe('keyset cursor', () => {
+  it('should round-trip the sort key and id', () => {
+    const cursor = encodeCursor('2025-03-01 12:00:00.123456', 'rfp-1');
+    expect(decodeCursor(cursor)).toEqual({
+      sortKey: '2025-03-01 12:00:00.123456',
+      id: 'rfp-1',
+    });
+  });
+
+  it('should reject malformed cursors', () => {
+    expect(decodeCursor('not-a-cursor')).toBeNull();
+    expect(
+      decodeCursor(Buffer.from('["nope","id"]').toString('base64url'))
+    ).toBeNull();
+  });
+
+  it('should trim a limit + 1 fetch to one page with a next cursor', () => {
+    const rows = ['a', 'b', 'c'].map((id, i) => ({
+      item: { id },
+      sortKey: `2025-03-0${3 - i} 00:00:00`,
+    }));
+
+    const page = toKeysetPage(rows, 2);
+    expect(page.items).toEqual([{ id: 'a' }, { id: 'b' }]);
+    expect(decodeCursor(page.nextCursor!)).toEqual({
+      sortKey: '2025-03-02 00:00:00',
+      id: 'b',
+    });
+
+    expect(toKeysetPage(rows, 3).nextCursor).toBeNull();
+  });
+});
@@ -0,0 +1,135 @@
+import { describe, it, expect, jest } from '@jest/globals';
+import { LRUCache } from '../../server/utils/lruCache';
+import {
+  TieredResponseCache,
+  getResponseCacheStats,
+} from '../../server/services/core/tieredResponseCache';
+
+describe('LRUCache', () => {
+  it('should evict the least recently used entry', () => {
+    const cache = new LRUCache<string, number>({ maxSize: 2 });
+    cache.set('a', 1);
+    cache.set('b', 2);
+    cache.get('a'); // a is now most recent
+    cache.set('c', 3);
+
+    expect(cache.has('a')).toBe(true);
+    expect(cache.has('b')).toBe(false);
+    expect(cache.getStats().evictions).toBe(1);
+  });
+
+  it('should expire entries after their TTL', () => {
+    const now = jest.spyOn(Date, 'now').mockReturnValue(1000);
+    const cache = new LRUCache<string, number>({ maxSize: 10, ttlMs: 500 });
+    cache.set('a', 1);
+
+    now.mockReturnValue(1400);
+    expect(cache.get('a')).toBe(1);
+
+    now.mockReturnValue(1600);
+    expect(cache.get('a')).toBeUndefined();
+    expect(cache.getStats()).toMatchObject({ hits: 1, misses: 1 });
+
+    now.mockRestore();
+  });
+});
+
+describe('TieredResponseCache', () => {
+  const createStorage = () => {
+    const rows = new Map<string, any>();
+    return {
+      rows,
+      getAiResponseCacheEntry: jest.fn(async (key: string) => rows.get(key)),
+      upsertAiResponseCacheEntry: jest.fn(async (entry: any) => {
+        rows.set(entry.cacheKey, entry);
+      }),
+      recordAiResponseCacheHits: jest.fn(async (_hits: any[]) => {}),
+      deleteExpiredAiResponseCacheEntries: jest.fn(async () => 0),
+    };
+  };
+
+  it('should build stable, namespaced keys', () => {
+    const storage = createStorage();
+    const a = new TieredResponseCache<string>(storage as any, {
+      namespace: 'test-a',
+      maxSize: 10,
+      ttlMs: 1000,
+    });
+    const b = new TieredResponseCache<string>(storage as any, {
+      namespace: 'test-b',
+      maxSize: 10,
+      ttlMs: 1000,
+    });
+
+    expect(a.key('gpt-4o', 'query')).toBe(a.key('gpt-4o', 'query'));
+    expect(a.key('gpt-4o', 'query')).not.toBe(b.key('gpt-4o', 'query'));
+  });
+
+  it('should fall back to the persistent tier and repopulate memory', async () => {
+    const storage = createStorage();
+    const writer = new TieredResponseCache<{ answer: number }>(
+      storage as any,
+      { namespace: 'test-writer', maxSize: 10, ttlMs: 60000 }
+    );
+    const key = writer.key('q');
+    await writer.set(key, { answer: 42 });
+
+    // A second instance (e.g. another machine) only sees Postgres
+    const reader = new TieredResponseCache<{ answer: number }>(
+      storage as any,
+      { namespace: 'test-reader', maxSize: 10, ttlMs: 60000 }
+    );
+    expect(await reader.get(key)).toEqual({ answer: 42 });
+    expect(await reader.get(key)).toEqual({ answer: 42 });
+
+    expect(storage.getAiResponseCacheEntry).toHaveBeenCalledTimes(1);
+    expect(reader.getStats()).toMatchObject({ persistentHits: 1, misses: 0 });
+  });
+
+  it('should record persistent hits in one batched write', async () => {
+    const storage = createStorage();
+    const writer = new TieredResponseCache<string>(storage as any, {
+      namespace: 'test-hits-writer',
+      maxSize: 10,
+      ttlMs: 60000,
+    });
+    await writer.set(writer.key('a'), 'A');
+    await writer.set(writer.key('b'), 'B');
+
+    // A one-entry memory tier, so alternating reads go to Postgres
+    const reader = new TieredResponseCache<string>(storage as any, {
+      namespace: 'test-hits-reader',
+      maxSize: 1,
+      ttlMs: 60000,
+    });
+    await reader.get(writer.key('a'));
+    await reader.get(writer.key('b'));
+    await reader.get(writer.key('a'));
+    expect(storage.recordAiResponseCacheHits).not.toHaveBeenCalled();
+
+    await reader.flushHits();
+    await reader.flushHits();
+
+    expect(storage.recordAiResponseCacheHits).toHaveBeenCalledTimes(1);
+    expect(storage.recordAiResponseCacheHits).toHaveBeenCalledWith([
+      expect.objectContaining({ cacheKey: writer.key('a'), hits: 2 }),
+      expect.objectContaining({ cacheKey: writer.key('b'), hits: 1 }),
+    ]);
+  });
+
+  it('should treat persistence failures as misses', async () => {
+    const storage = createStorage();
+    storage.getAiResponseCacheEntry.mockRejectedValueOnce(new Error('down'));
+    const cache = new TieredResponseCache<string>(storage as any, {
+      namespace: 'test-failing',
+      maxSize: 10,
+      ttlMs: 1000,
+    });
+
+    expect(await cache.get(cache.key('q'))).toBeUndefined();
+    expect(getResponseCacheStats()['test-failing']).toMatchObject({
+      misses: 1,
+      persistenceErrors: 1,
+    });
+  });
+});
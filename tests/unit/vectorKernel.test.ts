@@ -0,0 +1,116 @@
+import { describe, it, expect } from '@jest/globals';
+import {
+  VectorMatrix,
+  assignToCentroids,
+  kMeans,
+  meanSilhouette,
+  normalizeVector,
+  scoreAll,
+  selectTopK,
+} from '../../server/services/learning/vectorKernel';
+
+const seededRandom = (seed: number) => {
+  let state = seed;
+  return () => {
+    state = (state * 1664525 + 1013904223) % 4294967296;
+    return state / 4294967296;
+  };
+};
+
+describe('vectorKernel', () => {
+  it('should store rows normalized and swap-remove in O(1)', () => {
+    const matrix = new VectorMatrix(2, 1);
+    matrix.add([3, 4]);
+    matrix.add([0, 2]);
+    matrix.add([5, 0]);
+
+    expect(Array.from(matrix.row(0))).toEqual([
+      expect.closeTo(0.6, 6),
+      expect.closeTo(0.8, 6),
+    ]);
+
+    expect(matrix.removeSwap(0)).toBe(2);
+    expect(matrix.size).toBe(2);
+    expect(Array.from(matrix.row(0))).toEqual([1, 0]);
+    expect(matrix.removeSwap(1)).toBe(-1);
+  });
+
+  it('should select the same top-k as a full sort', () => {
+    const random = seededRandom(1);
+    const scores = Float32Array.from({ length: 1000 }, () => random());
+    const expected = Array.from(scores)
+      .map((score, index) => ({ index, score }))
+      .sort((a, b) => b.score - a.score)
+      .slice(0, 7)
+      .map(row => row.index);
+
+    expect(selectTopK(scores, 7).map(row => row.index)).toEqual(expected);
+  });
+
+  it('should apply minScore and exclusions when selecting', () => {
+    const matrix = VectorMatrix.from([
+      [1, 0],
+      [1, 1],
+      [0, 1],
+    ]);
+    const scores = scoreAll(matrix, normalizeVector([1, 0]));
+
+    const results = selectTopK(scores, 5, {
+      minScore: 0.5,
+      exclude: index => index === 0,
+    });
+
+    expect(results).toEqual([{ index: 1, score: expect.closeTo(0.7071, 4) }]);
+  });
+
+  it('should match brute-force nearest-centroid assignment', () => {
+    const random = seededRandom(2);
+    const dims = 13;
+    const k = 7;
+    const vectors = Array.from({ length: 101 }, () =>
+      Array.from({ length: dims }, () => random() - 0.5)
+    );
+    const matrix = VectorMatrix.from(vectors);
+    const centroids = Float32Array.from({ length: k * dims }, () =>
+      random()
+    );
+    const assignments = new Int32Array(vectors.length).fill(-1);
+    const distances = new Float32Array(vectors.length);
+
+    assignToCentroids(matrix, centroids, k, assignments, distances);
+
+    for (let row = 0; row < vectors.length; row++) {
+      const point = matrix.row(row);
+      let best = 0;
+      let bestDistance = Infinity;
+      for (let j = 0; j < k; j++) {
+        let distance = 0;
+        for (let d = 0; d < dims; d++) {
+          distance += (point[d] - centroids[j * dims + d]) ** 2;
+        }
+        if (distance < bestDistance) {
+          bestDistance = distance;
+          best = j;
+        }
+      }
+      expect(assignments[row]).toBe(best);
+      expect(distances[row]).toBeCloseTo(bestDistance, 4);
+    }
+  });
+
+  it('should separate well-clustered points', () => {
+    const random = seededRandom(3);
+    const vectors = Array.from({ length: 40 }, (_, i) =>
+      i % 2 === 0 ? [1, random() * 0.1, 0] : [0, random() * 0.1, 1]
+    );
+    const matrix = VectorMatrix.from(vectors);
+
+    const result = kMeans(matrix, 2, { random: seededRandom(4) });
+
+    const evenCluster = result.assignments[0];
+    result.assignments.forEach((cluster, i) => {
+      expect(cluster === evenCluster).toBe(i % 2 === 0);
+    });
+    expect(meanSilhouette(matrix, result.assignments, 2)).toBeGreaterThan(0.9);
+  });
+});
@@ -0,0 +1,172 @@
+import {
+  describe,
+  it,
+  expect,
+  jest,
+  beforeEach,
+  afterEach,
+} from '@jest/globals';
+import type { WorkItem } from '@shared/schema';
+import { WorkItemQueue } from '../../server/services/workflows/workItemQueue';
+import { storage } from '../../server/storage';
+
+const sleep = (ms: number) => new Promise(resolve => setTimeout(resolve, ms));
+
+const workItem = (id: string, taskType: string): WorkItem =>
+  ({ id, taskType, priority: 5, deadline: null }) as unknown as WorkItem;
+
+describe('WorkItemQueue', () => {
+  let pending: WorkItem[];
+  let queue: WorkItemQueue | undefined;
+  let releaseWorkItems: jest.SpiedFunction<typeof storage.releaseWorkItems>;
+
+  beforeEach(() => {
+    pending = [];
+    // Emulates the SKIP LOCKED claim: each row is handed out once
+    jest
+      .spyOn(storage, 'claimWorkItems')
+      .mockImplementation(async ({ limit, excludeTaskTypes = [] }) => {
+        const claimed: WorkItem[] = [];
+        pending = pending.filter(item => {
+          if (
+            claimed.length < limit &&
+            !excludeTaskTypes.includes(item.taskType)
+          ) {
+            claimed.push(item);
+            return false;
+          }
+          return true;
+        });
+        return claimed.map(item => ({
+          workItem: item,
+          readyAt: new Date(Date.now() - 40),
+          claimedAt: new Date(),
+        }));
+      });
+    releaseWorkItems = jest
+      .spyOn(storage, 'releaseWorkItems')
+      .mockResolvedValue();
+    jest.spyOn(storage, 'getWorkItemQueueDepth').mockImplementation(async () =>
+      pending.reduce<Record<string, number>>((depth, item) => {
+        depth[item.taskType] = (depth[item.taskType] || 0) + 1;
+        return depth;
+      }, {})
+    );
+  });
+
+  afterEach(async () => {
+    await queue?.stop();
+    jest.restoreAllMocks();
+  });
+
+  it('should run claimed items within global and per-type limits', async () => {
+    pending = [
+      ...['s1', 's2', 's3', 's4'].map(id => workItem(id, 'portal_scan')),
+      ...['p1', 'p2'].map(id => workItem(id, 'proposal_generation')),
+    ];
+    const running: Record<string, number> = {};
+    const maxRunning: Record<string, number> = {};
+    let active = 0;
+    let maxActive = 0;
+    const executed: string[] = [];
+
+    queue = new WorkItemQueue({
+      concurrency: 3,
+      taskConcurrency: { portal_scan: 2 },
+      defaultTaskConcurrency: 1,
+      listenConnectionString: null,
+      execute: async item => {
+        active++;
+        running[item.taskType] = (running[item.taskType] || 0) + 1;
+        maxActive = Math.max(maxActive, active);
+        maxRunning[item.taskType] = Math.max(
+          maxRunning[item.taskType] || 0,
+          running[item.taskType]
+        );
+        await sleep(10);
+        running[item.taskType]--;
+        active--;
+        executed.push(item.id);
+      },
+    });
+    queue.start();
+
+    for (let i = 0; i < 50 && executed.length < 6; i++) await sleep(10);
+
+    expect(executed.sort()).toEqual(['p1', 'p2', 's1', 's2', 's3', 's4']);
+    expect(maxActive).toBeLessThanOrEqual(3);
+    expect(maxRunning).toEqual({ portal_scan: 2, proposal_generation: 1 });
+  });
+
+  it('should release items that prepare leaves out', async () => {
+    pending = [workItem('a', 'portal_scan'), workItem('b', 'compliance')];
+    const executed: string[] = [];
+
+    queue = new WorkItemQueue({
+      listenConnectionString: null,
+      releaseDelayMs: 60000,
+      prepare: async items =>
+        items.filter(item => item.taskType !== 'compliance'),
+      execute: async item => {
+        executed.push(item.id);
+      },
+    });
+    queue.start();
+    await sleep(20);
+
+    expect(executed).toEqual(['a']);
+    expect(releaseWorkItems).toHaveBeenCalledWith(['b'], expect.any(Date));
+    const notBefore = releaseWorkItems.mock.calls[0][1] as Date;
+    expect(notBefore.getTime()).toBeGreaterThan(Date.now() + 50000);
+  });
+
+  it('should extend the lease on items it holds until they finish', async () => {
+    pending = [workItem('a', 'portal_scan')];
+    const extendWorkItemLeases = jest
+      .spyOn(storage, 'extendWorkItemLeases')
+      .mockResolvedValue();
+    let finished = false;
+
+    queue = new WorkItemQueue({
+      listenConnectionString: null,
+      leaseMs: 60,
+      execute: async () => {
+        await sleep(100);
+        finished = true;
+      },
+    });
+    queue.start();
+    await sleep(150);
+
+    expect(finished).toBe(true);
+    expect(extendWorkItemLeases).toHaveBeenCalledWith(['a'], 60);
+    const calls = extendWorkItemLeases.mock.calls.length;
+    await sleep(60);
+    expect(extendWorkItemLeases).toHaveBeenCalledTimes(calls);
+  });
+
+  it('should report queue depth and claim latency', async () => {
+    pending = [workItem('a', 'portal_scan')];
+    queue = new WorkItemQueue({
+      listenConnectionString: null,
+      execute: async () => {
+        throw new Error('boom');
+      },
+    });
+    jest.spyOn(console, 'error').mockImplementation(() => {});
+
+    queue.start();
+    await sleep(20);
+    pending = [workItem('b', 'portal_scan'), workItem('c', 'compliance')];
+
+    const metrics = await queue.getMetrics();
+    expect(metrics).toMatchObject({
+      claimed: 1,
+      failed: 1,
+      running: 0,
+      queueDepth: { portal_scan: 1, compliance: 1 },
+      queueDepthTotal: 2,
+    });
+    expect(metrics.claimLatencyMs.p50).toBeGreaterThanOrEqual(40);
+  });
+});